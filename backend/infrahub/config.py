@@ -320,6 +320,52 @@ class ApiSettings(BaseSettings):
     cors_allow_credentials: bool = Field(
         default=True, description="If True, cookies will be allowed to be included in cross-site HTTP requests"
     )
+    graphql_query_cache_size: int = Field(
+        default=1000,
+        ge=0,
+        description="Maximum number of parsed and validated GraphQL queries kept in memory, 0 to disable the cache",
+    )
+    search_index_cache_size: int = Field(
+        default=10,
+        ge=0,
+        description="Maximum number of branches with their search index kept in memory, 0 to disable the index",
+    )
+    hierarchy_cache_size: int = Field(
+        default=100,
+        ge=0,
+        description=(
+            "Maximum number of hierarchies of a branch kept in memory to resolve the ancestors and descendants, "
+            "0 to disable the cache"
+        ),
+    )
+    ipam_tree_cache_size: int = Field(
+        default=100,
+        ge=0,
+        description=(
+            "Maximum number of IP namespaces of a branch kept in memory to find the parents and children of "
+            "the IP prefixes and addresses, 0 to disable the cache"
+        ),
+    )
+    hfid_index_cache_size: int = Field(
+        default=1000,
+        ge=0,
+        description=(
+            "Maximum number of kinds of a branch with their human friendly ids kept in memory, 0 to disable the index"
+        ),
+    )
+    number_pool_cache_size: int = Field(
+        default=1000,
+        ge=0,
+        description="Maximum number of number pools with their free numbers kept in memory, 0 to disable the cache",
+    )
+    subscription_staleness_timeout: int = Field(
+        default=600,
+        ge=0,
+        description=(
+            "Number of seconds after which a subscribed query is executed again if no modification has been notified, "
+            "0 to execute it again only on notification"
+        ),
+    )
 
 
 class GitSettings(BaseSettings):
@@ -328,6 +374,12 @@ class GitSettings(BaseSettings):
     sync_interval: int = Field(
         default=10, ge=0, description="Time (in seconds) between git repositories synchronizations"
     )
+    sync_concurrency: int = Field(
+        default=4, ge=1, description="Maximum number of git repositories synchronized at the same time"
+    )
+    max_workers: int = Field(
+        default=8, ge=1, description="Maximum number of threads used to execute the git operations of a worker"
+    )
 
 
 class HTTPSettings(BaseSettings):
@@ -528,6 +580,12 @@ class SecuritySettings(BaseSettings):
     refresh_token_lifetime: int = Field(
         default=THIRTY_DAYS_IN_SECONDS, description="Lifetime of refresh token in seconds"
     )
+    permission_cache_ttl: int = Field(
+        default=60, ge=0, description="Lifetime in seconds of the permissions cached for an account, 0 to disable"
+    )
+    permission_cache_size: int = Field(
+        default=1000, ge=0, description="Maximum number of accounts and branches with their permissions cached"
+    )
     secret_key: str = Field(
         default_factory=generate_uuid, description="The secret key used to validate authentication tokens"
     )
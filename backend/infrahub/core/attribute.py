@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import ipaddress
 import re
+from copy import deepcopy
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Union
 
 import netaddr
 import ujson
@@ -16,12 +17,7 @@ from infrahub import config
 from infrahub.core import registry
 from infrahub.core.constants import NULL_VALUE, AttributeDBNodeType, BranchSupportType, RelationshipStatus
 from infrahub.core.property import FlagPropertyMixin, NodePropertyData, NodePropertyMixin
-from infrahub.core.query.attribute import (
-    AttributeGetQuery,
-    AttributeUpdateFlagQuery,
-    AttributeUpdateNodePropertyQuery,
-    AttributeUpdateValueQuery,
-)
+from infrahub.core.query.attribute import AttributeGetQuery, AttributeUpdateManyQuery
 from infrahub.core.query.node import AttributeFromDB, NodeListGetAttributeQuery
 from infrahub.core.timestamp import Timestamp
 from infrahub.core.utils import add_relationship, convert_ip_to_binary_str, update_relationships_to
@@ -34,6 +30,7 @@ from .constants.relationship_label import RELATIONSHIP_TO_NODE_LABEL, RELATIONSH
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
     from infrahub.core.node import Node
+    from infrahub.core.query import QueryResult
     from infrahub.core.schema import AttributeSchema
     from infrahub.database import InfrahubDatabase
 
@@ -75,6 +72,88 @@ class AttributeCreateData(BaseModel):
     node_type: AttributeDBNodeType = AttributeDBNodeType.DEFAULT
 
 
+class AttributeUpdateData(BaseModel):
+    """Changes to write for an existing attribute, only the properties that have been modified are defined."""
+
+    uuid: str
+    branch: str
+    branch_level: int
+    node_type: AttributeDBNodeType = AttributeDBNodeType.DEFAULT
+    content: Optional[dict[str, Any]] = None
+    flag_properties: dict[str, bool] = Field(default_factory=dict)
+    node_properties: dict[str, str] = Field(default_factory=dict)
+    rel_ids_to_close: list[str] = Field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return self.content is not None or bool(self.flag_properties) or bool(self.node_properties)
+
+
+async def update_attributes(
+    db: InfrahubDatabase, node: Node, attributes: Sequence[BaseAttribute], at: Optional[Timestamp] = None
+) -> bool:
+    """Update multiple attributes of the same node in the database.
+
+    The current version of all the attributes is retrieved with one query
+    and the changes are written with another one, only if some changes are needed.
+    """
+    return await update_nodes_attributes(db=db, branch=node._branch, attributes=attributes, at=at)
+
+
+async def update_nodes_attributes(
+    db: InfrahubDatabase, branch: Branch, attributes: Sequence[BaseAttribute], at: Optional[Timestamp] = None
+) -> bool:
+    """Update multiple attributes of one or multiple nodes of the same branch in the database.
+
+    The current version of all the attributes is retrieved with one query
+    and the changes are written with another one, only if some changes are needed.
+    """
+    update_at = Timestamp(at)
+
+    if not attributes:
+        return False
+
+    for attr in attributes:
+        attr.validate_update()
+
+    node_ids = list(dict.fromkeys(attr.node.id for attr in attributes))
+    query = await NodeListGetAttributeQuery.init(
+        db=db,
+        ids=node_ids,
+        fields={attr.name: True for attr in attributes},
+        branch=branch,
+        at=update_at,
+        include_source=True,
+        include_owner=True,
+    )
+    await query.execute(db=db)
+    current_attributes = query.get_results_by_node_and_attribute_name()
+
+    updates: list[AttributeUpdateData] = []
+    for attr in attributes:
+        node_attributes = current_attributes.get(attr.node.id, {})
+        if attr.name not in node_attributes:
+            raise IndexError(f"Unable to find the result with ID: {attr.node.id} and NAME: {attr.name}")
+        current_attr_data, current_attr_result = node_attributes[attr.name]
+        update_data = attr.get_update_data(current_attr_data=current_attr_data, current_attr_result=current_attr_result)
+        if update_data.has_changes:
+            updates.append(update_data)
+
+    if updates:
+        query = await AttributeUpdateManyQuery.init(db=db, attributes=updates, at=update_at)
+        await query.execute(db=db)
+        query.validate_changes()
+
+        rel_ids_to_close = [rel_id for update_data in updates for rel_id in update_data.rel_ids_to_close]
+        if rel_ids_to_close:
+            await update_relationships_to(rel_ids_to_close, to=update_at, db=db)
+
+    for attr in attributes:
+        attr.mark_as_saved()
+
+    return True
+
+
 class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
     type: Optional[Union[type, tuple[type]]] = None
 
@@ -108,6 +187,7 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         self.is_default = is_default
         self.is_from_profile = is_from_profile
         self.from_pool: Optional[dict] = None
+        self._loaded_state: Optional[tuple] = None
 
         self._init_node_property_mixin(kwargs)
         self._init_flag_property_mixin(kwargs)
@@ -297,6 +377,26 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         if not self.updated_at and data.updated_at:
             self.updated_at = Timestamp(data.updated_at)
 
+        self.mark_as_saved()
+
+    def _get_state(self) -> tuple:
+        value = deepcopy(self.value) if isinstance(self.value, (dict, list)) else self.value
+        flags = tuple(getattr(self, prop_name) for prop_name in self._flag_properties)
+        node_properties = tuple(getattr(self, f"{prop_name}_id") for prop_name in self._node_properties)
+        return (value, self.is_default, self.is_from_profile, flags, node_properties)
+
+    def mark_as_saved(self) -> None:
+        """Record the current state of the attribute as the one present in the database."""
+        self._loaded_state = self._get_state()
+
+    @property
+    def has_changes(self) -> bool:
+        """Indicate if the attribute has been modified since it has been loaded from or saved to the database.
+
+        An attribute that hasn't been loaded from the database is always considered modified.
+        """
+        return self._loaded_state is None or self._loaded_state != self._get_state()
+
     def value_from_db(self, data: AttributeFromDB) -> Any:
         if data.value == NULL_VALUE:
             return None
@@ -317,7 +417,7 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
 
         save_at = Timestamp(at)
 
-        if not self.id or self.is_from_profile:
+        if not self.id or self.is_from_profile or not self.has_changes:
             return False
 
         return await self._update(at=save_at, db=db)
@@ -375,16 +475,12 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         return True
 
     async def _update(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> bool:
-        """Update the attribute in the database.
+        """Update the attribute in the database."""
 
-        Get the current value
-         - If the value is the same, do nothing
-         - If the value is inherited and is different, raise error (for now just ignore)
-         - If the value is different, create new node and update relationship
+        return await update_attributes(db=db, node=self.node, attributes=[self], at=at)
 
-        """
-
-        update_at = Timestamp(at)
+    def validate_update(self) -> None:
+        """Validate the attribute before an update and check if the current value is still the default one."""
 
         # Validate if the value is still correct, will raise a ValidationError if not
         self.validate(value=self.value, name=self.name, schema=self.schema)
@@ -397,30 +493,28 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
         ):
             self.is_default = False
 
-        query = await NodeListGetAttributeQuery.init(
-            db=db,
-            ids=[self.node.id],
-            fields={self.name: True},
-            branch=self.branch,
-            at=update_at,
-            include_source=True,
-            include_owner=True,
-        )
-        await query.execute(db=db)
-        current_attr_data, current_attr_result = query.get_result_by_id_and_name(self.node.id, self.name)
+    def get_update_data(
+        self, current_attr_data: AttributeFromDB, current_attr_result: QueryResult
+    ) -> AttributeUpdateData:
+        """Compare the attribute with its current version in the database and return the changes to write.
 
+        Get the current value
+         - If the value is the same, do nothing
+         - If the value is inherited and is different, raise error (for now just ignore)
+         - If the value is different, create new node and update relationship
+        """
         branch = self.get_branch_based_on_support_type()
+        update_data = AttributeUpdateData(uuid=self.id, branch=branch.name, branch_level=branch.hierarchy_level)
 
         # ---------- Update the Value ----------
-        if current_attr_data.content != self.to_db():
-            # Create the new AttributeValue and update the existing relationship
-            query = await AttributeUpdateValueQuery.init(db=db, attr=self, at=update_at)
-            await query.execute(db=db)
+        content = self.to_db()
+        if current_attr_data.content != content:
+            update_data.content = content
+            update_data.node_type = self.get_db_node_type()
 
-            # TODO check that everything went well
             rel = current_attr_result.get_rel("r2")
             if rel.get("branch") == branch.name:
-                await update_relationships_to([rel.element_id], to=update_at, db=db)
+                update_data.rel_ids_to_close.append(rel.element_id)
 
         # ---------- Update the Flags ----------
         SUPPORTED_FLAGS = (
@@ -430,12 +524,11 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
 
         for flag_name, _, rel_name in SUPPORTED_FLAGS:
             if current_attr_data.flag_properties[flag_name] != getattr(self, flag_name):
-                query = await AttributeUpdateFlagQuery.init(db=db, attr=self, at=update_at, flag_name=flag_name)
-                await query.execute(db=db)
+                update_data.flag_properties[flag_name] = getattr(self, flag_name)
 
                 rel = current_attr_result.get(rel_name)
                 if rel.get("branch") == branch.name:
-                    await update_relationships_to([rel.element_id], to=update_at, db=db)
+                    update_data.rel_ids_to_close.append(rel.element_id)
 
         # ---------- Update the Node Properties ----------
         for prop_name in self._node_properties:
@@ -443,16 +536,13 @@ class BaseAttribute(FlagPropertyMixin, NodePropertyMixin):
                 prop_name in current_attr_data.node_properties
                 and current_attr_data.node_properties[prop_name].uuid == getattr(self, f"{prop_name}_id")
             ):
-                query = await AttributeUpdateNodePropertyQuery.init(
-                    db=db, attr=self, at=update_at, prop_name=prop_name, prop_id=getattr(self, f"{prop_name}_id")
-                )
-                await query.execute(db=db)
+                update_data.node_properties[prop_name] = str(getattr(self, f"{prop_name}_id"))
 
                 rel = current_attr_result.get(f"rel_{prop_name}")
                 if rel and rel.get("branch") == branch.name:
-                    await update_relationships_to([rel.element_id], to=update_at, db=db)
+                    update_data.rel_ids_to_close.append(rel.element_id)
 
-        return True
+        return update_data
 
     async def to_graphql(
         self,
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Optional, Union
 
 from pydantic import Field, field_validator
 
+from infrahub.core.cache_sync import invalidate_branch_caches
 from infrahub.core.constants import (
     GLOBAL_BRANCH_NAME,
 )
@@ -12,17 +13,22 @@ from infrahub.core.models import SchemaBranchHash  # noqa: TCH001
 from infrahub.core.node.standard import StandardNode
 from infrahub.core.query.branch import (
     DeleteBranchRelationshipsQuery,
-    GetAllBranchInternalRelationshipQuery,
+    RebaseBranchCountRelationshipsQuery,
     RebaseBranchDeleteRelationshipQuery,
     RebaseBranchUpdateRelationshipQuery,
 )
 from infrahub.core.registry import registry
 from infrahub.core.timestamp import Timestamp
+from infrahub.database.constants import DatabaseType
 from infrahub.exceptions import BranchNotFoundError, InitializationError, ValidationError
 
 if TYPE_CHECKING:
+    from infrahub.core.task.user_task import UserTask
     from infrahub.database import InfrahubDatabase
 
+# Maximum number of edges updated or deleted in a single transaction during a rebase
+REBASE_BATCH_SIZE = 10_000
+
 
 class Branch(StandardNode):  # pylint: disable=too-many-public-methods
     name: str = Field(
@@ -250,6 +256,17 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
         await super().delete(db=db)
         query = await DeleteBranchRelationshipsQuery.init(db=db, branch_name=self.name)
         await query.execute(db=db)
+        invalidate_branch_caches(branch_name=self.name)
+
+    @staticmethod
+    def _get_time_filter(rel: str, idx: int) -> str:
+        """Return the filter for the edges of a group of branches that are active at the time of this group.
+
+        The branch and the start time are compared first, a single predicate per group of branches
+        lets the database use the range indexes on these properties.
+        The times are compared on the integer `from_ts` and `to_ts` properties of the edges.
+        """
+        return f"({rel}.branch IN $branch{idx} AND {rel}.from_ts <= $time{idx} AND ({rel}.to_ts IS NULL OR {rel}.to_ts >= $time{idx}))"
 
     def get_query_filter_relationships(
         self, rel_labels: list, at: Optional[Union[Timestamp, str]] = None, include_outside_parentheses: bool = False
@@ -269,17 +286,10 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
 
         for idx, (branch_name, time_to_query) in enumerate(branches_times.items()):
             params[f"branch{idx}"] = list(branch_name)
-            params[f"time{idx}"] = time_to_query
+            params[f"time{idx}"] = Timestamp(time_to_query).to_epoch_microseconds()
 
         for rel in rel_labels:
-            filters_per_rel = []
-            for idx, (branch_name, time_to_query) in enumerate(branches_times.items()):
-                filters_per_rel.append(
-                    f"({rel}.branch IN $branch{idx} AND {rel}.from <= $time{idx} AND {rel}.to IS NULL)"
-                )
-                filters_per_rel.append(
-                    f"({rel}.branch IN $branch{idx} AND {rel}.from <= $time{idx} AND {rel}.to >= $time{idx})"
-                )
+            filters_per_rel = [self._get_time_filter(rel=rel, idx=idx) for idx in range(len(branches_times))]
 
             if not include_outside_parentheses:
                 filters.append("\n OR ".join(filters_per_rel))
@@ -306,20 +316,17 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
         at = Timestamp(at)
         at_str = at.to_string()
         if branch_agnostic:
-            filter_str = "r.from <= $time1 AND (r.to IS NULL or r.to >= $time1)"
-            params["time1"] = at_str
+            filter_str = "r.from_ts <= $time1 AND (r.to_ts IS NULL or r.to_ts >= $time1)"
+            params["time1"] = at.to_epoch_microseconds()
             return filter_str, params
 
         branches_times = self.get_branches_and_times_to_query_global(at=at_str, is_isolated=is_isolated)
 
         for idx, (branch_name, time_to_query) in enumerate(branches_times.items()):
             params[f"branch{idx}"] = list(branch_name)
-            params[f"time{idx}"] = time_to_query
+            params[f"time{idx}"] = Timestamp(time_to_query).to_epoch_microseconds()
 
-        filters = []
-        for idx, (branch_name, time_to_query) in enumerate(branches_times.items()):
-            filters.append(f"(r.branch IN $branch{idx} AND r.from <= $time{idx} AND r.to IS NULL)")
-            filters.append(f"(r.branch IN $branch{idx} AND r.from <= $time{idx} AND r.to >= $time{idx})")
+        filters = [self._get_time_filter(rel="r", idx=idx) for idx in range(len(branches_times))]
 
         filter_str = "(" + "\n OR ".join(filters) + ")"
 
@@ -352,13 +359,13 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
             branches_times = self.get_branches_and_times_to_query(at=start_time)
 
         params["branches"] = list({branch for branches in branches_times for branch in branches})
-        params["start_time"] = start_time.to_string()
-        params["end_time"] = end_time.to_string()
+        params["start_time"] = start_time.to_epoch_microseconds()
+        params["end_time"] = end_time.to_epoch_microseconds()
 
         for rel in rel_labels:
+            # An edge without an end time is always covered by the first condition
             filters_per_rel = [
-                f"({rel}.branch IN $branches AND {rel}.from <= $end_time AND {rel}.to IS NULL)",
-                f"({rel}.branch IN $branches AND ({rel}.from <= $end_time OR ({rel}.to >= $start_time AND {rel}.to <= $end_time)))",
+                f"({rel}.branch IN $branches AND ({rel}.from_ts <= $end_time OR ({rel}.to_ts >= $start_time AND {rel}.to_ts <= $end_time)))",
             ]
 
             if not include_outside_parentheses:
@@ -388,8 +395,8 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
 
         for idx, branch_name in enumerate(start_times.keys()):
             params[f"branch{idx}"] = branch_name
-            params[f"start_time{idx}"] = start_times[branch_name]
-            params[f"end_time{idx}"] = end_times[branch_name]
+            params[f"start_time{idx}"] = Timestamp(start_times[branch_name]).to_epoch_microseconds()
+            params[f"end_time{idx}"] = Timestamp(end_times[branch_name]).to_epoch_microseconds()
 
         for rel in rel_labels:
             filters_per_rel = []
@@ -397,11 +404,11 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
                 filters_per_rel.extend(
                     [
                         f"""({rel}.branch = $branch{idx}
-                             AND {rel}.from >= $start_time{idx}
-                             AND {rel}.from <= $end_time{idx}
-                             AND ( r2.to is NULL or r2.to >= $end_time{idx}))""",
-                        f"""({rel}.branch = $branch{idx} AND {rel}.from >= $start_time{idx}
-                            AND {rel}.to <= $start_time{idx})""",
+                             AND {rel}.from_ts >= $start_time{idx}
+                             AND {rel}.from_ts <= $end_time{idx}
+                             AND ( r2.to_ts is NULL or r2.to_ts >= $end_time{idx}))""",
+                        f"""({rel}.branch = $branch{idx} AND {rel}.from_ts >= $start_time{idx}
+                            AND {rel}.to_ts <= $start_time{idx})""",
                     ]
                 )
 
@@ -422,22 +429,23 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
         end_time = Timestamp(end_time)
 
         params["branches"] = self.get_branches_in_scope()
-        params["start_time"] = start_time.to_string()
-        params["end_time"] = end_time.to_string()
+        params["start_time"] = start_time.to_epoch_microseconds()
+        params["end_time"] = end_time.to_epoch_microseconds()
 
+        # An edge without an end time created within the range is always covered by the first condition
         filters_per_rel = [
-            f"""({rel_label}.branch IN $branches AND {rel_label}.from >= $start_time
-                 AND {rel_label}.from <= $end_time AND {rel_label}.to IS NULL)""",
-            f"""({rel_label}.branch IN $branches AND (({rel_label}.from >= $start_time
-                 AND {rel_label}.from <= $end_time) OR ({rel_label}.to >= $start_time
-                 AND {rel_label}.to <= $end_time)))""",
+            f"""({rel_label}.branch IN $branches AND (({rel_label}.from_ts >= $start_time
+                 AND {rel_label}.from_ts <= $end_time) OR ({rel_label}.to_ts >= $start_time
+                 AND {rel_label}.to_ts <= $end_time)))""",
         ]
 
         filters.append("(" + "\n OR ".join(filters_per_rel) + ")")
 
         return filters, params
 
-    async def rebase(self, db: InfrahubDatabase, at: Optional[Union[str, Timestamp]] = None) -> None:
+    async def rebase(
+        self, db: InfrahubDatabase, at: Optional[Union[str, Timestamp]] = None, task: Optional[UserTask] = None
+    ) -> None:
         """Rebase the current Branch with its origin branch"""
 
         at = Timestamp(at)
@@ -447,7 +455,7 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
         # Update the from time on all other relationships
         # If conflict is set, ignore the one with Drop
 
-        await self.rebase_graph(db=db, at=at)
+        await self.rebase_graph(db=db, at=at, task=task)
 
         # FIXME, we must ensure that there is no conflict before rebasing a branch
         #   Otherwise we could endup with a complicated situation
@@ -457,46 +465,59 @@ class Branch(StandardNode):  # pylint: disable=too-many-public-methods
         # Update the branch in the registry after the rebase
         registry.branch[self.name] = self
 
-    async def rebase_graph(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> None:
+    async def rebase_graph(
+        self,
+        db: InfrahubDatabase,
+        at: Optional[Timestamp] = None,
+        task: Optional[UserTask] = None,
+        batch_size: int = REBASE_BATCH_SIZE,
+    ) -> None:
+        """Update or delete the edges of the branch in the database, by batches of batch_size edges.
+
+        Outside of a transaction each batch is committed on its own, on Neo4j the batches are executed by the database
+        with a single query. Within a transaction, the batches are all part of this transaction.
+        If a batch fails outside of a transaction, the batches already committed are kept, the edges already moved to
+        `at` are updated again by the next rebase and the remaining edges are processed by it.
+        """
         at = Timestamp(at)
-
-        query = await GetAllBranchInternalRelationshipQuery.init(db=db, branch=self)
-        await query.execute(db=db)
-
-        rels_to_delete = []
-        rels_to_update = []
-        for result in query.get_results():
-            element_id = result.get("r").element_id
-
-            conflict_status = result.get("r").get("conflict", None)
-            if conflict_status and conflict_status == "drop":
-                rels_to_delete.append(element_id)
+        in_transactions = not db.is_transaction and db.db_type == DatabaseType.NEO4J
+
+        count_query = await RebaseBranchCountRelationshipsQuery.init(db=db, branch=self, at=at)
+        await count_query.execute(db=db)
+        nbr_to_update, nbr_to_delete = count_query.get_counts()
+        if task:
+            await task.info(
+                message=f"Rebasing branch {self.name}: {nbr_to_update} relationships to update, {nbr_to_delete} to delete",
+                db=db,
+            )
+
+        for query_class, nbr_rels, action in (
+            (RebaseBranchUpdateRelationshipQuery, nbr_to_update, "updated"),
+            (RebaseBranchDeleteRelationshipQuery, nbr_to_delete, "deleted"),
+        ):
+            if not nbr_rels:
                 continue
 
-            time_to_str = result.get("r").get("to", None)
-            time_from_str = result.get("r").get("from")
-            time_from = Timestamp(time_from_str)
-
-            if not time_to_str and time_from_str and time_from <= at:
-                rels_to_update.append(element_id)
+            if in_transactions:
+                query = await query_class.init(db=db, branch=self, at=at, batch_size=batch_size, in_transactions=True)
+                await query.execute(db=db)
+                if task:
+                    await task.info(message=f"Rebasing branch {self.name}: {nbr_rels} relationships {action}", db=db)
                 continue
 
-            if not time_to_str and time_from_str and time_from > at:
-                rels_to_delete.append(element_id)
-                continue
-
-            time_to = Timestamp(time_to_str)
-            if time_to < at:
-                rels_to_delete.append(element_id)
-                continue
-
-            rels_to_update.append(element_id)
-
-        update_query = await RebaseBranchUpdateRelationshipQuery.init(db=db, ids=rels_to_update, at=at)
-        await update_query.execute(db=db)
-
-        delete_query = await RebaseBranchDeleteRelationshipQuery.init(db=db, ids=rels_to_delete, at=at)
-        await delete_query.execute(db=db)
+            nbr_processed = 0
+            while True:
+                query = await query_class.init(db=db, branch=self, at=at, batch_size=batch_size)
+                await query.execute(db=db)
+                nbr_batch = query.get_nbr_rels()
+                nbr_processed += nbr_batch
+                if task and nbr_batch:
+                    await task.info(
+                        message=f"Rebasing branch {self.name}: {nbr_processed}/{nbr_rels} relationships {action}",
+                        db=db,
+                    )
+                if nbr_batch < batch_size:
+                    break
 
 
 registry.branch_object = Branch
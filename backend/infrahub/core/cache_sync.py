@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import weakref
+from collections import OrderedDict
+from typing import Any, Generic, Iterable, Optional, TypeVar, Union
+
+from infrahub.core.timestamp import Timestamp
+
+# Modifications are loaded again if they have been done up to this number of seconds before the last synchronization
+# to account for the transactions of other workers that were not yet committed when the data was loaded
+SYNC_MARGIN = 60
+
+# Minimum number of seconds between two synchronizations of the same item of a branch cache,
+# the modifications done by other workers within this interval are not visible yet
+SYNC_INTERVAL = 1
+
+# Maximum number of seconds between two full loads of an item synchronized incrementally, the modifications
+# committed more than SYNC_MARGIN seconds after their time are only found by a full load
+FULL_SYNC_INTERVAL = 300
+
+ItemT = TypeVar("ItemT")
+
+_branch_caches: weakref.WeakSet[BranchCache] = weakref.WeakSet()
+_last_local_write: Optional[Timestamp] = None
+
+
+def notify_local_write() -> None:
+    """Record that this worker has modified the database, the items of the branch caches are synchronized on their next use."""
+    global _last_local_write  # pylint: disable=global-statement
+    _last_local_write = Timestamp()
+
+
+def get_sync_since(synced_at: Timestamp, at: Optional[Timestamp] = None) -> Timestamp:
+    """Return the time from which the modifications must be loaded to synchronize an item synchronized at synced_at.
+
+    If provided, the modifications done since `at` are also loaded to find out if the item can be used at this time.
+    """
+    since = synced_at.add_delta(seconds=-SYNC_MARGIN)
+    if at is not None and at < since:
+        return at
+    return since
+
+
+def is_sync_required(synced_at: Timestamp, at: Timestamp) -> bool:
+    """Return whether an item synchronized at synced_at must be synchronized again before being used at `at`.
+
+    The synchronization is skipped for SYNC_INTERVAL seconds, unless this worker has modified the database since then
+    or the item is requested for a time older than its synchronization.
+    """
+    if at < synced_at:
+        return True
+    if _last_local_write is not None and _last_local_write >= synced_at:
+        return True
+    return synced_at < Timestamp().add_delta(seconds=-SYNC_INTERVAL)
+
+
+def is_full_sync_required(full_synced_at: Timestamp) -> bool:
+    """Return whether an item fully loaded at full_synced_at must be loaded again instead of being synchronized."""
+    return full_synced_at < Timestamp().add_delta(seconds=-FULL_SYNC_INTERVAL)
+
+
+def has_changes_after(changes: Iterable[str], at: Timestamp) -> bool:
+    """Return whether one of the times of modification returned by a synchronization is after `at`."""
+    return any(Timestamp(changed_at) > at for changed_at in changes)
+
+
+def invalidate_branch_caches(branch_name: Optional[str] = None) -> None:
+    """Remove the items of a given branch or of all the branches from all the branch caches."""
+    for cache in list(_branch_caches):
+        cache.invalidate(branch_name=branch_name)
+
+
+class BranchCache(Generic[ItemT]):
+    """Base of the in-memory caches of data of the graph whose items belong to a branch.
+
+    The key of an item is either the name of its branch or a tuple starting with the name of its branch.
+    All the branch caches are registered to be invalidated together when a branch is deleted.
+    If max_size is set, the least recently used items are removed when the cache is full.
+    """
+
+    def __init__(self) -> None:
+        self._items: OrderedDict[Union[str, tuple[Any, ...]], ItemT] = OrderedDict()
+        _branch_caches.add(self)
+
+    @property
+    def max_size(self) -> Optional[int]:
+        return None
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @staticmethod
+    def _get_branch_name(key: Union[str, tuple[Any, ...]]) -> str:
+        return key if isinstance(key, str) else key[0]
+
+    def _get_item(self, key: Union[str, tuple[Any, ...]]) -> Optional[ItemT]:
+        item = self._items.get(key)
+        if item is not None:
+            self._items.move_to_end(key)
+        return item
+
+    def _set_item(self, key: Union[str, tuple[Any, ...]], item: ItemT) -> None:
+        self._items[key] = item
+        self._items.move_to_end(key)
+        if self.max_size is None:
+            return
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def invalidate(self, branch_name: Optional[str] = None) -> None:
+        """Remove the items of a given branch or of all the branches if no branch is provided."""
+        if branch_name is None:
+            self._items.clear()
+            return
+
+        for key in [key for key in self._items if self._get_branch_name(key) == branch_name]:
+            del self._items[key]
@@ -29,6 +29,20 @@ class NodeConstraintRunner:
         for node_constraint in self.node_constraints:
             await node_constraint.check(node, filters=field_filters)
 
+        await self._check_relationships(node=node, field_filters=field_filters)
+
+    async def check_many(self, nodes: list[Node], field_filters: Optional[list[str]] = None) -> None:
+        """Validate multiple nodes of the same kind, the node constraints are evaluated for all the nodes at once."""
+        for node in nodes:
+            await node.resolve_relationships(db=self.db)
+
+        for node_constraint in self.node_constraints:
+            await node_constraint.check_many(nodes, filters=field_filters)
+
+        for node in nodes:
+            await self._check_relationships(node=node, field_filters=field_filters)
+
+    async def _check_relationships(self, node: Node, field_filters: Optional[list[str]] = None) -> None:
         for relationship_name in node.get_schema().relationship_names:
             if field_filters and relationship_name not in field_filters:
                 continue
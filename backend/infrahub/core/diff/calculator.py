@@ -1,17 +1,39 @@
 from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.diff.query_parser import DiffQueryParser
-from infrahub.core.query.diff import DiffAllPathsQuery
+from infrahub.core.query.diff import DiffAllPathsQuery, DiffNodeUuidBoundariesQuery
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 
-from .model.path import CalculatedDiffs, NodeFieldSpecifier
+from .model.path import CalculatedDiffs, NodeFieldSpecifier, NodeUuidRange
 
 
 class DiffCalculator:
+    NODE_CHUNK_SIZE: int = 10000
+
     def __init__(self, db: InfrahubDatabase) -> None:
         self.db = db
 
+    async def get_node_uuid_ranges(
+        self, diff_branch: Branch, from_time: Timestamp, to_time: Timestamp, chunk_size: int | None = None
+    ) -> list[NodeUuidRange]:
+        """Split the nodes in ranges of UUIDs that can be calculated one after the other.
+
+        A range covers at most chunk_size nodes modified on the diff branch within the timeframe, the diff of the
+        base branch only includes these nodes, so the memory used to calculate the diff of a range doesn't depend on
+        the size of the whole diff.
+        """
+        query = await DiffNodeUuidBoundariesQuery.init(
+            db=self.db,
+            branch=diff_branch,
+            diff_from=from_time,
+            diff_to=to_time,
+            chunk_size=chunk_size or self.NODE_CHUNK_SIZE,
+        )
+        await query.execute(db=self.db)
+        boundaries: list[str | None] = [None, *query.get_boundaries(), None]
+        return [NodeUuidRange(lower=lower, upper=upper) for lower, upper in zip(boundaries[:-1], boundaries[1:])]
+
     async def calculate_diff(
         self,
         base_branch: Branch,
@@ -19,11 +41,13 @@ class DiffCalculator:
         from_time: Timestamp,
         to_time: Timestamp,
         previous_node_specifiers: set[NodeFieldSpecifier] | None = None,
+        node_uuid_range: NodeUuidRange | None = None,
     ) -> CalculatedDiffs:
         if diff_branch.name == registry.default_branch:
             diff_branch_from_time = from_time
         else:
             diff_branch_from_time = Timestamp(diff_branch.get_branched_from())
+        node_uuid_range = node_uuid_range or NodeUuidRange()
         diff_parser = DiffQueryParser(
             base_branch=base_branch,
             diff_branch=diff_branch,
@@ -38,15 +62,17 @@ class DiffCalculator:
             diff_branch_from_time=diff_branch_from_time,
             diff_from=from_time,
             diff_to=to_time,
+            node_uuid_range=(node_uuid_range.lower, node_uuid_range.upper),
         )
-        await branch_diff_query.execute(db=self.db)
-        for query_result in branch_diff_query.get_results():
-            diff_parser.read_result(query_result=query_result)
+        await diff_parser.read_results(query_results=branch_diff_query.stream(db=self.db))
 
         if base_branch.name != diff_branch.name:
             branch_node_specifiers = diff_parser.get_node_field_specifiers_for_branch(branch_name=diff_branch.name)
-            new_node_field_specifiers = branch_node_specifiers - (previous_node_specifiers or set())
-            current_node_field_specifiers = (previous_node_specifiers or set()) - new_node_field_specifiers
+            previous_node_specifiers = {
+                nfs for nfs in previous_node_specifiers or set() if node_uuid_range.contains(nfs.node_uuid)
+            }
+            new_node_field_specifiers = branch_node_specifiers - previous_node_specifiers
+            current_node_field_specifiers = previous_node_specifiers - new_node_field_specifiers
             base_diff_query = await DiffAllPathsQuery.init(
                 db=self.db,
                 branch=base_branch,
@@ -58,10 +84,9 @@ class DiffCalculator:
                     (nfs.node_uuid, nfs.field_name) for nfs in current_node_field_specifiers
                 ],
                 new_node_field_specifiers=[(nfs.node_uuid, nfs.field_name) for nfs in new_node_field_specifiers],
+                node_uuid_range=(node_uuid_range.lower, node_uuid_range.upper),
             )
-            await base_diff_query.execute(db=self.db)
-            for query_result in base_diff_query.get_results():
-                diff_parser.read_result(query_result=query_result)
+            await diff_parser.read_results(query_results=base_diff_query.stream(db=self.db))
 
         diff_parser.parse()
         return CalculatedDiffs(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING
 
 from infrahub import lock
@@ -10,10 +11,14 @@ from infrahub.log import get_logger
 
 from .model.path import (
     BranchTrackingId,
+    EnrichedDiffConflict,
+    EnrichedDiffNode,
     EnrichedDiffRoot,
     EnrichedDiffs,
+    EnrichedNodeLinkRequest,
     NameTrackingId,
     NodeFieldSpecifier,
+    NodeUuidRange,
     TimeRange,
     TrackingId,
 )
@@ -30,6 +35,7 @@ if TYPE_CHECKING:
     from .enricher.aggregated import AggregatedDiffEnricher
     from .enricher.labels import DiffLabelsEnricher
     from .enricher.summary_counts import DiffSummaryCountsEnricher
+    from .model.diff import DataConflict
     from .repository.repository import DiffRepository
 
 
@@ -45,6 +51,110 @@ class EnrichedDiffRequest:
     node_field_specifiers: set[NodeFieldSpecifier] = field(default_factory=set)
 
 
+@dataclass
+class ChunkedEnrichedDiffs:
+    """Diffs saved one range of node UUIDs at a time.
+
+    Only the summary of the roots, the UUIDs of the saved nodes and the conflicts are kept from one chunk to the next.
+    The hierarchy enricher adds the unchanged parents of the nodes to each chunk, a parent is saved with the first
+    chunk that includes it unless its UUID is in a later range. In that case it's saved with its own range if it
+    has been modified, otherwise at the end with the links to it.
+    """
+
+    diffs: EnrichedDiffs
+    saved_node_uuids: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+    deferred_nodes: dict[str, dict[str, EnrichedDiffNode]] = field(default_factory=lambda: defaultdict(dict))
+    deferred_links: list[EnrichedNodeLinkRequest] = field(default_factory=list)
+    enriched_conflicts: list[EnrichedDiffConflict] = field(default_factory=list)
+    data_conflicts: list[DataConflict] = field(default_factory=list)
+
+    @classmethod
+    def from_first_chunk(cls, enriched_diffs: EnrichedDiffs) -> ChunkedEnrichedDiffs:
+        diff_roots = []
+        for diff_root in (enriched_diffs.base_branch_diff, enriched_diffs.diff_branch_diff):
+            empty_root = replace(diff_root, nodes=set())
+            empty_root.reset_summaries()
+            diff_roots.append(empty_root)
+        return cls(
+            diffs=EnrichedDiffs(
+                base_branch_name=enriched_diffs.base_branch_name,
+                diff_branch_name=enriched_diffs.diff_branch_name,
+                base_branch_diff=diff_roots[0],
+                diff_branch_diff=diff_roots[1],
+            )
+        )
+
+    def add_chunk(self, enriched_diffs: EnrichedDiffs, node_uuid_range: NodeUuidRange) -> None:
+        """Move a chunk under the roots of the diffs and remove the nodes that must not be saved with it"""
+        for chunk_root, diff_root in (
+            (enriched_diffs.base_branch_diff, self.diffs.base_branch_diff),
+            (enriched_diffs.diff_branch_diff, self.diffs.diff_branch_diff),
+        ):
+            chunk_root.uuid = diff_root.uuid
+            chunk_root.partner_uuid = diff_root.partner_uuid
+
+            diff_root.num_added += chunk_root.num_added
+            diff_root.num_updated += chunk_root.num_updated
+            diff_root.num_removed += chunk_root.num_removed
+            diff_root.num_conflicts += chunk_root.num_conflicts
+            diff_root.contains_conflict |= chunk_root.contains_conflict
+            # The root is saved with the summary of all the chunks so far
+            chunk_root.num_added = diff_root.num_added
+            chunk_root.num_updated = diff_root.num_updated
+            chunk_root.num_removed = diff_root.num_removed
+            chunk_root.num_conflicts = diff_root.num_conflicts
+            chunk_root.contains_conflict = diff_root.contains_conflict
+
+            self._select_nodes(chunk_root=chunk_root, node_uuid_range=node_uuid_range)
+
+    def _select_nodes(self, chunk_root: EnrichedDiffRoot, node_uuid_range: NodeUuidRange) -> None:
+        saved_node_uuids = self.saved_node_uuids[chunk_root.uuid]
+        deferred_nodes = self.deferred_nodes[chunk_root.uuid]
+        for node in list(chunk_root.nodes):
+            if node_uuid_range.contains(node.uuid):
+                deferred_nodes.pop(node.uuid, None)
+            # The nodes outside of the range are unchanged parents
+            elif node.uuid in saved_node_uuids:
+                chunk_root.nodes.remove(node)
+                continue
+            elif node_uuid_range.is_before(node.uuid):
+                chunk_root.nodes.remove(node)
+                deferred_nodes.setdefault(node.uuid, node)
+                continue
+            saved_node_uuids.add(node.uuid)
+
+        for node in chunk_root.nodes:
+            for relationship in node.relationships:
+                for child_node in relationship.nodes:
+                    if child_node.uuid not in saved_node_uuids:
+                        self.deferred_links.append(
+                            EnrichedNodeLinkRequest(
+                                root_uuid=chunk_root.uuid,
+                                parent_uuid=node.uuid,
+                                relationship_name=relationship.name,
+                                child_uuid=child_node.uuid,
+                            )
+                        )
+
+    def get_deferred_diffs(self) -> EnrichedDiffs:
+        """Return the roots with the deferred parents that have not been saved with their own range"""
+        diff_roots = []
+        for diff_root in (self.diffs.base_branch_diff, self.diffs.diff_branch_diff):
+            saved_node_uuids = self.saved_node_uuids[diff_root.uuid]
+            nodes = {
+                node
+                for node_uuid, node in self.deferred_nodes[diff_root.uuid].items()
+                if node_uuid not in saved_node_uuids
+            }
+            diff_roots.append(replace(diff_root, nodes=nodes))
+        return EnrichedDiffs(
+            base_branch_name=self.diffs.base_branch_name,
+            diff_branch_name=self.diffs.diff_branch_name,
+            base_branch_diff=diff_roots[0],
+            diff_branch_diff=diff_roots[1],
+        )
+
+
 class DiffCoordinator:
     lock_namespace = "diff-update"
 
@@ -131,19 +241,15 @@ class DiffCoordinator:
             self.lock_registry.get(name=incremental_lock_name, namespace=self.lock_namespace),
         ):
             log.debug(f"Acquired lock to run branch diff update for {base_branch.name} - {diff_branch.name}")
-            enriched_diffs = await self._update_diffs(
+            diff_branch_diff = await self._update_diffs(
                 base_branch=base_branch,
                 diff_branch=diff_branch,
                 from_time=from_time,
                 to_time=to_time,
                 tracking_id=tracking_id,
             )
-            await self.summary_counts_enricher.enrich(enriched_diff_root=enriched_diffs.base_branch_diff)
-            await self.summary_counts_enricher.enrich(enriched_diff_root=enriched_diffs.diff_branch_diff)
-            await self.diff_repo.save(enriched_diffs=enriched_diffs)
-            await self._update_core_data_checks(enriched_diff=enriched_diffs.diff_branch_diff)
             log.debug(f"Branch diff update complete for {base_branch.name} - {diff_branch.name}")
-        return enriched_diffs.diff_branch_diff
+        return diff_branch_diff
 
     async def create_or_update_arbitrary_timeframe_diff(
         self,
@@ -161,19 +267,15 @@ class DiffCoordinator:
         )
         async with self.lock_registry.get(name=general_lock_name, namespace=self.lock_namespace):
             log.debug(f"Acquired lock to run arbitrary diff update for {base_branch.name} - {diff_branch.name}")
-            enriched_diffs = await self._update_diffs(
+            diff_branch_diff = await self._update_diffs(
                 base_branch=base_branch,
                 diff_branch=diff_branch,
                 from_time=from_time,
                 to_time=to_time,
                 tracking_id=tracking_id,
             )
-            await self.summary_counts_enricher.enrich(enriched_diff_root=enriched_diffs.base_branch_diff)
-            await self.summary_counts_enricher.enrich(enriched_diff_root=enriched_diffs.diff_branch_diff)
-            await self.diff_repo.save(enriched_diffs=enriched_diffs)
-            await self._update_core_data_checks(enriched_diff=enriched_diffs.diff_branch_diff)
             log.debug(f"Arbitrary diff update complete for {base_branch.name} - {diff_branch.name}")
-        return enriched_diffs.diff_branch_diff
+        return diff_branch_diff
 
     async def recalculate(
         self,
@@ -198,26 +300,17 @@ class DiffCoordinator:
             from_time = current_branch_diff.from_time
             branched_from_time = Timestamp(diff_branch.get_branched_from())
             from_time = max(from_time, branched_from_time)
-            enriched_diffs = await self._update_diffs(
+            diff_branch_diff = await self._update_diffs(
                 base_branch=base_branch,
                 diff_branch=diff_branch,
                 from_time=branched_from_time,
                 to_time=to_time,
                 tracking_id=current_branch_diff.tracking_id,
                 force_branch_refresh=True,
+                earlier_branch_diff=current_branch_diff,
             )
-
-            if current_branch_diff:
-                await self.conflict_transferer.transfer(
-                    earlier=current_branch_diff, later=enriched_diffs.diff_branch_diff
-                )
-
-            await self.summary_counts_enricher.enrich(enriched_diff_root=enriched_diffs.base_branch_diff)
-            await self.summary_counts_enricher.enrich(enriched_diff_root=enriched_diffs.diff_branch_diff)
-            await self.diff_repo.save(enriched_diffs=enriched_diffs)
-            await self._update_core_data_checks(enriched_diff=enriched_diffs.diff_branch_diff)
             log.debug(f"Diff recalculation complete for {base_branch.name} - {diff_branch.name}")
-        return enriched_diffs.diff_branch_diff
+        return diff_branch_diff
 
     async def _update_diffs(
         self,
@@ -227,7 +320,8 @@ class DiffCoordinator:
         to_time: Timestamp,
         tracking_id: TrackingId | None = None,
         force_branch_refresh: bool = False,
-    ) -> EnrichedDiffs:
+        earlier_branch_diff: EnrichedDiffRoot | None = None,
+    ) -> EnrichedDiffRoot:
         diff_uuids_to_delete = []
         retrieved_enriched_diffs = await self.diff_repo.get_pairs(
             base_branch_name=base_branch.name,
@@ -241,30 +335,106 @@ class DiffCoordinator:
                     diff_uuids_to_delete.append(enriched_diffs.base_branch_diff.uuid)
                 if enriched_diffs.diff_branch_diff.tracking_id:
                     diff_uuids_to_delete.append(enriched_diffs.diff_branch_diff.uuid)
+        diff_request = EnrichedDiffRequest(
+            base_branch=base_branch,
+            diff_branch=diff_branch,
+            from_time=from_time,
+            to_time=to_time,
+        )
+        partial_enriched_diffs = retrieved_enriched_diffs if not force_branch_refresh else []
+
+        # The diffs are combined in memory with the partial diffs, without them the diffs are calculated by chunks
+        if not partial_enriched_diffs:
+            node_uuid_ranges = await self.diff_calculator.get_node_uuid_ranges(
+                diff_branch=diff_branch, from_time=from_time, to_time=to_time
+            )
+            if len(node_uuid_ranges) > 1:
+                return await self._update_diffs_by_chunk(
+                    diff_request=diff_request,
+                    node_uuid_ranges=node_uuid_ranges,
+                    tracking_id=tracking_id,
+                    earlier_branch_diff=earlier_branch_diff,
+                    diff_uuids_to_delete=diff_uuids_to_delete,
+                )
+
         aggregated_enriched_diffs = await self._get_aggregated_enriched_diffs(
-            diff_request=EnrichedDiffRequest(
-                base_branch=base_branch,
-                diff_branch=diff_branch,
-                from_time=from_time,
-                to_time=to_time,
-            ),
-            partial_enriched_diffs=retrieved_enriched_diffs if not force_branch_refresh else [],
+            diff_request=diff_request, partial_enriched_diffs=partial_enriched_diffs
+        )
+        await self._prepare_diffs_for_save(
+            enriched_diffs=aggregated_enriched_diffs, tracking_id=tracking_id, earlier_branch_diff=earlier_branch_diff
         )
+        if diff_uuids_to_delete:
+            await self.diff_repo.delete_diff_roots(diff_root_uuids=diff_uuids_to_delete)
+        await self.diff_repo.save(enriched_diffs=aggregated_enriched_diffs)
+        await self._update_core_data_checks(enriched_diff=aggregated_enriched_diffs.diff_branch_diff)
+        return aggregated_enriched_diffs.diff_branch_diff
 
-        await self.conflicts_enricher.add_conflicts_to_branch_diff(
-            base_diff_root=aggregated_enriched_diffs.base_branch_diff,
-            branch_diff_root=aggregated_enriched_diffs.diff_branch_diff,
+    async def _update_diffs_by_chunk(
+        self,
+        diff_request: EnrichedDiffRequest,
+        node_uuid_ranges: list[NodeUuidRange],
+        tracking_id: TrackingId | None,
+        earlier_branch_diff: EnrichedDiffRoot | None,
+        diff_uuids_to_delete: list[str],
+    ) -> EnrichedDiffRoot:
+        """Calculate, enrich and save the diffs one range of node UUIDs after the other.
+
+        The memory used depends on the size of the ranges instead of the size of the diffs, the returned root only
+        includes the summary of the diff.
+        """
+        chunked_diffs: ChunkedEnrichedDiffs | None = None
+        for node_uuid_range in node_uuid_ranges:
+            enriched_diffs = await self._get_enriched_diff(diff_request=diff_request, node_uuid_range=node_uuid_range)
+            await self._prepare_diffs_for_save(
+                enriched_diffs=enriched_diffs, tracking_id=tracking_id, earlier_branch_diff=earlier_branch_diff
+            )
+            if chunked_diffs is None:
+                chunked_diffs = ChunkedEnrichedDiffs.from_first_chunk(enriched_diffs=enriched_diffs)
+                if diff_uuids_to_delete:
+                    await self.diff_repo.delete_diff_roots(diff_root_uuids=diff_uuids_to_delete)
+            chunked_diffs.add_chunk(enriched_diffs=enriched_diffs, node_uuid_range=node_uuid_range)
+            if not enriched_diffs.base_branch_diff.nodes and not enriched_diffs.diff_branch_diff.nodes:
+                continue
+
+            chunked_diffs.enriched_conflicts.extend(enriched_diffs.diff_branch_diff.get_all_conflicts())
+            chunked_diffs.data_conflicts.extend(
+                await self.data_check_synchronizer.get_data_conflicts(enriched_diff=enriched_diffs.diff_branch_diff)
+            )
+            await self.diff_repo.save(enriched_diffs=enriched_diffs)
+
+        if chunked_diffs is None:
+            raise ValueError("At least one range of node UUIDs is required to calculate a diff")
+
+        await self.diff_repo.save(
+            enriched_diffs=chunked_diffs.get_deferred_diffs(), node_link_requests=chunked_diffs.deferred_links
         )
-        await self.labels_enricher.enrich(
-            enriched_diff_root=aggregated_enriched_diffs.diff_branch_diff, conflicts_only=True
+        await self.data_check_synchronizer.synchronize_conflicts(
+            diff_branch_name=chunked_diffs.diffs.diff_branch_name,
+            enriched_conflicts=chunked_diffs.enriched_conflicts,
+            data_conflicts=chunked_diffs.data_conflicts,
+        )
+        return chunked_diffs.diffs.diff_branch_diff
+
+    async def _prepare_diffs_for_save(
+        self,
+        enriched_diffs: EnrichedDiffs,
+        tracking_id: TrackingId | None = None,
+        earlier_branch_diff: EnrichedDiffRoot | None = None,
+    ) -> None:
+        await self.conflicts_enricher.add_conflicts_to_branch_diff(
+            base_diff_root=enriched_diffs.base_branch_diff,
+            branch_diff_root=enriched_diffs.diff_branch_diff,
         )
+        await self.labels_enricher.enrich(enriched_diff_root=enriched_diffs.diff_branch_diff, conflicts_only=True)
 
         if tracking_id:
-            aggregated_enriched_diffs.base_branch_diff.tracking_id = tracking_id
-            aggregated_enriched_diffs.diff_branch_diff.tracking_id = tracking_id
-        if diff_uuids_to_delete:
-            await self.diff_repo.delete_diff_roots(diff_root_uuids=diff_uuids_to_delete)
-        return aggregated_enriched_diffs
+            enriched_diffs.base_branch_diff.tracking_id = tracking_id
+            enriched_diffs.diff_branch_diff.tracking_id = tracking_id
+        if earlier_branch_diff:
+            await self.conflict_transferer.transfer(earlier=earlier_branch_diff, later=enriched_diffs.diff_branch_diff)
+
+        await self.summary_counts_enricher.enrich(enriched_diff_root=enriched_diffs.base_branch_diff)
+        await self.summary_counts_enricher.enrich(enriched_diff_root=enriched_diffs.diff_branch_diff)
 
     async def _get_aggregated_enriched_diffs(
         self, diff_request: EnrichedDiffRequest, partial_enriched_diffs: list[EnrichedDiffs]
@@ -311,13 +481,16 @@ class DiffCoordinator:
     async def _update_core_data_checks(self, enriched_diff: EnrichedDiffRoot) -> list[Node]:
         return await self.data_check_synchronizer.synchronize(enriched_diff=enriched_diff)
 
-    async def _get_enriched_diff(self, diff_request: EnrichedDiffRequest) -> EnrichedDiffs:
+    async def _get_enriched_diff(
+        self, diff_request: EnrichedDiffRequest, node_uuid_range: NodeUuidRange | None = None
+    ) -> EnrichedDiffs:
         calculated_diff_pair = await self.diff_calculator.calculate_diff(
             base_branch=diff_request.base_branch,
             diff_branch=diff_request.diff_branch,
             from_time=diff_request.from_time,
             to_time=diff_request.to_time,
             previous_node_specifiers=diff_request.node_field_specifiers,
+            node_uuid_range=node_uuid_range,
         )
         enriched_diff_pair = await self.diff_enricher.enrich(calculated_diffs=calculated_diff_pair)
         return enriched_diff_pair
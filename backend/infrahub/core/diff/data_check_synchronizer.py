@@ -7,6 +7,7 @@ from infrahub.core.node import Node
 from infrahub.database import InfrahubDatabase
 
 from .conflicts_extractor import DiffConflictsExtractor
+from .model.diff import DataConflict
 from .model.path import ConflictSelection, EnrichedDiffConflict, EnrichedDiffRoot
 
 
@@ -22,15 +23,45 @@ class DiffDataCheckSynchronizer:
         self.conflict_recorder = conflict_recorder
 
     async def synchronize(self, enriched_diff: EnrichedDiffRoot) -> list[Node]:
-        proposed_changes = await NodeManager.query(
-            db=self.db,
-            schema=InfrahubKind.PROPOSEDCHANGE,
-            filters={"source_branch": enriched_diff.diff_branch_name, "state": ProposedChangeState.OPEN},
-        )
+        proposed_changes = await self._get_open_proposed_changes(diff_branch_name=enriched_diff.diff_branch_name)
         if not proposed_changes:
             return []
         enriched_conflicts = enriched_diff.get_all_conflicts()
-        data_conflicts = await self.conflicts_extractor.get_data_conflicts(enriched_diff_root=enriched_diff)
+        data_conflicts = await self.get_data_conflicts(enriched_diff=enriched_diff)
+        return await self._record_conflicts(
+            proposed_changes=proposed_changes, enriched_conflicts=enriched_conflicts, data_conflicts=data_conflicts
+        )
+
+    async def synchronize_conflicts(
+        self,
+        diff_branch_name: str,
+        enriched_conflicts: list[EnrichedDiffConflict],
+        data_conflicts: list[DataConflict],
+    ) -> list[Node]:
+        """Synchronize the conflicts of a diff that is not loaded at once, such as a diff saved one chunk at a time"""
+        proposed_changes = await self._get_open_proposed_changes(diff_branch_name=diff_branch_name)
+        if not proposed_changes:
+            return []
+        return await self._record_conflicts(
+            proposed_changes=proposed_changes, enriched_conflicts=enriched_conflicts, data_conflicts=data_conflicts
+        )
+
+    async def get_data_conflicts(self, enriched_diff: EnrichedDiffRoot) -> list[DataConflict]:
+        return await self.conflicts_extractor.get_data_conflicts(enriched_diff_root=enriched_diff)
+
+    async def _get_open_proposed_changes(self, diff_branch_name: str) -> list[Node]:
+        return await NodeManager.query(
+            db=self.db,
+            schema=InfrahubKind.PROPOSEDCHANGE,
+            filters={"source_branch": diff_branch_name, "state": ProposedChangeState.OPEN},
+        )
+
+    async def _record_conflicts(
+        self,
+        proposed_changes: list[Node],
+        enriched_conflicts: list[EnrichedDiffConflict],
+        data_conflicts: list[DataConflict],
+    ) -> list[Node]:
         all_data_checks = []
         for pc in proposed_changes:
             core_data_checks = await self.conflict_recorder.record_conflicts(
@@ -89,6 +89,20 @@ class NodeFieldSpecifier:
         return hash(f"{self.node_uuid}:{self.field_name}")
 
 
+@dataclass(frozen=True)
+class NodeUuidRange:
+    """Range of node UUIDs, the lower bound is included and the upper bound excluded, None means unbounded"""
+
+    lower: str | None = None
+    upper: str | None = None
+
+    def contains(self, node_uuid: str) -> bool:
+        return (self.lower is None or node_uuid >= self.lower) and (self.upper is None or node_uuid < self.upper)
+
+    def is_before(self, node_uuid: str) -> bool:
+        return self.upper is not None and node_uuid >= self.upper
+
+
 @dataclass
 class BaseSummary:
     num_added: int = field(default=0, kw_only=True)
@@ -704,3 +718,11 @@ class DatabasePath:  # pylint: disable=too-many-public-methods
 class EnrichedNodeCreateRequest:
     node: EnrichedDiffNode
     root_uuid: str
+
+
+@dataclass
+class EnrichedNodeLinkRequest:
+    root_uuid: str
+    parent_uuid: str
+    relationship_name: str
+    child_uuid: str
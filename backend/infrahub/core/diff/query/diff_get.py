@@ -30,6 +30,8 @@ class EnrichedDiffGetQuery(Query):
     name = "enriched_diff_get"
     type = QueryType.READ
     insert_limit = False
+    keyset_keys = ["diff_node_uuid"]
+    keyset_strict = True
 
     def __init__(
         self,
@@ -80,7 +82,7 @@ class EnrichedDiffGetQuery(Query):
 
         query_2 = """
         // group by diff node uuid for pagination
-        WITH diff_node.uuid AS diff_node_uuid, diff_node.kind AS diff_node_kind, collect([diff_root, diff_node]) AS node_root_tuples
+        WITH COALESCE(diff_node.uuid, "") AS diff_node_uuid, diff_node.kind AS diff_node_kind, collect([diff_root, diff_node]) AS node_root_tuples
         // order by kind and latest label for each diff_node uuid
         CALL {
             WITH node_root_tuples
@@ -90,15 +92,27 @@ class EnrichedDiffGetQuery(Query):
             RETURN diff_node.label AS latest_node_label
             LIMIT 1
         }
-        WITH diff_node_kind, node_root_tuples, latest_node_label
-        ORDER BY diff_node_kind, latest_node_label
+        WITH diff_node_uuid, diff_node_kind, node_root_tuples, latest_node_label
+        """
+        self.add_to_query(query=query_2)
+        # when reading the complete diff, the nodes are paginated by uuid with a cursor
+        self.add_keyset_filter()
+
+        if self.limit is None and self.offset is None:
+            group_order = "diff_node_uuid"
+        else:
+            group_order = "diff_node_kind, latest_node_label"
+
+        query_3 = """
+        WITH diff_node_uuid, diff_node_kind, node_root_tuples, latest_node_label
+        ORDER BY %(group_order)s
         SKIP COALESCE($offset, 0)
         LIMIT $limit
         UNWIND node_root_tuples AS nrt
-        WITH nrt[0] AS diff_root, nrt[1] AS diff_node
-        WITH diff_root, diff_node
+        WITH diff_node_uuid, nrt[0] AS diff_root, nrt[1] AS diff_node
+        WITH diff_node_uuid, diff_root, diff_node
         // if depth limit, make sure not to exceed it when traversing linked nodes
-        WITH diff_root, diff_node
+        WITH diff_node_uuid, diff_root, diff_node
         // -------------------------------------
         // Retrieve Parents
         // -------------------------------------
@@ -109,12 +123,12 @@ class EnrichedDiffGetQuery(Query):
             ORDER BY size(nodes(parents_path)) DESC
             LIMIT 1
         }
-        WITH diff_root, diff_node, parents_path
+        WITH diff_node_uuid, diff_root, diff_node, parents_path
         // -------------------------------------
         // Retrieve conflicts
         // -------------------------------------
         OPTIONAL MATCH (diff_node)-[:DIFF_HAS_CONFLICT]->(diff_node_conflict:DiffConflict)
-        WITH diff_root, diff_node, parents_path, diff_node_conflict
+        WITH diff_node_uuid, diff_root, diff_node, parents_path, diff_node_conflict
         // -------------------------------------
         // Retrieve Attributes
         // -------------------------------------
@@ -128,7 +142,7 @@ class EnrichedDiffGetQuery(Query):
             RETURN diff_attribute, diff_attr_property, diff_attr_property_conflict
             ORDER BY diff_attribute.name, diff_attr_property.property_type
         }
-        WITH diff_root, diff_node, parents_path, diff_node_conflict, collect([diff_attribute, diff_attr_property, diff_attr_property_conflict]) as diff_attributes
+        WITH diff_node_uuid, diff_root, diff_node, parents_path, diff_node_conflict, collect([diff_attribute, diff_attr_property, diff_attr_property_conflict]) as diff_attributes
         // -------------------------------------
         // Retrieve Relationships
         // -------------------------------------
@@ -148,15 +162,16 @@ class EnrichedDiffGetQuery(Query):
             ORDER BY diff_relationship.name, diff_rel_element.peer_id, diff_rel_property.property_type
         }
         WITH
+            diff_node_uuid,
             diff_root,
             diff_node,
             parents_path,
             diff_node_conflict,
             diff_attributes,
             collect([diff_relationship, diff_rel_element, diff_rel_conflict, diff_rel_property, diff_rel_property_conflict]) AS diff_relationships
-        """ % {"max_depth": self.max_depth * 2}
+        """ % {"max_depth": self.max_depth * 2, "group_order": group_order}
 
-        self.add_to_query(query=query_2)
+        self.add_to_query(query=query_3)
 
         self.return_labels = [
             "diff_root",
@@ -32,6 +32,7 @@ class DiffMergeQuery(Query):
         self.params = {
             "node_diff_dicts": self.node_diff_dicts,
             "at": self.at.to_string(),
+            "at_ts": self.at.to_epoch_microseconds(),
             "branch_level": self.target_branch.hierarchy_level,
             "target_branch": self.target_branch.name,
             "source_branch": self.source_branch_name,
@@ -67,8 +68,8 @@ CALL {
             WITH root, n, node_rel_status
             OPTIONAL MATCH (root)<-[target_r_root:IS_PART_OF {branch: $target_branch, status: "active"}]-(n)
             WHERE node_rel_status = "deleted"
-            AND target_r_root.from <= $at AND target_r_root.to IS NULL
-            SET target_r_root.to = $at
+            AND target_r_root.from_ts <= $at_ts AND target_r_root.to_ts IS NULL
+            SET target_r_root.to = $at, target_r_root.to_ts = $at_ts
         }
         // ------------------------------
         // create new IS_PART_OF relationship on target_branch
@@ -78,12 +79,12 @@ CALL {
             WITH root, n, node_rel_status
             OPTIONAL MATCH (root)<-[r_root:IS_PART_OF {branch: $target_branch}]-(n)
             WHERE r_root.status = node_rel_status
-            AND r_root.from <= $at
-            AND (r_root.to >= $at OR r_root.to IS NULL)
+            AND r_root.from_ts <= $at_ts
+            AND (r_root.to_ts >= $at_ts OR r_root.to_ts IS NULL)
             WITH root, r_root, n, node_rel_status
             WHERE r_root IS NULL
             CREATE (root)
-                <-[:IS_PART_OF { branch: $target_branch, branch_level: $branch_level, from: $at, status: node_rel_status }]
+                <-[:IS_PART_OF { branch: $target_branch, branch_level: $branch_level, from: $at, from_ts: $at_ts, status: node_rel_status }]
                 -(n)
         }
     }
@@ -123,8 +124,8 @@ CALL {
                     -[target_r_attr:HAS_ATTRIBUTE {branch: $target_branch, status: "active"}]
                     ->(a)
                 WHERE attr_rel_status = "deleted"
-                AND target_r_attr.from <= $at AND target_r_attr.to IS NULL
-                SET target_r_attr.to = $at
+                AND target_r_attr.from_ts <= $at_ts AND target_r_attr.to_ts IS NULL
+                SET target_r_attr.to = $at, target_r_attr.to_ts = $at_ts
             }
             WITH n, attr_rel_status, a
             // ------------------------------
@@ -136,11 +137,13 @@ CALL {
                 WHERE a IS NOT NULL
                 OPTIONAL MATCH (n)-[r_attr:HAS_ATTRIBUTE {branch: $target_branch}]->(a)
                 WHERE r_attr.status = attr_rel_status
-                AND r_attr.from <= $at
-                AND (r_attr.to >= $at OR r_attr.to IS NULL)
+                AND r_attr.from_ts <= $at_ts
+                AND (r_attr.to_ts >= $at_ts OR r_attr.to_ts IS NULL)
                 WITH n, r_attr, attr_rel_status, a
                 WHERE r_attr IS NULL
-                CREATE (n)-[:HAS_ATTRIBUTE { branch: $target_branch, branch_level: $branch_level, from: $at, status: attr_rel_status }]->(a)
+                CREATE (n)-[:HAS_ATTRIBUTE {
+                    branch: $target_branch, branch_level: $branch_level, from: $at, from_ts: $at_ts, status: attr_rel_status
+                }]->(a)
             }
             RETURN 1 AS done
         }
@@ -170,8 +173,8 @@ CALL {
                     -(r:Relationship {name: rel_name})
                     -[source_r_rel_2:IS_RELATED {branch: $source_branch}]
                     -(:Node {uuid: rel_peer_id})
-                WHERE source_r_rel_1.from <= $at AND source_r_rel_1.to IS NULL
-                AND source_r_rel_2.from <= $at AND source_r_rel_2.to IS NULL
+                WHERE source_r_rel_1.from_ts <= $at_ts AND source_r_rel_1.to_ts IS NULL
+                AND source_r_rel_2.from_ts <= $at_ts AND source_r_rel_2.to_ts IS NULL
                 RETURN r, CASE
                     WHEN startNode(source_r_rel_1).uuid = n.uuid THEN "r"
                     ELSE "l"
@@ -190,10 +193,10 @@ CALL {
                     -[target_r_rel_2:IS_RELATED {branch: $target_branch, status: "active"}]
                     -(:Node {uuid: rel_peer_id})
                 WHERE related_rel_status = "deleted"
-                AND target_r_rel_1.from <= $at AND target_r_rel_1.to IS NULL
-                AND target_r_rel_2.from <= $at AND target_r_rel_2.to IS NULL
-                SET target_r_rel_1.to = $at
-                SET target_r_rel_2.to = $at
+                AND target_r_rel_1.from_ts <= $at_ts AND target_r_rel_1.to_ts IS NULL
+                AND target_r_rel_2.from_ts <= $at_ts AND target_r_rel_2.to_ts IS NULL
+                SET target_r_rel_1.to = $at, target_r_rel_1.to_ts = $at_ts
+                SET target_r_rel_2.to = $at, target_r_rel_2.to_ts = $at_ts
             }
             WITH n, r, r1_dir, r2_dir, rel_name, rel_peer_id, related_rel_status
             // ------------------------------
@@ -207,10 +210,10 @@ CALL {
                     -(:Relationship {name: rel_name})
                     -[r_rel_2:IS_RELATED {branch: $target_branch, status: related_rel_status}]
                     -(p)
-                WHERE r_rel_1.from <= $at
-                AND (r_rel_1.to >= $at OR r_rel_1.to IS NULL)
-                AND r_rel_2.from <= $at
-                AND (r_rel_2.to >= $at OR r_rel_2.to IS NULL)
+                WHERE r_rel_1.from_ts <= $at_ts
+                AND (r_rel_1.to_ts >= $at_ts OR r_rel_1.to_ts IS NULL)
+                AND r_rel_2.from_ts <= $at_ts
+                AND (r_rel_2.to_ts >= $at_ts OR r_rel_2.to_ts IS NULL)
                 WITH n, r, r1_dir, r2_dir, p, related_rel_status, r_rel_1, r_rel_2
                 WHERE r_rel_1 IS NULL
                 AND r_rel_2 IS NULL
@@ -222,7 +225,7 @@ CALL {
                     WITH n, r, r1_dir, related_rel_status
                     WHERE r1_dir = "r"
                     CREATE (n)
-                        -[:IS_RELATED {branch: $target_branch, branch_level: $branch_level, from: $at, status: related_rel_status}]
+                        -[:IS_RELATED {branch: $target_branch, branch_level: $branch_level, from: $at, from_ts: $at_ts, status: related_rel_status}]
                         ->(r)
                 }
                 CALL {
@@ -230,7 +233,7 @@ CALL {
                     WITH n, r, r1_dir, related_rel_status
                     WHERE r1_dir = "l"
                     CREATE (n)
-                        <-[:IS_RELATED {branch: $target_branch, branch_level: $branch_level, from: $at, status: related_rel_status}]
+                        <-[:IS_RELATED {branch: $target_branch, branch_level: $branch_level, from: $at, from_ts: $at_ts, status: related_rel_status}]
                         -(r)
                 }
                 CALL {
@@ -238,7 +241,7 @@ CALL {
                     WITH r, p, r2_dir, related_rel_status
                     WHERE r2_dir = "r"
                     CREATE (r)
-                        -[:IS_RELATED {branch: $target_branch, branch_level: $branch_level, from: $at, status: related_rel_status}]
+                        -[:IS_RELATED {branch: $target_branch, branch_level: $branch_level, from: $at, from_ts: $at_ts, status: related_rel_status}]
                         ->(p)
                 }
                 CALL {
@@ -246,7 +249,7 @@ CALL {
                     WITH r, p, r2_dir, related_rel_status
                     WHERE r2_dir = "l"
                     CREATE (r)
-                        <-[:IS_RELATED {branch: $target_branch, branch_level: $branch_level, from: $at, status: related_rel_status}]
+                        <-[:IS_RELATED {branch: $target_branch, branch_level: $branch_level, from: $at, from_ts: $at_ts, status: related_rel_status}]
                         -(p)
                 }
             }
@@ -280,6 +283,7 @@ class DiffMergePropertiesQuery(Query):
         self.params = {
             "property_diff_dicts": self.property_diff_dicts,
             "at": self.at.to_string(),
+            "at_ts": self.at.to_epoch_microseconds(),
             "branch_level": self.target_branch.hierarchy_level,
             "target_branch": self.target_branch.name,
             "source_branch": self.source_branch_name,
@@ -374,8 +378,8 @@ CALL {
                 -[target_r_prop {branch: $target_branch}]
                 ->()
             WHERE type(target_r_prop) = prop_type
-            AND target_r_prop.from < $at AND target_r_prop.to IS NULL
-            SET target_r_prop.to = $at
+            AND target_r_prop.from_ts < $at_ts AND target_r_prop.to_ts IS NULL
+            SET target_r_prop.to = $at, target_r_prop.to_ts = $at_ts
         }
         // ------------------------------
         // check for existing edge on target_branch
@@ -385,8 +389,8 @@ CALL {
             OPTIONAL MATCH (attr_rel)-[r_prop {branch: $target_branch}]->(prop_node)
             WHERE type(r_prop) = prop_type
             AND r_prop.status = prop_rel_status
-            AND r_prop.from <= $at
-            AND (r_prop.to >= $at OR r_prop.to IS NULL)
+            AND r_prop.from_ts <= $at_ts
+            AND (r_prop.to_ts >= $at_ts OR r_prop.to_ts IS NULL)
             RETURN r_prop
         }
         WITH attr_rel, prop_rel_status, prop_type, prop_node, r_prop
@@ -399,31 +403,41 @@ CALL {
             WITH attr_rel, prop_rel_status, prop_type, prop_node
             WITH attr_rel, prop_rel_status, prop_type, prop_node
             WHERE prop_type = "HAS_VALUE"
-            CREATE (attr_rel)-[:HAS_VALUE { branch: $target_branch, branch_level: $branch_level, from: $at, status: prop_rel_status }]->(prop_node)
+            CREATE (attr_rel)-[:HAS_VALUE {
+                branch: $target_branch, branch_level: $branch_level, from: $at, from_ts: $at_ts, status: prop_rel_status
+            }]->(prop_node)
         }
         CALL {
             WITH attr_rel, prop_rel_status, prop_type, prop_node
             WITH attr_rel, prop_rel_status, prop_type, prop_node
             WHERE prop_type = "HAS_SOURCE"
-            CREATE (attr_rel)-[:HAS_SOURCE { branch: $target_branch, branch_level: $branch_level, from: $at, status: prop_rel_status }]->(prop_node)
+            CREATE (attr_rel)-[:HAS_SOURCE {
+                branch: $target_branch, branch_level: $branch_level, from: $at, from_ts: $at_ts, status: prop_rel_status
+            }]->(prop_node)
         }
         CALL {
             WITH attr_rel, prop_rel_status, prop_type, prop_node
             WITH attr_rel, prop_rel_status, prop_type, prop_node
             WHERE prop_type = "HAS_OWNER"
-            CREATE (attr_rel)-[:HAS_OWNER { branch: $target_branch, branch_level: $branch_level, from: $at, status: prop_rel_status }]->(prop_node)
+            CREATE (attr_rel)-[:HAS_OWNER {
+                branch: $target_branch, branch_level: $branch_level, from: $at, from_ts: $at_ts, status: prop_rel_status
+            }]->(prop_node)
         }
         CALL {
             WITH attr_rel, prop_rel_status, prop_type, prop_node
             WITH attr_rel, prop_rel_status, prop_type, prop_node
             WHERE prop_type = "IS_VISIBLE"
-            CREATE (attr_rel)-[:IS_VISIBLE { branch: $target_branch, branch_level: $branch_level, from: $at, status: prop_rel_status }]->(prop_node)
+            CREATE (attr_rel)-[:IS_VISIBLE {
+                branch: $target_branch, branch_level: $branch_level, from: $at, from_ts: $at_ts, status: prop_rel_status
+            }]->(prop_node)
         }
         CALL {
             WITH attr_rel, prop_rel_status, prop_type, prop_node
             WITH attr_rel, prop_rel_status, prop_type, prop_node
             WHERE prop_type = "IS_PROTECTED"
-            CREATE (attr_rel)-[:IS_PROTECTED { branch: $target_branch, branch_level: $branch_level, from: $at, status: prop_rel_status }]->(prop_node)
+            CREATE (attr_rel)-[:IS_PROTECTED {
+                branch: $target_branch, branch_level: $branch_level, from: $at, from_ts: $at_ts, status: prop_rel_status
+            }]->(prop_node)
         }
     }
 }
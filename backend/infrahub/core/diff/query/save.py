@@ -12,6 +12,7 @@ from ..model.path import (
     EnrichedDiffs,
     EnrichedDiffSingleRelationship,
     EnrichedNodeCreateRequest,
+    EnrichedNodeLinkRequest,
 )
 
 
@@ -31,19 +32,18 @@ UNWIND $diff_root_list AS diff_root_map
 WITH diff_root_map
 CALL {
     WITH diff_root_map
-    MERGE (diff_root:DiffRoot {
-        base_branch: diff_root_map.base_branch,
-        diff_branch: diff_root_map.diff_branch,
-        from_time: diff_root_map.from_time,
-        to_time: diff_root_map.to_time,
-        uuid: diff_root_map.uuid,
-        num_added: diff_root_map.num_added,
-        num_updated: diff_root_map.num_updated,
-        num_removed: diff_root_map.num_removed,
-        num_conflicts: diff_root_map.num_conflicts,
-        contains_conflict: diff_root_map.contains_conflict
-    })
-    SET diff_root.tracking_id = diff_root_map.tracking_id
+    // a root saved in several chunks is updated with the summary of all the chunks saved so far
+    MERGE (diff_root:DiffRoot {uuid: diff_root_map.uuid})
+    SET diff_root.base_branch = diff_root_map.base_branch,
+        diff_root.diff_branch = diff_root_map.diff_branch,
+        diff_root.from_time = diff_root_map.from_time,
+        diff_root.to_time = diff_root_map.to_time,
+        diff_root.num_added = diff_root_map.num_added,
+        diff_root.num_updated = diff_root_map.num_updated,
+        diff_root.num_removed = diff_root_map.num_removed,
+        diff_root.num_conflicts = diff_root_map.num_conflicts,
+        diff_root.contains_conflict = diff_root_map.contains_conflict,
+        diff_root.tracking_id = diff_root_map.tracking_id
     RETURN diff_root
 }
 WITH DISTINCT diff_root AS diff_root
@@ -84,12 +84,13 @@ class EnrichedNodeBatchCreateQuery(Query):
     type = QueryType.WRITE
     insert_return = False
 
-    def __init__(self, node_create_batch: list[EnrichedNodeCreateRequest], **kwargs: Any) -> None:
+    def __init__(self, node_details_list: list[dict[str, Any]], **kwargs: Any) -> None:
+        """node_details_list is built with build_node_details, the nodes linked to by these nodes must already be saved"""
         super().__init__(**kwargs)
-        self.node_create_batch = node_create_batch
+        self.node_details_list = node_details_list
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
-        self.params = self._build_node_batch_params()
+        self.params = {"node_details_list": self.node_details_list}
         query = """
 UNWIND $node_details_list AS node_details
 WITH node_details.root_uuid AS root_uuid, node_details.node_map AS node_map
@@ -108,7 +109,7 @@ CALL {
     // -------------------------
     // add attributes for this node
     // -------------------------
-    WITH diff_node, node_map
+    WITH diff_root, diff_node, node_map
     CALL {
         WITH diff_node, node_map
         UNWIND node_map.attributes AS node_attribute
@@ -132,13 +133,23 @@ CALL {
     // -------------------------
     // add relationships for this node
     // -------------------------
-    WITH diff_node, node_map
+    WITH diff_root, diff_node, node_map
     CALL {
-        WITH diff_node, node_map
+        WITH diff_root, diff_node, node_map
         UNWIND node_map.relationships as node_relationship
         CREATE (diff_node)-[:DIFF_HAS_RELATIONSHIP]->(diff_relationship:DiffRelationship)
         SET diff_relationship = node_relationship.node_properties
         // -------------------------
+        // link the nodes of this relationship group, saved in an earlier batch
+        // -------------------------
+        WITH diff_root, diff_relationship, node_relationship
+        CALL {
+            WITH diff_root, diff_relationship, node_relationship
+            UNWIND node_relationship.child_node_uuids AS child_node_uuid
+            MATCH (diff_root)-[:DIFF_HAS_NODE]->(child_node:DiffNode {uuid: child_node_uuid})
+            MERGE (diff_relationship)-[:DIFF_HAS_NODE]->(child_node)
+        }
+        // -------------------------
         // add elements for this relationship group
         // -------------------------
         WITH diff_relationship, node_relationship
@@ -171,7 +182,8 @@ CALL {
         """
         self.add_to_query(query)
 
-    def _build_conflict_params(self, enriched_conflict: EnrichedDiffConflict) -> dict[str, Any]:
+    @classmethod
+    def _build_conflict_params(cls, enriched_conflict: EnrichedDiffConflict) -> dict[str, Any]:
         return {
             "uuid": enriched_conflict.uuid,
             "base_branch_action": enriched_conflict.base_branch_action.value,
@@ -189,10 +201,11 @@ CALL {
             "selected_branch": enriched_conflict.selected_branch.value if enriched_conflict.selected_branch else None,
         }
 
-    def _build_diff_property_params(self, enriched_property: EnrichedDiffProperty) -> dict[str, Any]:
+    @classmethod
+    def _build_diff_property_params(cls, enriched_property: EnrichedDiffProperty) -> dict[str, Any]:
         conflict_params = None
         if enriched_property.conflict:
-            conflict_params = self._build_conflict_params(enriched_conflict=enriched_property.conflict)
+            conflict_params = cls._build_conflict_params(enriched_conflict=enriched_property.conflict)
         return {
             "node_properties": {
                 "property_type": enriched_property.property_type.value,
@@ -207,9 +220,10 @@ CALL {
             "conflict_params": conflict_params,
         }
 
-    def _build_diff_attribute_params(self, enriched_attribute: EnrichedDiffAttribute) -> dict[str, Any]:
+    @classmethod
+    def _build_diff_attribute_params(cls, enriched_attribute: EnrichedDiffAttribute) -> dict[str, Any]:
         property_props = [
-            self._build_diff_property_params(enriched_property=prop) for prop in enriched_attribute.properties
+            cls._build_diff_property_params(enriched_property=prop) for prop in enriched_attribute.properties
         ]
         return {
             "node_properties": {
@@ -226,15 +240,16 @@ CALL {
             "properties": property_props,
         }
 
+    @classmethod
     def _build_diff_single_relationship_params(
-        self, enriched_single_relationship: EnrichedDiffSingleRelationship
+        cls, enriched_single_relationship: EnrichedDiffSingleRelationship
     ) -> dict[str, Any]:
         property_props = [
-            self._build_diff_property_params(enriched_property=prop) for prop in enriched_single_relationship.properties
+            cls._build_diff_property_params(enriched_property=prop) for prop in enriched_single_relationship.properties
         ]
         conflict_params = None
         if enriched_single_relationship.conflict:
-            conflict_params = self._build_conflict_params(enriched_conflict=enriched_single_relationship.conflict)
+            conflict_params = cls._build_conflict_params(enriched_conflict=enriched_single_relationship.conflict)
         return {
             "node_properties": {
                 "changed_at": enriched_single_relationship.changed_at.to_string(),
@@ -252,9 +267,10 @@ CALL {
             "properties": property_props,
         }
 
-    def _build_diff_relationship_params(self, enriched_relationship: EnrichedDiffRelationship) -> dict[str, Any]:
+    @classmethod
+    def _build_diff_relationship_params(cls, enriched_relationship: EnrichedDiffRelationship) -> dict[str, Any]:
         single_relationship_props = [
-            self._build_diff_single_relationship_params(enriched_single_relationship=esr)
+            cls._build_diff_single_relationship_params(enriched_single_relationship=esr)
             for esr in enriched_relationship.relationships
         ]
         return {
@@ -274,18 +290,20 @@ CALL {
                 "contains_conflict": enriched_relationship.contains_conflict,
             },
             "relationships": single_relationship_props,
+            "child_node_uuids": [child_node.uuid for child_node in enriched_relationship.nodes],
         }
 
-    def _build_diff_node_params(self, enriched_node: EnrichedDiffNode) -> dict[str, Any]:
+    @classmethod
+    def _build_diff_node_params(cls, enriched_node: EnrichedDiffNode) -> dict[str, Any]:
         attribute_props = [
-            self._build_diff_attribute_params(enriched_attribute=attribute) for attribute in enriched_node.attributes
+            cls._build_diff_attribute_params(enriched_attribute=attribute) for attribute in enriched_node.attributes
         ]
         relationship_props = [
-            self._build_diff_relationship_params(relationship) for relationship in enriched_node.relationships
+            cls._build_diff_relationship_params(relationship) for relationship in enriched_node.relationships
         ]
         conflict_params = None
         if enriched_node.conflict:
-            conflict_params = self._build_conflict_params(enriched_conflict=enriched_node.conflict)
+            conflict_params = cls._build_conflict_params(enriched_conflict=enriched_node.conflict)
         return {
             "node_properties": {
                 "uuid": enriched_node.uuid,
@@ -305,16 +323,12 @@ CALL {
             "relationships": relationship_props,
         }
 
-    def _build_node_batch_params(self) -> dict[str, list[dict[str, Any]]]:
-        node_details: list[dict[str, Any]] = []
-        for node_create_request in self.node_create_batch:
-            node_details.append(
-                {
-                    "root_uuid": node_create_request.root_uuid,
-                    "node_map": self._build_diff_node_params(enriched_node=node_create_request.node),
-                }
-            )
-        return {"node_details_list": node_details}
+    @classmethod
+    def build_node_details(cls, node_create_request: EnrichedNodeCreateRequest) -> dict[str, Any]:
+        return {
+            "root_uuid": node_create_request.root_uuid,
+            "node_map": cls._build_diff_node_params(enriched_node=node_create_request.node),
+        }
 
 
 class EnrichedNodesLinkQuery(Query):
@@ -322,16 +336,23 @@ class EnrichedNodesLinkQuery(Query):
     type = QueryType.WRITE
     insert_return = False
 
-    def __init__(self, enriched_diffs: EnrichedDiffs, **kwargs: Any) -> None:
+    def __init__(self, node_link_requests: list[EnrichedNodeLinkRequest], **kwargs: Any) -> None:
+        """Link nodes saved by different batches, the nodes of a batch are linked when they are created"""
         super().__init__(**kwargs)
-        self.enriched_diffs = enriched_diffs
+        self.node_link_requests = node_link_requests
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
-        parent_links_list = []
-        for diff_root in (self.enriched_diffs.base_branch_diff, self.enriched_diffs.diff_branch_diff):
-            for node in diff_root.nodes:
-                parent_links_list.extend(self._build_node_parent_links(enriched_node=node, root_uuid=diff_root.uuid))
-        self.params = {"node_links_list": parent_links_list}
+        self.params = {
+            "node_links_list": [
+                {
+                    "parent_uuid": link_request.parent_uuid,
+                    "relationship_name": link_request.relationship_name,
+                    "child_uuid": link_request.child_uuid,
+                    "root_uuid": link_request.root_uuid,
+                }
+                for link_request in self.node_link_requests
+            ]
+        }
         query = """
 UNWIND $node_links_list AS node_link_details
 WITH
@@ -349,20 +370,3 @@ CALL {
 }
         """
         self.add_to_query(query)
-
-    def _build_node_parent_links(self, enriched_node: EnrichedDiffNode, root_uuid: str) -> list[dict[str, str]]:
-        if not enriched_node.relationships:
-            return []
-        parent_links = []
-        for relationship in enriched_node.relationships:
-            for child_node in relationship.nodes:
-                parent_links.append(
-                    {
-                        "parent_uuid": enriched_node.uuid,
-                        "relationship_name": relationship.name,
-                        "child_uuid": child_node.uuid,
-                        "root_uuid": root_uuid,
-                    }
-                )
-                parent_links.extend(self._build_node_parent_links(enriched_node=child_node, root_uuid=root_uuid))
-        return parent_links
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
 from uuid import uuid4
 
 from infrahub.core.constants import BranchSupportType, DiffAction, RelationshipCardinality, RelationshipStatus
@@ -468,6 +468,11 @@ class DiffQueryParser:
         database_path = DatabasePath.from_cypher_path(cypher_path=path)
         self._parse_path(database_path=database_path)
 
+    async def read_results(self, query_results: AsyncIterator[QueryResult]) -> None:
+        """Read the results while they are being streamed, without keeping the raw records in memory."""
+        async for query_result in query_results:
+            self.read_result(query_result=query_result)
+
     def parse(self) -> None:
         if len(self._diff_root_by_branch) > 1:
             self._apply_base_branch_previous_values()
@@ -1,4 +1,6 @@
-from typing import Generator
+import asyncio
+from collections import defaultdict
+from typing import Any, Generator
 
 from infrahub import config
 from infrahub.core import registry
@@ -9,9 +11,11 @@ from infrahub.exceptions import ResourceNotFoundError
 from ..model.path import (
     ConflictSelection,
     EnrichedDiffConflict,
+    EnrichedDiffNode,
     EnrichedDiffRoot,
     EnrichedDiffs,
     EnrichedNodeCreateRequest,
+    EnrichedNodeLinkRequest,
     TimeRange,
     TrackingId,
 )
@@ -28,7 +32,8 @@ from .deserializer import EnrichedDiffDeserializer
 
 
 class DiffRepository:
-    MAX_SAVE_BATCH_SIZE: int = 100
+    MAX_SAVE_BATCH_SIZE: int = 1000
+    MAX_SAVE_BATCH_BYTES: int = 500_000
 
     def __init__(self, db: InfrahubDatabase, deserializer: EnrichedDiffDeserializer):
         self.db = db
@@ -142,27 +147,136 @@ class DiffRepository:
             raise ResourceNotFoundError(f"Multiple diffs for {error_str}")
         return enriched_diffs[0]
 
-    def _get_node_create_request_batch(
-        self, enriched_diffs: EnrichedDiffs
-    ) -> Generator[list[EnrichedNodeCreateRequest], None, None]:
-        node_requests = []
+    def _get_node_create_request_waves(self, enriched_diffs: EnrichedDiffs) -> list[list[EnrichedNodeCreateRequest]]:
+        """Group the nodes by depth, a node is saved after the nodes of its relationships so it can link to them"""
+        waves: dict[int, list[EnrichedNodeCreateRequest]] = defaultdict(list)
         for diff_root in (enriched_diffs.base_branch_diff, enriched_diffs.diff_branch_diff):
+            nodes_by_uuid = {node.uuid: node for node in diff_root.nodes}
+            depths: dict[str, int] = {}
             for node in diff_root.nodes:
-                node_requests.append(EnrichedNodeCreateRequest(node=node, root_uuid=diff_root.uuid))
-                if len(node_requests) == self.MAX_SAVE_BATCH_SIZE:
-                    yield node_requests
-                    node_requests = []
-        if node_requests:
-            yield node_requests
-
-    @retry_db_transaction(name="enriched_diff_save")
-    async def save(self, enriched_diffs: EnrichedDiffs) -> None:
+                depth = self._get_node_depth(node_uuid=node.uuid, nodes_by_uuid=nodes_by_uuid, depths=depths)
+                waves[depth].append(EnrichedNodeCreateRequest(node=node, root_uuid=diff_root.uuid))
+        return [waves[depth] for depth in sorted(waves)]
+
+    def _get_node_depth(
+        self, node_uuid: str, nodes_by_uuid: dict[str, EnrichedDiffNode], depths: dict[str, int]
+    ) -> int:
+        if node_uuid in depths:
+            return depths[node_uuid]
+        # set before the recursion in case of a loop between the nodes
+        depths[node_uuid] = 0
+        depth = 0
+        for relationship in nodes_by_uuid[node_uuid].relationships:
+            for child_node in relationship.nodes:
+                if child_node.uuid in nodes_by_uuid and child_node.uuid != node_uuid:
+                    child_depth = self._get_node_depth(
+                        node_uuid=child_node.uuid, nodes_by_uuid=nodes_by_uuid, depths=depths
+                    )
+                    depth = max(depth, child_depth + 1)
+        depths[node_uuid] = depth
+        return depth
+
+    def _get_node_details_batches(
+        self, node_create_requests: list[EnrichedNodeCreateRequest]
+    ) -> Generator[list[dict[str, Any]], None, None]:
+        """Serialize the nodes lazily into batches of up to MAX_SAVE_BATCH_BYTES or MAX_SAVE_BATCH_SIZE nodes"""
+        node_details_list: list[dict[str, Any]] = []
+        batch_size = 0
+        for node_create_request in node_create_requests:
+            node_details = EnrichedNodeBatchCreateQuery.build_node_details(node_create_request=node_create_request)
+            node_details_list.append(node_details)
+            batch_size += self._get_params_size(value=node_details)
+            if len(node_details_list) >= self.MAX_SAVE_BATCH_SIZE or batch_size >= self.MAX_SAVE_BATCH_BYTES:
+                yield node_details_list
+                node_details_list = []
+                batch_size = 0
+        if node_details_list:
+            yield node_details_list
+
+    def _get_params_size(self, value: Any) -> int:
+        """Approximate number of bytes sent to the database for these parameters"""
+        if isinstance(value, dict):
+            return sum(len(key) + self._get_params_size(value=item) for key, item in value.items())
+        if isinstance(value, list):
+            return sum(self._get_params_size(value=item) for item in value)
+        if isinstance(value, str):
+            return len(value)
+        return 8
+
+    @retry_db_transaction(name="enriched_diff_save_roots")
+    async def _save_roots(self, enriched_diffs: EnrichedDiffs) -> None:
         root_query = await EnrichedDiffRootsCreateQuery.init(db=self.db, enriched_diffs=enriched_diffs)
         await root_query.execute(db=self.db)
-        for node_create_batch in self._get_node_create_request_batch(enriched_diffs=enriched_diffs):
-            node_query = await EnrichedNodeBatchCreateQuery.init(db=self.db, node_create_batch=node_create_batch)
-            await node_query.execute(db=self.db)
-        link_query = await EnrichedNodesLinkQuery.init(db=self.db, enriched_diffs=enriched_diffs)
+
+    @retry_db_transaction(name="enriched_diff_save_nodes")
+    async def _save_node_batch(self, db: InfrahubDatabase, node_details_list: list[dict[str, Any]]) -> None:
+        node_query = await EnrichedNodeBatchCreateQuery.init(db=db, node_details_list=node_details_list)
+        await node_query.execute(db=db)
+
+    async def _save_root_nodes(self, node_create_requests: list[EnrichedNodeCreateRequest]) -> None:
+        """Save the nodes of a single root on a dedicated session, the next batch is serialized while the previous one is in flight
+
+        Every batch creates edges from the same DiffRoot vertex, which is locked by each write,
+        so the batches of a root are sent one after the other instead of waiting on each other's lock
+        """
+        async with self.db.start_session() as db:
+            pending: asyncio.Task | None = None
+            try:
+                for node_details_list in self._get_node_details_batches(node_create_requests=node_create_requests):
+                    if pending:
+                        await pending
+                    pending = asyncio.create_task(self._save_node_batch(db=db, node_details_list=node_details_list))
+                    # let the query be sent before serializing the next batch
+                    await asyncio.sleep(0)
+                if pending:
+                    await pending
+            except BaseException:
+                if pending:
+                    pending.cancel()
+                raise
+
+    async def _save_nodes(self, enriched_diffs: EnrichedDiffs) -> None:
+        # each batch is a single query, it is either saved completely or not at all and can be retried
+        for node_create_requests in self._get_node_create_request_waves(enriched_diffs=enriched_diffs):
+            requests_by_root: dict[str, list[EnrichedNodeCreateRequest]] = defaultdict(list)
+            for node_create_request in node_create_requests:
+                requests_by_root[node_create_request.root_uuid].append(node_create_request)
+
+            if self.db.is_transaction:
+                # the queries of a transaction must run one after the other on its own session
+                for root_requests in requests_by_root.values():
+                    for node_details_list in self._get_node_details_batches(node_create_requests=root_requests):
+                        await self._save_node_batch(db=self.db, node_details_list=node_details_list)
+                continue
+
+            # the roots don't share any vertex, their batches are saved concurrently
+            tasks = [
+                asyncio.create_task(self._save_root_nodes(node_create_requests=root_requests))
+                for root_requests in requests_by_root.values()
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+    async def save(
+        self, enriched_diffs: EnrichedDiffs, node_link_requests: list[EnrichedNodeLinkRequest] | None = None
+    ) -> None:
+        """Save the roots and their nodes, the roots are updated if they have already been saved with other nodes
+
+        The nodes of a batch are linked to the nodes of their relationships when they are created,
+        node_link_requests are the links to nodes saved in an earlier call
+        """
+        await self._save_roots(enriched_diffs=enriched_diffs)
+        await self._save_nodes(enriched_diffs=enriched_diffs)
+        if node_link_requests:
+            await self._save_links(node_link_requests=node_link_requests)
+
+    @retry_db_transaction(name="enriched_diff_save_links")
+    async def _save_links(self, node_link_requests: list[EnrichedNodeLinkRequest]) -> None:
+        link_query = await EnrichedNodesLinkQuery.init(db=self.db, node_link_requests=node_link_requests)
         await link_query.execute(db=self.db)
 
     async def summary(
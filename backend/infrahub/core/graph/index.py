@@ -17,6 +17,22 @@ node_indexes: list[IndexItem] = [
 rel_indexes: list[IndexItem] = [
     IndexItem(name="attr_from", label="HAS_ATTRIBUTE", properties=["from"], type=IndexType.RANGE),
     IndexItem(name="attr_branch", label="HAS_ATTRIBUTE", properties=["branch"], type=IndexType.RANGE),
+    IndexItem(name="attr_to", label="HAS_ATTRIBUTE", properties=["to"], type=IndexType.RANGE),
     IndexItem(name="value_from", label="HAS_VALUE", properties=["from"], type=IndexType.RANGE),
     IndexItem(name="value_branch", label="HAS_VALUE", properties=["branch"], type=IndexType.RANGE),
+    IndexItem(name="value_to", label="HAS_VALUE", properties=["to"], type=IndexType.RANGE),
+    IndexItem(name="related_from", label="IS_RELATED", properties=["from"], type=IndexType.RANGE),
+    IndexItem(name="related_branch", label="IS_RELATED", properties=["branch"], type=IndexType.RANGE),
+    IndexItem(name="related_to", label="IS_RELATED", properties=["to"], type=IndexType.RANGE),
+    IndexItem(name="part_of_from", label="IS_PART_OF", properties=["from"], type=IndexType.RANGE),
+    IndexItem(name="part_of_branch", label="IS_PART_OF", properties=["branch"], type=IndexType.RANGE),
+    IndexItem(name="part_of_to", label="IS_PART_OF", properties=["to"], type=IndexType.RANGE),
+    IndexItem(name="attr_from_ts", label="HAS_ATTRIBUTE", properties=["from_ts"], type=IndexType.RANGE),
+    IndexItem(name="attr_to_ts", label="HAS_ATTRIBUTE", properties=["to_ts"], type=IndexType.RANGE),
+    IndexItem(name="value_from_ts", label="HAS_VALUE", properties=["from_ts"], type=IndexType.RANGE),
+    IndexItem(name="value_to_ts", label="HAS_VALUE", properties=["to_ts"], type=IndexType.RANGE),
+    IndexItem(name="related_from_ts", label="IS_RELATED", properties=["from_ts"], type=IndexType.RANGE),
+    IndexItem(name="related_to_ts", label="IS_RELATED", properties=["to_ts"], type=IndexType.RANGE),
+    IndexItem(name="part_of_from_ts", label="IS_PART_OF", properties=["from_ts"], type=IndexType.RANGE),
+    IndexItem(name="part_of_to_ts", label="IS_PART_OF", properties=["to_ts"], type=IndexType.RANGE),
 ]
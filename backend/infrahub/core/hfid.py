@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from infrahub import config
+from infrahub.core import registry
+from infrahub.core.cache_sync import BranchCache, get_sync_since, has_changes_after, is_sync_required
+from infrahub.core.constants import RelationshipCardinality
+from infrahub.core.query.node import NodeGetHfidChangesQuery, NodeGetHfidValuesQuery
+from infrahub.core.timestamp import Timestamp
+
+if TYPE_CHECKING:
+    from infrahub.core.branch import Branch
+    from infrahub.core.schema import GenericSchema, MainSchemaTypes, NodeSchema
+    from infrahub.database import InfrahubDatabase
+
+HfidKey = tuple[str, ...]
+
+
+def get_hfid_components(
+    schema: Union[NodeSchema, GenericSchema, MainSchemaTypes], branch: Branch
+) -> Optional[list[tuple[Optional[str], str]]]:
+    """Return the relationship identifier and the attribute name of each component of the human friendly id.
+
+    None is returned if the schema has no human friendly id or if one of its components can't be resolved in a query,
+    only the value of an attribute of the node or of a peer of cardinality one is supported.
+    """
+    if not schema.human_friendly_id:
+        return None
+
+    schema_branch = registry.schema.get_schema_branch(name=branch.name)
+    components: list[tuple[Optional[str], str]] = []
+    for path in schema.human_friendly_id:
+        schema_path = schema.parse_schema_path(path=path, schema=schema_branch)
+        if schema_path.attribute_property_name != "value" or not schema_path.attribute_schema:
+            return None
+        if schema_path.is_type_relationship:
+            if schema_path.relationship_schema.cardinality != RelationshipCardinality.ONE:
+                return None
+            components.append((schema_path.relationship_schema.identifier, schema_path.attribute_schema.name))
+        else:
+            components.append((None, schema_path.attribute_schema.name))
+    return components
+
+
+def get_hfid_key(values: list[Any]) -> Optional[HfidKey]:
+    """Return the key of a human friendly id in the index, None if one of its values is missing or not a scalar."""
+    if any(value is None or not isinstance(value, (str, int, float)) for value in values):
+        return None
+    return tuple(str(value) for value in values)
+
+
+async def load_hfid_values(
+    db: InfrahubDatabase,
+    branch: Branch,
+    schema: Union[NodeSchema, GenericSchema],
+    node_ids: list[str],
+    at: Timestamp,
+) -> Optional[dict[str, list[Any]]]:
+    """Return the values of the human friendly id of the given nodes with a single query, None if they can't be queried."""
+    components = get_hfid_components(schema=schema, branch=branch)
+    if not components:
+        return None
+
+    query = await NodeGetHfidValuesQuery.init(
+        db=db, branch=branch, kind=schema.kind, components=components, node_ids=node_ids, at=at
+    )
+    await query.execute(db=db)
+    return query.get_values()
+
+
+@dataclass
+class HfidIndex:
+    """Human friendly id of the nodes of a kind on a branch, with the ids of the nodes indexed by human friendly id."""
+
+    branched_from: Optional[str]
+    schema_hash: str
+    synced_at: Timestamp
+    keys: dict[str, HfidKey] = field(default_factory=dict)
+    node_ids: dict[HfidKey, set[str]] = field(default_factory=lambda: defaultdict(set))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def set_node(self, node_id: str, values: list[Any]) -> None:
+        self.remove_node(node_id=node_id)
+        key = get_hfid_key(values=values)
+        if key is None:
+            return
+
+        self.keys[node_id] = key
+        self.node_ids[key].add(node_id)
+
+    def remove_node(self, node_id: str) -> None:
+        key = self.keys.pop(node_id, None)
+        if key is None:
+            return
+
+        self.node_ids[key].discard(node_id)
+        if not self.node_ids[key]:
+            del self.node_ids[key]
+
+    def lookup(self, key: HfidKey) -> list[str]:
+        return sorted(self.node_ids.get(key, set()))
+
+
+class HfidIndexCache(BranchCache[HfidIndex]):
+    """Cache of the human friendly ids of the nodes of each kind and of each branch.
+
+    The human friendly ids are computed once per kind and per branch, after that only the nodes whose human friendly id
+    might have changed since the previous synchronization are computed again: the nodes created or deleted, the nodes
+    with a modified attribute or relationship used by the human friendly id and the nodes with a peer whose attribute
+    used by the human friendly id has been modified. The modifications done by any worker are found with the time
+    properties of the edges, the index doesn't need to be notified when a node is saved or deleted.
+    The indexes of the least recently used kinds are removed when more than max_size kinds are indexed.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        super().__init__()
+        self._max_size = max_size
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return config.SETTINGS.api.hfid_index_cache_size
+
+    async def lookup(
+        self,
+        db: InfrahubDatabase,
+        branch: Branch,
+        schema: Union[NodeSchema, GenericSchema],
+        values: list[Any],
+        at: Timestamp,
+    ) -> Optional[list[str]]:
+        """Return the ids of the nodes with this human friendly id, or None if they can't be resolved from the index at this time."""
+        if db.is_transaction or self.max_size <= 0:
+            # The modifications not yet committed by this transaction must not be visible outside of it
+            return None
+
+        key = get_hfid_key(values=values)
+        components = get_hfid_components(schema=schema, branch=branch)
+        if key is None or not components or len(components) != len(key):
+            return None
+
+        index = await self.get(db=db, branch=branch, schema=schema, components=components, at=at)
+        if index is None:
+            return None
+        return index.lookup(key=key)
+
+    async def get(
+        self,
+        db: InfrahubDatabase,
+        branch: Branch,
+        schema: Union[NodeSchema, GenericSchema],
+        components: list[tuple[Optional[str], str]],
+        at: Timestamp,
+    ) -> Optional[HfidIndex]:
+        """Synchronize and return the index, None is returned if it has been modified after the requested time."""
+        schema_hash = registry.schema.get_schema_branch(name=branch.name).get_hash()
+        synced_at = Timestamp()
+
+        key = (branch.name, schema.kind)
+        index = self._get_item(key=key)
+        if index and (index.branched_from != branch.branched_from or index.schema_hash != schema_hash):
+            index = None
+
+        if index is None:
+            query = await NodeGetHfidValuesQuery.init(
+                db=db, branch=branch, kind=schema.kind, components=components, at=synced_at
+            )
+            await query.execute(db=db)
+            index = HfidIndex(branched_from=branch.branched_from, schema_hash=schema_hash, synced_at=synced_at)
+            for node_id, values in query.get_values().items():
+                index.set_node(node_id=node_id, values=values)
+            self._set_item(key=key, item=index)
+            since = at
+        elif not is_sync_required(synced_at=index.synced_at, at=at):
+            return index
+        else:
+            since = get_sync_since(synced_at=index.synced_at, at=at)
+
+        changes_query = await NodeGetHfidChangesQuery.init(
+            db=db,
+            kind=schema.kind,
+            attribute_names=sorted({name for identifier, name in components if not identifier}),
+            identifiers=sorted({identifier for identifier, _ in components if identifier}),
+            peer_attribute_names=sorted({name for identifier, name in components if identifier}),
+            since=since,
+        )
+        await changes_query.execute(db=db)
+        changes = changes_query.get_changes()
+
+        if changes:
+            node_ids = list(changes.keys())
+            query = await NodeGetHfidValuesQuery.init(
+                db=db, branch=branch, kind=schema.kind, components=components, node_ids=node_ids, at=synced_at
+            )
+            await query.execute(db=db)
+            values_by_node_id = query.get_values()
+            for node_id in node_ids:
+                index.remove_node(node_id=node_id)
+                if node_id in values_by_node_id:
+                    index.set_node(node_id=node_id, values=values_by_node_id[node_id])
+        index.synced_at = synced_at
+
+        if has_changes_after(changes=changes.values(), at=at):
+            return None
+        return index
+
+
+hfid_index_cache = HfidIndexCache()
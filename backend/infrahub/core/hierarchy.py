@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+from infrahub import config
+from infrahub.core.cache_sync import BranchCache, get_sync_since, has_changes_after, is_sync_required
+from infrahub.core.constants import RelationshipHierarchyDirection
+from infrahub.core.query.node import NodeGetHierarchyChangesQuery, NodeGetHierarchyParentsQuery
+from infrahub.core.timestamp import Timestamp
+
+if TYPE_CHECKING:
+    from infrahub.core.branch import Branch
+    from infrahub.database import InfrahubDatabase
+
+
+@dataclass
+class HierarchyClosure:
+    """Parent of each node of a hierarchy on a branch, used to resolve the ancestors and descendants of a node in memory."""
+
+    branched_from: Optional[str]
+    synced_at: Timestamp
+    parents: dict[str, str] = field(default_factory=dict)
+    children: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+
+    def set_parent(self, node_id: str, parent_id: Optional[str]) -> None:
+        previous_parent_id = self.parents.pop(node_id, None)
+        if previous_parent_id is not None:
+            self.children[previous_parent_id].discard(node_id)
+            if not self.children[previous_parent_id]:
+                del self.children[previous_parent_id]
+
+        if parent_id is not None:
+            self.parents[node_id] = parent_id
+            self.children[parent_id].add(node_id)
+
+    def get_ancestors(self, node_id: str, max_depth: int) -> list[str]:
+        ancestors: list[str] = []
+        current_id = node_id
+        while len(ancestors) < max_depth and current_id in self.parents:
+            current_id = self.parents[current_id]
+            if current_id == node_id or current_id in ancestors:
+                break
+            ancestors.append(current_id)
+        return ancestors
+
+    def get_descendants(self, node_id: str, max_depth: int) -> list[str]:
+        descendants: list[str] = []
+        visited = {node_id}
+        level = [node_id]
+        for _ in range(max_depth):
+            level = [
+                child_id
+                for parent_id in level
+                for child_id in self.children.get(parent_id, ())
+                if child_id not in visited
+            ]
+            if not level:
+                break
+            visited.update(level)
+            descendants.extend(level)
+        return descendants
+
+
+class HierarchyClosureCache(BranchCache[HierarchyClosure]):
+    """Cache of the hierarchies of each branch, indexed by branch and by hierarchy kind.
+
+    The parents are loaded once per branch and hierarchy, after that only the nodes whose parent has been modified since
+    the previous synchronization are loaded again. The modifications done by any worker are found with the time
+    properties of the edges, the cache doesn't need to be notified when a node is saved or deleted.
+    The least recently used hierarchies are removed when more than max_size hierarchies are cached.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        super().__init__()
+        self._max_size = max_size
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return config.SETTINGS.api.hierarchy_cache_size
+
+    async def get_relatives(
+        self,
+        db: InfrahubDatabase,
+        branch: Branch,
+        hierarchy: str,
+        node_id: str,
+        direction: RelationshipHierarchyDirection,
+        at: Timestamp,
+    ) -> Optional[list[str]]:
+        """Return the ancestors or descendants of a node, or None if they can't be resolved from the cache at this time."""
+        if db.is_transaction or self.max_size <= 0:
+            # The modifications not yet committed by this transaction must not be visible outside of it
+            return None
+
+        closure = await self.get(db=db, branch=branch, hierarchy=hierarchy, at=at)
+        if closure is None:
+            return None
+
+        max_depth = config.SETTINGS.database.max_depth_search_hierarchy
+        if direction == RelationshipHierarchyDirection.ANCESTORS:
+            return closure.get_ancestors(node_id=node_id, max_depth=max_depth)
+        return closure.get_descendants(node_id=node_id, max_depth=max_depth)
+
+    async def get(
+        self, db: InfrahubDatabase, branch: Branch, hierarchy: str, at: Timestamp
+    ) -> Optional[HierarchyClosure]:
+        """Synchronize and return the hierarchy, None is returned if it has been modified after the requested time."""
+        key = (branch.name, hierarchy)
+        synced_at = Timestamp()
+
+        closure = self._get_item(key=key)
+        if closure and closure.branched_from != branch.branched_from:
+            closure = None
+
+        if closure is None:
+            query = await NodeGetHierarchyParentsQuery.init(db=db, branch=branch, hierarchy=hierarchy, at=synced_at)
+            await query.execute(db=db)
+            closure = HierarchyClosure(branched_from=branch.branched_from, synced_at=synced_at)
+            for node_id, parent_id in query.get_parents().items():
+                closure.set_parent(node_id=node_id, parent_id=parent_id)
+            self._set_item(key=key, item=closure)
+            since = at
+        elif not is_sync_required(synced_at=closure.synced_at, at=at):
+            return closure
+        else:
+            since = get_sync_since(synced_at=closure.synced_at, at=at)
+
+        changes_query = await NodeGetHierarchyChangesQuery.init(db=db, branch=branch, hierarchy=hierarchy, since=since)
+        await changes_query.execute(db=db)
+        changes = changes_query.get_changes()
+
+        if changes:
+            query = await NodeGetHierarchyParentsQuery.init(
+                db=db, branch=branch, hierarchy=hierarchy, node_ids=list(changes.keys()), at=synced_at
+            )
+            await query.execute(db=db)
+            parents = query.get_parents()
+            for node_id in changes:
+                closure.set_parent(node_id=node_id, parent_id=parents.get(node_id))
+        closure.synced_at = synced_at
+
+        if has_changes_after(changes=changes.values(), at=at):
+            return None
+        return closure
+
+
+hierarchy_closure_cache = HierarchyClosureCache()
@@ -1,19 +1,46 @@
 import ipaddress
-from typing import TYPE_CHECKING, Optional, Union
+from collections import defaultdict
+from typing import TYPE_CHECKING, Optional, Sequence, Union
 
+from infrahub.core import registry
+from infrahub.core.attribute import update_nodes_attributes
 from infrahub.core.branch import Branch
-from infrahub.core.constants import InfrahubKind
+from infrahub.core.constants import BranchSupportType, InfrahubKind
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
-from infrahub.core.query.ipam import IPPrefixReconcileQuery
+from infrahub.core.query.ipam import IPNodeParentsQuery, IPPrefixReconcileQuery, get_namespace_id
+from infrahub.core.query.relationship import RelationshipCreateManyQuery, RelationshipDeleteManyQuery
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.exceptions import NodeNotFoundError
 
 from .constants import AllIPTypes
+from .model import IpamNodeDetails
+from .tree import IPNamespaceTree, ipam_tree_cache
 
 if TYPE_CHECKING:
+    from infrahub.core.attribute import BaseAttribute
     from infrahub.core.relationship.model import RelationshipManager
+    from infrahub.core.schema import RelationshipSchema
+
+
+def get_ip_value(ipam_node_details: IpamNodeDetails) -> AllIPTypes:
+    if ipam_node_details.is_address:
+        return ipaddress.ip_interface(ipam_node_details.ip_value)
+    return ipaddress.ip_network(ipam_node_details.ip_value)
+
+
+def get_sort_key(ip_value: AllIPTypes) -> tuple[int, int, int, int]:
+    """Sort the values by network, the prefixes before the addresses they contain."""
+    if isinstance(ip_value, (ipaddress.IPv6Interface, ipaddress.IPv4Interface)):
+        return ip_value.version, int(ip_value.network.network_address), ip_value.max_prefixlen + 1, int(ip_value.ip)
+    return ip_value.version, int(ip_value.network_address), ip_value.prefixlen, 0
+
+
+def get_ip_node_type(ip_value: AllIPTypes) -> str:
+    if isinstance(ip_value, (ipaddress.IPv6Interface, ipaddress.IPv4Interface)):
+        return InfrahubKind.IPADDRESS
+    return InfrahubKind.IPPREFIX
 
 
 class IPNodesToReconcile:
@@ -95,21 +122,37 @@ class IpamReconciler:
     ) -> Optional[Node]:
         self.at = Timestamp(at)
 
+        # The new parent and children are not needed to delete a node, otherwise they are found in memory when possible
+        tree: Optional[IPNamespaceTree] = None
+        if not is_delete:
+            tree = await ipam_tree_cache.get(
+                db=self.db, branch=self.branch, namespace_id=get_namespace_id(namespace), at=self.at
+            )
+
         query = await IPPrefixReconcileQuery.init(
-            db=self.db, branch=self.branch, ip_value=ip_value, namespace=namespace, node_uuid=node_uuid, at=self.at
+            db=self.db,
+            branch=self.branch,
+            ip_value=ip_value,
+            namespace=namespace,
+            node_uuid=node_uuid,
+            calculate_relatives=not is_delete and tree is None,
+            at=self.at,
         )
         await query.execute(db=self.db)
 
         ip_node_uuid = query.get_ip_node_uuid()
         if not ip_node_uuid:
-            node_type = InfrahubKind.IPPREFIX
-            if isinstance(ip_value, (ipaddress.IPv6Interface, ipaddress.IPv4Interface)):
-                node_type = InfrahubKind.IPADDRESS
-            raise NodeNotFoundError(node_type=node_type, identifier=str(ip_value))
+            raise NodeNotFoundError(node_type=get_ip_node_type(ip_value=ip_value), identifier=str(ip_value))
         current_parent_uuid = query.get_current_parent_uuid()
-        calculated_parent_uuid = query.get_calculated_parent_uuid()
         current_children_uuids = set(query.get_current_children_uuids())
-        calculated_children_uuids = set(query.get_calculated_children_uuids())
+        calculated_parent_uuid: Optional[str] = None
+        calculated_children_uuids: set[str] = set()
+        if tree is not None:
+            calculated_parent_uuid = tree.get_parent(ip_value=ip_value)
+            calculated_children_uuids = set(tree.get_children(ip_value=ip_value)) - {ip_node_uuid}
+        elif not is_delete:
+            calculated_parent_uuid = query.get_calculated_parent_uuid()
+            calculated_children_uuids = set(query.get_calculated_children_uuids())
 
         all_uuids: set[str] = set()
         all_uuids = (all_uuids | {ip_node_uuid}) if ip_node_uuid else all_uuids
@@ -151,6 +194,151 @@ class IpamReconciler:
 
         return reconcile_nodes.node
 
+    async def reconcile_many(
+        self, ipam_node_details: Sequence[IpamNodeDetails], at: Optional[Timestamp] = None
+    ) -> None:
+        """Reconcile the parent and the children of multiple IP prefixes and IP addresses at once.
+
+        The final parent of every node impacted by the batch is computed in memory from the tree of its namespace,
+        then the relationships are modified with a few queries, each node being updated once even if it's related to
+        several nodes of the batch. The nodes are reconciled one by one if the namespace can't be loaded in memory.
+        """
+        self.at = Timestamp(at)
+
+        details_by_namespace: dict[str, list[tuple[AllIPTypes, IpamNodeDetails]]] = defaultdict(list)
+        for details in ipam_node_details:
+            details_by_namespace[details.namespace_id].append((get_ip_value(details), details))
+
+        for namespace_id in sorted(details_by_namespace):
+            namespace_details = sorted(details_by_namespace[namespace_id], key=lambda item: get_sort_key(item[0]))
+            tree = await ipam_tree_cache.get(db=self.db, branch=self.branch, namespace_id=namespace_id, at=self.at)
+            if tree is not None and self._get_missing_details(tree=tree, namespace_details=namespace_details):
+                # The nodes committed by another worker might not be found by the synchronization of the tree yet
+                tree = await ipam_tree_cache.get(
+                    db=self.db, branch=self.branch, namespace_id=namespace_id, at=self.at, full_sync=True
+                )
+            if tree is None:
+                for ip_value, details in namespace_details:
+                    await self.reconcile(
+                        ip_value=ip_value,
+                        namespace=namespace_id,
+                        node_uuid=details.node_uuid,
+                        is_delete=details.is_delete,
+                        at=self.at,
+                    )
+                continue
+
+            # The nodes still not found in the tree are reconciled one by one
+            missing_details = self._get_missing_details(tree=tree, namespace_details=namespace_details)
+            missing_uuids = {details.node_uuid for _, details in missing_details}
+            await self._reconcile_namespace(
+                tree=tree,
+                namespace_details=[item for item in namespace_details if item[1].node_uuid not in missing_uuids],
+            )
+            for ip_value, details in missing_details:
+                await self.reconcile(
+                    ip_value=ip_value,
+                    namespace=namespace_id,
+                    node_uuid=details.node_uuid,
+                    is_delete=details.is_delete,
+                    at=self.at,
+                )
+
+    @staticmethod
+    def _get_missing_details(
+        tree: IPNamespaceTree, namespace_details: list[tuple[AllIPTypes, IpamNodeDetails]]
+    ) -> list[tuple[AllIPTypes, IpamNodeDetails]]:
+        """Return the nodes of the batch that are not deleted and not found in the tree."""
+        return [item for item in namespace_details if not item[1].is_delete and item[1].node_uuid not in tree]
+
+    async def _reconcile_namespace(
+        self, tree: IPNamespaceTree, namespace_details: list[tuple[AllIPTypes, IpamNodeDetails]]
+    ) -> None:
+        # The deleted nodes are removed first, their relationships with their parent and their children are deleted with them
+        deleted_uuids = [details.node_uuid for _, details in namespace_details if details.is_delete]
+        if deleted_uuids:
+            deleted_nodes = await NodeManager.get_many(db=self.db, branch=self.branch, ids=deleted_uuids, at=self.at)
+            for deleted_node in deleted_nodes.values():
+                await deleted_node.delete(db=self.db, at=self.at)
+            # The deletion has been committed, the tree can be updated without waiting for the next synchronization
+            for deleted_uuid in deleted_uuids:
+                tree.remove(node_id=deleted_uuid)
+
+        # The nodes whose parent might change are the nodes of the batch, their new children and their current children
+        updated_uuids = [details.node_uuid for _, details in namespace_details if not details.is_delete]
+        impacted_uuids: set[str] = set(updated_uuids)
+        for ip_value, details in namespace_details:
+            if details.is_delete:
+                impacted_uuids.update(tree.get_children(ip_value=ip_value))
+            else:
+                impacted_uuids.update(tree.get_children(ip_value=tree.get_value(node_id=details.node_uuid)))
+
+        query = await IPNodeParentsQuery.init(
+            db=self.db, branch=self.branch, node_ids=sorted(impacted_uuids), parent_ids=updated_uuids, at=self.at
+        )
+        await query.execute(db=self.db)
+        current_parents = query.get_parents()
+        impacted_uuids.update(current_parents.keys())
+
+        calculated_parents: dict[str, Optional[str]] = {}
+        for node_uuid in sorted(impacted_uuids):
+            if node_uuid not in tree:
+                continue
+            calculated_parent_uuid = tree.get_parent(ip_value=tree.get_value(node_id=node_uuid))
+            expected_parent_uuids = {calculated_parent_uuid} if calculated_parent_uuid else set()
+            if set(current_parents.get(node_uuid, {})) != expected_parent_uuids:
+                calculated_parents[node_uuid] = calculated_parent_uuid
+
+        if calculated_parents:
+            await self._update_parents(calculated_parents=calculated_parents, current_parents=current_parents)
+
+    async def _update_parents(
+        self, calculated_parents: dict[str, Optional[str]], current_parents: dict[str, dict[str, str]]
+    ) -> None:
+        nodes = await NodeManager.get_many(
+            db=self.db, branch=self.branch, ids=list(calculated_parents), fields={"is_top_level": None}, at=self.at
+        )
+
+        rel_schemas: dict[tuple[str, str], RelationshipSchema] = {}
+        rels_to_delete: dict[tuple[str, str], list[tuple[str, str, str]]] = defaultdict(list)
+        rels_to_create: dict[tuple[str, str], list[tuple[str, str]]] = defaultdict(list)
+        updated_attributes: list[BaseAttribute] = []
+
+        for node_uuid, calculated_parent_uuid in calculated_parents.items():
+            node = nodes[node_uuid]
+            node_kinds = {node.get_kind()} | set(node.get_schema().inherit_from)
+            rel_name = "ip_prefix" if InfrahubKind.IPADDRESS in node_kinds else "parent"
+            key = (node.get_kind(), rel_name)
+            rel_schemas[key] = node.get_schema().get_relationship(name=rel_name)
+
+            current_parent_rels = current_parents.get(node_uuid, {})
+            for parent_uuid, rel_uuid in current_parent_rels.items():
+                if parent_uuid != calculated_parent_uuid:
+                    rels_to_delete[key].append((node_uuid, rel_uuid, parent_uuid))
+            if calculated_parent_uuid and calculated_parent_uuid not in current_parent_rels:
+                rels_to_create[key].append((node_uuid, calculated_parent_uuid))
+
+            if rel_name == "parent" and node.is_top_level.value != (calculated_parent_uuid is None):  # type: ignore[attr-defined]
+                node.is_top_level.value = calculated_parent_uuid is None  # type: ignore[attr-defined]
+                updated_attributes.append(node.is_top_level)  # type: ignore[attr-defined]
+
+        for key, rel_schema in rel_schemas.items():
+            branch = self.branch
+            if rel_schema.branch == BranchSupportType.AGNOSTIC:
+                branch = registry.get_global_branch()
+            if rels_to_delete[key]:
+                delete_query = await RelationshipDeleteManyQuery.init(
+                    db=self.db, schema=rel_schema, relationships=rels_to_delete[key], branch=branch, at=self.at
+                )
+                await delete_query.execute(db=self.db)
+            if rels_to_create[key]:
+                create_query = await RelationshipCreateManyQuery.init(
+                    db=self.db, schema=rel_schema, peers=rels_to_create[key], branch=branch, at=self.at
+                )
+                await create_query.execute(db=self.db)
+
+        await update_nodes_attributes(db=self.db, branch=self.branch, attributes=updated_attributes, at=self.at)
+
     async def _update_node_parent(self, node: Node, new_parent_uuid: Optional[str]) -> None:
         node_kinds = {node.get_kind()} | set(node.get_schema().inherit_from)
         is_prefix = False
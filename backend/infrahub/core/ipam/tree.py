@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+from infrahub import config
+from infrahub.core.cache_sync import BranchCache, get_sync_since, has_changes_after, is_sync_required
+from infrahub.core.query.ipam import IPNodeChangesQuery, IPNodeValuesQuery
+from infrahub.core.timestamp import Timestamp
+
+from .constants import AllIPTypes, IPAddressType, IPNetworkType
+
+if TYPE_CHECKING:
+    from infrahub.core.branch import Branch
+    from infrahub.database import InfrahubDatabase
+
+
+class RadixNode:
+    """Node of a radix tree, identified by a network and a prefix length.
+
+    The IP prefixes are stored on the node of their network, the IP addresses on the node of their host address
+    with the prefix length of their interface.
+    """
+
+    __slots__ = ("addresses", "children", "min_address_prefixlen", "network", "prefixes", "prefixlen")
+
+    def __init__(self, network: int, prefixlen: int, max_prefixlen: int) -> None:
+        self.network = network
+        self.prefixlen = prefixlen
+        self.children: list[Optional[RadixNode]] = [None, None]
+        self.prefixes: set[str] = set()
+        self.addresses: dict[str, int] = {}
+        # Smallest interface prefix length among the addresses of this node and of its descendants
+        self.min_address_prefixlen = max_prefixlen + 1
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.prefixes and not self.addresses
+
+
+class RadixTree:
+    """Binary radix tree of the networks of one IP version.
+
+    The nodes without any prefix or address and with a single child are not kept, the depth of the tree is bounded
+    by the number of bits of the addresses and the size of the tree by the number of values stored.
+    """
+
+    def __init__(self, max_prefixlen: int) -> None:
+        self.max_prefixlen = max_prefixlen
+        self.root = RadixNode(network=0, prefixlen=0, max_prefixlen=max_prefixlen)
+
+    def mask(self, network: int, prefixlen: int) -> int:
+        host_bits = self.max_prefixlen - prefixlen
+        return (network >> host_bits) << host_bits
+
+    def _bit(self, network: int, position: int) -> int:
+        return (network >> (self.max_prefixlen - position - 1)) & 1
+
+    def find(self, network: int, prefixlen: int) -> list[RadixNode]:
+        """Return the nodes from the root containing the network, the last one is the node of the network if it exists."""
+        path: list[RadixNode] = []
+        node: Optional[RadixNode] = self.root
+        while node is not None and node.prefixlen <= prefixlen and self.mask(network, node.prefixlen) == node.network:
+            path.append(node)
+            if node.prefixlen == prefixlen:
+                break
+            node = node.children[self._bit(network, node.prefixlen)]
+        return path
+
+    def find_subtree(self, network: int, prefixlen: int) -> Optional[RadixNode]:
+        """Return the highest node contained in the network, including the node of the network itself."""
+        node: Optional[RadixNode] = self.root
+        while node is not None and node.prefixlen < prefixlen:
+            if self.mask(network, node.prefixlen) != node.network:
+                return None
+            node = node.children[self._bit(network, node.prefixlen)]
+        if node is None or self.mask(node.network, prefixlen) != network:
+            return None
+        return node
+
+    def insert(self, network: int, prefixlen: int) -> list[RadixNode]:
+        """Return the nodes from the root to the node of the network, the node is created if it doesn't exist yet."""
+        node = self.root
+        path = [node]
+        while node.prefixlen < prefixlen:
+            bit = self._bit(network, node.prefixlen)
+            child = node.children[bit]
+            if child is None:
+                child = RadixNode(network=network, prefixlen=prefixlen, max_prefixlen=self.max_prefixlen)
+                node.children[bit] = child
+                path.append(child)
+                break
+
+            common_prefixlen = min(
+                self.max_prefixlen - (network ^ child.network).bit_length(), child.prefixlen, prefixlen
+            )
+            if common_prefixlen < child.prefixlen:
+                # The network contains the child or diverges from it, a node is added between them
+                intermediate = RadixNode(
+                    network=self.mask(network, common_prefixlen),
+                    prefixlen=common_prefixlen,
+                    max_prefixlen=self.max_prefixlen,
+                )
+                intermediate.children[self._bit(child.network, common_prefixlen)] = child
+                node.children[bit] = intermediate
+                child = intermediate
+
+            node = child
+            path.append(node)
+
+        return path
+
+    def cleanup(self, path: list[RadixNode]) -> None:
+        """Remove the nodes of the path that are not needed anymore and update the nodes remaining."""
+        for index in range(len(path) - 1, 0, -1):
+            node = path[index]
+            children = [child for child in node.children if child is not None]
+            if not node.is_empty or len(children) == 2:
+                break
+            parent = path[index - 1]
+            parent.children[self._bit(node.network, parent.prefixlen)] = children[0] if children else None
+
+        self.refresh(path=path)
+
+    def refresh(self, path: list[RadixNode]) -> None:
+        for node in reversed(path):
+            node.min_address_prefixlen = min(
+                [
+                    *node.addresses.values(),
+                    *[child.min_address_prefixlen for child in node.children if child is not None],
+                ],
+                default=self.max_prefixlen + 1,
+            )
+
+
+@dataclass
+class IPNamespaceTree:
+    """IP prefixes and IP addresses of a namespace on a branch, used to find the parent and children of a value in memory."""
+
+    branched_from: Optional[str]
+    synced_at: Timestamp
+    prefixes: dict[str, IPNetworkType] = field(default_factory=dict)
+    addresses: dict[str, IPAddressType] = field(default_factory=dict)
+    trees: dict[int, RadixTree] = field(default_factory=lambda: {4: RadixTree(32), 6: RadixTree(128)})
+
+    def __len__(self) -> int:
+        return len(self.prefixes) + len(self.addresses)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self.prefixes or node_id in self.addresses
+
+    @staticmethod
+    def _get_key(ip_value: AllIPTypes) -> tuple[int, int]:
+        if isinstance(ip_value, IPAddressType):
+            return int(ip_value.ip), ip_value.max_prefixlen
+        return int(ip_value.network_address), ip_value.prefixlen
+
+    def add(self, node_id: str, ip_value: AllIPTypes) -> None:
+        self.remove(node_id=node_id)
+
+        tree = self.trees[ip_value.version]
+        path = tree.insert(*self._get_key(ip_value))
+        if isinstance(ip_value, IPAddressType):
+            path[-1].addresses[node_id] = ip_value.network.prefixlen
+            self.addresses[node_id] = ip_value
+        else:
+            path[-1].prefixes.add(node_id)
+            self.prefixes[node_id] = ip_value
+        tree.refresh(path=path)
+
+    def remove(self, node_id: str) -> None:
+        ip_value: Optional[AllIPTypes] = self.prefixes.pop(node_id, None)
+        if ip_value is None:
+            ip_value = self.addresses.pop(node_id, None)
+        if ip_value is None:
+            return
+
+        tree = self.trees[ip_value.version]
+        path = tree.find(*self._get_key(ip_value))
+        path[-1].prefixes.discard(node_id)
+        path[-1].addresses.pop(node_id, None)
+        tree.cleanup(path=path)
+
+    def get_value(self, node_id: str) -> AllIPTypes:
+        if node_id in self.prefixes:
+            return self.prefixes[node_id]
+        return self.addresses[node_id]
+
+    def get_ids(self, ip_value: AllIPTypes) -> list[str]:
+        """Return the nodes with this exact value."""
+        network, prefixlen = self._get_key(ip_value)
+        path = self.trees[ip_value.version].find(network, prefixlen)
+        if not path or path[-1].prefixlen != prefixlen:
+            return []
+        if isinstance(ip_value, IPAddressType):
+            return sorted(node_id for node_id in path[-1].addresses if self.addresses[node_id] == ip_value)
+        return sorted(path[-1].prefixes)
+
+    def get_parent(self, ip_value: AllIPTypes) -> Optional[str]:
+        """Return the most specific prefix containing the value, an address can't be in a prefix longer than its network."""
+        if isinstance(ip_value, IPAddressType):
+            max_prefixlen = ip_value.network.prefixlen
+        else:
+            max_prefixlen = ip_value.prefixlen - 1
+
+        parent: Optional[RadixNode] = None
+        for node in self.trees[ip_value.version].find(*self._get_key(ip_value)):
+            if node.prefixlen > max_prefixlen:
+                break
+            if node.prefixes:
+                parent = node
+
+        if parent is None:
+            return None
+        return min(parent.prefixes)
+
+    def get_children(self, ip_value: AllIPTypes) -> list[str]:
+        """Return the prefixes and addresses whose parent is the value, only a prefix can have children."""
+        if isinstance(ip_value, IPAddressType):
+            return []
+
+        prefixlen = ip_value.prefixlen
+        start = self.trees[ip_value.version].find_subtree(int(ip_value.network_address), prefixlen)
+        if start is None:
+            return []
+
+        children: list[str] = []
+        # The prefix length of the shallowest prefix found between the value and each node, the prefixes below it
+        # are not children of the value, nor the addresses with an interface within this prefix
+        stack: list[tuple[RadixNode, Optional[int]]] = [(start, None)]
+        while stack:
+            node, covering_prefixlen = stack.pop()
+            if node.prefixlen > prefixlen and node.prefixes and covering_prefixlen is None:
+                children.extend(sorted(node.prefixes))
+                covering_prefixlen = node.prefixlen
+
+            children.extend(
+                sorted(
+                    node_id
+                    for node_id, address_prefixlen in node.addresses.items()
+                    if address_prefixlen >= prefixlen
+                    and (covering_prefixlen is None or address_prefixlen < covering_prefixlen)
+                )
+            )
+
+            for child in reversed(node.children):
+                if child is None:
+                    continue
+                if covering_prefixlen is not None and child.min_address_prefixlen >= covering_prefixlen:
+                    continue
+                stack.append((child, covering_prefixlen))
+
+        return children
+
+    def get_subnets(self, ip_prefix: IPNetworkType) -> list[tuple[str, IPNetworkType]]:
+        """Return the prefixes within the prefix that are not within another one, ordered by network."""
+        prefixlen = ip_prefix.prefixlen
+        start = self.trees[ip_prefix.version].find_subtree(int(ip_prefix.network_address), prefixlen)
+        if start is None:
+            return []
+
+        subnets: list[tuple[str, IPNetworkType]] = []
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            if node.prefixlen > prefixlen and node.prefixes:
+                subnets.extend((node_id, self.prefixes[node_id]) for node_id in sorted(node.prefixes))
+                continue
+            stack.extend(child for child in reversed(node.children) if child is not None)
+
+        return subnets
+
+    def get_ip_addresses(self, ip_prefix: IPNetworkType) -> list[tuple[str, IPAddressType]]:
+        """Return all the addresses within the prefix, ordered by address."""
+        tree = self.trees[ip_prefix.version]
+        prefixlen = ip_prefix.prefixlen
+        start = tree.find_subtree(int(ip_prefix.network_address), prefixlen)
+        if start is None:
+            return []
+
+        addresses: list[tuple[str, IPAddressType]] = []
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            addresses.extend(
+                (node_id, self.addresses[node_id])
+                for node_id, address_prefixlen in sorted(node.addresses.items(), key=lambda item: (item[1], item[0]))
+                if address_prefixlen >= prefixlen
+            )
+            stack.extend(
+                child
+                for child in reversed(node.children)
+                if child is not None and child.min_address_prefixlen <= tree.max_prefixlen
+            )
+
+        return addresses
+
+
+class IPNamespaceTreeCache(BranchCache[IPNamespaceTree]):
+    """Cache of the IP prefixes and IP addresses of each branch, indexed by branch and by namespace.
+
+    The values are loaded once per branch and namespace, after that only the nodes modified since the previous
+    synchronization are loaded again. The modifications done by any worker are found with the time properties of
+    the edges, the cache doesn't need to be notified when a prefix or an address is saved or deleted.
+    The least recently used namespaces are removed when more than max_size namespaces are cached.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        super().__init__()
+        self._max_size = max_size
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return config.SETTINGS.api.ipam_tree_cache_size
+
+    async def get(
+        self, db: InfrahubDatabase, branch: Branch, namespace_id: str, at: Timestamp, full_sync: bool = False
+    ) -> Optional[IPNamespaceTree]:
+        """Synchronize and return the tree of a namespace, None is returned if it can't be used at this time.
+
+        The tree only contains committed data and can't be used within a transaction or if the namespace has been
+        modified after the requested time. If full_sync is set, the tree is loaded again completely.
+        """
+        if db.is_transaction or self.max_size <= 0:
+            return None
+
+        key = (branch.name, namespace_id)
+        synced_at = Timestamp()
+
+        tree = self._get_item(key=key)
+        if tree and (full_sync or tree.branched_from != branch.branched_from):
+            tree = None
+
+        if tree is None:
+            query = await IPNodeValuesQuery.init(db=db, branch=branch, namespace=namespace_id, at=synced_at)
+            await query.execute(db=db)
+            tree = IPNamespaceTree(branched_from=branch.branched_from, synced_at=synced_at)
+            for ip_node in query.get_nodes():
+                tree.add(node_id=ip_node.id, ip_value=ip_node.ip_value)
+            self._set_item(key=key, item=tree)
+            since = at
+        elif not is_sync_required(synced_at=tree.synced_at, at=at):
+            return tree
+        else:
+            since = get_sync_since(synced_at=tree.synced_at, at=at)
+
+        changes_query = await IPNodeChangesQuery.init(db=db, branch=branch, since=since)
+        await changes_query.execute(db=db)
+        changes = changes_query.get_changes()
+
+        if changes:
+            query = await IPNodeValuesQuery.init(db=db, branch=branch, node_ids=list(changes.keys()), at=synced_at)
+            await query.execute(db=db)
+            ip_nodes = {ip_node.id: ip_node for ip_node in query.get_nodes()}
+            for node_id in changes:
+                ip_node = ip_nodes.get(node_id)
+                if ip_node and ip_node.namespace_id == namespace_id:
+                    tree.add(node_id=node_id, ip_value=ip_node.ip_value)
+                else:
+                    tree.remove(node_id=node_id)
+        tree.synced_at = synced_at
+
+        if has_changes_after(changes=changes.values(), at=at):
+            return None
+        return tree
+
+
+ipam_tree_cache = IPNamespaceTreeCache()
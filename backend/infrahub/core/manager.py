@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from functools import reduce
 from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, Union, overload
 
 from infrahub_sdk.utils import deep_merge_dict, is_valid_uuid
 
+from infrahub.core.hfid import hfid_index_cache, load_hfid_values
+from infrahub.core.hierarchy import hierarchy_closure_cache
 from infrahub.core.node import Node
 from infrahub.core.node.delete_validator import NodeDeleteValidator
 from infrahub.core.query.node import (
     AttributeFromDB,
     AttributeNodePropertyFromDB,
     NodeAttributesFromDB,
+    NodeCreateManyQuery,
+    NodeDeleteManyQuery,
     NodeGetHierarchyQuery,
     NodeGetListQuery,
     NodeListGetAttributeQuery,
@@ -57,9 +62,9 @@ def get_schema(
     db: InfrahubDatabase, branch: Branch, node_schema: type[SchemaProtocol] | MainSchemaTypes | str
 ) -> MainSchemaTypes:
     if isinstance(node_schema, str):
-        return db.schema.get(name=node_schema, branch=branch.name)
+        return db.schema.get(name=node_schema, branch=branch.name, duplicate=False)
     if hasattr(node_schema, "_is_runtime_protocol") and getattr(node_schema, "_is_runtime_protocol"):
-        return db.schema.get(name=node_schema.__name__, branch=branch.name)
+        return db.schema.get(name=node_schema.__name__, branch=branch.name, duplicate=False)
     if not isinstance(node_schema, (MainSchemaTypes)):
         raise ValueError(f"Invalid schema provided {node_schema}")
 
@@ -413,12 +418,18 @@ class NodeManager:
         branch = await registry.get_branch(branch=branch, db=db)
         at = Timestamp(at)
 
+        hierarchy_schema = node_schema.get_hierarchy_schema(db=db, branch=branch)
+        peer_ids = await hierarchy_closure_cache.get_relatives(
+            db=db, branch=branch, hierarchy=hierarchy_schema.kind, node_id=id, direction=direction, at=at
+        )
+
         query = await NodeGetHierarchyQuery.init(
             db=db,
             direction=direction,
             node_id=id,
             node_schema=node_schema,
             filters=filters,
+            peer_ids=peer_ids,
             at=at,
             branch=branch,
         )
@@ -442,12 +453,18 @@ class NodeManager:
         branch = await registry.get_branch(branch=branch, db=db)
         at = Timestamp(at)
 
+        hierarchy_schema = node_schema.get_hierarchy_schema(db=db, branch=branch)
+        hierarchy_peer_ids = await hierarchy_closure_cache.get_relatives(
+            db=db, branch=branch, hierarchy=hierarchy_schema.kind, node_id=id, direction=direction, at=at
+        )
+
         query = await NodeGetHierarchyQuery.init(
             db=db,
             direction=direction,
             node_id=id,
             node_schema=node_schema,
             filters=filters,
+            peer_ids=hierarchy_peer_ids,
             offset=offset,
             limit=limit,
             at=at,
@@ -460,8 +477,6 @@ class NodeManager:
         if not peers_ids:
             return {}
 
-        hierarchy_schema = node_schema.get_hierarchy_schema(db=db, branch=branch)
-
         # if display_label has been requested we need to ensure we are querying the right fields
         if fields and "display_label" in fields:
             schema_branch = db.schema.get_schema_branch(name=branch.name)
@@ -805,20 +820,33 @@ class NodeManager:
 
             filters[key] = path.attribute_schema.get_class().deserialize_from_string(item)
 
-        items = await NodeManager.query(
-            db=db,
-            schema=node_schema,
-            fields=fields,
-            limit=2,
-            filters=filters,
-            branch=branch,
-            at=at,
-            include_owner=include_owner,
-            include_source=include_source,
-            prefetch_relationships=prefetch_relationships,
-            account=account,
-            branch_agnostic=branch_agnostic,
-        )
+        query_params: dict[str, Any] = {
+            "db": db,
+            "schema": node_schema,
+            "fields": fields,
+            "limit": 2,
+            "branch": branch,
+            "at": at,
+            "include_owner": include_owner,
+            "include_source": include_source,
+            "prefetch_relationships": prefetch_relationships,
+            "account": account,
+            "branch_agnostic": branch_agnostic,
+        }
+
+        items = []
+        if not branch_agnostic:
+            # Resolve the human friendly id from the index and only query the matching nodes
+            node_ids = await hfid_index_cache.lookup(
+                db=db, branch=branch, schema=node_schema, values=list(filters.values()), at=at
+            )
+            if node_ids:
+                items = await NodeManager.query(filters={"ids": node_ids[:2]}, **query_params)
+
+        # The nodes committed by other workers are not in the index until its next synchronization,
+        # the graph is queried when the index has no match
+        if not items:
+            items = await NodeManager.query(filters=filters, **query_params)
 
         if len(items) < 1:
             if raise_on_error:
@@ -1210,8 +1238,98 @@ class NodeManager:
 
             nodes[node_id] = item
 
+        if fields and "hfid" in fields:
+            await cls._preload_hfid_peer_values(db=db, nodes=list(nodes.values()), branch=branch, at=at)
+
         return nodes
 
+    @classmethod
+    async def _preload_hfid_peer_values(
+        cls, db: InfrahubDatabase, nodes: list[Node], branch: Branch, at: Timestamp
+    ) -> None:
+        """Query the values of the peers used by the human friendly id of the nodes with one query per kind.
+
+        Without it, each node would resolve and fetch its peers one by one to render its human friendly id.
+        """
+        nodes_per_kind: dict[str, list[Node]] = defaultdict(list)
+        for node in nodes:
+            hfid = node._schema.human_friendly_id or []
+            if any(path.split("__")[0] in node._schema.relationship_names for path in hfid):
+                nodes_per_kind[node.get_kind()].append(node)
+
+        for kind_nodes in nodes_per_kind.values():
+            schema = kind_nodes[0]._schema
+            values = await load_hfid_values(
+                db=db, branch=branch, schema=schema, node_ids=[node.get_id() for node in kind_nodes], at=at
+            )
+            if values is None:
+                continue
+
+            for node in kind_nodes:
+                node_values = values.get(node.get_id())
+                if node_values is None:
+                    continue
+                node._hfid_peer_values = {
+                    path: value
+                    for path, value in zip(schema.human_friendly_id, node_values)
+                    if path.split("__")[0] in schema.relationship_names
+                }
+
+    @classmethod
+    async def create_many(
+        cls,
+        db: InfrahubDatabase,
+        nodes: list[Node],
+        at: Optional[Union[Timestamp, str]] = None,
+        batch_size: int = 1_000,
+    ) -> list[Node]:
+        """Create multiple new nodes in the database.
+
+        The nodes are grouped by kind and each group is created with a single query per batch of `batch_size` nodes,
+        instead of one query per node. The nodes must have been initialized with `Node.new` and
+        must have been validated beforehand, no constraint is checked by this method.
+
+        Args:
+            db (InfrahubDatabase): Database connection, all the queries are executed within the same transaction.
+            nodes (list[Node]): List of nodes to create.
+            at (Timestamp or Str, optional): Time of the creation. Defaults to None.
+            batch_size (int, optional): Maximum number of nodes to create in a single query. Defaults to 1000.
+
+        Returns:
+            list[Node]: The nodes provided, now flagged as existing in the database.
+        """
+        create_at = Timestamp(at)
+
+        nodes_per_kind: dict[str, list[Node]] = defaultdict(list)
+        for node in nodes:
+            if node._existing:
+                raise ValueError(f"The node {node.get_id()} already exists in the database")
+            nodes_per_kind[node.get_kind()].append(node)
+
+        if db.is_transaction:
+            await cls._create_many(db=db, nodes_per_kind=nodes_per_kind, at=create_at, batch_size=batch_size)
+        else:
+            async with db.start_transaction() as dbt:
+                await cls._create_many(db=dbt, nodes_per_kind=nodes_per_kind, at=create_at, batch_size=batch_size)
+
+        return nodes
+
+    @classmethod
+    async def _create_many(
+        cls, db: InfrahubDatabase, nodes_per_kind: dict[str, list[Node]], at: Timestamp, batch_size: int
+    ) -> None:
+        for kind_nodes in nodes_per_kind.values():
+            branch = kind_nodes[0].get_branch_based_on_support_type()
+            for idx in range(0, len(kind_nodes), batch_size):
+                batch = kind_nodes[idx : idx + batch_size]
+                query = await NodeCreateManyQuery.init(db=db, nodes=batch, branch=branch, at=at)
+                await query.execute(db=db)
+
+                ids_per_node = query.get_ids_per_node()
+                for node in batch:
+                    db_id, new_ids = ids_per_node[node.get_id()]
+                    node._set_created(db_id=db_id, new_ids=new_ids, at=at)
+
     @classmethod
     async def delete(
         cls,
@@ -1219,9 +1337,15 @@ class NodeManager:
         nodes: list[Node],
         branch: Optional[Union[Branch, str]] = None,
         at: Optional[Union[Timestamp, str]] = None,
+        batch_size: int = 1_000,
     ) -> list[Any]:
-        """Returns list of deleted nodes because of cascading deletes"""
+        """Returns list of deleted nodes because of cascading deletes
+
+        The nodes are grouped by kind and each group is deleted with a single query per batch of `batch_size` nodes,
+        the nodes implementing their own deletion are deleted one by one.
+        """
         branch = await registry.get_branch(branch=branch, db=db)
+        delete_at = Timestamp(at)
         node_delete_validator = NodeDeleteValidator(db=db, branch=branch)
         ids_to_delete = await node_delete_validator.get_ids_to_delete(nodes=nodes, at=at)
         node_ids = {node.get_id() for node in nodes}
@@ -1229,12 +1353,33 @@ class NodeManager:
         if missing_ids_to_delete:
             node_map = await cls.get_many(db=db, ids=list(missing_ids_to_delete), branch=branch, at=at)
             nodes += list(node_map.values())
-        deleted_nodes = []
+
+        deleted_nodes: dict[str, Node] = {}
+        nodes_per_kind: dict[tuple[str, str], list[Node]] = defaultdict(list)
         for node in nodes:
-            await node.delete(db=db, at=at)
-            deleted_nodes.append(node)
+            if node.get_id() in deleted_nodes:
+                continue
+            deleted_nodes[node.get_id()] = node
+            if type(node).delete is not Node.delete:
+                await node.delete(db=db, at=delete_at)
+            else:
+                nodes_per_kind[node._branch.name, node.get_kind()].append(node)
+
+        global_branch = registry.get_global_branch()
+        for kind_nodes in nodes_per_kind.values():
+            identifiers = sorted({rel_schema.identifier for rel_schema in kind_nodes[0].get_schema().relationships})
+            for idx in range(0, len(kind_nodes), batch_size):
+                query = await NodeDeleteManyQuery.init(
+                    db=db,
+                    node_ids=[node.get_id() for node in kind_nodes[idx : idx + batch_size]],
+                    identifiers=identifiers,
+                    global_branch=global_branch,
+                    branch=kind_nodes[0]._branch,
+                    at=delete_at,
+                )
+                await query.execute(db=db)
 
-        return deleted_nodes
+        return list(deleted_nodes.values())
 
 
 registry.manager = NodeManager
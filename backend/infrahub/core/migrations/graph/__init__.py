@@ -18,6 +18,7 @@ from .m013_convert_git_password_credential import Migration013
 from .m014_remove_index_attr_value import Migration014
 from .m015_diff_format_update import Migration015
 from .m016_diff_delete_bug_fix import Migration016
+from .m017_add_edge_timestamps import Migration017
 
 if TYPE_CHECKING:
     from infrahub.core.root import Root
@@ -41,6 +42,7 @@ MIGRATIONS: list[type[Union[GraphMigration, InternalSchemaMigration, ArbitraryMi
     Migration014,
     Migration015,
     Migration016,
+    Migration017,
 ]
 
 
@@ -54,4 +56,9 @@ async def get_graph_migrations(
             continue
         applicable_migrations.append(migration)
 
+    # The queries of the previous migrations filter the edges on their integer timestamps,
+    # these timestamps must be added first without changing the version of the graph
+    if len(applicable_migrations) > 1 and isinstance(applicable_migrations[-1], Migration017):
+        applicable_migrations.insert(0, Migration017.init(minimum_version=root.graph_version - 1))
+
     return applicable_migrations
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional
+
+from infrahub.core.migrations.shared import MigrationResult
+from infrahub.core.query import Query, QueryType
+from infrahub.core.timestamp import Timestamp
+from infrahub.log import get_logger
+
+from ..shared import ArbitraryMigration
+
+if TYPE_CHECKING:
+    from infrahub.database import InfrahubDatabase
+
+log = get_logger()
+
+# Every edge carrying a time is connected to at least one vertex with one of these labels
+VERTEX_LABELS = ["Node", "Attribute", "Relationship"]
+BATCH_SIZE = 1000
+
+
+@lru_cache(maxsize=4096)
+def _to_epoch_microseconds(value: str) -> int:
+    # The edges created by the same query share the same time, the conversion is cached
+    return Timestamp(value).to_epoch_microseconds()
+
+
+class Migration017GetEdgesQuery(Query):
+    """Return the edges without the integer timestamps connected to a batch of vertices following uuid_after."""
+
+    name = "migration_017_get_edges"
+    type: QueryType = QueryType.READ
+
+    def __init__(self, label: str, batch_size: int, uuid_after: Optional[str] = None, **kwargs: Any) -> None:
+        self.label = label
+        self.batch_size = batch_size
+        self.uuid_after = uuid_after
+
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        uuid_filter = ""
+        if self.uuid_after is not None:
+            self.params["uuid_after"] = self.uuid_after
+            uuid_filter = "WHERE n.uuid > $uuid_after"
+
+        query = """
+        MATCH (n:%(label)s)
+        %(uuid_filter)s
+        WITH n
+        ORDER BY n.uuid
+        LIMIT %(batch_size)s
+        OPTIONAL MATCH (n)-[r]-()
+        WHERE r.from IS NOT NULL AND (r.from_ts IS NULL OR (r.to IS NOT NULL AND r.to_ts IS NULL))
+        """ % {"label": self.label, "uuid_filter": uuid_filter, "batch_size": self.batch_size}
+        self.add_to_query(query)
+        self.return_labels = [
+            "n.uuid AS uuid",
+            "%s(r) AS rel_id" % db.get_id_function_name(),
+            "r.from AS rel_from",
+            "r.to AS rel_to",
+        ]
+
+    def get_last_uuid(self) -> Optional[str]:
+        uuids = [result.get_as_type(label="uuid", return_type=str) for result in self.results]
+        return max(uuids) if uuids else None
+
+    def get_edges(self) -> list[dict[str, Any]]:
+        edges: dict[Any, dict[str, Any]] = {}
+        for result in self.results:
+            rel_id = result.get("rel_id")
+            if rel_id is None or rel_id in edges:
+                continue
+            rel_to = result.get("rel_to")
+            edges[rel_id] = {
+                "id": rel_id,
+                "from_ts": _to_epoch_microseconds(result.get("rel_from")),
+                "to_ts": _to_epoch_microseconds(rel_to) if rel_to else None,
+            }
+        return list(edges.values())
+
+
+class Migration017SetEdgesQuery(Query):
+    name = "migration_017_set_edges"
+    type: QueryType = QueryType.WRITE
+    insert_return: bool = False
+
+    def __init__(self, edges: list[dict[str, Any]], **kwargs: Any) -> None:
+        self.edges = edges
+
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params["edges"] = self.edges
+
+        query = """
+        UNWIND $edges AS edge
+        MATCH ()-[r]->()
+        WHERE %(id_func)s(r) = edge.id
+        SET r.from_ts = edge.from_ts, r.to_ts = edge.to_ts
+        """ % {"id_func": db.get_id_function_name()}
+        self.add_to_query(query)
+
+
+class Migration017CountQuery(Query):
+    name = "migration_017_count"
+    type: QueryType = QueryType.READ
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        query = """
+        MATCH ()-[r]->()
+        WHERE r.from IS NOT NULL AND (r.from_ts IS NULL OR (r.to IS NOT NULL AND r.to_ts IS NULL))
+        """
+        self.add_to_query(query)
+        self.return_labels = ["count(r) AS nbr_edges"]
+
+    def get_count(self) -> int:
+        result = self.get_result()
+        return result.get_as_type(label="nbr_edges", return_type=int) if result else 0
+
+
+async def add_edge_timestamps(db: InfrahubDatabase, batch_size: int = BATCH_SIZE) -> int:
+    """Store the integer `from_ts` and `to_ts` on the edges only having the `from` and `to` strings.
+
+    The vertices are processed in batches ordered by uuid so each batch is anchored on the index of the uuids,
+    the timestamps are converted in Python to behave the same way with all the databases.
+    Return the number of edges updated.
+    """
+    nbr_edges = 0
+    for label in VERTEX_LABELS:
+        uuid_after: Optional[str] = None
+        while True:
+            query = await Migration017GetEdgesQuery.init(
+                db=db, label=label, batch_size=batch_size, uuid_after=uuid_after
+            )
+            await query.execute(db=db)
+            uuid_after = query.get_last_uuid()
+            if uuid_after is None:
+                break
+
+            edges = query.get_edges()
+            if edges:
+                async with db.start_transaction() as ts:
+                    set_query = await Migration017SetEdgesQuery.init(db=ts, edges=edges)
+                    await set_query.execute(db=ts)
+                nbr_edges += len(edges)
+
+    return nbr_edges
+
+
+class Migration017(ArbitraryMigration):
+    name: str = "017_add_edge_timestamps"
+    minimum_version: int = 16
+
+    async def validate_migration(self, db: InfrahubDatabase) -> MigrationResult:
+        result = MigrationResult()
+
+        query = await Migration017CountQuery.init(db=db)
+        await query.execute(db=db)
+        if nbr_edges := query.get_count():
+            result.errors.append(f"{nbr_edges} edges are missing their integer timestamps")
+
+        return result
+
+    async def execute(self, db: InfrahubDatabase) -> MigrationResult:
+        result = MigrationResult()
+
+        try:
+            nbr_edges = await add_edge_timestamps(db=db)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            result.errors.append(str(exc))
+            return result
+
+        log.info(f"Added the integer timestamps to {nbr_edges} edges")
+        return result
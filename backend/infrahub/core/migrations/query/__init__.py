@@ -1,13 +1,78 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from infrahub.core.query import Query, QueryType
 
 if TYPE_CHECKING:
+    from infrahub.database import InfrahubDatabase
+
     from ..shared import AttributeSchemaMigration, SchemaMigration
 
 
+def get_batch_conditions(
+    query: Query, variable: str, uuid_after: Optional[str], uuid_until: Optional[str]
+) -> list[str]:
+    """Return the conditions limiting the vertices processed by a migration query to the ones with a uuid within a batch.
+
+    The batch includes the uuids greater than uuid_after and lower or equal to uuid_until, a missing bound is open.
+    The conditions must be part of the MATCH of the vertices for the range to be looked up in the index of the uuids.
+    """
+    conditions = []
+    if uuid_after is not None:
+        query.params["batch_uuid_after"] = uuid_after
+        conditions.append(f"{variable}.uuid > $batch_uuid_after")
+    if uuid_until is not None:
+        query.params["batch_uuid_until"] = uuid_until
+        conditions.append(f"{variable}.uuid <= $batch_uuid_until")
+    return conditions
+
+
+class MigrationBatchBoundaryQuery(Query):
+    """Split the sorted uuids of the vertices with a given label following uuid_after in batches of batch_size vertices,
+    return the uuid of the last vertex of each batch but the last one.
+    """
+
+    name = "migration_batch_boundary"
+    type: QueryType = QueryType.READ
+
+    def __init__(
+        self,
+        label: str,
+        batch_size: int,
+        uuid_after: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.label = label
+        self.batch_size = batch_size
+        self.uuid_after = uuid_after
+
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        uuid_filter = ""
+        if self.uuid_after is not None:
+            self.params["uuid_after"] = self.uuid_after
+            uuid_filter = "WHERE n.uuid > $uuid_after"
+
+        query = """
+        MATCH (n:%(label)s)
+        %(uuid_filter)s
+        WITH DISTINCT n.uuid AS uuid
+        ORDER BY uuid
+        WITH collect(uuid) AS uuids
+        UNWIND range($batch_size - 1, size(uuids) - 1, $batch_size) AS boundary_index
+        WITH uuids[boundary_index] AS boundary
+        """ % {"label": self.label, "uuid_filter": uuid_filter}
+        self.params["batch_size"] = self.batch_size
+        self.add_to_query(query)
+        self.return_labels = ["boundary"]
+        self.order_by = ["boundary"]
+
+    def get_boundaries(self) -> list[str]:
+        return [result.get_as_type(label="boundary", return_type=str) for result in self.get_results()]
+
+
 class MigrationQuery(Query):
     type: QueryType = QueryType.WRITE
 
@@ -19,6 +84,11 @@ class MigrationQuery(Query):
         self.migration = migration
         super().__init__(**kwargs)
 
+    @classmethod
+    def get_batch_label(cls, migration: SchemaMigration) -> Optional[str]:  # pylint: disable=unused-argument
+        """Return the label of the vertices to process by batches, or None if the query must process all of them at once."""
+        return None
+
     def get_nbr_migrations_executed(self) -> int:
         return self.num_of_results
 
@@ -34,5 +104,10 @@ class AttributeMigrationQuery(Query):
         self.migration = migration
         super().__init__(**kwargs)
 
+    @classmethod
+    def get_batch_label(cls, migration: AttributeSchemaMigration) -> Optional[str]:  # pylint: disable=unused-argument
+        """Return the label of the vertices to process by batches, or None if the query must process all of them at once."""
+        return None
+
     def get_nbr_migrations_executed(self) -> int:
         return self.num_of_results
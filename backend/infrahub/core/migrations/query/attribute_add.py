@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING, Any, Optional
 from infrahub.core.constants import NULL_VALUE, RelationshipStatus
 from infrahub.core.query import Query
 
+from . import get_batch_conditions
+
 if TYPE_CHECKING:
     from infrahub.database import InfrahubDatabase
 
@@ -19,6 +21,8 @@ class AttributeAddQuery(Query):
         attribute_kind: str,
         branch_support: str,
         default_value: Optional[Any] = None,
+        uuid_after: Optional[str] = None,
+        uuid_until: Optional[str] = None,
         **kwargs: Any,
     ) -> None:
         self.node_kind = node_kind
@@ -26,6 +30,8 @@ class AttributeAddQuery(Query):
         self.attribute_kind = attribute_kind
         self.branch_support = branch_support
         self.default_value = default_value
+        self.uuid_after = uuid_after
+        self.uuid_until = uuid_until
 
         super().__init__(**kwargs)
 
@@ -48,14 +54,23 @@ class AttributeAddQuery(Query):
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.ACTIVE.value,
             "from": self.at.to_string(),
+            "from_ts": self.at.to_epoch_microseconds(),
         }
 
         self.params["is_protected_default"] = False
         self.params["is_visible_default"] = True
 
+        conditions = [
+            *get_batch_conditions(query=self, variable="n", uuid_after=self.uuid_after, uuid_until=self.uuid_until),
+            "NOT exists((n)-[:HAS_ATTRIBUTE]-(:Attribute { name: $attr_name }))",
+        ]
         query = """
         MATCH p = (n:%(node_kind)s)
-        WHERE NOT exists((n)-[:HAS_ATTRIBUTE]-(:Attribute { name: $attr_name }))
+        WHERE %(conditions)s
+        """ % {"node_kind": self.node_kind, "conditions": " AND ".join(conditions)}
+        self.add_to_query(query)
+
+        query = """
         CALL {
             WITH n
             MATCH (root:Root)<-[r:IS_PART_OF]-(n)
@@ -75,7 +90,7 @@ class AttributeAddQuery(Query):
         CREATE (a)-[:HAS_VALUE $rel_props ]->(av)
         CREATE (a)-[:IS_PROTECTED $rel_props]->(is_protected_value)
         CREATE (a)-[:IS_VISIBLE $rel_props]->(is_visible_value)
-        """ % {"branch_filter": branch_filter, "node_kind": self.node_kind}
+        """ % {"branch_filter": branch_filter}
         self.add_to_query(query)
         self.return_labels = ["n.uuid", "a.uuid"]
 
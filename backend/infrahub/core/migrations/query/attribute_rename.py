@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from pydantic import BaseModel
 
@@ -8,6 +8,8 @@ from infrahub.core.constants import BranchSupportType, RelationshipStatus
 from infrahub.core.graph.schema import GraphAttributeRelationships
 from infrahub.core.query import Query
 
+from . import get_batch_conditions
+
 if TYPE_CHECKING:
     from pydantic.fields import FieldInfo
 
@@ -28,20 +30,31 @@ class AttributeRenameQuery(Query):
         self,
         previous_attr: AttributeInfo,
         new_attr: AttributeInfo,
+        uuid_after: Optional[str] = None,
+        uuid_until: Optional[str] = None,
         **kwargs: Any,
     ) -> None:
         self.previous_attr = previous_attr
         self.new_attr = new_attr
+        self.uuid_after = uuid_after
+        self.uuid_until = uuid_until
 
         super().__init__(**kwargs)
 
     def render_match(self) -> str:
+        batch_conditions = get_batch_conditions(
+            query=self, variable="node", uuid_after=self.uuid_after, uuid_until=self.uuid_until
+        )
         query = """
         // Find all the active nodes
         MATCH (node:Node)
         WHERE ( "Profile%(node_kind)s" IN LABELS(node) OR "%(node_kind)s" IN LABELS(node) )
            AND exists((node)-[:HAS_ATTRIBUTE]-(:Attribute { name: $prev_attr.name }))
-        """ % {"node_kind": self.previous_attr.node_kind}
+           %(batch_filter)s
+        """ % {
+            "node_kind": self.previous_attr.node_kind,
+            "batch_filter": "".join(f" AND {condition}" for condition in batch_conditions),
+        }
 
         return query
 
@@ -87,6 +100,8 @@ class AttributeRenameQuery(Query):
         self.params["prev_attr"] = self.previous_attr.model_dump()
 
         self.params["current_time"] = self.at.to_string()
+        self.params["current_time_ts"] = self.at.to_epoch_microseconds()
+
         self.params["branch_name"] = self.branch.name
 
         self.params["rel_props_create"] = {
@@ -94,6 +109,7 @@ class AttributeRenameQuery(Query):
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.ACTIVE.value,
             "from": self.at.to_string(),
+            "from_ts": self.at.to_epoch_microseconds(),
         }
 
         self.params["rel_props_delete"] = {
@@ -101,6 +117,7 @@ class AttributeRenameQuery(Query):
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.DELETED.value,
             "from": self.at.to_string(),
+            "from_ts": self.at.to_epoch_microseconds(),
         }
 
         sub_queries_create = [
@@ -173,7 +190,7 @@ class AttributeRenameQuery(Query):
         else:
             query = """
             FOREACH (i in CASE WHEN rb.branch = $branch_name THEN [1] ELSE [] END |
-                SET rb.to = $current_time
+                SET rb.to = $current_time, rb.to_ts = $current_time_ts
             )
             RETURN DISTINCT new_attr
             """
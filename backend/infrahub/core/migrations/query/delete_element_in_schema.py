@@ -98,6 +98,8 @@ class DeleteElementInSchemaQuery(Query):
         self.params["node_namespace"] = self.node_namespace
 
         self.params["current_time"] = self.at.to_string()
+        self.params["current_time_ts"] = self.at.to_epoch_microseconds()
+
         self.params["branch_name"] = self.branch.name
 
         self.params["rel_props_prev"] = {
@@ -105,6 +107,7 @@ class DeleteElementInSchemaQuery(Query):
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.DELETED.value,
             "from": self.at.to_string(),
+            "from_ts": self.at.to_epoch_microseconds(),
         }
 
         sub_query_out = self._render_sub_query_out()
@@ -144,7 +147,7 @@ class DeleteElementInSchemaQuery(Query):
         }
         WITH p2 as peer_node, rel_outband, element_to_delete
         FOREACH (i in CASE WHEN rel_outband.branch = $branch_name THEN [1] ELSE [] END |
-            SET rel_outband.to = $current_time
+            SET rel_outband.to = $current_time, rel_outband.to_ts = $current_time_ts
         )
         WITH DISTINCT(element_to_delete) AS element_to_delete
         // Process Inbound Relationship
@@ -164,7 +167,7 @@ class DeleteElementInSchemaQuery(Query):
         }
         WITH p2 as peer_node, rel_inband, element_to_delete
         FOREACH (i in CASE WHEN rel_inband.branch = $branch_name THEN [1] ELSE [] END |
-            SET rel_inband.to = $current_time
+            SET rel_inband.to = $current_time, rel_inband.to_ts = $current_time_ts
         )
         RETURN DISTINCT element_to_delete
         """ % {
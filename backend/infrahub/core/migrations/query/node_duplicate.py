@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from pydantic import BaseModel
 
@@ -8,6 +8,8 @@ from infrahub.core.constants import BranchSupportType, RelationshipStatus
 from infrahub.core.graph.schema import GraphNodeRelationships, GraphRelDirection
 from infrahub.core.query import Query
 
+from . import get_batch_conditions
+
 if TYPE_CHECKING:
     from pydantic.fields import FieldInfo
 
@@ -33,17 +35,26 @@ class NodeDuplicateQuery(Query):
         self,
         previous_node: SchemaNodeInfo,
         new_node: SchemaNodeInfo,
+        uuid_after: Optional[str] = None,
+        uuid_until: Optional[str] = None,
         **kwargs: Any,
     ) -> None:
         self.previous_node = previous_node
         self.new_node = new_node
+        self.uuid_after = uuid_after
+        self.uuid_until = uuid_until
 
         super().__init__(**kwargs)
 
     def render_match(self) -> str:
+        batch_conditions = get_batch_conditions(
+            query=self, variable="node", uuid_after=self.uuid_after, uuid_until=self.uuid_until
+        )
+        batch_filter = f"WHERE {' AND '.join(batch_conditions)}" if batch_conditions else ""
         query = f"""
         // Find all the active nodes
         MATCH (node:{self.previous_node.kind})
+        {batch_filter}
         """
 
         return query
@@ -96,6 +107,8 @@ class NodeDuplicateQuery(Query):
         self.params["previous_node"] = self.previous_node.model_dump()
 
         self.params["current_time"] = self.at.to_string()
+        self.params["current_time_ts"] = self.at.to_epoch_microseconds()
+
         self.params["branch_name"] = self.branch.name
         self.params["branch_support"] = self.new_node.branch_support
 
@@ -104,6 +117,7 @@ class NodeDuplicateQuery(Query):
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.ACTIVE.value,
             "from": self.at.to_string(),
+            "from_ts": self.at.to_epoch_microseconds(),
         }
 
         self.params["rel_props_prev"] = {
@@ -111,6 +125,7 @@ class NodeDuplicateQuery(Query):
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.DELETED.value,
             "from": self.at.to_string(),
+            "from_ts": self.at.to_epoch_microseconds(),
         }
 
         sub_query_out = self._render_sub_query_out()
@@ -149,7 +164,7 @@ class NodeDuplicateQuery(Query):
         }
         WITH p2 as peer_node, rel_outband, active_node, new_node
         FOREACH (i in CASE WHEN rel_outband.branch = $branch_name THEN [1] ELSE [] END |
-            SET rel_outband.to = $current_time
+            SET rel_outband.to = $current_time, rel_outband.to_ts = $current_time_ts
         )
         WITH active_node, new_node
         MATCH (active_node)<-[]-(peer)
@@ -168,7 +183,7 @@ class NodeDuplicateQuery(Query):
         }
         WITH p2 as peer_node, rel_inband, active_node, new_node
         FOREACH (i in CASE WHEN rel_inband.branch = $branch_name THEN [1] ELSE [] END |
-            SET rel_inband.to = $current_time
+            SET rel_inband.to = $current_time, rel_inband.to_ts = $current_time_ts
         )
         RETURN DISTINCT new_node
         """ % {
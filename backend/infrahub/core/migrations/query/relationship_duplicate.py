@@ -91,6 +91,8 @@ class RelationshipDuplicateQuery(Query):
         self.params["previous_rel"] = self.previous_rel.model_dump()
 
         self.params["current_time"] = self.at.to_string()
+        self.params["current_time_ts"] = self.at.to_epoch_microseconds()
+
         self.params["branch_name"] = self.branch.name
         self.params["branch_support"] = self.new_rel.branch_support
 
@@ -99,6 +101,7 @@ class RelationshipDuplicateQuery(Query):
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.ACTIVE.value,
             "from": self.at.to_string(),
+            "from_ts": self.at.to_epoch_microseconds(),
         }
 
         self.params["rel_props_prev"] = {
@@ -106,6 +109,7 @@ class RelationshipDuplicateQuery(Query):
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.DELETED.value,
             "from": self.at.to_string(),
+            "from_ts": self.at.to_epoch_microseconds(),
         }
 
         sub_query_out = self._render_sub_query_out()
@@ -144,7 +148,7 @@ class RelationshipDuplicateQuery(Query):
         }
         WITH p2 as peer_node, rel_inband, active_rel, new_rel
         FOREACH (i in CASE WHEN rel_inband.branch = $branch_name THEN [1] ELSE [] END |
-            SET rel_inband.to = $current_time
+            SET rel_inband.to = $current_time, rel_inband.to_ts = $current_time_ts
         )
         WITH DISTINCT(active_rel) as active_rel, new_rel
         // Process Outbound Relationship
@@ -164,7 +168,7 @@ class RelationshipDuplicateQuery(Query):
         }
         WITH p2 as peer_node, rel_outband, active_rel, new_rel
         FOREACH (i in CASE WHEN rel_outband.branch = $branch_name THEN [1] ELSE [] END |
-            SET rel_outband.to = $current_time
+            SET rel_outband.to = $current_time, rel_outband.to_ts = $current_time_ts
         )
         RETURN DISTINCT new_rel
         """ % {
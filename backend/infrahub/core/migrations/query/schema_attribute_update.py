@@ -86,8 +86,8 @@ class SchemaAttributeUpdateQuery(Query):
 
         query = """
         MERGE (new_value: AttributeValue { value: $attr_new_value, is_default: false })
-        CREATE (attr)-[:HAS_VALUE { branch: rel.branch, branch_level: rel.branch_level, status: "active", from: $at } ]->(new_value)
-        SET rel.to = $at
+        CREATE (attr)-[:HAS_VALUE { branch: rel.branch, branch_level: rel.branch_level, status: "active", from: $at, from_ts: $at_ts } ]->(new_value)
+        SET rel.to = $at, rel.to_ts = $at_ts
         """
         self.add_to_query(query)
         self.return_labels = ["attr"]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Sequence
+from typing import Any, Optional, Sequence
 
 from ..query import AttributeMigrationQuery
 from ..query.attribute_rename import AttributeInfo, AttributeRenameQuery
@@ -34,6 +34,10 @@ class AttributeNameUpdateMigrationQuery01(AttributeMigrationQuery, AttributeRena
 
         super().__init__(migration=migration, new_attr=new_attr, previous_attr=previous_attr, **kwargs)
 
+    @classmethod
+    def get_batch_label(cls, migration: AttributeSchemaMigration) -> Optional[str]:
+        return migration.previous_schema.kind
+
     def get_nbr_migrations_executed(self) -> int:
         return self.stats.get_counter(name="nodes_created")
 
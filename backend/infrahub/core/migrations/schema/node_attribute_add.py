@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Sequence
+from typing import Any, Optional, Sequence
 
 from ..query import AttributeMigrationQuery
 from ..query.attribute_add import AttributeAddQuery
@@ -25,6 +25,10 @@ class NodeAttributeAddMigrationQuery01(AttributeMigrationQuery, AttributeAddQuer
             **kwargs,
         )
 
+    @classmethod
+    def get_batch_label(cls, migration: AttributeSchemaMigration) -> Optional[str]:
+        return migration.new_schema.kind
+
 
 class NodeAttributeAddMigration(AttributeSchemaMigration):
     name: str = "node.attribute.add"
@@ -25,6 +25,7 @@ class NodeAttributeRemoveMigrationQuery01(AttributeMigrationQuery):
         self.params["node_kind"] = self.migration.new_schema.kind
         self.params["attr_name"] = self.migration.schema_path.field_name
         self.params["current_time"] = self.at.to_string()
+        self.params["current_time_ts"] = self.at.to_epoch_microseconds()
         self.params["branch_name"] = self.branch.name
         self.params["branch_support"] = self.migration.previous_attribute_schema.get_branch().value
 
@@ -33,6 +34,7 @@ class NodeAttributeRemoveMigrationQuery01(AttributeMigrationQuery):
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.DELETED.value,
             "from": self.at.to_string(),
+            "from_ts": self.at.to_epoch_microseconds(),
         }
 
         def render_sub_query_per_rel_type(rel_type: str, rel_def: FieldInfo) -> str:
@@ -99,7 +101,7 @@ class NodeAttributeRemoveMigrationQuery01(AttributeMigrationQuery):
         }
         WITH p2 as peer_node, rb, active_attr
         FOREACH (i in CASE WHEN rb.branch = $branch_name THEN [1] ELSE [] END |
-            SET rb.to = $current_time
+            SET rb.to = $current_time, rb.to_ts = $current_time_ts
         )
         RETURN DISTINCT active_attr
         """ % {"branch_filter": branch_filter, "sub_query_all": sub_query_all}
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Sequence
+from typing import Any, Optional, Sequence
 
 from ..query.node_duplicate import NodeDuplicateQuery, SchemaNodeInfo
 from ..shared import MigrationQuery, SchemaMigration
@@ -28,6 +28,10 @@ class NodeKindUpdateMigrationQuery01(MigrationQuery, NodeDuplicateQuery):
         )
         super().__init__(migration=migration, new_node=new_node, previous_node=previous_node, **kwargs)
 
+    @classmethod
+    def get_batch_label(cls, migration: SchemaMigration) -> Optional[str]:
+        return migration.previous_schema.kind
+
     def get_nbr_migrations_executed(self) -> int:
         return self.stats.get_counter(name="nodes_created")
 
@@ -38,6 +38,7 @@ class NodeRemoveMigrationBaseQuery(MigrationQuery):
 
         self.params["node_kind"] = self.migration.previous_schema.kind
         self.params["current_time"] = self.at.to_string()
+        self.params["current_time_ts"] = self.at.to_epoch_microseconds()
         self.params["branch_name"] = self.branch.name
 
         self.params["rel_props"] = {
@@ -45,6 +46,7 @@ class NodeRemoveMigrationBaseQuery(MigrationQuery):
             "branch_level": self.branch.hierarchy_level,
             "status": RelationshipStatus.DELETED.value,
             "from": self.at.to_string(),
+            "from_ts": self.at.to_epoch_microseconds(),
         }
 
         node_remove_query = self.render_node_remove_query(branch_filter=branch_filter)
@@ -98,7 +100,7 @@ class NodeRemoveMigrationQueryIn(NodeRemoveMigrationBaseQuery):
         }
         WITH p2 as peer_node, rel_inband, active_node
         FOREACH (i in CASE WHEN rel_inband.branch = $branch_name THEN [1] ELSE [] END |
-            SET rel_inband.to = $current_time
+            SET rel_inband.to = $current_time, rel_inband.to_ts = $current_time_ts
         )
         """ % {"sub_query": sub_query, "branch_filter": branch_filter}
         return query
@@ -142,7 +144,7 @@ class NodeRemoveMigrationQueryOut(NodeRemoveMigrationBaseQuery):
         }
         WITH p2 as peer_node, rel_outband, active_node
         FOREACH (i in CASE WHEN rel_outband.branch = $branch_name THEN [1] ELSE [] END |
-            SET rel_outband.to = $current_time
+            SET rel_outband.to = $current_time, rel_outband.to_ts = $current_time_ts
         )
         """ % {"sub_query": sub_query, "branch_filter": branch_filter}
 
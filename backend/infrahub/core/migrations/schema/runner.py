@@ -63,5 +63,14 @@ async def schema_migrations_runner(
 
     for response in responses:
         error_messages.extend(response.data.errors)
+        service.log.info(
+            f"Migration {response.data.migration_name!r} completed",
+            branch=branch.name,
+            path=response.data.schema_path.get_path() if response.data.schema_path else None,
+            nbr_migrations_executed=response.data.nbr_migrations_executed,
+            nbr_batches=response.data.nbr_batches,
+            duration=response.data.duration,
+            errors=len(response.data.errors),
+        )
 
     return error_messages
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Any, Optional, Sequence, Union
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -16,19 +17,30 @@ from infrahub.core.schema import (
     SchemaRoot,
     internal_schema,
 )
+from infrahub.core.timestamp import Timestamp
+from infrahub.log import get_logger
+from infrahub.message_bus.types import KVTTL
 
-from .query import MigrationQuery  # noqa: TCH001
+from .query import MigrationBatchBoundaryQuery, MigrationQuery
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
     from infrahub.core.schema.schema_branch import SchemaBranch
-    from infrahub.core.timestamp import Timestamp
     from infrahub.database import InfrahubDatabase
+    from infrahub.services.adapters.cache import InfrahubCache
+
+log = get_logger()
+
+
+# Maximum number of vertices processed by a schema migration query in a single transaction
+MIGRATION_BATCH_SIZE = 10_000
 
 
 class MigrationResult(BaseModel):
     errors: list[str] = Field(default_factory=list)
     nbr_migrations_executed: int = 0
+    nbr_batches: int = 0
+    duration: float = 0.0
 
     @property
     def success(self) -> bool:
@@ -37,6 +49,21 @@ class MigrationResult(BaseModel):
 
         return False
 
+    @property
+    def rate(self) -> float:
+        """Number of migrations executed per second."""
+        if not self.duration:
+            return 0.0
+        return self.nbr_migrations_executed / self.duration
+
+
+class MigrationCheckpoint(BaseModel):
+    """Last batch completed by a schema migration, to resume it from there if it fails."""
+
+    at: str = Field(..., description="Time of the migration, used for all the batches")
+    query_index: int = Field(0, description="Index of the query being executed")
+    uuid_after: Optional[str] = Field(None, description="uuid of the last vertex processed by the query")
+
 
 class SchemaMigration(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -48,22 +75,118 @@ class SchemaMigration(BaseModel):
     schema_path: SchemaPath
 
     async def execute(
-        self, db: InfrahubDatabase, branch: Branch, at: Optional[Union[Timestamp, str]] = None
+        self,
+        db: InfrahubDatabase,
+        branch: Branch,
+        at: Optional[Union[Timestamp, str]] = None,
+        checkpoints: Optional[InfrahubCache] = None,
+        batch_size: int = MIGRATION_BATCH_SIZE,
     ) -> MigrationResult:
-        async with db.start_transaction() as ts:
-            result = MigrationResult()
+        """Execute the queries of the migration, each batch of vertices is committed in its own transaction.
 
-            for migration_query in self.queries:
+        If a cache is provided with checkpoints, the last batch completed is recorded in it
+        and a migration that failed is resumed from there when it's executed again.
+        """
+        result = MigrationResult()
+        started_at = time.monotonic()
+        checkpoint_key = self.get_checkpoint_key(branch=branch)
+
+        checkpoint = await self._load_checkpoint(checkpoints=checkpoints, key=checkpoint_key)
+        if checkpoint:
+            log.info("Resuming the migration", migration=self.name, branch=branch.name, **checkpoint.model_dump())
+        else:
+            checkpoint = MigrationCheckpoint(at=Timestamp(at).to_string())
+
+        for index, migration_query in enumerate(self.queries):
+            if index < checkpoint.query_index:
+                continue
+
+            batch_label = migration_query.get_batch_label(migration=self)
+            try:
+                # The last batch is open to include the vertices created after the boundaries have been computed
+                uuid_boundaries: list[Optional[str]] = [None]
+                if batch_label:
+                    boundary_query = await MigrationBatchBoundaryQuery.init(
+                        db=db, label=batch_label, batch_size=batch_size, uuid_after=checkpoint.uuid_after
+                    )
+                    await boundary_query.execute(db=db)
+                    uuid_boundaries = [*boundary_query.get_boundaries(), None]
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                result.errors.append(str(exc))
+                result.duration = time.monotonic() - started_at
+                return result
+
+            for uuid_until in uuid_boundaries:
+                batch_params: dict[str, Any] = {}
+                if batch_label:
+                    batch_params = {"uuid_after": checkpoint.uuid_after, "uuid_until": uuid_until}
                 try:
-                    query = await migration_query.init(db=ts, branch=branch, at=at, migration=self)
-                    await query.execute(db=ts)
-                    result.nbr_migrations_executed += query.get_nbr_migrations_executed()
+                    async with db.start_transaction() as ts:
+                        query = await migration_query.init(
+                            db=ts, branch=branch, at=checkpoint.at, migration=self, **batch_params
+                        )
+                        await query.execute(db=ts)
+                        result.nbr_migrations_executed += query.get_nbr_migrations_executed()
                 except Exception as exc:  # pylint: disable=broad-exception-caught
                     result.errors.append(str(exc))
+                    result.duration = time.monotonic() - started_at
                     return result
 
+                result.nbr_batches += 1
+                result.duration = time.monotonic() - started_at
+
+                if uuid_until is None:
+                    checkpoint = MigrationCheckpoint(at=checkpoint.at, query_index=index + 1)
+                else:
+                    checkpoint.uuid_after = uuid_until
+                await self._save_checkpoint(checkpoints=checkpoints, key=checkpoint_key, checkpoint=checkpoint)
+
+                log.info(
+                    "Migration batch completed",
+                    migration=self.name,
+                    branch=branch.name,
+                    nbr_batches=result.nbr_batches,
+                    nbr_migrations_executed=result.nbr_migrations_executed,
+                    rate=round(result.rate, 2),
+                )
+
+        await self._save_checkpoint(checkpoints=checkpoints, key=checkpoint_key, checkpoint=None)
+
         return result
 
+    @staticmethod
+    async def _load_checkpoint(checkpoints: Optional[InfrahubCache], key: str) -> Optional[MigrationCheckpoint]:
+        if not checkpoints:
+            return None
+        try:
+            value = await checkpoints.get(key=key)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # Without checkpoint, the migration is executed from the start
+            log.warning("Unable to load the checkpoint of the migration", key=key, error=str(exc))
+            return None
+        return MigrationCheckpoint.model_validate_json(value) if value else None
+
+    @staticmethod
+    async def _save_checkpoint(
+        checkpoints: Optional[InfrahubCache], key: str, checkpoint: Optional[MigrationCheckpoint]
+    ) -> None:
+        """Record the checkpoint, or remove it once the migration is completed."""
+        if not checkpoints:
+            return
+        try:
+            if checkpoint:
+                await checkpoints.set(key=key, value=checkpoint.model_dump_json(), expires=KVTTL.TWO_HOURS)
+            else:
+                await checkpoints.delete(key=key)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            log.warning("Unable to save the checkpoint of the migration", key=key, error=str(exc))
+
+    def get_checkpoint_key(self, branch: Branch) -> str:
+        """Return the key of the checkpoint of this migration, specific to the version of the schema being migrated."""
+        schema = self.new_node_schema or self.previous_node_schema
+        schema_hash = schema.get_hash() if schema else ""
+        return f"schema_migration:{branch.name}:{self.name}:{self.schema_path.get_path()}:{schema_hash}"
+
     @property
     def new_schema(self) -> Union[NodeSchema, GenericSchema]:
         if self.new_node_schema:
@@ -15,6 +15,7 @@ from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import InitializationError, NodeNotFoundError, PoolExhaustedError, ValidationError
 from infrahub.types import ATTRIBUTE_TYPES
 
+from ..attribute import update_attributes
 from ..relationship import RelationshipManager
 from ..utils import update_relationships_to
 from .base import BaseNode, BaseNodeMeta, BaseNodeOptions
@@ -74,7 +75,13 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
         if not self._schema.human_friendly_id:
             return None
 
-        hfid = [await self.get_path_value(db=db, path=item) for item in self._schema.human_friendly_id]
+        hfid = []
+        for item in self._schema.human_friendly_id:
+            relationship_name = item.split("__")[0]
+            if item in self._hfid_peer_values and not getattr(self, relationship_name).has_changes:
+                hfid.append(self._hfid_peer_values[item])
+            else:
+                hfid.append(await self.get_path_value(db=db, path=item))
         if include_kind:
             return [self.get_kind()] + hfid
         return hfid
@@ -163,6 +170,9 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
         self._owner: Optional[Node] = None
         self._is_protected: bool = None
 
+        # Values of the peers used by the human friendly id, preloaded for a batch of nodes
+        self._hfid_peer_values: dict[str, Any] = {}
+
         # Lists of attributes and relationships names
         self._attributes: list[str] = []
         self._relationships: list[str] = []
@@ -203,9 +213,9 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
             attrs["schema"] = schema
         elif isinstance(schema, str):
             # TODO need to raise a proper exception for this, right now it will raise a generic ValueError
-            attrs["schema"] = db.schema.get(name=schema, branch=branch)
+            attrs["schema"] = db.schema.get(name=schema, branch=branch, duplicate=False)
         elif hasattr(schema, "_is_runtime_protocol") and getattr(schema, "_is_runtime_protocol"):
-            attrs["schema"] = db.schema.get(name=schema.__name__, branch=branch)
+            attrs["schema"] = db.schema.get(name=schema.__name__, branch=branch, duplicate=False)
         else:
             raise ValueError(f"Invalid schema provided {type(schema)}, expected NodeSchema or ProfileSchema")
 
@@ -443,18 +453,22 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
         query = await NodeCreateAllQuery.init(db=db, node=self, at=create_at)
         await query.execute(db=db)
 
-        _, self.db_id = query.get_self_ids()
-        self._at = create_at
-        self._updated_at = create_at
-        self._existing = True
+        _, db_id = query.get_self_ids()
+        self._set_created(db_id=db_id, new_ids=query.get_ids(), at=create_at)
 
-        new_ids = query.get_ids()
+    def _set_created(self, db_id: str, new_ids: dict[str, tuple[str, str]], at: Timestamp) -> None:
+        """Flag the node as existing and assign the IDs returned by the database after its creation."""
+        self.db_id = db_id
+        self._at = at
+        self._updated_at = at
+        self._existing = True
 
         # Go over the list of Attribute and assign the new IDs one by one
         for name in self._attributes:
             attr: BaseAttribute = getattr(self, name)
             attr.id, attr.db_id = new_ids[name]
-            attr.at = create_at
+            attr.at = at
+            attr.mark_as_saved()
 
         # Go over the list of relationships and assign the new IDs one by one
         for name in self._relationships:
@@ -462,26 +476,32 @@ class Node(BaseNode, metaclass=BaseNodeMeta):
             for rel in relm._relationships:
                 identifier = f"{rel.schema.identifier}::{rel.peer_id}"
                 rel.id, rel.db_id = new_ids[identifier]
+            relm.mark_as_saved()
 
     async def _update(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> None:
         """Update the node in the database if needed."""
 
         update_at = Timestamp(at)
 
-        # Go over the list of Attribute and update them one by one
+        # Only the attributes modified since they have been loaded are updated, all together
+        attributes: list[BaseAttribute] = []
         for name in self._attributes:
             attr: BaseAttribute = getattr(self, name)
-            await attr.save(at=update_at, db=db)
+            if attr.id and not attr.is_from_profile and attr.has_changes:
+                attributes.append(attr)
+        await update_attributes(db=db, node=self, attributes=attributes, at=update_at)
 
-        # Go over the list of relationships and update them one by one
+        # Go over the list of modified relationships and update them one by one
         for name in self._relationships:
             rel: RelationshipManager = getattr(self, name)
-            await rel.save(at=update_at, db=db)
+            if rel.has_changes:
+                await rel.save(at=update_at, db=db)
 
     async def save(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> Self:
         """Create or Update the Node in the database."""
 
         save_at = Timestamp(at)
+        self._hfid_peer_values = {}
 
         if self._existing:
             await self._update(at=save_at, db=db)
@@ -8,3 +8,13 @@ from infrahub.core.timestamp import Timestamp
 class NodeConstraintInterface(ABC):
     @abstractmethod
     async def check(self, node: Node, at: Optional[Timestamp] = None, filters: Optional[list[str]] = None) -> None: ...
+
+    async def check_many(
+        self, nodes: list[Node], at: Optional[Timestamp] = None, filters: Optional[list[str]] = None
+    ) -> None:
+        """Validate multiple nodes of the same kind.
+
+        Constraints able to validate all the nodes at once should override this method.
+        """
+        for node in nodes:
+            await self.check(node, at=at, filters=filters)
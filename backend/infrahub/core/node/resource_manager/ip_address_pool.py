@@ -1,17 +1,15 @@
 from __future__ import annotations
 
-import ipaddress
 from typing import TYPE_CHECKING, Any, Optional
 
 from infrahub.core import registry
 from infrahub.core.ipam.reconciler import IpamReconciler
-from infrahub.core.query.ipam import get_ip_addresses
 from infrahub.core.query.resource_manager import (
     IPAddressPoolGetReserved,
     IPAddressPoolSetReserved,
 )
-from infrahub.exceptions import PoolExhaustedError, ValidationError
-from infrahub.pools.address import get_available
+from infrahub.exceptions import PoolExhaustedError
+from infrahub.pools.ip_pool import ip_pool_allocator_cache
 
 from .. import Node
 
@@ -60,12 +58,16 @@ class CoreIPAddressPool(Node):
 
         prefixlen = prefixlen or data.get("prefixlen") or self.default_prefix_length.value  # type: ignore[attr-defined]
 
-        next_prefix = await self.get_next(db=db, prefixlen=prefixlen)
+        next_prefix = (await self.reserve_next(db=db, count=1, prefixlen=prefixlen))[0]
 
         target_schema = registry.get_node_schema(name=address_type, branch=branch)
         node = await Node.init(db=db, schema=target_schema, branch=branch)
         await node.new(db=db, address=str(next_prefix), ip_namespace=ip_namespace, **data)
-        await node.save(db=db)
+        try:
+            await node.save(db=db)
+        except Exception:
+            ip_pool_allocator_cache.invalidate(pool_id=self.get_id())
+            raise
         reconciler = IpamReconciler(db=db, branch=branch)
         await reconciler.reconcile(ip_value=next_prefix, namespace=ip_namespace.id, node_uuid=node.get_id())
 
@@ -78,29 +80,35 @@ class CoreIPAddressPool(Node):
         return node
 
     async def get_next(self, db: InfrahubDatabase, prefixlen: Optional[int] = None) -> IPAddressType:
-        # Measure utilization of all prefixes identified as resources
-        resources = await self.resources.get_peers(db=db)  # type: ignore[attr-defined]
-        ip_namespace = await self.ip_namespace.get_peer(db=db)  # type: ignore[attr-defined]
-
-        for resource in resources.values():
-            ip_prefix = ipaddress.ip_network(resource.prefix.value)  # type: ignore[attr-defined]
-            prefix_length = prefixlen or ip_prefix.prefixlen
-
-            if not ip_prefix.prefixlen <= prefix_length <= ip_prefix.max_prefixlen:
-                raise ValidationError(input_value="Invalid prefix length for current selected prefix")
-
-            addresses = await get_ip_addresses(
-                db=db, ip_prefix=ip_prefix, namespace=ip_namespace, branch=self._branch, branch_agnostic=True
-            )
-
-            available = get_available(
-                network=ip_prefix,
-                addresses=[ip.address for ip in addresses],
-                is_pool=resource.is_pool.value,  # type: ignore[attr-defined]
-            )
-
-            if available:
-                next_address = available.iter_cidrs()[0]
-                return ipaddress.ip_interface(f"{next_address.ip}/{prefix_length}")
-
-        raise PoolExhaustedError("There are no more addresses available in this pool.")
+        """Return the next address available in the pool, without reserving it."""
+        pool_allocator = await ip_pool_allocator_cache.get(db=db, pool=self, branch=self._branch, is_address=True)
+        addresses = pool_allocator.allocate_many(count=1, prefixlen=prefixlen)
+        pool_allocator.release(values=addresses)
+        if not addresses:
+            raise PoolExhaustedError("There are no more addresses available in this pool.")
+
+        return addresses[0]  # type: ignore[return-value]
+
+    async def reserve_next(
+        self, db: InfrahubDatabase, count: int, prefixlen: Optional[int] = None
+    ) -> list[IPAddressType]:
+        """Reserve the next count addresses available in the pool, they won't be returned again by this worker.
+
+        The addresses are expected to be created right after, the allocator of the pool is loaded again otherwise.
+        """
+        pool_allocator = await ip_pool_allocator_cache.get(db=db, pool=self, branch=self._branch, is_address=True)
+        while True:
+            addresses = pool_allocator.allocate_many(count=count, prefixlen=prefixlen)
+            if len(addresses) < count:
+                pool_allocator.release(values=addresses)
+                raise PoolExhaustedError("There are no more addresses available in this pool.")
+
+            overlaps = await pool_allocator.get_overlaps(db=db, branch=self._branch, values=addresses)
+            if not overlaps:
+                break
+
+            # Some addresses are used by nodes not found by the synchronization yet, other addresses are allocated instead
+            pool_allocator.release(values=addresses)
+            pool_allocator.reserve(values=overlaps)
+
+        return addresses  # type: ignore[return-value]
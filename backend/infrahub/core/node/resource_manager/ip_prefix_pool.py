@@ -1,16 +1,14 @@
 from __future__ import annotations
 
-import ipaddress
 from typing import TYPE_CHECKING, Any, Optional
 
 from infrahub.core import registry
 from infrahub.core.ipam.reconciler import IpamReconciler
-from infrahub.core.query.ipam import get_subnets
 from infrahub.core.query.resource_manager import (
     PrefixPoolGetReserved,
     PrefixPoolSetReserved,
 )
-from infrahub.pools.prefix import PrefixPool
+from infrahub.pools.ip_pool import ip_pool_allocator_cache
 
 from .. import Node
 
@@ -55,8 +53,6 @@ class CoreIPPrefixPool(Node):
                 "A prefixlen or a default_value must be provided to allocate a new prefix"
             )
 
-        next_prefix = await self.get_next(db=db, prefixlen=prefixlen)
-
         prefix_type = prefix_type or data.get("prefix_type", None) or self.default_prefix_type.value  # type: ignore[attr-defined]
         if not prefix_type:
             raise ValueError(
@@ -66,10 +62,16 @@ class CoreIPPrefixPool(Node):
 
         member_type = member_type or data.get("member_type", None) or self.default_member_type.value.value  # type: ignore[attr-defined]
 
+        next_prefix = (await self.reserve_next(db=db, count=1, prefixlen=prefixlen))[0]
+
         target_schema = registry.get_node_schema(name=prefix_type, branch=branch)
         node = await Node.init(db=db, schema=target_schema, branch=branch)
         await node.new(db=db, prefix=str(next_prefix), member_type=member_type, ip_namespace=ip_namespace, **data)
-        await node.save(db=db)
+        try:
+            await node.save(db=db)
+        except Exception:
+            ip_pool_allocator_cache.invalidate(pool_id=self.get_id())
+            raise
         reconciler = IpamReconciler(db=db, branch=branch)
         await reconciler.reconcile(ip_value=next_prefix, namespace=ip_namespace.id, node_uuid=node.get_id())
 
@@ -82,27 +84,33 @@ class CoreIPPrefixPool(Node):
         return node
 
     async def get_next(self, db: InfrahubDatabase, prefixlen: int) -> IPNetworkType:
-        # Measure utilization of all prefixes identified as resources
-        resources = await self.resources.get_peers(db=db)  # type: ignore[attr-defined]
-        ip_namespace = await self.ip_namespace.get_peer(db=db)  # type: ignore[attr-defined]
-
-        for resource in resources.values():
-            subnets = await get_subnets(
-                db=db,
-                ip_prefix=ipaddress.ip_network(resource.prefix.value),  # type: ignore[attr-defined]
-                namespace=ip_namespace,
-                branch=self._branch,
-                branch_agnostic=True,
-            )
-
-            pool = PrefixPool(resource.prefix.value)  # type: ignore[attr-defined]
-            for subnet in subnets:
-                pool.reserve(subnet=str(subnet.prefix))
-
-            try:
-                next_available = pool.get(prefixlen=prefixlen)
-                return next_available
-            except IndexError:
-                continue
-
-        raise IndexError("No more resources available")
+        """Return the next prefix available in the pool, without reserving it."""
+        pool_allocator = await ip_pool_allocator_cache.get(db=db, pool=self, branch=self._branch, is_address=False)
+        prefixes = pool_allocator.allocate_many(count=1, prefixlen=prefixlen)
+        pool_allocator.release(values=prefixes)
+        if not prefixes:
+            raise IndexError("No more resources available")
+
+        return prefixes[0]  # type: ignore[return-value]
+
+    async def reserve_next(self, db: InfrahubDatabase, count: int, prefixlen: int) -> list[IPNetworkType]:
+        """Reserve the next count prefixes available in the pool, they won't be returned again by this worker.
+
+        The prefixes are expected to be created right after, the allocator of the pool is loaded again otherwise.
+        """
+        pool_allocator = await ip_pool_allocator_cache.get(db=db, pool=self, branch=self._branch, is_address=False)
+        while True:
+            prefixes = pool_allocator.allocate_many(count=count, prefixlen=prefixlen)
+            if len(prefixes) < count:
+                pool_allocator.release(values=prefixes)
+                raise IndexError("No more resources available")
+
+            overlaps = await pool_allocator.get_overlaps(db=db, branch=self._branch, values=prefixes)
+            if not overlaps:
+                break
+
+            # Some prefixes are used by nodes not found by the synchronization yet, other prefixes are allocated instead
+            pool_allocator.release(values=prefixes)
+            pool_allocator.reserve(values=overlaps)
+
+        return prefixes  # type: ignore[return-value]
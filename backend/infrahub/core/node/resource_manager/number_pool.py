@@ -2,13 +2,17 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from infrahub.core.query.resource_manager import NumberPoolGetReserved, NumberPoolGetUsed, NumberPoolSetReserved
+from infrahub_sdk.uuidt import UUIDT
+
+from infrahub.core.query.resource_manager import NumberPoolGetReserved, NumberPoolSetReserved
 from infrahub.exceptions import PoolExhaustedError
+from infrahub.pools.number import number_allocator_cache
 
 from .. import Node
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
+    from infrahub.core.timestamp import Timestamp
     from infrahub.database import InfrahubDatabase
 
 
@@ -31,36 +35,67 @@ class CoreNumberPool(Node):
             return reservation
 
         # If we have not returned a value we need to find one if avaiable
-        number = await self.get_next(db=db, branch=branch)
+        numbers = await self.reserve_next(db=db, branch=branch, identifiers=[identifier])
+        return numbers[0]
+
+    async def get_resources(
+        self,
+        db: InfrahubDatabase,
+        branch: Branch,
+        count: int,
+        identifiers: Optional[list[str]] = None,
+    ) -> list[int]:
+        """Reserve the next count numbers available in the pool, with a single write in the database.
+
+        The identifiers of the reservations are generated if they are not provided.
+        """
+        identifiers = identifiers or [str(UUIDT()) for _ in range(count)]
+        if len(identifiers) != count:
+            raise ValueError(f"{count} identifiers are required to reserve {count} numbers, got {len(identifiers)}")
 
-        query_set = await NumberPoolSetReserved.init(
-            db=db, pool_id=self.get_id(), identifier=identifier, reserved=number
-        )
-        await query_set.execute(db=db)
+        return await self.reserve_next(db=db, branch=branch, identifiers=identifiers)
 
-        return number
+    async def reserve_next(self, db: InfrahubDatabase, branch: Branch, identifiers: list[str]) -> list[int]:
+        allocator = await number_allocator_cache.get(db=db, pool=self, branch=branch)  # type: ignore[arg-type]
+        while True:
+            # Numbers are removed from the allocator before the write to avoid allocating them twice within this worker,
+            # they are released by a later synchronization if the transaction writing them is rolled back
+            numbers = allocator.allocate_many(count=len(identifiers))
+            if len(numbers) < len(identifiers):
+                for number in numbers:
+                    allocator.release(number=number)
+                raise PoolExhaustedError("There are no more addresses available in this pool.")
+
+            try:
+                query_set = await NumberPoolSetReserved.init(
+                    db=db, pool_id=self.get_id(), reservations=dict(zip(identifiers, numbers))
+                )
+                await query_set.execute(db=db)
+            except Exception:
+                for number in numbers:
+                    allocator.release(number=number)
+                raise
+
+            conflicts = set(query_set.get_conflicts())
+            if not conflicts:
+                return numbers
+
+            # Some numbers have been reserved by another worker without being found by the synchronization yet,
+            # they are marked as used and other numbers are allocated
+            for number in numbers:
+                if number in conflicts:
+                    allocator.reserve(number=number)
+                else:
+                    allocator.release(number=number)
 
     async def get_next(self, db: InfrahubDatabase, branch: Branch) -> int:
-        query = await NumberPoolGetUsed.init(db=db, branch=branch, pool=self, branch_agnostic=True)
-        await query.execute(db=db)
-        taken = [result.get_as_optional_type("av.value", return_type=int) for result in query.results]
-        next_number = find_next_free(
-            start=self.start_range.value,  # type: ignore[attr-defined]
-            end=self.end_range.value,  # type: ignore[attr-defined]
-            taken=taken,
-        )
+        allocator = await number_allocator_cache.get(db=db, pool=self, branch=branch)  # type: ignore[arg-type]
+        next_number = allocator.get_next()
         if next_number is None:
             raise PoolExhaustedError("There are no more addresses available in this pool.")
 
         return next_number
 
-
-def find_next_free(start: int, end: int, taken: list[int | None]) -> Optional[int]:
-    used_numbers = [number for number in taken if number is not None]
-    used_set = set(used_numbers)
-
-    for num in range(start, end + 1):
-        if num not in used_set:
-            return num
-
-    return None
+    async def delete(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> None:
+        await super().delete(db=db, at=at)
+        number_allocator_cache.invalidate(pool_id=self.get_id())
@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Generator, Iterator, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Generator, Iterator, Optional, TypeVar, Union
 
 import ujson
 from neo4j.graph import Node as Neo4jNode
@@ -12,6 +12,7 @@ from neo4j.graph import Path as Neo4jPath
 from neo4j.graph import Relationship as Neo4jRelationship
 
 from infrahub import config
+from infrahub.core.cache_sync import notify_local_write
 from infrahub.core.constants import PermissionLevel
 from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import QueryError
@@ -335,6 +336,17 @@ class QueryStat:
         return cls(**data)
 
 
+@dataclass
+class KeysetCursor:
+    """Position of a keyset (cursor) based pagination, only the rows ordered after `values` will be returned.
+
+    If `inclusive` is set, the rows with a key equal to `values` are returned as well.
+    """
+
+    values: list[Any]
+    inclusive: bool = False
+
+
 class Query(ABC):
     name: str = "base-query"
     type: QueryType = QueryType.READ
@@ -343,6 +355,14 @@ class Query(ABC):
     insert_return: bool = True
     insert_limit: bool = True
 
+    # Expressions used to paginate through the results with a cursor instead of SKIP/LIMIT
+    # Each key must be sortable in ascending order, never NULL and valid both where the filter is inserted and in RETURN
+    keyset_keys: Optional[list[str]] = None
+    # Indicate that the rows sharing the same keys are always returned within the same chunk
+    # either because the keys are unique or because the query is already grouping the results by keys
+    # if not set, the results must be ordered by the keys
+    keyset_strict: bool = False
+
     def __init__(
         self,
         branch: Optional[Branch] = None,
@@ -373,6 +393,8 @@ class Query(ABC):
         self.return_labels: list[str] = []
         self.results: list[QueryResult] = []
 
+        self.keyset_filter_index: Optional[int] = None
+
         self.has_been_executed: bool = False
         self.has_errors: bool = False
 
@@ -418,6 +440,35 @@ class Query(ABC):
         else:
             self.query_lines.extend([line.strip() for line in query.split("\n") if line.strip()])
 
+    def add_keyset_filter(self) -> None:
+        """Define where the keyset filter will be inserted in the query when paginating with a cursor.
+
+        Placing the filter as early as possible limits the amount of work done by the database for each chunk,
+        if not defined the filter is inserted at the end of the query, right before the RETURN statement.
+        """
+        self.keyset_filter_index = len(self.query_lines)
+
+    def get_keyset_filter(self, cursor: KeysetCursor) -> tuple[str, dict[str, Any]]:
+        """Generate the WHERE clause to return only the rows ordered after the cursor.
+
+        The keys are compared in lexicographic order,
+        for 2 keys (k0, k1) the filter is: k0 > $v0 OR (k0 = $v0 AND k1 > $v1)
+        """
+        if not self.keyset_keys:
+            raise ValueError(f"{self.name} doesn't define keyset_keys")
+
+        params = {f"keyset_{idx}": value for idx, value in enumerate(cursor.values)}
+        conditions = []
+        for idx, key in enumerate(self.keyset_keys):
+            terms = [f"{prev_key} = $keyset_{prev_idx}" for prev_idx, prev_key in enumerate(self.keyset_keys[:idx])]
+            terms.append(f"{key} > $keyset_{idx}")
+            conditions.append("(" + " AND ".join(terms) + ")")
+        if cursor.inclusive:
+            terms = [f"{key} = $keyset_{idx}" for idx, key in enumerate(self.keyset_keys)]
+            conditions.append("(" + " AND ".join(terms) + ")")
+
+        return " OR ".join(conditions), params
+
     def add_subquery(self, subquery: str, with_clause: Optional[str] = None) -> None:
         self.add_to_query("CALL {")
         self.add_to_query(subquery)
@@ -431,14 +482,25 @@ class Query(ABC):
         inline: bool = False,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        keyset: Optional[KeysetCursor] = None,
+        with_keys: bool = False,
     ) -> str:
         # Make a local copy of the _query_lines
         limit = limit or self.limit
         offset = offset or self.offset
         tmp_query_lines = self.query_lines.copy()
 
+        if keyset:
+            keyset_filter, _ = self.get_keyset_filter(cursor=keyset)
+            filter_index = self.keyset_filter_index if self.keyset_filter_index is not None else len(tmp_query_lines)
+            tmp_query_lines[filter_index:filter_index] = ["WITH *", f"WHERE {keyset_filter}"]
+
+        return_labels = self.return_labels.copy()
+        if with_keys and self.keyset_keys:
+            return_labels.extend(f"{key} AS keyset_{idx}" for idx, key in enumerate(self.keyset_keys))
+
         if self.insert_return:
-            tmp_query_lines.append("RETURN " + ",".join(self.return_labels))
+            tmp_query_lines.append("RETURN " + ",".join(return_labels))
 
         if self.order_by:
             tmp_query_lines.append("ORDER BY " + ",".join(self.order_by))
@@ -539,6 +601,7 @@ class Query(ABC):
             )
             if "stats" in metadata:
                 self.stats.add(metadata.get("stats"))
+            notify_local_write()
         else:
             raise ValueError(f"unknown value for {self.type}")
 
@@ -550,26 +613,135 @@ class Query(ABC):
 
         return self
 
+    async def stream(self, db: InfrahubDatabase) -> AsyncIterator[QueryResult]:
+        """Execute a READ query and yield the results as they are delivered by the database.
+
+        Unlike execute(), the results are not stored in self.results,
+        the caller is expected to process each result as it comes to keep the memory usage bounded.
+        """
+        if self.type != QueryType.READ:
+            raise TypeError("Only READ queries can be streamed.")
+
+        if config.SETTINGS.miscellaneous.print_query_details:
+            self.print(include_var=True)
+
+        if self.limit or self.offset:
+            records = db.stream_query(query=self.get_query(), params=self.params, name=self.name)
+        else:
+            records = self._read_with_size_limit(db=db, stream=True)
+
+        has_results = False
+        async for record in records:
+            has_results = True
+            yield QueryResult(data=record, labels=self.return_labels)
+
+        if not has_results and self.raise_error_if_empty:
+            raise QueryError(query=self.get_query(), params=self.params)
+
+        self.has_been_executed = True
+
     async def query_with_size_limit(self, db: InfrahubDatabase) -> list[Record]:
+        return [record async for record in self._read_with_size_limit(db=db)]
+
+    async def _read_chunk(
+        self, db: InfrahubDatabase, query: str, params: dict[str, Any], stream: bool
+    ) -> AsyncIterator[Record]:
+        if stream:
+            async for record in db.stream_query(query=query, params=params, name=self.name):
+                yield record
+            return
+
+        records, metadata = await db.execute_query_with_metadata(query=query, params=params, name=self.name)
+        if "stats" in metadata:
+            self.stats.add(metadata.get("stats"))
+        for record in records:
+            yield record
+
+    async def _read_with_size_limit(self, db: InfrahubDatabase, stream: bool = False) -> AsyncIterator[Record]:
+        if self.keyset_keys:
+            async for record in self._read_with_keyset(db=db, stream=stream):
+                yield record
+            return
+
         query_limit = config.SETTINGS.database.query_size_limit
         offset = 0
-        results: list[Record] = []
-        remaining = True
-        while remaining:
-            offset_results, metadata = await db.execute_query_with_metadata(
-                query=self.get_query(limit=query_limit, offset=offset),
-                params=self.params,
-                name=self.name,
-            )
-            if "stats" in metadata:
-                self.stats.add(metadata.get("stats"))
-            results.extend(offset_results)
+        while True:
+            nbr_records = 0
+            async for record in self._read_chunk(
+                db=db, query=self.get_query(limit=query_limit, offset=offset), params=self.params, stream=stream
+            ):
+                nbr_records += 1
+                yield record
             offset += query_limit
 
-            if len(offset_results) < query_limit:
-                remaining = False
+            if nbr_records < query_limit:
+                return
+
+    async def _read_with_keyset(self, db: InfrahubDatabase, stream: bool = False) -> AsyncIterator[Record]:
+        """Read all the results in chunks, each chunk resumes from the last key returned by the previous one.
 
-        return results
+        Unlike SKIP/LIMIT, the database doesn't have to go through all the previous rows again for each chunk.
+        When the keys are not unique, the results must be ordered by the keys: the rows matching the last key
+        of a chunk are held back and read again with the next chunk to guarantee that no row is missed.
+        If a single key spans the whole chunk, the rows are paginated within this key with an offset.
+        """
+        query_limit = config.SETTINGS.database.query_size_limit
+        nbr_keys = len(self.keyset_keys or [])
+        cursor: Optional[KeysetCursor] = None
+        offset = 0
+
+        while True:
+            params = self.params
+            if cursor:
+                _, keyset_params = self.get_keyset_filter(cursor=cursor)
+                params = {**self.params, **keyset_params}
+
+            nbr_records = 0
+            last_key: Optional[tuple[Any, ...]] = None
+            pending: list[Record] = []
+            has_released = False
+            async for record in self._read_chunk(
+                db=db,
+                query=self.get_query(limit=query_limit, offset=offset, keyset=cursor, with_keys=True),
+                params=params,
+                stream=stream,
+            ):
+                nbr_records += 1
+                key = tuple(record[f"keyset_{idx}"] for idx in range(nbr_keys))
+                if self.keyset_strict:
+                    last_key = key if last_key is None else max(last_key, key)
+                    yield record
+                    continue
+
+                if key != last_key:
+                    for pending_record in pending:
+                        yield pending_record
+                    has_released = has_released or bool(pending)
+                    pending = []
+                    last_key = key
+                pending.append(record)
+
+            if nbr_records < query_limit or last_key is None:
+                for pending_record in pending:
+                    yield pending_record
+                return
+
+            if self.keyset_strict:
+                cursor, offset = KeysetCursor(values=list(last_key)), 0
+                continue
+
+            if has_released:
+                # The rows matching the last key will be read again with the next chunk
+                cursor, offset = KeysetCursor(values=list(last_key), inclusive=True), 0
+                continue
+
+            # All the rows of this chunk share the same key
+            for pending_record in pending:
+                yield pending_record
+            if cursor and cursor.inclusive and tuple(cursor.values) == last_key:
+                offset += query_limit
+            else:
+                cursor, offset = KeysetCursor(values=list(last_key), inclusive=True), query_limit
 
     async def count(self, db: InfrahubDatabase) -> int:
         """Count the number of results matching a READ query.
@@ -7,9 +7,10 @@ from infrahub.core.constants.relationship_label import RELATIONSHIP_TO_NODE_LABE
 from infrahub.core.constants.schema import FlagProperty, NodeProperty
 from infrahub.core.query import Query, QueryNode, QueryRel, QueryType
 from infrahub.core.timestamp import Timestamp
+from infrahub.exceptions import QueryError
 
 if TYPE_CHECKING:
-    from infrahub.core.attribute import BaseAttribute
+    from infrahub.core.attribute import AttributeUpdateData, BaseAttribute
     from infrahub.core.branch import Branch
     from infrahub.core.query import QueryElement
     from infrahub.database import InfrahubDatabase
@@ -53,6 +54,7 @@ class AttributeUpdateValueQuery(AttributeQuery):
         self.params["branch"] = self.branch.name
         self.params["branch_level"] = self.branch.hierarchy_level
         self.params["at"] = at.to_string()
+        self.params["at_ts"] = at.to_epoch_microseconds()
         content = self.attr.to_db()
         self.params.update(self.attr.to_db())
 
@@ -68,7 +70,7 @@ class AttributeUpdateValueQuery(AttributeQuery):
         query = """
         MATCH (a:Attribute { uuid: $attr_uuid })
         MERGE (av:%(labels)s { %(props)s } )
-        CREATE (a)-[r:%(rel_label)s { branch: $branch, branch_level: $branch_level, status: "active", from: $at }]->(av)
+        CREATE (a)-[r:%(rel_label)s { branch: $branch, branch_level: $branch_level, status: "active", from: $at, from_ts: $at_ts }]->(av)
         """ % {"rel_label": self.attr._rel_to_value_label, "labels": ":".join(labels), "props": ", ".join(prop_list)}
 
         self.add_to_query(query)
@@ -102,13 +104,14 @@ class AttributeUpdateFlagQuery(AttributeQuery):
         self.params["branch"] = self.branch.name
         self.params["branch_level"] = self.branch.hierarchy_level
         self.params["at"] = at.to_string()
+        self.params["at_ts"] = at.to_epoch_microseconds()
         self.params["flag_value"] = getattr(self.attr, self.flag_name)
         self.params["flag_type"] = self.attr.get_kind()
 
         query = """
         MATCH (a:Attribute { uuid: $attr_uuid })
         MERGE (flag:Boolean { value: $flag_value })
-        CREATE (a)-[r:%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at }]->(flag)
+        CREATE (a)-[r:%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at, from_ts: $at_ts }]->(flag)
         """ % self.flag_name.upper()
 
         self.add_to_query(query)
@@ -139,6 +142,7 @@ class AttributeUpdateNodePropertyQuery(AttributeQuery):
         self.params["branch"] = self.branch.name
         self.params["branch_level"] = self.branch.hierarchy_level
         self.params["at"] = at.to_string()
+        self.params["at_ts"] = at.to_epoch_microseconds()
         self.params["prop_name"] = self.prop_name
         self.params["prop_id"] = self.prop_id
 
@@ -148,7 +152,7 @@ class AttributeUpdateNodePropertyQuery(AttributeQuery):
             """
         MATCH (a:Attribute { uuid: $attr_uuid })
         MATCH (np:Node { uuid: $prop_id })
-        CREATE (a)-[r:%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at }]->(np)
+        CREATE (a)-[r:%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at, from_ts: $at_ts }]->(np)
         """
             % rel_name
         )
@@ -157,6 +161,118 @@ class AttributeUpdateNodePropertyQuery(AttributeQuery):
         self.return_labels = ["a", "np", "r"]
 
 
+class AttributeUpdateManyQuery(Query):
+    """Write the new values, flags and node properties of multiple attributes at once.
+
+    Each type of change is processed in its own subquery, only the subqueries with some changes are included.
+    """
+
+    name = "attribute_update_many"
+    type: QueryType = QueryType.WRITE
+
+    def __init__(self, attributes: list[AttributeUpdateData], at: Optional[Union[Timestamp, str]] = None, **kwargs):
+        self.attributes = attributes
+        self.at = Timestamp(at)
+        self.nbr_expected_changes: dict[str, int] = {}
+
+        super().__init__(**kwargs)
+
+    def _add_subquery(self, param_name: str, items: list[dict[str, Any]], query: str) -> None:
+        if not items:
+            return
+
+        self.params[param_name] = items
+        self.nbr_expected_changes[f"nbr_{param_name}"] = len(items)
+        self.add_to_query(
+            """
+        CALL {
+            UNWIND $%(param_name)s AS item
+            MATCH (a:Attribute { uuid: item.uuid })
+            %(query)s
+            RETURN count(*) AS nbr_%(param_name)s
+        }
+        """
+            % {"param_name": param_name, "query": query}
+        )
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        self.params["at"] = self.at.to_string()
+        self.params["at_ts"] = self.at.to_epoch_microseconds()
+        rel_props = (
+            '{ branch: item.branch, branch_level: item.branch_level, status: "active", from: $at, from_ts: $at_ts }'
+        )
+
+        # ---------- Values ----------
+        for node_type, labels in (
+            (AttributeDBNodeType.DEFAULT, "AttributeValue"),
+            (AttributeDBNodeType.IPHOST, "AttributeValue:AttributeIPHost"),
+            (AttributeDBNodeType.IPNETWORK, "AttributeValue:AttributeIPNetwork"),
+        ):
+            items = [
+                {"uuid": attr.uuid, "branch": attr.branch, "branch_level": attr.branch_level, "content": attr.content}
+                for attr in self.attributes
+                if attr.content is not None and attr.node_type == node_type
+            ]
+            content_keys = sorted({key for item in items for key in item["content"]})
+            query = """
+            MERGE (av:%(labels)s { %(props)s })
+            CREATE (a)-[:%(rel_label)s %(rel_props)s]->(av)
+            """ % {
+                "labels": labels,
+                "props": ", ".join(f"{key}: item.content.{key}" for key in content_keys),
+                "rel_label": RELATIONSHIP_TO_VALUE_LABEL,
+                "rel_props": rel_props,
+            }
+            self._add_subquery(param_name=f"values_{node_type.value}", items=items, query=query)
+
+        # ---------- Flags ----------
+        for flag in FlagProperty:
+            items = [
+                {
+                    "uuid": attr.uuid,
+                    "branch": attr.branch,
+                    "branch_level": attr.branch_level,
+                    "value": attr.flag_properties[flag.value],
+                }
+                for attr in self.attributes
+                if flag.value in attr.flag_properties
+            ]
+            query = """
+            MERGE (flag:Boolean { value: item.value })
+            CREATE (a)-[:%(rel_label)s %(rel_props)s]->(flag)
+            """ % {"rel_label": flag.value.upper(), "rel_props": rel_props}
+            self._add_subquery(param_name=f"flags_{flag.value}", items=items, query=query)
+
+        # ---------- Node Properties ----------
+        for prop in NodeProperty:
+            items = [
+                {
+                    "uuid": attr.uuid,
+                    "branch": attr.branch,
+                    "branch_level": attr.branch_level,
+                    "peer_id": attr.node_properties[prop.value],
+                }
+                for attr in self.attributes
+                if prop.value in attr.node_properties
+            ]
+            query = """
+            MATCH (np:Node { uuid: item.peer_id })
+            CREATE (a)-[:%(rel_label)s %(rel_props)s]->(np)
+            """ % {"rel_label": f"HAS_{prop.value.upper()}", "rel_props": rel_props}
+            self._add_subquery(param_name=f"props_{prop.value}", items=items, query=query)
+
+        if not self.nbr_expected_changes:
+            raise ValueError("At least one attribute with some changes must be provided")
+
+        self.return_labels = list(self.nbr_expected_changes.keys())
+
+    def validate_changes(self) -> None:
+        """Raise an error if some changes couldn't be written, because an attribute or a node property wasn't found."""
+        result = self.get_result()
+        if not result or any(result.get(label) != nbr for label, nbr in self.nbr_expected_changes.items()):
+            raise QueryError(query=self.get_query(), params=self.params)
+
+
 class AttributeGetQuery(AttributeQuery):
     name = "attribute_get"
     type: QueryType = QueryType.READ
@@ -25,7 +25,7 @@ class AddNodeToBranch(Query):
         MATCH (root:Root)
         MATCH (d) WHERE %(id_func)s(d) = $node_id
         WITH root,d
-        CREATE (d)-[r:IS_PART_OF { branch: $branch, branch_level: $branch_level, from: $now, status: $status }]->(root)
+        CREATE (d)-[r:IS_PART_OF { branch: $branch, branch_level: $branch_level, from: $now, from_ts: $now_ts, status: $status }]->(root)
         RETURN %(id_func)s(r)
         """ % {
             "id_func": db.get_id_function_name(),
@@ -33,6 +33,7 @@ class AddNodeToBranch(Query):
 
         self.params["node_id"] = db.to_database_id(self.node_id)
         self.params["now"] = self.at.to_string()
+        self.params["now_ts"] = self.at.to_epoch_microseconds()
         self.params["branch"] = self.branch.name
         self.params["branch_level"] = self.branch.hierarchy_level
         self.params["status"] = RelationshipStatus.ACTIVE.value
@@ -89,64 +90,174 @@ class GetAllBranchInternalRelationshipQuery(Query):
         self.return_labels = ["r"]
 
 
+# Condition matching the edges of a branch that must be deleted during a rebase: the edges dropped to resolve a conflict,
+# the edges created after the time of the rebase and the edges whose end is before the time of the rebase.
+# All the other edges of the branch are moved to the time of the rebase.
+REBASE_DELETE_FILTER = """(
+    coalesce(r.conflict, "") = "drop"
+    OR (r.to_ts IS NULL AND coalesce(r.from_ts > $at_ts, FALSE))
+    OR (r.to_ts IS NOT NULL AND r.to_ts < $at_ts)
+)"""
+
+
+class RebaseBranchCountRelationshipsQuery(Query):
+    """Count the edges of the branch to update and to delete during a rebase."""
+
+    name: str = "rebase_branch_count"
+
+    type: QueryType = QueryType.READ
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params["branch_name"] = self.branch.name
+        self.params["at_ts"] = self.at.to_epoch_microseconds()
+
+        query = """
+        MATCH ()-[r]->()
+        WHERE r.branch = $branch_name
+        WITH %(delete_filter)s AS to_delete
+        """ % {"delete_filter": REBASE_DELETE_FILTER}
+        self.add_to_query(query=query)
+        self.return_labels = [
+            "sum(CASE WHEN to_delete THEN 0 ELSE 1 END) AS nbr_to_update",
+            "sum(CASE WHEN to_delete THEN 1 ELSE 0 END) AS nbr_to_delete",
+        ]
+
+    def get_counts(self) -> tuple[int, int]:
+        """Return the number of edges to update and the number of edges to delete."""
+        result = self.get_result()
+        if not result:
+            return 0, 0
+        return (
+            result.get_as_type(label="nbr_to_update", return_type=int),
+            result.get_as_type(label="nbr_to_delete", return_type=int),
+        )
+
+
 class RebaseBranchUpdateRelationshipQuery(Query):
+    """Move the edges of the branch that are kept by the rebase to the time of the rebase.
+
+    With in_transactions, the edges are updated in batches of batch_size edges each committed in its own transaction,
+    this is only supported by Neo4j outside of an explicit transaction. Otherwise, only the first batch_size edges
+    not already updated are updated and their number is returned, the query must be executed until it returns 0.
+    """
+
     name: str = "rebase_branch_update"
 
     type: QueryType = QueryType.WRITE
 
-    def __init__(self, ids: list[str], **kwargs: Any) -> None:
-        self.ids = ids
+    def __init__(self, batch_size: int, in_transactions: bool = False, **kwargs: Any) -> None:
+        self.batch_size = batch_size
+        self.in_transactions = in_transactions
         super().__init__(**kwargs)
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params["branch_name"] = self.branch.name
+        self.params["at"] = self.at.to_string()
+        self.params["at_ts"] = self.at.to_epoch_microseconds()
+
         query = """
         MATCH ()-[r]->()
-        WHERE %(id_func)s(r) IN $ids
-        SET r.from = $at
-        SET r.conflict = NULL
-        """ % {
-            "id_func": db.get_id_function_name(),
-        }
+        WHERE r.branch = $branch_name
+            AND NOT %(delete_filter)s
+            AND (coalesce(r.from_ts, 0) <> $at_ts OR r.conflict IS NOT NULL)
+        """ % {"delete_filter": REBASE_DELETE_FILTER}
+        self.add_to_query(query=query)
+
+        if self.in_transactions:
+            self.insert_return = False
+            query = """
+            CALL {
+                WITH r
+                SET r.from = $at, r.from_ts = $at_ts, r.conflict = NULL
+            } IN TRANSACTIONS OF %(batch_size)s ROWS
+            """ % {"batch_size": self.batch_size}
+            self.add_to_query(query=query)
+            return
 
+        query = """
+        WITH r
+        LIMIT %(batch_size)s
+        SET r.from = $at, r.from_ts = $at_ts, r.conflict = NULL
+        """ % {"batch_size": self.batch_size}
         self.add_to_query(query=query)
+        self.return_labels = ["count(*) AS nbr_rels"]
 
-        self.params["at"] = self.at.to_string()
-        self.params["ids"] = [db.to_database_id(id) for id in self.ids]
-        self.return_labels = [f"{db.get_id_function_name()}(r)"]
+    def get_nbr_rels(self) -> int:
+        """Return the number of edges updated by a query not executed in transactions."""
+        result = self.get_result()
+        return result.get_as_type(label="nbr_rels", return_type=int) if result else 0
 
 
 class RebaseBranchDeleteRelationshipQuery(Query):
+    """Delete the edges of the branch that are discarded by the rebase, along with the vertices left without any edge.
+
+    With in_transactions, the edges are deleted in batches of batch_size edges each committed in its own transaction,
+    this is only supported by Neo4j outside of an explicit transaction. Otherwise, only the first batch_size edges
+    are deleted and their number is returned, the query must be executed until it returns 0.
+    """
+
     name: str = "rebase_branch_delete"
 
     type: QueryType = QueryType.WRITE
-    insert_return: bool = False
 
-    def __init__(self, ids: list[str], **kwargs: Any) -> None:
-        self.ids = ids
+    def __init__(self, batch_size: int, in_transactions: bool = False, **kwargs: Any) -> None:
+        self.batch_size = batch_size
+        self.in_transactions = in_transactions
         super().__init__(**kwargs)
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
-        if config.SETTINGS.database.db_type == config.DatabaseType.MEMGRAPH:
+        self.params["branch_name"] = self.branch.name
+        self.params["at_ts"] = self.at.to_epoch_microseconds()
+
+        query = """
+        MATCH (s)-[r]->(d)
+        WHERE r.branch = $branch_name AND %(delete_filter)s
+        """ % {"delete_filter": REBASE_DELETE_FILTER}
+        self.add_to_query(query=query)
+
+        if self.in_transactions:
+            self.insert_return = False
             query = """
-            MATCH p = (s)-[r]-(d)
-            WHERE %(id_func)s(r) IN $ids
-            DELETE r
-            """
-        else:
+            CALL {
+                WITH s, r, d
+                DELETE r
+                WITH s, d
+                UNWIND [s, d] AS n
+                WITH DISTINCT n
+                WHERE NOT exists((n)--())
+                DELETE n
+            } IN TRANSACTIONS OF %(batch_size)s ROWS
+            """ % {"batch_size": self.batch_size}
+            self.add_to_query(query=query)
+            return
+
+        if config.SETTINGS.database.db_type == config.DatabaseType.MEMGRAPH:
             query = """
-            MATCH p = (s)-[r]-(d)
-            WHERE %(id_func)s(r) IN $ids
+            WITH r
+            LIMIT %(batch_size)s
             DELETE r
-            WITH *
-            UNWIND nodes(p) AS n
-            MATCH (n)
+            """ % {"batch_size": self.batch_size}
+            self.add_to_query(query=query)
+            self.return_labels = ["count(*) AS nbr_rels"]
+            return
+
+        query = """
+        WITH s, r, d
+        LIMIT %(batch_size)s
+        DELETE r
+        WITH collect(s) + collect(d) AS nodes, count(*) AS nbr_rels
+        CALL {
+            WITH nodes
+            UNWIND nodes AS n
+            WITH DISTINCT n
             WHERE NOT exists((n)--())
             DELETE n
-            """
-        query %= {
-            "id_func": db.get_id_function_name(),
         }
-
+        """ % {"batch_size": self.batch_size}
         self.add_to_query(query=query)
+        self.return_labels = ["nbr_rels"]
 
-        self.params["ids"] = [db.to_database_id(id) for id in self.ids]
+    def get_nbr_rels(self) -> int:
+        """Return the number of edges deleted by a query not executed in transactions."""
+        result = self.get_result()
+        return result.get_as_type(label="nbr_rels", return_type=int) if result else 0
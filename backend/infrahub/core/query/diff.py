@@ -511,6 +511,7 @@ class DiffAllPathsQuery(DiffQuery):
         branch_support: list[BranchSupportType] | None = None,
         current_node_field_specifiers: list[tuple[str, str]] | None = None,
         new_node_field_specifiers: list[tuple[str, str]] | None = None,
+        node_uuid_range: tuple[str | None, str | None] | None = None,
         **kwargs: Any,
     ):
         self.base_branch = base_branch
@@ -518,6 +519,8 @@ class DiffAllPathsQuery(DiffQuery):
         self.branch_support = branch_support or [BranchSupportType.AWARE]
         self.current_node_field_specifiers = current_node_field_specifiers
         self.new_node_field_specifiers = new_node_field_specifiers
+        # only the nodes with a UUID greater or equal to the lower bound and lower than the upper bound are included
+        self.node_uuid_range = node_uuid_range or (None, None)
 
         super().__init__(**kwargs)
 
@@ -534,6 +537,8 @@ class DiffAllPathsQuery(DiffQuery):
                 "branch_support": [item.value for item in self.branch_support],
                 "new_node_field_specifiers": self.new_node_field_specifiers,
                 "current_node_field_specifiers": self.current_node_field_specifiers,
+                "node_uuid_min": self.node_uuid_range[0],
+                "node_uuid_max": self.node_uuid_range[1],
             }
         )
         query = """
@@ -555,6 +560,8 @@ CALL {
         // -------------------------------------
         MATCH (q:Root)<-[diff_rel:IS_PART_OF {branch: $branch_name}]-(p:Node)
         WHERE (node_ids_list IS NULL OR p.uuid IN node_ids_list)
+        AND ($node_uuid_min IS NULL OR p.uuid >= $node_uuid_min)
+        AND ($node_uuid_max IS NULL OR p.uuid < $node_uuid_max)
         AND (from_time <= diff_rel.from < $to_time)
         AND (diff_rel.to IS NULL OR (from_time <= diff_rel.to < $to_time))
         AND (p.branch_support IN $branch_support OR q.branch_support IN $branch_support)
@@ -634,6 +641,8 @@ CALL {
             MATCH (root:Root)<-[r_root:IS_PART_OF]-(p:Node)-[diff_rel:HAS_ATTRIBUTE {branch: $branch_name}]->(q:Attribute)
             // exclude attributes and relationships under added/removed nodes b/c they are covered above
             WHERE (node_field_specifiers_list IS NULL OR [p.uuid, q.name] IN node_field_specifiers_list)
+            AND ($node_uuid_min IS NULL OR p.uuid >= $node_uuid_min)
+            AND ($node_uuid_max IS NULL OR p.uuid < $node_uuid_max)
             AND r_root.branch IN [$branch_name, $base_branch_name, $global_branch_name]
             AND (p.branch_support IN $branch_support OR q.branch_support IN $branch_support)
             // if p has a different type of branch support and was addded within our timeframe
@@ -650,6 +659,8 @@ CALL {
             MATCH (root:Root)<-[r_root:IS_PART_OF]-(p:Node)-[diff_rel:IS_RELATED {branch: $branch_name}]-(q:Relationship)
             // exclude attributes and relationships under added/removed nodes b/c they are covered above
             WHERE (node_field_specifiers_list IS NULL OR [p.uuid, q.name] IN node_field_specifiers_list)
+            AND ($node_uuid_min IS NULL OR p.uuid >= $node_uuid_min)
+            AND ($node_uuid_max IS NULL OR p.uuid < $node_uuid_max)
             AND r_root.branch IN [$branch_name, $base_branch_name, $global_branch_name]
             AND (p.branch_support IN $branch_support OR q.branch_support IN $branch_support)
             // if p has a different type of branch support and was addded within our timeframe
@@ -746,6 +757,8 @@ CALL {
         // -------------------------------------
         MATCH diff_rel_path = (root:Root)<-[r_root:IS_PART_OF]-(n:Node)-[r_node]-(p)-[diff_rel {branch: $branch_name}]->(q)
         WHERE (node_field_specifiers_list IS NULL OR [n.uuid, p.name] IN node_field_specifiers_list)
+        AND ($node_uuid_min IS NULL OR n.uuid >= $node_uuid_min)
+        AND ($node_uuid_max IS NULL OR n.uuid < $node_uuid_max)
         AND (from_time <= diff_rel.from < $to_time)
         AND (diff_rel.to IS NULL OR (from_time <= diff_rel.to < $to_time))
         // exclude attributes and relationships under added/removed nodes, attrs, and rels b/c they are covered above
@@ -889,3 +902,52 @@ UNWIND diff_rel_paths AS diff_path
         """ % {"id_func": db.get_id_function_name()}
         self.add_to_query(query)
         self.return_labels = ["DISTINCT diff_path AS diff_path"]
+
+
+class DiffNodeUuidBoundariesQuery(DiffQuery):
+    """Split the sorted UUIDs of the nodes modified on the branch within the timeframe in ranges of chunk_size nodes,
+    return the lower bound of each range but the first
+
+    A node is modified if one of its edges, or one of the edges of its attributes and relationships, has been
+    added or removed on the branch within the timeframe.
+    """
+
+    name: str = "diff_node_uuid_boundaries"
+    insert_limit: bool = False
+
+    def __init__(self, chunk_size: int, **kwargs: Any):
+        self.chunk_size = chunk_size
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params.update(
+            {
+                "branch_name": self.branch.name,
+                "from_time": self.diff_from.to_string(),
+                "to_time": self.diff_to.to_string(),
+                "chunk_size": self.chunk_size,
+            }
+        )
+        query = """
+CALL {
+    MATCH (n:Node)-[r {branch: $branch_name}]-()
+    WHERE ($from_time <= r.from < $to_time) OR ($from_time <= r.to < $to_time)
+    RETURN n.uuid AS node_uuid
+    UNION
+    MATCH (n:Node)-[:HAS_ATTRIBUTE|IS_RELATED]-(field)-[r {branch: $branch_name}]-()
+    WHERE (field:Attribute OR field:Relationship)
+    AND (($from_time <= r.from < $to_time) OR ($from_time <= r.to < $to_time))
+    RETURN n.uuid AS node_uuid
+}
+WITH DISTINCT node_uuid
+ORDER BY node_uuid
+WITH collect(node_uuid) AS node_uuids
+UNWIND range($chunk_size, size(node_uuids) - 1, $chunk_size) AS boundary_index
+WITH node_uuids[boundary_index] AS boundary
+        """
+        self.add_to_query(query)
+        self.return_labels = ["boundary"]
+        self.order_by = ["boundary"]
+
+    def get_boundaries(self) -> list[str]:
+        return [result.get_as_type(label="boundary", return_type=str) for result in self.get_results()]
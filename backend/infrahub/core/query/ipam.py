@@ -7,16 +7,14 @@ from typing import TYPE_CHECKING, Iterable, Optional, Union
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.ipam.constants import AllIPTypes, IPAddressType, IPNetworkType
 from infrahub.core.registry import registry
+from infrahub.core.timestamp import Timestamp
 from infrahub.core.utils import convert_ip_to_binary_str
 
 from . import Query
 
 if TYPE_CHECKING:
-    from uuid import UUID
-
     from infrahub.core.branch import Branch
     from infrahub.core.node import Node
-    from infrahub.core.timestamp import Timestamp
     from infrahub.database import InfrahubDatabase
 
 
@@ -26,17 +24,24 @@ ADDRESS_ATTRIBUTE_LABEL = "AttributeIPHost"
 
 @dataclass
 class IPPrefixData:
-    id: UUID
+    id: str
     prefix: IPNetworkType
 
 
 @dataclass
 class IPAddressData:
-    id: UUID
+    id: str
     address: IPAddressType
 
 
-def _get_namespace_id(
+@dataclass
+class IPNodeData:
+    id: str
+    namespace_id: str
+    ip_value: AllIPTypes
+
+
+def get_namespace_id(
     namespace: Optional[Union[Node, str]] = None,
 ) -> str:
     if namespace and isinstance(namespace, str):
@@ -56,7 +61,7 @@ class IPPrefixSubnetFetch(Query):
         **kwargs,
     ):
         self.obj = obj
-        self.namespace_id = _get_namespace_id(namespace)
+        self.namespace_id = get_namespace_id(namespace)
 
         super().__init__(**kwargs)
 
@@ -147,7 +152,7 @@ class IPPrefixIPAddressFetch(Query):
         **kwargs,
     ):
         self.obj = obj
-        self.namespace_id = _get_namespace_id(namespace)
+        self.namespace_id = get_namespace_id(namespace)
 
         super().__init__(**kwargs)
 
@@ -218,7 +223,16 @@ async def get_subnets(
     at: Optional[Union[Timestamp, str]] = None,
     branch_agnostic: bool = False,
 ) -> Iterable[IPPrefixData]:
+    from infrahub.core.ipam.tree import ipam_tree_cache  # pylint: disable=import-outside-toplevel
+
     branch = await registry.get_branch(db=db, branch=branch)
+    if not branch_agnostic:
+        tree = await ipam_tree_cache.get(
+            db=db, branch=branch, namespace_id=get_namespace_id(namespace), at=Timestamp(at)
+        )
+        if tree is not None:
+            return [IPPrefixData(id=node_id, prefix=subnet) for node_id, subnet in tree.get_subnets(ip_prefix)]
+
     query = await IPPrefixSubnetFetch.init(
         db=db, branch=branch, obj=ip_prefix, namespace=namespace, at=at, branch_agnostic=branch_agnostic
     )
@@ -234,7 +248,16 @@ async def get_ip_addresses(
     at=None,
     branch_agnostic: bool = False,
 ) -> Iterable[IPAddressData]:
+    from infrahub.core.ipam.tree import ipam_tree_cache  # pylint: disable=import-outside-toplevel
+
     branch = await registry.get_branch(db=db, branch=branch)
+    if not branch_agnostic:
+        tree = await ipam_tree_cache.get(
+            db=db, branch=branch, namespace_id=get_namespace_id(namespace), at=Timestamp(at)
+        )
+        if tree is not None:
+            return [IPAddressData(id=node_id, address=address) for node_id, address in tree.get_ip_addresses(ip_prefix)]
+
     query = await IPPrefixIPAddressFetch.init(
         db=db, branch=branch, obj=ip_prefix, namespace=namespace, at=at, branch_agnostic=branch_agnostic
     )
@@ -251,10 +274,10 @@ class IPPrefixUtilization(Query):
 
     async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
         self.params["ids"] = [p.get_id() for p in self.ip_prefixes]
-        self.params["time_at"] = self.at.to_string()
+        self.params["time_at"] = self.at.to_epoch_microseconds()
 
         def rel_filter(rel_name: str) -> str:
-            return f"{rel_name}.from <= $time_at AND ({rel_name}.to IS NULL OR {rel_name}.to >= $time_at)"
+            return f"{rel_name}.from_ts <= $time_at AND ({rel_name}.to_ts IS NULL OR {rel_name}.to_ts >= $time_at)"
 
         query = f"""
         MATCH (pfx:Node)
@@ -316,11 +339,14 @@ class IPPrefixReconcileQuery(Query):
         ip_value: AllIPTypes,
         namespace: Optional[Union[Node, str]] = None,
         node_uuid: Optional[str] = None,
+        calculate_relatives: bool = True,
         **kwargs,
     ):
         self.ip_value = ip_value
         self.ip_uuid = node_uuid
-        self.namespace_id = _get_namespace_id(namespace)
+        self.namespace_id = get_namespace_id(namespace)
+        # The calculated parent and children can be skipped if they are already known
+        self.calculate_relatives = calculate_relatives
         super().__init__(**kwargs)
 
     async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
@@ -423,6 +449,10 @@ class IPPrefixReconcileQuery(Query):
         }
         self.add_to_query(get_current_children_query)
 
+        if not self.calculate_relatives:
+            self.return_labels = ["ip_node", "current_parent", "current_children"]
+            return
+
         get_new_parent_query = """
         // Identify the correct parent, if any, for the prefix node
         CALL {
@@ -573,3 +603,400 @@ class IPPrefixReconcileQuery(Query):
 
     def get_calculated_children_uuids(self) -> list[str]:
         return self._get_uuids_from_query_list("new_children")
+
+
+class IPNodeValuesQuery(Query):
+    """Return the namespace and the value of the IP prefixes and IP addresses of a namespace.
+
+    If node_ids is provided, the given nodes are returned instead, whatever namespace they belong to.
+    """
+
+    name: str = "ip_node_values"
+
+    def __init__(
+        self,
+        namespace: Optional[Union[Node, str]] = None,
+        node_ids: Optional[list[str]] = None,
+        **kwargs,
+    ):
+        self.namespace_id = get_namespace_id(namespace)
+        self.node_ids = node_ids
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        branch_filter, branch_params = self.branch.get_query_filter_path(at=self.at.to_string())
+        self.params.update(branch_params)
+        self.params["namespace_rel_names"] = ["ip_namespace__ip_prefix", "ip_namespace__ip_address"]
+
+        if self.node_ids is not None:
+            self.params["node_ids"] = self.node_ids
+            self.add_to_query(
+                """
+                MATCH (ip_node:Node)
+                WHERE ip_node.uuid IN $node_ids AND (ip_node:%(ip_prefix_kind)s OR ip_node:%(ip_address_kind)s)
+                """
+                % {"ip_prefix_kind": InfrahubKind.IPPREFIX, "ip_address_kind": InfrahubKind.IPADDRESS}
+            )
+        else:
+            self.params["namespace_id"] = self.namespace_id
+            self.add_to_query(
+                """
+                MATCH (:%(namespace_kind)s { uuid: $namespace_id })-[:IS_RELATED]-(rl:Relationship)-[:IS_RELATED]-(ip_node:Node)
+                WHERE rl.name IN $namespace_rel_names AND (ip_node:%(ip_prefix_kind)s OR ip_node:%(ip_address_kind)s)
+                WITH DISTINCT ip_node
+                """
+                % {
+                    "namespace_kind": InfrahubKind.IPNAMESPACE,
+                    "ip_prefix_kind": InfrahubKind.IPPREFIX,
+                    "ip_address_kind": InfrahubKind.IPADDRESS,
+                }
+            )
+
+        query = """
+        CALL {
+            WITH ip_node
+            MATCH (:Root)<-[r:IS_PART_OF]-(ip_node)
+            WHERE %(branch_filter)s
+            RETURN r.status = "active" AS node_is_active
+            ORDER BY r.branch_level DESC, r.from DESC
+            LIMIT 1
+        }
+        WITH ip_node, node_is_active
+        WHERE node_is_active = TRUE
+        CALL {
+            // Get the current namespace of the node
+            WITH ip_node
+            MATCH (ip_node)-[r1:IS_RELATED]-(rl:Relationship)-[r2:IS_RELATED]-(ns:%(namespace_kind)s)
+            WHERE rl.name IN $namespace_rel_names AND all(r IN [r1, r2] WHERE (%(branch_filter)s))
+            WITH
+                ns,
+                CASE WHEN r1.branch_level > r2.branch_level THEN r1.branch_level ELSE r2.branch_level END AS branch_level,
+                r1.status = "active" AND r2.status = "active" AS is_active,
+                r1.from AS from1,
+                r2.from AS from2
+            ORDER BY ns.uuid, branch_level DESC, from2 DESC, from1 DESC, is_active DESC
+            WITH ns, head(collect(is_active)) AS is_active
+            WHERE is_active = TRUE
+            RETURN ns
+            LIMIT 1
+        }
+        CALL {
+            // Get the current value of the prefix or of the address
+            WITH ip_node
+            MATCH (ip_node)-[r1:HAS_ATTRIBUTE]->(a:Attribute)-[r2:HAS_VALUE]->(av:AttributeValue)
+            WHERE a.name IN ["prefix", "address"] AND all(r IN [r1, r2] WHERE (%(branch_filter)s))
+            RETURN av, r1.status = "active" AND r2.status = "active" AS value_is_active
+            ORDER BY r1.branch_level + r2.branch_level DESC, r2.from DESC, r1.from DESC
+            LIMIT 1
+        }
+        WITH ip_node, ns, av, value_is_active, "%(ip_address_kind)s" IN labels(ip_node) AS is_address
+        WHERE value_is_active = TRUE
+        """ % {
+            "branch_filter": branch_filter,
+            "namespace_kind": InfrahubKind.IPNAMESPACE,
+            "ip_address_kind": InfrahubKind.IPADDRESS,
+        }
+
+        self.add_to_query(query)
+        self.return_labels = ["ip_node.uuid AS node_id", "ns.uuid AS namespace_id", "av.value AS value", "is_address"]
+
+    def get_nodes(self) -> list[IPNodeData]:
+        nodes: list[IPNodeData] = []
+
+        for result in self.get_results():
+            value = result.get_as_type(label="value", return_type=str)
+            ip_value: AllIPTypes
+            if result.get_as_type(label="is_address", return_type=bool):
+                ip_value = ipaddress.ip_interface(value)
+            else:
+                ip_value = ipaddress.ip_network(value)
+            nodes.append(
+                IPNodeData(
+                    id=result.get_as_type(label="node_id", return_type=str),
+                    namespace_id=result.get_as_type(label="namespace_id", return_type=str),
+                    ip_value=ip_value,
+                )
+            )
+
+        return nodes
+
+
+class IPNodeBranchAgnosticValuesQuery(IPNodeValuesQuery):
+    """Return the namespace and the value of IP prefixes and IP addresses on any branch.
+
+    A node is returned once per value if it has different values on different branches.
+    """
+
+    name: str = "ip_node_branch_agnostic_values"
+
+    def __init__(self, node_ids: list[str], **kwargs):
+        super().__init__(node_ids=node_ids, **kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        branch_filter, branch_params = self.branch.get_query_filter_path(at=self.at.to_string(), branch_agnostic=True)
+        self.params.update(branch_params)
+        self.params["node_ids"] = self.node_ids
+        self.params["namespace_rel_names"] = ["ip_namespace__ip_prefix", "ip_namespace__ip_address"]
+        self.params["attribute_names"] = ["prefix", "address"]
+
+        query = """
+        MATCH (ip_node:Node)
+        WHERE ip_node.uuid IN $node_ids AND (ip_node:%(ip_prefix_kind)s OR ip_node:%(ip_address_kind)s)
+        MATCH (ip_node)-[r1:IS_RELATED]-(rl:Relationship)-[r2:IS_RELATED]-(ns:%(namespace_kind)s)
+        WHERE rl.name IN $namespace_rel_names AND all(r IN [r1, r2] WHERE (%(branch_filter)s) AND r.status = "active")
+        MATCH (ip_node)-[r3:HAS_ATTRIBUTE]->(a:Attribute)-[r4:HAS_VALUE]->(av:AttributeValue)
+        WHERE a.name IN $attribute_names AND all(r IN [r3, r4] WHERE (%(branch_filter)s) AND r.status = "active")
+        WITH DISTINCT ip_node, ns, av, "%(ip_address_kind)s" IN labels(ip_node) AS is_address
+        """ % {
+            "branch_filter": branch_filter,
+            "namespace_kind": InfrahubKind.IPNAMESPACE,
+            "ip_prefix_kind": InfrahubKind.IPPREFIX,
+            "ip_address_kind": InfrahubKind.IPADDRESS,
+        }
+
+        self.add_to_query(query)
+        self.return_labels = ["ip_node.uuid AS node_id", "ns.uuid AS namespace_id", "av.value AS value", "is_address"]
+
+
+class IPNodeOverlapsQuery(Query):
+    """Return the IP prefixes or the IP addresses of a namespace overlapping with some values, on any branch.
+
+    An IP address overlaps with a value if it has the same IP. An IP prefix overlaps with a value if it's equal to it,
+    one of its subnets or one of its supernets whose prefix length is longer than the one provided with the value.
+    """
+
+    name: str = "ip_node_overlaps"
+
+    def __init__(
+        self,
+        ip_values: dict[AllIPTypes, int],
+        is_address: bool,
+        namespace: Optional[Union[Node, str]] = None,
+        **kwargs,
+    ):
+        self.ip_values = ip_values
+        self.is_address = is_address
+        self.namespace_id = get_namespace_id(namespace)
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        branch_filter, branch_params = self.branch.get_query_filter_path(at=self.at.to_string(), branch_agnostic=True)
+        self.params.update(branch_params)
+        self.params["namespace_id"] = self.namespace_id
+        self.params["namespace_rel_names"] = ["ip_namespace__ip_prefix", "ip_namespace__ip_address"]
+        self.params["attribute_names"] = ["prefix", "address"]
+
+        checks: list[dict[str, Union[str, int]]] = []
+        supernet_checks: list[dict[str, Union[str, int]]] = []
+        for ip_value, min_prefixlen in self.ip_values.items():
+            if isinstance(ip_value, IPAddressType):
+                checks.append(
+                    {
+                        "value": str(ip_value),
+                        "binary": convert_ip_to_binary_str(ip_value.ip),  # type: ignore[arg-type]
+                        "version": ip_value.version,
+                        "prefixlen": 0,
+                    }
+                )
+                continue
+
+            checks.append(
+                {
+                    "value": str(ip_value),
+                    "binary": convert_ip_to_binary_str(ip_value)[: ip_value.prefixlen],
+                    "version": ip_value.version,
+                    "prefixlen": ip_value.prefixlen,
+                }
+            )
+            for prefixlen in range(min_prefixlen + 1, ip_value.prefixlen):
+                supernet_checks.append(
+                    {
+                        "value": str(ip_value),
+                        "binary": convert_ip_to_binary_str(ip_value.supernet(new_prefix=prefixlen)),
+                        "version": ip_value.version,
+                        "prefixlen": prefixlen,
+                    }
+                )
+        self.params["checks"] = checks
+        self.params["supernet_checks"] = supernet_checks
+
+        query = """
+        CALL {
+            UNWIND $checks AS check
+            MATCH (av:%(value_label)s)
+            WHERE av.binary_address STARTS WITH check.binary
+                AND av.version = check.version
+                AND coalesce(av.prefixlen, 0) >= check.prefixlen
+            RETURN check.value AS candidate, av
+            UNION
+            UNWIND $supernet_checks AS check
+            MATCH (av:%(value_label)s)
+            WHERE av.binary_address = check.binary AND av.version = check.version AND av.prefixlen = check.prefixlen
+            RETURN check.value AS candidate, av
+        }
+        MATCH (av)<-[r1:HAS_VALUE]-(a:Attribute)<-[r2:HAS_ATTRIBUTE]-(ip_node:%(node_kind)s)
+        WHERE a.name IN $attribute_names AND all(r IN [r1, r2] WHERE (%(branch_filter)s) AND r.status = "active")
+        MATCH (ip_node)-[r3:IS_RELATED]-(rl:Relationship)-[r4:IS_RELATED]-(:%(namespace_kind)s { uuid: $namespace_id })
+        WHERE rl.name IN $namespace_rel_names AND all(r IN [r3, r4] WHERE (%(branch_filter)s) AND r.status = "active")
+        WITH DISTINCT candidate, av
+        """ % {
+            "value_label": ADDRESS_ATTRIBUTE_LABEL if self.is_address else PREFIX_ATTRIBUTE_LABEL,
+            "node_kind": InfrahubKind.IPADDRESS if self.is_address else InfrahubKind.IPPREFIX,
+            "namespace_kind": InfrahubKind.IPNAMESPACE,
+            "branch_filter": branch_filter,
+        }
+
+        self.add_to_query(query)
+        self.return_labels = ["candidate", "av.value AS value"]
+
+    def get_overlaps(self) -> dict[str, list[str]]:
+        """Return the values of the IP prefixes or IP addresses overlapping with each value."""
+        overlaps: dict[str, list[str]] = {}
+        for result in self.get_results():
+            overlaps.setdefault(result.get_as_type(label="candidate", return_type=str), []).append(
+                result.get_as_type(label="value", return_type=str)
+            )
+        return overlaps
+
+
+class IPNodeChangesQuery(Query):
+    """Return the IP prefixes and IP addresses whose namespace, value or status has been modified since a given time, on any branch.
+
+    The edges are found with the range indexes on the time properties of the relationships.
+    """
+
+    name: str = "ip_node_changes"
+
+    def __init__(self, since: Timestamp, **kwargs):
+        self.since = since
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        self.params["since"] = self.since.to_epoch_microseconds()
+        self.params["namespace_rel_names"] = ["ip_namespace__ip_prefix", "ip_namespace__ip_address"]
+        self.params["attribute_names"] = ["prefix", "address"]
+
+        edge_queries = [
+            """
+            MATCH ()-[r:IS_PART_OF]->()
+            WHERE r.%(time)s_ts >= $since
+            RETURN startNode(r) AS ip_node, r.%(time)s AS changed_at
+            """,
+            """
+            MATCH ()-[r:IS_RELATED]->()
+            WHERE r.%(time)s_ts >= $since
+            WITH r, CASE WHEN startNode(r):Relationship THEN startNode(r) ELSE endNode(r) END AS rl
+            WHERE rl.name IN $namespace_rel_names
+            MATCH (rl)-[:IS_RELATED]-(ip_node:Node)
+            RETURN ip_node, r.%(time)s AS changed_at
+            """,
+            """
+            MATCH ()-[r:HAS_ATTRIBUTE]->()
+            WHERE r.%(time)s_ts >= $since AND endNode(r).name IN $attribute_names
+            RETURN startNode(r) AS ip_node, r.%(time)s AS changed_at
+            """,
+            """
+            MATCH ()-[r:HAS_VALUE]->()
+            WHERE r.%(time)s_ts >= $since
+            WITH r, startNode(r) AS a
+            WHERE a.name IN $attribute_names
+            MATCH (ip_node:Node)-[:HAS_ATTRIBUTE]->(a)
+            RETURN ip_node, r.%(time)s AS changed_at
+            """,
+        ]
+        subqueries = [edge_query % {"time": time} for edge_query in edge_queries for time in ("from", "to")]
+
+        query = """
+        CALL {
+            %(subqueries)s
+        }
+        WITH ip_node, changed_at
+        WHERE ip_node:%(ip_prefix_kind)s OR ip_node:%(ip_address_kind)s
+        WITH ip_node, max(changed_at) AS changed_at
+        """ % {
+            "subqueries": "UNION".join(subqueries),
+            "ip_prefix_kind": InfrahubKind.IPPREFIX,
+            "ip_address_kind": InfrahubKind.IPADDRESS,
+        }
+
+        self.add_to_query(query)
+        self.return_labels = ["ip_node.uuid AS node_id", "changed_at"]
+
+    def get_changes(self) -> dict[str, str]:
+        """Return the time of the latest modification of each node."""
+        return {
+            result.get_as_type(label="node_id", return_type=str): result.get_as_type(
+                label="changed_at", return_type=str
+            )
+            for result in self.get_results()
+        }
+
+
+class IPNodeParentsQuery(Query):
+    """Return the current parent prefix of IP prefixes and IP addresses, with the id of the relationship to this parent.
+
+    The parents are returned for the nodes provided with node_ids and for all the children of the prefixes provided with parent_ids.
+    """
+
+    name: str = "ip_node_parents"
+
+    def __init__(self, node_ids: list[str], parent_ids: Optional[list[str]] = None, **kwargs):
+        self.node_ids = node_ids
+        self.parent_ids = parent_ids or []
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        branch_filter, branch_params = self.branch.get_query_filter_path(at=self.at.to_string())
+        self.params.update(branch_params)
+        self.params["node_ids"] = self.node_ids
+        self.params["parent_ids"] = self.parent_ids
+
+        kinds = {"ip_prefix_kind": InfrahubKind.IPPREFIX, "ip_address_kind": InfrahubKind.IPADDRESS}
+        paths = [
+            '(child:%(ip_prefix_kind)s)-[r1:IS_RELATED]->(rl:Relationship { name: "parent__child" })-[r2:IS_RELATED]->(parent:%(ip_prefix_kind)s)'
+            % kinds,
+            '(child:%(ip_address_kind)s)-[r1:IS_RELATED]->(rl:Relationship { name: "ip_prefix__ip_address" })<-[r2:IS_RELATED]-(parent:%(ip_prefix_kind)s)'
+            % kinds,
+        ]
+        # One subquery per path and per filter to let each of them start from the index on the uuid of the nodes
+        subqueries = [
+            """
+            MATCH %(path)s
+            WHERE %(filter)s
+            RETURN child, rl, parent, r1, r2
+            """
+            % {"path": path, "filter": node_filter}
+            for path in paths
+            for node_filter in ("child.uuid IN $node_ids", "parent.uuid IN $parent_ids")
+        ]
+
+        query = """
+        CALL {
+            %(subqueries)s
+        }
+        WITH child, rl, parent, r1, r2
+        WHERE all(r IN [r1, r2] WHERE (%(branch_filter)s))
+        WITH
+            child,
+            rl,
+            parent,
+            CASE WHEN r1.branch_level > r2.branch_level THEN r1.branch_level ELSE r2.branch_level END AS branch_level,
+            r1.status = "active" AND r2.status = "active" AS is_active,
+            r1.from AS from1,
+            r2.from AS from2
+        ORDER BY child.uuid, rl.uuid, branch_level DESC, from2 DESC, from1 DESC, is_active DESC
+        WITH child, rl, parent, head(collect(is_active)) AS is_active
+        WHERE is_active = TRUE
+        """ % {"subqueries": "UNION".join(subqueries), "branch_filter": branch_filter}
+
+        self.add_to_query(query)
+        self.return_labels = ["child.uuid AS node_id", "parent.uuid AS parent_id", "rl.uuid AS rel_id"]
+
+    def get_parents(self) -> dict[str, dict[str, str]]:
+        """Return the id of the relationship to each parent of the nodes, indexed by node and by parent."""
+        parents: dict[str, dict[str, str]] = {}
+        for result in self.get_results():
+            node_id = result.get_as_type(label="node_id", return_type=str)
+            parent_id = result.get_as_type(label="parent_id", return_type=str)
+            parents.setdefault(node_id, {})[parent_id] = result.get_as_type(label="rel_id", return_type=str)
+        return parents
@@ -7,7 +7,12 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any, AsyncIterator, Generator, Optional, Union
 
 from infrahub import config
-from infrahub.core.constants import AttributeDBNodeType, RelationshipDirection, RelationshipHierarchyDirection
+from infrahub.core.constants import (
+    NULL_VALUE,
+    AttributeDBNodeType,
+    RelationshipDirection,
+    RelationshipHierarchyDirection,
+)
 from infrahub.core.query import Query, QueryResult, QueryType
 from infrahub.core.query.subquery import build_subquery_filter, build_subquery_order
 from infrahub.core.query.utils import find_node_schema
@@ -25,6 +30,7 @@ if TYPE_CHECKING:
     from infrahub.core.schema.attribute_schema import AttributeSchema
     from infrahub.core.schema.profile_schema import ProfileSchema
     from infrahub.core.schema.relationship_schema import RelationshipSchema
+    from infrahub.core.timestamp import Timestamp
     from infrahub.database import InfrahubDatabase
 
 # pylint: disable=consider-using-f-string,redefined-builtin,too-many-lines
@@ -115,6 +121,201 @@ class NodeQuery(Query):
         super().__init__(**kwargs)
 
 
+RELATIONSHIP_CREATE_PROPERTIES = (
+    "{ branch: rel.branch, branch_level: rel.branch_level, status: rel.status, hierarchy: rel.hierarchical,"
+    " from: $at, from_ts: $at_ts }"
+)
+
+IPHOST_CREATE_PROPERTIES = {
+    "value": "attr.content.value",
+    "is_default": "attr.content.is_default",
+    "binary_address": "attr.content.binary_address",
+    "version": "attr.content.version",
+    "prefixlen": "attr.content.prefixlen",
+}
+
+IPNETWORK_CREATE_PROPERTIES = {
+    "value": "attr.content.value",
+    "is_default": "attr.content.is_default",
+    "binary_address": "attr.content.binary_address",
+    "version": "attr.content.version",
+    "prefixlen": "attr.content.prefixlen",
+    # "num_addresses": "attr.content.num_addresses",
+}
+
+
+async def get_node_create_data(db: InfrahubDatabase, node: Node, branch: Branch, at: Timestamp) -> dict[str, Any]:
+    """Return the parameters required to create a node, its attributes and its relationships in the database."""
+    attributes: list[AttributeCreateData] = []
+    attributes_iphost: list[AttributeCreateData] = []
+    attributes_ipnetwork: list[AttributeCreateData] = []
+
+    for attr_name in node._attributes:
+        attr: BaseAttribute = getattr(node, attr_name)
+        attr_data = attr.get_create_data()
+
+        if attr_data.node_type == AttributeDBNodeType.IPHOST:
+            attributes_iphost.append(attr_data)
+        elif attr_data.node_type == AttributeDBNodeType.IPNETWORK:
+            attributes_ipnetwork.append(attr_data)
+        else:
+            attributes.append(attr_data)
+
+    relationships: list[RelationshipCreateData] = []
+    for rel_name in node._relationships:
+        rel_manager: RelationshipManager = getattr(node, rel_name)
+        for rel in rel_manager._relationships:
+            relationships.append(await rel.get_create_data(db=db))
+
+    return {
+        "attrs": [attr.model_dump() for attr in attributes],
+        "attrs_iphost": [attr.model_dump() for attr in attributes_iphost],
+        "attrs_ipnetwork": [attr.model_dump() for attr in attributes_ipnetwork],
+        "rels_bidir": [rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.BIDIR.value],
+        "rels_out": [
+            rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.OUTBOUND.value
+        ],
+        "rels_in": [rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.INBOUND.value],
+        "node_prop": {
+            "uuid": node.id,
+            "kind": node.get_kind(),
+            "namespace": node._schema.namespace,
+            "branch_support": node._schema.branch,
+        },
+        "node_branch_prop": {
+            "branch": branch.name,
+            "branch_level": branch.hierarchy_level,
+            "status": "active",
+            "from": at.to_string(),
+            "from_ts": at.to_epoch_microseconds(),
+        },
+    }
+
+
+def get_node_create_fields_query(prefix: str) -> str:
+    """Return the part of the query creating the attributes and the relationships of the node `n`.
+
+    The data of the attributes and the relationships is read from variables starting with `prefix`,
+    either query parameters (`$`) or the keys of a map (`node_data.`) when multiple nodes are created at once.
+    """
+    query = """
+    FOREACH ( attr IN %(prefix)sattrs |
+        CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
+        CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(a)
+        MERGE (av:AttributeValue { value: attr.content.value, is_default: attr.content.is_default })
+        CREATE (a)-[:HAS_VALUE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(av)
+        MERGE (ip:Boolean { value: attr.is_protected })
+        MERGE (iv:Boolean { value: attr.is_visible })
+        CREATE (a)-[:IS_PROTECTED { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(ip)
+        CREATE (a)-[:IS_VISIBLE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(iv)
+        FOREACH ( prop IN attr.source_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (a)-[:HAS_SOURCE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(peer)
+        )
+        FOREACH ( prop IN attr.owner_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(peer)
+        )
+    )
+    FOREACH ( attr IN %(prefix)sattrs_iphost |
+        CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
+        CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(a)
+        MERGE (av:AttributeValue:AttributeIPHost { %(iphost_prop)s })
+        CREATE (a)-[:HAS_VALUE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(av)
+        MERGE (ip:Boolean { value: attr.is_protected })
+        MERGE (iv:Boolean { value: attr.is_visible })
+        CREATE (a)-[:IS_PROTECTED { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(ip)
+        CREATE (a)-[:IS_VISIBLE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(iv)
+        FOREACH ( prop IN attr.source_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (a)-[:HAS_SOURCE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(peer)
+        )
+        FOREACH ( prop IN attr.owner_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(peer)
+        )
+    )
+    FOREACH ( attr IN %(prefix)sattrs_ipnetwork |
+        CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
+        CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(a)
+        MERGE (av:AttributeValue:AttributeIPNetwork { %(ipnetwork_prop)s })
+        CREATE (a)-[:HAS_VALUE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(av)
+        MERGE (ip:Boolean { value: attr.is_protected })
+        MERGE (iv:Boolean { value: attr.is_visible })
+        CREATE (a)-[:IS_PROTECTED { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(ip)
+        CREATE (a)-[:IS_VISIBLE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(iv)
+        FOREACH ( prop IN attr.source_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (a)-[:HAS_SOURCE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(peer)
+        )
+        FOREACH ( prop IN attr.owner_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at, from_ts: $at_ts }]->(peer)
+        )
+    )
+    FOREACH ( rel IN %(prefix)srels_bidir |
+        MERGE (d:Node { uuid: rel.destination_id })
+        CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
+        CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
+        CREATE (d)-[:IS_RELATED %(rel_prop)s ]->(rl)
+        MERGE (ip:Boolean { value: rel.is_protected })
+        MERGE (iv:Boolean { value: rel.is_visible })
+        CREATE (rl)-[:IS_PROTECTED { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, from_ts: $at_ts }]->(ip)
+        CREATE (rl)-[:IS_VISIBLE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, from_ts: $at_ts }]->(iv)
+        FOREACH ( prop IN rel.source_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (rl)-[:HAS_SOURCE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, from_ts: $at_ts }]->(peer)
+        )
+        FOREACH ( prop IN rel.owner_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, from_ts: $at_ts }]->(peer)
+        )
+    )
+    FOREACH ( rel IN %(prefix)srels_out |
+        MERGE (d:Node { uuid: rel.destination_id })
+        CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
+        CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
+        CREATE (d)<-[:IS_RELATED %(rel_prop)s ]-(rl)
+        MERGE (ip:Boolean { value: rel.is_protected })
+        MERGE (iv:Boolean { value: rel.is_visible })
+        CREATE (rl)-[:IS_PROTECTED { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, from_ts: $at_ts }]->(ip)
+        CREATE (rl)-[:IS_VISIBLE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, from_ts: $at_ts }]->(iv)
+        FOREACH ( prop IN rel.source_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (rl)-[:HAS_SOURCE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, from_ts: $at_ts }]->(peer)
+        )
+        FOREACH ( prop IN rel.owner_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, from_ts: $at_ts }]->(peer)
+        )
+    )
+    FOREACH ( rel IN %(prefix)srels_in |
+        MERGE (d:Node { uuid: rel.destination_id })
+        CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
+        CREATE (n)<-[:IS_RELATED %(rel_prop)s ]-(rl)
+        CREATE (d)-[:IS_RELATED %(rel_prop)s ]->(rl)
+        MERGE (ip:Boolean { value: rel.is_protected })
+        MERGE (iv:Boolean { value: rel.is_visible })
+        CREATE (rl)-[:IS_PROTECTED { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, from_ts: $at_ts }]->(ip)
+        CREATE (rl)-[:IS_VISIBLE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, from_ts: $at_ts }]->(iv)
+        FOREACH ( prop IN rel.source_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (rl)-[:HAS_SOURCE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, from_ts: $at_ts }]->(peer)
+        )
+        FOREACH ( prop IN rel.owner_prop |
+            MERGE (peer:Node { uuid: prop.peer_id })
+            CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at, from_ts: $at_ts }]->(peer)
+        )
+    )
+    """ % {
+        "prefix": prefix,
+        "rel_prop": RELATIONSHIP_CREATE_PROPERTIES,
+        "iphost_prop": ", ".join(f"{key}: {value}" for key, value in IPHOST_CREATE_PROPERTIES.items()),
+        "ipnetwork_prop": ", ".join(f"{key}: {value}" for key, value in IPNETWORK_CREATE_PROPERTIES.items()),
+    }
+    return query
+
+
 class NodeCreateAllQuery(NodeQuery):
     name = "node_create_all"
 
@@ -130,197 +331,23 @@ class NodeCreateAllQuery(NodeQuery):
         self.params["kind"] = self.node.get_kind()
         self.params["branch_support"] = self.node._schema.branch
 
-        attributes: list[AttributeCreateData] = []
-        attributes_iphost: list[AttributeCreateData] = []
-        attributes_ipnetwork: list[AttributeCreateData] = []
-
-        for attr_name in self.node._attributes:
-            attr: BaseAttribute = getattr(self.node, attr_name)
-            attr_data = attr.get_create_data()
-
-            if attr_data.node_type == AttributeDBNodeType.IPHOST:
-                attributes_iphost.append(attr_data)
-            elif attr_data.node_type == AttributeDBNodeType.IPNETWORK:
-                attributes_ipnetwork.append(attr_data)
-            else:
-                attributes.append(attr_data)
-
-        relationships: list[RelationshipCreateData] = []
-        for rel_name in self.node._relationships:
-            rel_manager: RelationshipManager = getattr(self.node, rel_name)
-            for rel in rel_manager._relationships:
-                relationships.append(await rel.get_create_data(db=db))
-
-        self.params["attrs"] = [attr.model_dump() for attr in attributes]
-        self.params["attrs_iphost"] = [attr.model_dump() for attr in attributes_iphost]
-        self.params["attrs_ipnetwork"] = [attr.model_dump() for attr in attributes_ipnetwork]
-        self.params["rels_bidir"] = [
-            rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.BIDIR.value
-        ]
-        self.params["rels_out"] = [
-            rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.OUTBOUND.value
-        ]
-        self.params["rels_in"] = [
-            rel.model_dump() for rel in relationships if rel.direction == RelationshipDirection.INBOUND.value
-        ]
-
-        self.params["node_prop"] = {
-            "uuid": self.node.id,
-            "kind": self.node.get_kind(),
-            "namespace": self.node._schema.namespace,
-            "branch_support": self.node._schema.branch,
-        }
-        self.params["node_branch_prop"] = {
-            "branch": self.branch.name,
-            "branch_level": self.branch.hierarchy_level,
-            "status": "active",
-            "from": at.to_string(),
-        }
-
-        rel_prop_str = "{ branch: rel.branch, branch_level: rel.branch_level, status: rel.status, hierarchy: rel.hierarchical, from: $at }"
-
-        iphost_prop = {
-            "value": "attr.content.value",
-            "is_default": "attr.content.is_default",
-            "binary_address": "attr.content.binary_address",
-            "version": "attr.content.version",
-            "prefixlen": "attr.content.prefixlen",
-        }
-        iphost_prop_list = [f"{key}: {value}" for key, value in iphost_prop.items()]
-
-        ipnetwork_prop = {
-            "value": "attr.content.value",
-            "is_default": "attr.content.is_default",
-            "binary_address": "attr.content.binary_address",
-            "version": "attr.content.version",
-            "prefixlen": "attr.content.prefixlen",
-            # "num_addresses": "attr.content.num_addresses",
-        }
-        ipnetwork_prop_list = [f"{key}: {value}" for key, value in ipnetwork_prop.items()]
+        self.params.update(await get_node_create_data(db=db, node=self.node, branch=self.branch, at=at))
 
         query = """
         MATCH (root:Root)
         CREATE (n:Node:%(labels)s $node_prop )
         CREATE (n)-[r:IS_PART_OF $node_branch_prop ]->(root)
         WITH distinct n
-        FOREACH ( attr IN $attrs |
-            CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
-            CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
-            MERGE (av:AttributeValue { value: attr.content.value, is_default: attr.content.is_default })
-            CREATE (a)-[:HAS_VALUE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(av)
-            MERGE (ip:Boolean { value: attr.is_protected })
-            MERGE (iv:Boolean { value: attr.is_visible })
-            CREATE (a)-[:IS_PROTECTED { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(ip)
-            CREATE (a)-[:IS_VISIBLE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(iv)
-            FOREACH ( prop IN attr.source_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (a)-[:HAS_SOURCE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
-            )
-            FOREACH ( prop IN attr.owner_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
-            )
-        )
-        FOREACH ( attr IN $attrs_iphost |
-            CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
-            CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
-            MERGE (av:AttributeValue:AttributeIPHost { %(iphost_prop)s })
-            CREATE (a)-[:HAS_VALUE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(av)
-            MERGE (ip:Boolean { value: attr.is_protected })
-            MERGE (iv:Boolean { value: attr.is_visible })
-            CREATE (a)-[:IS_PROTECTED { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(ip)
-            CREATE (a)-[:IS_VISIBLE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(iv)
-            FOREACH ( prop IN attr.source_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (a)-[:HAS_SOURCE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
-            )
-            FOREACH ( prop IN attr.owner_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
-            )
-        )
-        FOREACH ( attr IN $attrs_ipnetwork |
-            CREATE (a:Attribute { uuid: attr.uuid, name: attr.name, branch_support: attr.branch_support })
-            CREATE (n)-[:HAS_ATTRIBUTE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(a)
-            MERGE (av:AttributeValue:AttributeIPNetwork { %(ipnetwork_prop)s })
-            CREATE (a)-[:HAS_VALUE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(av)
-            MERGE (ip:Boolean { value: attr.is_protected })
-            MERGE (iv:Boolean { value: attr.is_visible })
-            CREATE (a)-[:IS_PROTECTED { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(ip)
-            CREATE (a)-[:IS_VISIBLE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(iv)
-            FOREACH ( prop IN attr.source_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (a)-[:HAS_SOURCE { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
-            )
-            FOREACH ( prop IN attr.owner_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (a)-[:HAS_OWNER { branch: attr.branch, branch_level: attr.branch_level, status: attr.status, from: $at }]->(peer)
-            )
-        )
-        FOREACH ( rel IN $rels_bidir |
-            MERGE (d:Node { uuid: rel.destination_id })
-            CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
-            CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
-            CREATE (d)-[:IS_RELATED %(rel_prop)s ]->(rl)
-            MERGE (ip:Boolean { value: rel.is_protected })
-            MERGE (iv:Boolean { value: rel.is_visible })
-            CREATE (rl)-[:IS_PROTECTED { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(ip)
-            CREATE (rl)-[:IS_VISIBLE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(iv)
-            FOREACH ( prop IN rel.source_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (rl)-[:HAS_SOURCE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
-            )
-            FOREACH ( prop IN rel.owner_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
-            )
-        )
-        FOREACH ( rel IN $rels_out |
-            MERGE (d:Node { uuid: rel.destination_id })
-            CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
-            CREATE (n)-[:IS_RELATED %(rel_prop)s ]->(rl)
-            CREATE (d)<-[:IS_RELATED %(rel_prop)s ]-(rl)
-            MERGE (ip:Boolean { value: rel.is_protected })
-            MERGE (iv:Boolean { value: rel.is_visible })
-            CREATE (rl)-[:IS_PROTECTED { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(ip)
-            CREATE (rl)-[:IS_VISIBLE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(iv)
-            FOREACH ( prop IN rel.source_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (rl)-[:HAS_SOURCE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
-            )
-            FOREACH ( prop IN rel.owner_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
-            )
-        )
-        FOREACH ( rel IN $rels_in |
-            MERGE (d:Node { uuid: rel.destination_id })
-            CREATE (rl:Relationship { uuid: rel.uuid, name: rel.name, branch_support: rel.branch_support })
-            CREATE (n)<-[:IS_RELATED %(rel_prop)s ]-(rl)
-            CREATE (d)-[:IS_RELATED %(rel_prop)s ]->(rl)
-            MERGE (ip:Boolean { value: rel.is_protected })
-            MERGE (iv:Boolean { value: rel.is_visible })
-            CREATE (rl)-[:IS_PROTECTED { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(ip)
-            CREATE (rl)-[:IS_VISIBLE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(iv)
-            FOREACH ( prop IN rel.source_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (rl)-[:HAS_SOURCE { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
-            )
-            FOREACH ( prop IN rel.owner_prop |
-                MERGE (peer:Node { uuid: prop.peer_id })
-                CREATE (rl)-[:HAS_OWNER { branch: rel.branch, branch_level: rel.branch_level, status: rel.status, from: $at }]->(peer)
-            )
-        )
+        %(create_fields)s
         WITH distinct n
         MATCH (n)-[:HAS_ATTRIBUTE|IS_RELATED]-(rn)-[:HAS_VALUE|IS_RELATED]-(rv)
         """ % {
             "labels": ":".join(self.node.get_labels()),
-            "rel_prop": rel_prop_str,
-            "iphost_prop": ", ".join(iphost_prop_list),
-            "ipnetwork_prop": ", ".join(ipnetwork_prop_list),
+            "create_fields": get_node_create_fields_query(prefix="$"),
         }
 
         self.params["at"] = at.to_string()
+        self.params["at_ts"] = at.to_epoch_microseconds()
 
         self.add_to_query(query)
         self.return_labels = ["n", "rn", "rv"]
@@ -348,6 +375,71 @@ class NodeCreateAllQuery(NodeQuery):
         return data
 
 
+class NodeCreateManyQuery(Query):
+    """Create multiple nodes of the same kind, with their attributes and relationships, in a single query."""
+
+    name = "node_create_many"
+
+    type: QueryType = QueryType.WRITE
+
+    raise_error_if_empty: bool = True
+
+    def __init__(self, nodes: list[Node], **kwargs: Any) -> None:
+        if not nodes:
+            raise ValueError("At least one node must be provided")
+        if len({node.get_kind() for node in nodes}) > 1:
+            raise ValueError("All the nodes must be of the same kind")
+
+        self.nodes = nodes
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        at = self.at or self.nodes[0]._at
+
+        self.params["nodes"] = [
+            await get_node_create_data(db=db, node=node, branch=self.branch, at=at) for node in self.nodes
+        ]
+        self.params["at"] = at.to_string()
+        self.params["at_ts"] = at.to_epoch_microseconds()
+
+        query = """
+        MATCH (root:Root)
+        UNWIND $nodes AS node_data
+        CREATE (n:Node:%(labels)s)
+        SET n = node_data.node_prop
+        CREATE (n)-[r:IS_PART_OF]->(root)
+        SET r = node_data.node_branch_prop
+        WITH distinct n, node_data
+        %(create_fields)s
+        WITH distinct n
+        MATCH (n)-[:HAS_ATTRIBUTE|IS_RELATED]-(rn)-[:HAS_VALUE|IS_RELATED]-(rv)
+        """ % {
+            "labels": ":".join(self.nodes[0].get_labels()),
+            "create_fields": get_node_create_fields_query(prefix="node_data."),
+        }
+
+        self.add_to_query(query)
+        self.return_labels = ["n", "rn", "rv"]
+
+    def get_ids_per_node(self) -> dict[str, tuple[str, dict[str, tuple[str, str]]]]:
+        """Return the database ID of each node and the IDs of their attributes and relationships, indexed by node UUID."""
+        data: dict[str, tuple[str, dict[str, tuple[str, str]]]] = {}
+        for result in self.get_results():
+            node = result.get("n")
+            if node["uuid"] not in data:
+                data[node["uuid"]] = (node.element_id, {})
+
+            field = result.get("rn")
+            if "Relationship" in field.labels:
+                peer = result.get("rv")
+                name = f"{field.get('name')}::{peer.get('uuid')}"
+            elif "Attribute" in field.labels:
+                name = field.get("name")
+            data[node["uuid"]][1][name] = (field["uuid"], field.element_id)
+
+        return data
+
+
 class NodeDeleteQuery(NodeQuery):
     name = "node_delete"
 
@@ -363,15 +455,174 @@ class NodeDeleteQuery(NodeQuery):
         query = """
         MATCH (root:Root)
         MATCH (n:Node { uuid: $uuid })
-        CREATE (n)-[r:IS_PART_OF { branch: $branch, branch_level: $branch_level, status: "deleted", from: $at }]->(root)
+        CREATE (n)-[r:IS_PART_OF { branch: $branch, branch_level: $branch_level, status: "deleted", from: $at, from_ts: $at_ts }]->(root)
         """
 
         self.params["at"] = self.at.to_string()
+        self.params["at_ts"] = self.at.to_epoch_microseconds()
 
         self.add_to_query(query)
         self.return_labels = ["n"]
 
 
+class NodeDeleteManyQuery(Query):
+    """Delete multiple nodes of the same kind, with their attributes and relationships, in a single query.
+
+    The edges active at the time of the deletion are closed if they belong to the branch of the deletion
+    and a new edge with the status deleted is created for each of them. The edges of the branch agnostic
+    nodes, attributes and relationships are deleted in the global branch.
+    """
+
+    name = "node_delete_many"
+
+    type: QueryType = QueryType.WRITE
+
+    insert_return: bool = False
+
+    ATTRIBUTE_PROPERTY_TYPES = ["HAS_VALUE", "IS_VISIBLE", "IS_PROTECTED", "HAS_SOURCE", "HAS_OWNER"]
+    RELATIONSHIP_PROPERTY_TYPES = ["IS_VISIBLE", "IS_PROTECTED", "HAS_SOURCE", "HAS_OWNER"]
+
+    def __init__(self, node_ids: list[str], identifiers: list[str], global_branch: Branch, **kwargs: Any) -> None:
+        if not node_ids:
+            raise ValueError("At least one node must be provided")
+
+        self.node_ids = node_ids
+        self.identifiers = identifiers
+        self.global_branch = global_branch
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params["ids"] = self.node_ids
+        self.params["identifiers"] = self.identifiers
+        self.params["branch"] = self.branch.name
+        self.params["branch_level"] = self.branch.hierarchy_level
+        self.params["global_branch"] = self.global_branch.name
+        self.params["global_branch_level"] = self.global_branch.hierarchy_level
+        self.params["at"] = self.at.to_string()
+        self.params["at_ts"] = self.at.to_epoch_microseconds()
+
+        branch_filter, branch_params = self.branch.get_query_filter_path(at=self.at.to_string())
+        self.params.update(branch_params)
+
+        # Close the edge if it belongs to the branch of the deletion and create the same edge with the status deleted
+        delete_edge = """
+            WITH %(source)s, %(destination)s, r, r.branch = $global_branch AS is_global
+            SET r.to = CASE WHEN is_global OR r.branch = $branch THEN $at ELSE r.to END
+            SET r.to_ts = CASE WHEN is_global OR r.branch = $branch THEN $at_ts ELSE r.to_ts END
+            CREATE (%(source)s)%(left)s[:%(rel_type)s {
+                branch: CASE WHEN is_global THEN $global_branch ELSE $branch END,
+                branch_level: CASE WHEN is_global THEN $global_branch_level ELSE $branch_level END,
+                status: "deleted",
+                from: $at, from_ts: $at_ts,
+                hierarchy: r.hierarchy
+            }]%(right)s(%(destination)s)
+        """
+        # Only the latest edge of each property, or of each peer of a relationship, is deleted if it's active
+        property_subquery = """
+        CALL {
+            WITH %(source)s
+            MATCH (%(source)s)%(left)s[r:%(rel_type)s]%(right)s(peer%(peer_label)s)
+            WHERE %(branch_filter)s
+            WITH %(source)s, r, peer
+            ORDER BY r.branch_level DESC, r.from DESC
+            %(latest_edge)s
+            WHERE r.status = "active"
+            %(delete_edge)s
+        }
+        """
+        latest_property_edge = """
+            WITH %(source)s, head(collect([r, peer])) AS latest
+            WITH %(source)s, latest[0] AS r, latest[1] AS peer
+        """
+        latest_peer_edge = """
+            WITH %(source)s, peer, head(collect(r)) AS r
+        """
+
+        def delete_peer_edges(
+            source: str, rel_type: str, outbound: bool = True, peer_label: str = "", per_peer: bool = False
+        ) -> str:
+            left, right = ("-", "->") if outbound else ("<-", "-")
+            return property_subquery % {
+                "source": source,
+                "rel_type": rel_type,
+                "left": left,
+                "right": right,
+                "peer_label": peer_label,
+                "branch_filter": branch_filter,
+                "latest_edge": (latest_peer_edge if per_peer else latest_property_edge) % {"source": source},
+                "delete_edge": delete_edge
+                % {"source": source, "destination": "peer", "rel_type": rel_type, "left": left, "right": right},
+            }
+
+        query = """
+        UNWIND $ids AS node_id
+        MATCH (n:Node { uuid: node_id })
+        CALL {
+            WITH n
+            MATCH (:Root)<-[r:IS_PART_OF]-(n)
+            WHERE %(branch_filter)s
+            RETURN r AS node_edge
+            ORDER BY r.branch_level DESC, r.from DESC
+            LIMIT 1
+        }
+        WITH n, node_edge
+        WHERE node_edge.status = "active"
+        CALL {
+            WITH n
+            MATCH (n)-[r:HAS_ATTRIBUTE]->(a:Attribute)
+            WHERE %(branch_filter)s
+            WITH n, a, r
+            ORDER BY a.uuid, r.branch_level DESC, r.from DESC
+            WITH n, a, head(collect(r)) AS r
+            WHERE r.status = "active"
+            %(delete_attribute_edge)s
+            %(delete_attribute_properties)s
+        }
+        CALL {
+            WITH n
+            OPTIONAL MATCH (n)-[r:IS_RELATED]-(rl:Relationship)
+            WHERE rl.name IN $identifiers AND %(branch_filter)s
+            WITH rl, r
+            ORDER BY rl.uuid, r.branch_level DESC, r.from DESC
+            WITH rl, head(collect(r)) AS r
+            WHERE r.status = "active"
+            RETURN collect(rl) AS relationships
+        }
+        CALL {
+            WITH n, node_edge
+            MATCH (root:Root)
+            WITH n, root, node_edge AS r
+            %(delete_node_edge)s
+        }
+        // The relationships between two deleted nodes must be deleted only once
+        WITH collect(relationships) AS relationships_per_node
+        UNWIND relationships_per_node AS relationships
+        UNWIND relationships AS rl
+        WITH DISTINCT rl
+        %(delete_relationship_edges)s
+        %(delete_relationship_properties)s
+        """ % {
+            "branch_filter": branch_filter,
+            "delete_attribute_edge": delete_edge
+            % {"source": "n", "destination": "a", "rel_type": "HAS_ATTRIBUTE", "left": "-", "right": "->"},
+            "delete_attribute_properties": "".join(
+                delete_peer_edges(source="a", rel_type=rel_type) for rel_type in self.ATTRIBUTE_PROPERTY_TYPES
+            ),
+            "delete_node_edge": delete_edge
+            % {"source": "n", "destination": "root", "rel_type": "IS_PART_OF", "left": "-", "right": "->"},
+            # The 2 nodes of a bidirectional relationship are both connected with an inbound edge
+            "delete_relationship_edges": delete_peer_edges(
+                source="rl", rel_type="IS_RELATED", peer_label=":Node", per_peer=True
+            )
+            + delete_peer_edges(source="rl", rel_type="IS_RELATED", outbound=False, peer_label=":Node", per_peer=True),
+            "delete_relationship_properties": "".join(
+                delete_peer_edges(source="rl", rel_type=rel_type) for rel_type in self.RELATIONSHIP_PROPERTY_TYPES
+            ),
+        }
+
+        self.add_to_query(query)
+
+
 class NodeCheckIDQuery(Query):
     name = "node_check_id"
 
@@ -398,6 +649,7 @@ class NodeCheckIDQuery(Query):
 
 class NodeListGetAttributeQuery(Query):
     name: str = "node_list_get_attribute"
+    keyset_keys = ["n.uuid", "a.name"]
 
     property_type_mapping = {
         "HAS_VALUE": ("r2", "av"),
@@ -441,6 +693,7 @@ class NodeListGetAttributeQuery(Query):
             self.params["field_names"] = list(self.fields.keys())
 
         self.add_to_query(query)
+        self.add_keyset_filter()
 
         query = """
         CALL {
@@ -520,6 +773,18 @@ class NodeListGetAttributeQuery(Query):
 
         raise IndexError(f"Unable to find the result with ID: {node_id} and NAME: {attr_name}")
 
+    def get_results_by_attribute_name(self, node_id: str) -> dict[str, tuple[AttributeFromDB, QueryResult]]:
+        """Return the data of all the attributes of a given node, indexed by the name of the attribute."""
+        return self.get_results_by_node_and_attribute_name().get(node_id, {})
+
+    def get_results_by_node_and_attribute_name(self) -> dict[str, dict[str, tuple[AttributeFromDB, QueryResult]]]:
+        """Return the data of all the attributes, indexed by the id of the node and by the name of the attribute."""
+        results: dict[str, dict[str, tuple[AttributeFromDB, QueryResult]]] = defaultdict(dict)
+        for result in self.get_results_group_by(("n", "uuid"), ("a", "name")):
+            node_id = result.get_node("n").get("uuid")
+            results[node_id][result.get_node("a").get("name")] = (self._extract_attribute_data(result=result), result)
+        return dict(results)
+
     def _extract_attribute_data(self, result: QueryResult) -> AttributeFromDB:
         attr = result.get_node("a")
         attr_value = result.get_node("av")
@@ -1158,12 +1423,15 @@ class NodeGetHierarchyQuery(Query):
         direction: RelationshipHierarchyDirection,
         node_schema: Union[NodeSchema, GenericSchema],
         filters: Optional[dict] = None,
+        peer_ids: Optional[list[str]] = None,
         **kwargs: Any,
     ) -> None:
+        """The ancestors or descendants are looked up in the graph unless they have already been resolved with peer_ids."""
         self.filters = filters or {}
         self.direction = direction
         self.node_id = node_id
         self.node_schema = node_schema
+        self.peer_ids = peer_ids
 
         super().__init__(**kwargs)
 
@@ -1211,8 +1479,16 @@ class NodeGetHierarchyQuery(Query):
         WITH peer1 as peer, is_active
         """ % {"filter": filter_str, "branch_filter": branch_filter, "with_clause": with_clause}
 
+        if self.peer_ids is not None:
+            self.params["hierarchy_peer_ids"] = self.peer_ids
+            query = """
+            MATCH (peer:Node)
+            WHERE peer.uuid IN $hierarchy_peer_ids AND $hierarchy IN LABELS(peer)
+            WITH peer
+            """
+
         self.add_to_query(query)
-        where_clause = ["is_active = TRUE"]
+        where_clause = ["is_active = TRUE"] if self.peer_ids is None else []
 
         clean_filters = extract_field_filters(field_name=self.direction.value, filters=self.filters)
 
@@ -1222,7 +1498,8 @@ class NodeGetHierarchyQuery(Query):
             if clean_filters.get("id", None):
                 self.params["peer_ids"].append(clean_filters.get("id"))
 
-        self.add_to_query("WHERE " + " AND ".join(where_clause))
+        if where_clause:
+            self.add_to_query("WHERE " + " AND ".join(where_clause))
 
         self.return_labels = ["peer"]
 
@@ -1304,3 +1581,440 @@ class NodeGetHierarchyQuery(Query):
                 uuid=peer_node.get("uuid"),
                 kind=peer_node.get("kind"),
             )
+
+
+class NodeGetHierarchyParentsQuery(Query):
+    """Return the parent of each node of a hierarchy, or only of the nodes provided with node_ids."""
+
+    name = "node_get_hierarchy_parents"
+
+    type: QueryType = QueryType.READ
+
+    def __init__(self, hierarchy: str, node_ids: Optional[list[str]] = None, **kwargs: Any) -> None:
+        self.hierarchy = hierarchy
+        self.node_ids = node_ids
+
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        branch_filter, branch_params = self.branch.get_query_filter_path(at=self.at.to_string())
+        self.params.update(branch_params)
+        self.params["hierarchy"] = self.hierarchy
+
+        node_filter = ""
+        if self.node_ids is not None:
+            self.params["ids"] = self.node_ids
+            node_filter = "child.uuid IN $ids AND"
+
+        query = """
+        MATCH (child:Node)-[r1:IS_RELATED { hierarchy: $hierarchy }]->(:Relationship)-[r2:IS_RELATED { hierarchy: $hierarchy }]->(parent:Node)
+        WHERE %(node_filter)s all(r IN [r1, r2] WHERE (%(branch_filter)s))
+        WITH
+            child,
+            parent,
+            CASE WHEN r1.branch_level > r2.branch_level THEN r1.branch_level ELSE r2.branch_level END AS branch_level,
+            r1.status = "active" AND r2.status = "active" AS is_active,
+            r1.from AS from1,
+            r2.from AS from2
+        ORDER BY child.uuid, parent.uuid, branch_level DESC, from2 DESC, from1 DESC, is_active DESC
+        WITH child, parent, head(collect(is_active)) AS is_active
+        WHERE is_active = TRUE
+        """ % {"node_filter": node_filter, "branch_filter": branch_filter}
+
+        self.add_to_query(query)
+        self.return_labels = ["child.uuid AS child_id", "parent.uuid AS parent_id"]
+
+    def get_parents(self) -> dict[str, str]:
+        return {
+            result.get_as_type(label="child_id", return_type=str): result.get_as_type(
+                label="parent_id", return_type=str
+            )
+            for result in self.results
+        }
+
+
+class NodeGetHierarchyChangesQuery(Query):
+    """Return the nodes of a hierarchy whose parent has been modified since a given time, on any branch.
+
+    The edges are found with the range indexes on the time properties of the IS_RELATED relationships.
+    """
+
+    name = "node_get_hierarchy_changes"
+
+    type: QueryType = QueryType.READ
+
+    def __init__(self, hierarchy: str, since: Timestamp, **kwargs: Any) -> None:
+        self.hierarchy = hierarchy
+        self.since = since
+
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params["hierarchy"] = self.hierarchy
+        self.params["since"] = self.since.to_epoch_microseconds()
+
+        query = """
+        CALL {
+            MATCH ()-[r:IS_RELATED]->()
+            WHERE r.from_ts >= $since
+            RETURN r, r.from AS changed_at
+            UNION
+            MATCH ()-[r:IS_RELATED]->()
+            WHERE r.to_ts >= $since
+            RETURN r, r.to AS changed_at
+        }
+        WITH r, changed_at
+        WHERE r.hierarchy = $hierarchy
+        WITH CASE WHEN startNode(r):Relationship THEN startNode(r) ELSE endNode(r) END AS rl, changed_at
+        MATCH (child:Node)-[:IS_RELATED { hierarchy: $hierarchy }]->(rl)
+        WITH child, max(changed_at) AS changed_at
+        """
+
+        self.add_to_query(query)
+        self.return_labels = ["child.uuid AS child_id", "changed_at"]
+
+    def get_changes(self) -> dict[str, str]:
+        """Return the time of the latest modification of the parent of each node."""
+        return {
+            result.get_as_type(label="child_id", return_type=str): result.get_as_type(
+                label="changed_at", return_type=str
+            )
+            for result in self.results
+        }
+
+
+class NodeGetSearchValuesQuery(Query):
+    """Return the current value of the given attributes for the active nodes of the given kinds, or only of the nodes provided with node_ids."""
+
+    name = "node_get_search_values"
+
+    type: QueryType = QueryType.READ
+
+    def __init__(
+        self, kinds: list[str], attribute_names: list[str], node_ids: Optional[list[str]] = None, **kwargs: Any
+    ) -> None:
+        self.kinds = kinds
+        self.attribute_names = attribute_names
+        self.node_ids = node_ids
+
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        branch_filter, branch_params = self.branch.get_query_filter_path(at=self.at.to_string())
+        self.params.update(branch_params)
+        self.params["kinds"] = self.kinds
+        self.params["attribute_names"] = self.attribute_names
+
+        node_filter = ""
+        if self.node_ids is not None:
+            self.params["ids"] = self.node_ids
+            node_filter = "AND n.uuid IN $ids"
+
+        query = """
+        MATCH (n:Node)
+        WHERE n.kind IN $kinds %(node_filter)s
+        CALL {
+            WITH n
+            MATCH (:Root)<-[r:IS_PART_OF]-(n)
+            WHERE %(branch_filter)s
+            RETURN r.status = "active" AS node_is_active
+            ORDER BY r.branch_level DESC, r.from DESC
+            LIMIT 1
+        }
+        WITH n, node_is_active
+        WHERE node_is_active = TRUE
+        MATCH (n)-[r1:HAS_ATTRIBUTE]->(a:Attribute)-[r2:HAS_VALUE]->(av:AttributeValue)
+        WHERE a.name IN $attribute_names AND all(r IN [r1, r2] WHERE (%(branch_filter)s))
+        WITH
+            n,
+            a,
+            av,
+            r1.branch_level + r2.branch_level AS branch_level,
+            r1.status = "active" AND r2.status = "active" AS is_active,
+            r1.from AS from1,
+            r2.from AS from2
+        ORDER BY n.uuid, a.name, branch_level DESC, from2 DESC, from1 DESC, is_active DESC
+        WITH n, a.name AS attribute_name, head(collect([av.value, is_active])) AS latest
+        WHERE latest[1] = TRUE AND latest[0] IS NOT NULL
+        """ % {"node_filter": node_filter, "branch_filter": branch_filter}
+
+        self.add_to_query(query)
+        self.return_labels = ["n.uuid AS node_id", "n.kind AS kind", "attribute_name", "latest[0] AS value"]
+
+    def get_values(self) -> Generator[tuple[str, str, str, str], None, None]:
+        """Return the id, the kind, the attribute name and the value of each attribute as a string."""
+        for result in self.results:
+            yield (
+                result.get_as_type(label="node_id", return_type=str),
+                result.get_as_type(label="kind", return_type=str),
+                result.get_as_type(label="attribute_name", return_type=str),
+                str(result.get("value")),
+            )
+
+
+class NodeGetSearchChangesQuery(Query):
+    """Return the nodes created, deleted or with one of the given attributes modified since a given time, on any branch.
+
+    The edges are found with the range indexes on the time properties of the relationships.
+    """
+
+    name = "node_get_search_changes"
+
+    type: QueryType = QueryType.READ
+
+    def __init__(self, attribute_names: list[str], since: Timestamp, **kwargs: Any) -> None:
+        self.attribute_names = attribute_names
+        self.since = since
+
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params["since"] = self.since.to_epoch_microseconds()
+        self.params["attribute_names"] = self.attribute_names
+
+        edge_queries = [
+            """
+            MATCH ()-[r:IS_PART_OF]->()
+            WHERE r.%(time)s_ts >= $since
+            RETURN startNode(r) AS n, r.%(time)s AS changed_at
+            """,
+            """
+            MATCH ()-[r:HAS_ATTRIBUTE]->()
+            WHERE r.%(time)s_ts >= $since AND endNode(r).name IN $attribute_names
+            RETURN startNode(r) AS n, r.%(time)s AS changed_at
+            """,
+            """
+            MATCH ()-[r:HAS_VALUE]->()
+            WHERE r.%(time)s_ts >= $since
+            WITH r, startNode(r) AS a
+            WHERE a.name IN $attribute_names
+            MATCH (n:Node)-[:HAS_ATTRIBUTE]->(a)
+            RETURN n, r.%(time)s AS changed_at
+            """,
+        ]
+        subqueries = [edge_query % {"time": time} for edge_query in edge_queries for time in ("from", "to")]
+
+        query = """
+        CALL {
+            %(subqueries)s
+        }
+        WITH n, changed_at
+        WHERE n:Node
+        WITH n, max(changed_at) AS changed_at
+        """ % {"subqueries": "UNION".join(subqueries)}
+
+        self.add_to_query(query)
+        self.return_labels = ["n.uuid AS node_id", "changed_at"]
+
+    def get_changes(self) -> dict[str, str]:
+        """Return the time of the latest modification of each node."""
+        return {
+            result.get_as_type(label="node_id", return_type=str): result.get_as_type(
+                label="changed_at", return_type=str
+            )
+            for result in self.results
+        }
+
+
+class NodeGetHfidValuesQuery(Query):
+    """Return the values of the components of the human friendly id of the active nodes of a given kind, or only of the nodes provided with node_ids.
+
+    Each component is provided as a tuple with the identifier of the relationship to the peer holding the value,
+    or None if the value is held by the node itself, and the name of the attribute.
+    """
+
+    name = "node_get_hfid_values"
+
+    type: QueryType = QueryType.READ
+
+    def __init__(
+        self,
+        kind: str,
+        components: list[tuple[Optional[str], str]],
+        node_ids: Optional[list[str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        self.kind = kind
+        self.components = components
+        self.node_ids = node_ids
+
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        branch_filter, branch_params = self.branch.get_query_filter_path(at=self.at.to_string())
+        self.params.update(branch_params)
+
+        node_filter = ""
+        if self.node_ids is not None:
+            self.params["ids"] = self.node_ids
+            node_filter = "WHERE n.uuid IN $ids"
+
+        attribute_subquery = """
+        CALL {
+            WITH n
+            OPTIONAL MATCH (n)-[r1:HAS_ATTRIBUTE]->(:Attribute { name: $attribute_name_%(index)s })-[r2:HAS_VALUE]->(av:AttributeValue)
+            WHERE all(r IN [r1, r2] WHERE (%(branch_filter)s))
+            WITH av, r1, r2
+            ORDER BY r1.branch_level + r2.branch_level DESC, r2.from DESC, r1.from DESC
+            RETURN head(collect([r1.status = "active" AND r2.status = "active", av.value])) AS latest_%(index)s
+        }
+        """
+        relationship_subquery = """
+        CALL {
+            WITH n
+            OPTIONAL MATCH (n)-[r1:IS_RELATED]-(:Relationship { name: $identifier_%(index)s })-[r2:IS_RELATED]-(peer:Node)
+            WHERE peer.uuid <> n.uuid AND all(r IN [r1, r2] WHERE (%(branch_filter)s))
+            WITH peer, r1, r2
+            ORDER BY peer.uuid, r1.branch_level + r2.branch_level DESC, r2.from DESC, r1.from DESC
+            WITH peer, head(collect(r1.status = "active" AND r2.status = "active")) AS peer_is_active
+            WHERE peer_is_active = TRUE
+            OPTIONAL MATCH (peer)-[r3:HAS_ATTRIBUTE]->(:Attribute { name: $attribute_name_%(index)s })-[r4:HAS_VALUE]->(av:AttributeValue)
+            WHERE all(r IN [r3, r4] WHERE (%(branch_filter)s))
+            WITH peer, av, r3, r4
+            ORDER BY peer.uuid, r3.branch_level + r4.branch_level DESC, r4.from DESC, r3.from DESC
+            RETURN head(collect([r3.status = "active" AND r4.status = "active", av.value])) AS latest_%(index)s
+        }
+        """
+
+        subqueries = []
+        for index, (identifier, attribute_name) in enumerate(self.components):
+            self.params[f"attribute_name_{index}"] = attribute_name
+            if identifier:
+                self.params[f"identifier_{index}"] = identifier
+                subqueries.append(relationship_subquery % {"index": index, "branch_filter": branch_filter})
+            else:
+                subqueries.append(attribute_subquery % {"index": index, "branch_filter": branch_filter})
+
+        query = """
+        MATCH (n:%(kind)s)
+        %(node_filter)s
+        CALL {
+            WITH n
+            MATCH (:Root)<-[r:IS_PART_OF]-(n)
+            WHERE %(branch_filter)s
+            RETURN r.status = "active" AS node_is_active
+            ORDER BY r.branch_level DESC, r.from DESC
+            LIMIT 1
+        }
+        WITH n, node_is_active
+        WHERE node_is_active = TRUE
+        %(subqueries)s
+        """ % {
+            "kind": self.kind,
+            "node_filter": node_filter,
+            "branch_filter": branch_filter,
+            "subqueries": "".join(subqueries),
+        }
+
+        self.add_to_query(query)
+        values = ", ".join(
+            f"CASE WHEN latest_{index}[0] = TRUE THEN latest_{index}[1] ELSE NULL END"
+            for index in range(len(self.components))
+        )
+        self.return_labels = ["n.uuid AS node_id", f"[{values}] AS hfid_values"]
+
+    def get_values(self) -> dict[str, list[Any]]:
+        """Return the values of the components of the human friendly id of each node, None for a missing value."""
+        return {
+            result.get_as_type(label="node_id", return_type=str): [
+                None if value == NULL_VALUE else value for value in result.get("hfid_values")
+            ]
+            for result in self.results
+        }
+
+
+class NodeGetHfidChangesQuery(Query):
+    """Return the nodes of a given kind whose human friendly id might have been modified since a given time, on any branch.
+
+    A node is returned when it has been created or deleted, when one of the attributes of its human friendly id
+    has been modified, when one of the relationships of its human friendly id has been modified
+    or when the attribute of a peer used by its human friendly id has been modified.
+    The edges are found with the range indexes on the time properties of the relationships.
+    """
+
+    name = "node_get_hfid_changes"
+
+    type: QueryType = QueryType.READ
+
+    def __init__(
+        self,
+        kind: str,
+        attribute_names: list[str],
+        identifiers: list[str],
+        peer_attribute_names: list[str],
+        since: Timestamp,
+        **kwargs: Any,
+    ) -> None:
+        self.kind = kind
+        self.attribute_names = attribute_names
+        self.identifiers = identifiers
+        self.peer_attribute_names = peer_attribute_names
+        self.since = since
+
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs: Any) -> None:
+        self.params["since"] = self.since.to_epoch_microseconds()
+        self.params["attribute_names"] = self.attribute_names
+        self.params["identifiers"] = self.identifiers
+        self.params["peer_attribute_names"] = self.peer_attribute_names
+
+        edge_queries = [
+            """
+            MATCH ()-[r:IS_PART_OF]->()
+            WHERE r.%(time)s_ts >= $since
+            RETURN startNode(r) AS n, r.%(time)s AS changed_at
+            """,
+            """
+            MATCH ()-[r:HAS_ATTRIBUTE]->()
+            WHERE r.%(time)s_ts >= $since AND endNode(r).name IN $attribute_names
+            RETURN startNode(r) AS n, r.%(time)s AS changed_at
+            """,
+            """
+            MATCH ()-[r:HAS_VALUE]->()
+            WHERE r.%(time)s_ts >= $since
+            WITH r, startNode(r) AS a
+            WHERE a.name IN $attribute_names
+            MATCH (n:Node)-[:HAS_ATTRIBUTE]->(a)
+            RETURN n, r.%(time)s AS changed_at
+            """,
+            """
+            MATCH ()-[r:IS_RELATED]->()
+            WHERE r.%(time)s_ts >= $since
+            WITH r, CASE WHEN startNode(r):Relationship THEN startNode(r) ELSE endNode(r) END AS rl
+            WHERE rl.name IN $identifiers
+            MATCH (n:Node)-[:IS_RELATED]-(rl)
+            RETURN n, r.%(time)s AS changed_at
+            """,
+            """
+            MATCH ()-[r:HAS_ATTRIBUTE|HAS_VALUE]->()
+            WHERE r.%(time)s_ts >= $since
+            WITH r, CASE WHEN startNode(r):Attribute THEN startNode(r) ELSE endNode(r) END AS a
+            WHERE a.name IN $peer_attribute_names
+            MATCH (n:Node)-[:IS_RELATED]-(rl:Relationship)-[:IS_RELATED]-(:Node)-[:HAS_ATTRIBUTE]->(a)
+            WHERE rl.name IN $identifiers
+            RETURN n, r.%(time)s AS changed_at
+            """,
+        ]
+        subqueries = [edge_query % {"time": time} for edge_query in edge_queries for time in ("from", "to")]
+
+        query = """
+        CALL {
+            %(subqueries)s
+        }
+        WITH n, changed_at
+        WHERE n:%(kind)s
+        WITH n, max(changed_at) AS changed_at
+        """ % {"subqueries": "UNION".join(subqueries), "kind": self.kind}
+
+        self.add_to_query(query)
+        self.return_labels = ["n.uuid AS node_id", "changed_at"]
+
+    def get_changes(self) -> dict[str, str]:
+        """Return the time of the latest modification of each node."""
+        return {
+            result.get_as_type(label="node_id", return_type=str): result.get_as_type(
+                label="changed_at", return_type=str
+            )
+            for result in self.results
+        }
@@ -182,6 +182,7 @@ class RelationshipQuery(Query):
             "branch_level": self.branch.hierarchy_level,
             "status": status.value,
             "from": self.at.to_string(),
+            "from_ts": self.at.to_epoch_microseconds(),
         }
         if self.schema.hierarchical:
             rel_prop_dict["hierarchy"] = self.schema.hierarchical
@@ -215,6 +216,7 @@ class RelationshipCreateQuery(RelationshipQuery):
         self.params["branch"] = self.branch.name
         self.params["branch_level"] = self.branch.hierarchy_level
         self.params["at"] = self.at.to_string()
+        self.params["at_ts"] = self.at.to_epoch_microseconds()
 
         self.params["is_protected"] = self.rel.is_protected
         self.params["is_visible"] = self.rel.is_visible
@@ -266,7 +268,7 @@ class RelationshipCreateQuery(RelationshipQuery):
 
     def query_add_node_property_create(self, name: str) -> None:
         query = """
-        CREATE (rl)-[:HAS_%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at }]->(%s)
+        CREATE (rl)-[:HAS_%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at, from_ts: $at_ts }]->(%s)
         """ % (
             name.upper(),
             name,
@@ -295,6 +297,7 @@ class RelationshipUpdatePropertyQuery(RelationshipQuery):
         self.params["branch"] = self.branch.name
         self.params["branch_level"] = self.branch.hierarchy_level
         self.params["at"] = self.at.to_string()
+        self.params["at_ts"] = self.at.to_epoch_microseconds()
 
         query = """
         MATCH (rl:Relationship { uuid: $rel_node_id })
@@ -334,7 +337,7 @@ class RelationshipUpdatePropertyQuery(RelationshipQuery):
 
     def query_add_flag_property_create(self, name: str) -> None:
         query = """
-        CREATE (rl)-[:%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at }]->(prop_%s)
+        CREATE (rl)-[:%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at, from_ts: $at_ts }]->(prop_%s)
         """ % (
             name.upper(),
             name,
@@ -348,7 +351,7 @@ class RelationshipUpdatePropertyQuery(RelationshipQuery):
 
     def query_add_node_property_create(self, name: str) -> None:
         query = """
-        CREATE (rl)-[:%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at }]->(prop_%s)
+        CREATE (rl)-[:%s { branch: $branch, branch_level: $branch_level, status: "active", from: $at, from_ts: $at_ts }]->(prop_%s)
         """ % (
             "HAS_" + name.upper(),
             name,
@@ -478,11 +481,176 @@ class RelationshipDeleteQuery(RelationshipQuery):
         )
 
         self.params["at"] = self.at.to_string()
+
         self.return_labels = ["rl"]
 
         self.add_to_query(query)
 
 
+class RelationshipCreateManyQuery(Query):
+    """Create multiple relationships of the same schema, each one between a source and a destination node.
+
+    The relationships are created with their default flags and without source or owner.
+    """
+
+    name = "relationship_create_many"
+
+    type: QueryType = QueryType.WRITE
+
+    def __init__(
+        self,
+        schema: RelationshipSchema,
+        peers: list[tuple[str, str]],
+        rel_type: str = "IS_RELATED",
+        **kwargs,
+    ):
+        self.schema = schema
+        self.peers = peers
+        self.rel_type = rel_type
+
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        self.params["relationships"] = [
+            {"uuid": str(UUIDT()), "source_id": source_id, "destination_id": destination_id}
+            for source_id, destination_id in self.peers
+        ]
+        self.params["name"] = self.schema.identifier
+        self.params["branch_support"] = self.schema.branch.value
+        self.params["is_protected"] = False
+        self.params["is_visible"] = True
+
+        self.params["rel_prop"] = {
+            "branch": self.branch.name,
+            "branch_level": self.branch.hierarchy_level,
+            "status": RelationshipStatus.ACTIVE.value,
+            "from": self.at.to_string(),
+            "from_ts": self.at.to_epoch_microseconds(),
+        }
+        if self.schema.hierarchical:
+            self.params["rel_prop"]["hierarchy"] = self.schema.hierarchical
+
+        arrows = self.schema.get_query_arrows()
+        r1 = f"{arrows.left.start}[r1:{self.rel_type} $rel_prop ]{arrows.left.end}"
+        r2 = f"{arrows.right.start}[r2:{self.rel_type} $rel_prop ]{arrows.right.end}"
+
+        query = """
+        MERGE (ip:Boolean { value: $is_protected })
+        MERGE (iv:Boolean { value: $is_visible })
+        WITH ip, iv
+        UNWIND $relationships AS relationship
+        MATCH (s:Node { uuid: relationship.source_id })
+        MATCH (d:Node { uuid: relationship.destination_id })
+        CREATE (rl:Relationship { uuid: relationship.uuid, name: $name, branch_support: $branch_support })
+        CREATE (s)%(r1)s(rl)
+        CREATE (rl)%(r2)s(d)
+        CREATE (rl)-[r3:IS_PROTECTED $rel_prop ]->(ip)
+        CREATE (rl)-[r4:IS_VISIBLE $rel_prop ]->(iv)
+        """ % {"r1": r1, "r2": r2}
+
+        self.add_to_query(query)
+        self.return_labels = ["rl.uuid AS rel_id"]
+
+    def get_created_ids(self) -> list[str]:
+        return [result.get_as_type(label="rel_id", return_type=str) for result in self.get_results()]
+
+
+class RelationshipDeleteManyQuery(Query):
+    """Delete multiple relationships of the same schema, identified by the source node, the relationship and the destination node.
+
+    The active edges of the branch are closed and edges with the status deleted are created,
+    like it's done by RelationshipGetQuery and RelationshipDeleteQuery for a single relationship.
+    """
+
+    name = "relationship_delete_many"
+
+    type: QueryType = QueryType.WRITE
+
+    def __init__(
+        self,
+        schema: RelationshipSchema,
+        relationships: list[tuple[str, str, str]],
+        rel_type: str = "IS_RELATED",
+        **kwargs,
+    ):
+        self.schema = schema
+        self.relationships = relationships
+        self.rel_type = rel_type
+
+        super().__init__(**kwargs)
+
+    async def query_init(self, db: InfrahubDatabase, **kwargs) -> None:
+        self.params["relationships"] = [
+            {"source_id": source_id, "rel_id": rel_id, "destination_id": destination_id}
+            for source_id, rel_id, destination_id in self.relationships
+        ]
+        self.params["branch"] = self.branch.name
+        self.params["at"] = self.at.to_string()
+        self.params["at_ts"] = self.at.to_epoch_microseconds()
+
+        self.params["rel_prop"] = {
+            "branch": self.branch.name,
+            "branch_level": self.branch.hierarchy_level,
+            "status": RelationshipStatus.DELETED.value,
+            "from": self.at.to_string(),
+            "from_ts": self.at.to_epoch_microseconds(),
+        }
+        if self.schema.hierarchical:
+            self.params["rel_prop"]["hierarchy"] = self.schema.hierarchical
+
+        arrows = self.schema.get_query_arrows()
+        r1 = f"{arrows.left.start}[r1:{self.rel_type} $rel_prop ]{arrows.left.end}"
+        r2 = f"{arrows.right.start}[r2:{self.rel_type} $rel_prop ]{arrows.right.end}"
+
+        query = """
+        UNWIND $relationships AS relationship
+        MATCH (s:Node { uuid: relationship.source_id })-[:%(rel_type)s]-(rl:Relationship { uuid: relationship.rel_id })
+        MATCH (rl)-[:%(rel_type)s]-(d:Node { uuid: relationship.destination_id })
+        WITH DISTINCT s, rl, d
+        CALL {
+            WITH s, rl
+            MATCH (s)-[active_edge:%(rel_type)s]-(rl)
+            WHERE active_edge.branch = $branch AND active_edge.status = "active" AND active_edge.to IS NULL
+            SET active_edge.to = $at, active_edge.to_ts = $at_ts
+        }
+        CALL {
+            WITH rl, d
+            MATCH (rl)-[active_edge:%(rel_type)s]-(d)
+            WHERE active_edge.branch = $branch AND active_edge.status = "active" AND active_edge.to IS NULL
+            SET active_edge.to = $at, active_edge.to_ts = $at_ts
+        }
+        CREATE (s)%(r1)s(rl)
+        CREATE (rl)%(r2)s(d)
+        WITH rl
+        CALL {
+            WITH rl
+            MATCH (rl)-[edge:IS_VISIBLE]->(visible)
+            CREATE (rl)-[deleted_edge:IS_VISIBLE $rel_prop]->(visible)
+        }
+        CALL {
+            WITH rl
+            MATCH (rl)-[edge:IS_PROTECTED]->(protected)
+            CREATE (rl)-[deleted_edge:IS_PROTECTED $rel_prop]->(protected)
+        }
+        CALL {
+            WITH rl
+            MATCH (rl)-[edge:HAS_OWNER]->(owner_node)
+            CREATE (rl)-[deleted_edge:HAS_OWNER $rel_prop]->(owner_node)
+        }
+        CALL {
+            WITH rl
+            MATCH (rl)-[edge:HAS_SOURCE]->(source_node)
+            CREATE (rl)-[deleted_edge:HAS_SOURCE $rel_prop]->(source_node)
+        }
+        """ % {"rel_type": self.rel_type, "r1": r1, "r2": r2}
+
+        self.add_to_query(query)
+        self.return_labels = ["rl.uuid AS rel_id"]
+
+    def get_deleted_ids(self) -> list[str]:
+        return [result.get_as_type(label="rel_id", return_type=str) for result in self.get_results()]
+
+
 class RelationshipGetPeerQuery(Query):
     name = "relationship_get_peer"
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 from infrahub.core import registry
 from infrahub.core.constants import InfrahubKind, RelationshipStatus
@@ -8,6 +8,7 @@ from infrahub.core.query import Query
 
 if TYPE_CHECKING:
     from infrahub.core.protocols import CoreNumberPool
+    from infrahub.core.timestamp import Timestamp
     from infrahub.database import InfrahubDatabase
 
 
@@ -90,6 +91,7 @@ class IPAddressPoolSetReserved(Query):
             "branch_level": global_branch.hierarchy_level,
             "status": RelationshipStatus.ACTIVE.value,
             "from": self.at.to_string(),
+            "from_ts": self.at.to_epoch_microseconds(),
             "identifier": self.identifier,
         }
 
@@ -121,10 +123,10 @@ class NumberPoolGetAllocated(Query):
         self.params["start_range"] = self.pool.start_range.value
         self.params["end_range"] = self.pool.end_range.value
 
-        self.params["time_at"] = self.at.to_string()
+        self.params["time_at"] = self.at.to_epoch_microseconds()
 
         def rel_filter(rel_name: str) -> str:
-            return f"{rel_name}.from <= $time_at AND ({rel_name}.to IS NULL OR {rel_name}.to >= $time_at)"
+            return f"{rel_name}.from_ts <= $time_at AND ({rel_name}.to_ts IS NULL OR {rel_name}.to_ts >= $time_at)"
 
         query = f"""
         MATCH (n:%(node)s)-[ha:HAS_ATTRIBUTE]-(a:Attribute {{name: $node_attribute}})-[hv:HAS_VALUE]-(av:AttributeValue)
@@ -191,9 +193,11 @@ class NumberPoolGetUsed(Query):
     def __init__(
         self,
         pool: CoreNumberPool,
+        since: Optional[Timestamp] = None,
         **kwargs: dict[str, Any],
     ) -> None:
         self.pool = pool
+        self.since = since
 
         super().__init__(**kwargs)  # type: ignore[arg-type]
 
@@ -208,13 +212,20 @@ class NumberPoolGetUsed(Query):
 
         self.params.update(branch_params)
 
+        since_filter = ""
+        if self.since:
+            # Only return the numbers reserved after a given time
+            self.params["since"] = self.since.to_epoch_microseconds()
+            since_filter = "AND r.from_ts >= $since"
+
         query = """
         MATCH (pool:%(number_pool)s { uuid: $pool_id })-[r:IS_RESERVED]->(av:AttributeValue )
         WHERE
             toInteger(av.value) >= $start_range and toInteger(av.value) <= $end_range
             AND
             %(branch_filter)s
-        """ % {"branch_filter": branch_filter, "number_pool": InfrahubKind.NUMBERPOOL}
+            %(since_filter)s
+        """ % {"branch_filter": branch_filter, "since_filter": since_filter, "number_pool": InfrahubKind.NUMBERPOOL}
 
         self.add_to_query(query)
         self.return_labels = ["av.value"]
@@ -227,20 +238,24 @@ class NumberPoolSetReserved(Query):
     def __init__(
         self,
         pool_id: str,
-        reserved: int,
-        identifier: str,
+        reserved: Optional[int] = None,
+        identifier: Optional[str] = None,
+        reservations: Optional[dict[str, int]] = None,
         **kwargs: dict[str, Any],
     ) -> None:
+        """Reserve a single number with reserved and identifier, or multiple numbers indexed by identifier with reservations."""
         self.pool_id = pool_id
-        self.reserved = reserved
-        self.identifier = identifier
+        self.reservations = dict(reservations or {})
+        if reserved is not None and identifier is not None:
+            self.reservations[identifier] = reserved
 
         super().__init__(**kwargs)  # type: ignore[arg-type]
 
     async def query_init(self, db: InfrahubDatabase, **kwargs: dict[str, Any]) -> None:
         self.params["pool_id"] = self.pool_id
-        self.params["reserved"] = self.reserved
-        self.params["identifier"] = self.identifier
+        self.params["reservations"] = [
+            {"identifier": identifier, "value": value} for identifier, value in self.reservations.items()
+        ]
 
         global_branch = registry.get_global_branch()
         self.params["rel_prop"] = {
@@ -248,17 +263,40 @@ class NumberPoolSetReserved(Query):
             "branch_level": global_branch.hierarchy_level,
             "status": RelationshipStatus.ACTIVE.value,
             "from": self.at.to_string(),
-            "identifier": self.identifier,
+            "from_ts": self.at.to_epoch_microseconds(),
         }
 
+        # The values are locked before checking if they are already reserved, a concurrent transaction reserving
+        # the same value waits for this one to complete and finds its reservation.
+        # Nothing is reserved if one of the values is already reserved.
         query = """
         MATCH (pool:%(number_pool)s { uuid: $pool_id })
-        MERGE (value:AttributeValue { value: $reserved, is_default: false })
-        CREATE (pool)-[rel:IS_RESERVED $rel_prop]->(value)
+        UNWIND $reservations AS reservation
+        MERGE (value:AttributeValue { value: reservation.value, is_default: false })
+        SET value.is_default = false
+        WITH pool, reservation, value, exists((pool)-[:IS_RESERVED]->(value)) AS is_reserved
+        WITH
+            pool,
+            collect(value) AS values,
+            collect(reservation.identifier) AS identifiers,
+            collect(CASE WHEN is_reserved THEN reservation.value END) AS conflicts
+        FOREACH (idx IN CASE WHEN size(conflicts) = 0 THEN range(0, size(values) - 1) ELSE [] END |
+            FOREACH (value IN [values[idx]] |
+                CREATE (pool)-[rel:IS_RESERVED $rel_prop]->(value)
+                SET rel.identifier = identifiers[idx]
+            )
+        )
         """ % {"number_pool": InfrahubKind.NUMBERPOOL}
 
         self.add_to_query(query)
-        self.return_labels = ["value"]
+        self.return_labels = ["conflicts"]
+
+    def get_conflicts(self) -> list[int]:
+        """Return the values that were already reserved, in which case none of the values has been reserved."""
+        result = self.get_result()
+        if not result:
+            return []
+        return [int(value) for value in result.get_as_type("conflicts", return_type=list)]
 
 
 class PrefixPoolGetIdentifiers(Query):
@@ -340,6 +378,7 @@ class PrefixPoolSetReserved(Query):
             "branch_level": global_branch.hierarchy_level,
             "status": RelationshipStatus.ACTIVE.value,
             "from": self.at.to_string(),
+            "from_ts": self.at.to_epoch_microseconds(),
             "identifier": self.identifier,
         }
 
@@ -709,6 +709,7 @@ class RelationshipManager:
         )
         self._relationship_id_details: Optional[RelationshipUpdateDetails] = None
         self.has_fetched_relationships: bool = False
+        self._loaded_hashes: Optional[list[int]] = None
 
     @classmethod
     async def init(
@@ -752,6 +753,24 @@ class RelationshipManager:
     def get_kind(self) -> str:
         return self.schema.kind
 
+    def _get_hashes(self) -> list[int]:
+        return sorted(hash(rel) for rel in self._relationships)
+
+    def mark_as_saved(self) -> None:
+        """Record the current list of relationships as the one present in the database."""
+        self._loaded_hashes = self._get_hashes()
+
+    @property
+    def has_changes(self) -> bool:
+        """Indicate if the relationships have been modified since they have been fetched from or saved to the database.
+
+        Relationships that haven't been fetched can't have been modified,
+        relationships provided when the node was initialized are always considered modified.
+        """
+        if not self.has_fetched_relationships:
+            return False
+        return self._loaded_hashes is None or self._loaded_hashes != self._get_hashes()
+
     def __iter__(self) -> Iterator[Relationship]:
         if self.schema.cardinality == "one":
             raise TypeError("relationship with single cardinality are not iterable")
@@ -890,6 +909,16 @@ class RelationshipManager:
 
         current_peer_ids = [rel.get_peer_id() for rel in self._relationships]
 
+        if not self.node._existing:
+            # A node that hasn't been saved yet can't have any relationship in the database
+            self._relationship_id_details = RelationshipUpdateDetails(
+                peer_ids_present_both=[],
+                peer_ids_present_local_only=list(set(current_peer_ids)),
+                peer_ids_present_database_only=[],
+                peers_database={},
+            )
+            return self._relationship_id_details
+
         query = await RelationshipGetPeerQuery.init(
             db=db,
             source=self.node,
@@ -943,6 +972,8 @@ class RelationshipManager:
         for peer_id in details.peer_ids_present_local_only:
             await self.remove(peer_id=peer_id, db=db)
 
+        self.mark_as_saved()
+
     async def get(self, db: InfrahubDatabase) -> Union[Relationship, list[Relationship]]:
         rels = await self.get_relationships(db=db)
 
@@ -1130,6 +1161,7 @@ class RelationshipManager:
                         db=db,
                     )
 
+        self.mark_as_saved()
         return self
 
     async def delete(self, db: InfrahubDatabase, at: Optional[Timestamp] = None) -> None:
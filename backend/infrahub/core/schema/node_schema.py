@@ -112,7 +112,7 @@ class NodeSchema(GeneratedNodeSchema):
     def get_hierarchy_schema(self, db: InfrahubDatabase, branch: Optional[Union[Branch, str]] = None) -> GenericSchema:
         if not self.hierarchy:
             raise ValueError("The node is not part of a hierarchy")
-        schema = db.schema.get(name=self.hierarchy, branch=branch)
+        schema = db.schema.get(name=self.hierarchy, branch=branch, duplicate=False)
         if not isinstance(schema, GenericSchema):
             raise TypeError
         return schema
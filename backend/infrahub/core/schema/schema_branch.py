@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import copy
 import hashlib
+import weakref
 from collections import defaultdict
 from itertools import chain
 from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Union
@@ -45,7 +46,8 @@ from infrahub.core.schema import (
 from infrahub.core.schema.definitions.core import core_profile_schema_definition
 from infrahub.core.validators import CONSTRAINT_VALIDATOR_MAP
 from infrahub.exceptions import SchemaNotFoundError, ValidationError
-from infrahub.graphql.manager import GraphQLSchemaManager
+from infrahub.graphql.query_cache import query_cache
+from infrahub.graphql.schema_registry import GraphQLSchemaKey, graphql_schema_registry
 from infrahub.log import get_logger
 from infrahub.types import ATTRIBUTE_TYPES
 from infrahub.utils import format_label
@@ -59,6 +61,8 @@ if TYPE_CHECKING:
     from graphql import GraphQLSchema
     from pydantic import ValidationInfo
 
+    from infrahub.graphql.manager import GraphQLSchemaManager
+
 
 # pylint: disable=redefined-builtin,too-many-public-methods,too-many-lines
 
@@ -72,6 +76,8 @@ class SchemaBranch:
         self.profiles: dict[str, str] = {}
         self._graphql_schema: Optional[GraphQLSchema] = None
         self._graphql_manager: Optional[GraphQLSchemaManager] = None
+        self._graphql_schema_release: Optional[weakref.finalize] = None
+        self._graphql_schema_key: Optional[GraphQLSchemaKey] = None
 
         if data:
             self.nodes = data.get("nodes", {})
@@ -166,13 +172,19 @@ class SchemaBranch:
         return cls(cache=cache, data=nodes)
 
     def clear_cache(self) -> None:
+        if self._graphql_schema_release:
+            self._graphql_schema_release()
+        self._graphql_schema_release = None
+        self._graphql_schema_key = None
         self._graphql_manager = None
         self._graphql_schema = None
+        query_cache.clear(schema_hash=self.get_hash())
 
     def get_graphql_manager(self) -> GraphQLSchemaManager:
+        """Return the manager used to generate the GraphQL schema, the schema is generated if needed."""
         if not self._graphql_manager:
-            self._graphql_manager = GraphQLSchemaManager(schema=self)
-        return self._graphql_manager
+            self.get_graphql_schema()
+        return self._graphql_manager  # type: ignore[return-value]
 
     def get_graphql_schema(
         self,
@@ -181,15 +193,31 @@ class SchemaBranch:
         include_subscription: bool = True,
         include_types: bool = True,
     ) -> GraphQLSchema:
+        """Return the GraphQL schema for this schema branch.
+
+        The GraphQL schemas are shared between all the schema branches with the same hash,
+        the reference to the shared schema is released when the cache is cleared or when this object is deleted.
+        """
         if not self._graphql_schema:
-            self._graphql_schema = self.get_graphql_manager().generate(
+            key, entry = graphql_schema_registry.acquire(
+                schema_branch=self,
                 include_query=include_query,
                 include_mutation=include_mutation,
                 include_subscription=include_subscription,
                 include_types=include_types,
             )
+            self._graphql_schema_release = weakref.finalize(self, graphql_schema_registry.release, key)
+            self._graphql_schema_key = key
+            self._graphql_manager = entry.manager
+            self._graphql_schema = entry.schema
         return self._graphql_schema
 
+    def get_graphql_schema_key(self) -> GraphQLSchemaKey:
+        """Return the key of the GraphQL schema of this schema branch in the registry, the schema is generated if needed."""
+        if not self._graphql_schema_key:
+            self.get_graphql_schema()
+        return self._graphql_schema_key  # type: ignore[return-value]
+
     def diff(self, other: SchemaBranch) -> SchemaDiff:
         # Identify the nodes or generics that have been added or removed
         local_kind_id_map = self.get_all_kind_id_map(exclude_profiles=True)
@@ -291,6 +319,8 @@ class SchemaBranch:
         by default the function always returns a copy of the object, not the object itself
 
         If duplicate is set to false, the real object will be returned.
+        The objects in the cache are indexed by their hash and are shared between branches,
+        they must be treated as read-only: callers that need to modify a schema must work on a copy.
         """
         key = None
         if name in self.nodes:
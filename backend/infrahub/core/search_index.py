@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import heapq
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+from infrahub import config
+from infrahub.core import registry
+from infrahub.core.cache_sync import BranchCache, get_sync_since, has_changes_after, is_sync_required
+from infrahub.core.query.node import NodeGetSearchChangesQuery, NodeGetSearchValuesQuery
+from infrahub.core.timestamp import Timestamp
+
+if TYPE_CHECKING:
+    from infrahub.core.branch import Branch
+    from infrahub.database import InfrahubDatabase
+
+# Rank of a match, the lowest rank is returned first
+MATCH_EXACT = 0
+MATCH_PREFIX = 1
+MATCH_SUBSTRING = 2
+
+
+def get_trigrams(value: str) -> set[str]:
+    return {value[index : index + 3] for index in range(len(value) - 2)}
+
+
+@dataclass
+class SearchEntry:
+    kind: str
+    values: list[str]
+
+
+@dataclass
+class SearchIndex:
+    """Values of the display labels and of the human friendly ids of the nodes of a branch, indexed by trigram.
+
+    The values are lowercased, a query of at least 3 characters is only compared to the nodes having all its trigrams.
+    """
+
+    branched_from: Optional[str]
+    schema_hash: str
+    synced_at: Timestamp
+    entries: dict[str, SearchEntry] = field(default_factory=dict)
+    trigrams: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def set_node(self, node_id: str, kind: str, values: list[str]) -> None:
+        self.remove_node(node_id=node_id)
+        lowered_values = sorted({value.lower() for value in values if value})
+        if not lowered_values:
+            return
+
+        self.entries[node_id] = SearchEntry(kind=kind, values=lowered_values)
+        for value in lowered_values:
+            for trigram in get_trigrams(value):
+                self.trigrams[trigram].add(node_id)
+
+    def remove_node(self, node_id: str) -> None:
+        entry = self.entries.pop(node_id, None)
+        if entry is None:
+            return
+
+        for value in entry.values:
+            for trigram in get_trigrams(value):
+                self.trigrams[trigram].discard(node_id)
+                if not self.trigrams[trigram]:
+                    del self.trigrams[trigram]
+
+    def search(self, q: str, limit: int) -> list[tuple[str, str]]:
+        """Return the id and the kind of the best matching nodes, exact matches first, then prefixes and substrings.
+
+        Nodes with the same rank are sorted by the length of their matching value and by id.
+        """
+        query = q.lower()
+        if not query or limit <= 0:
+            return []
+
+        query_trigrams = get_trigrams(query)
+        if query_trigrams:
+            node_id_sets = sorted((self.trigrams.get(trigram, set()) for trigram in query_trigrams), key=len)
+            candidates: set[str] = node_id_sets[0].intersection(*node_id_sets[1:])
+        else:
+            candidates = set(self.entries)
+
+        matches: list[tuple[int, int, str]] = []
+        for node_id in candidates:
+            best_match: Optional[tuple[int, int, str]] = None
+            for value in self.entries[node_id].values:
+                if value == query:
+                    match = (MATCH_EXACT, len(value), node_id)
+                elif value.startswith(query):
+                    match = (MATCH_PREFIX, len(value), node_id)
+                elif query in value:
+                    match = (MATCH_SUBSTRING, len(value), node_id)
+                else:
+                    continue
+                if best_match is None or match < best_match:
+                    best_match = match
+            if best_match is not None:
+                matches.append(best_match)
+
+        return [(node_id, self.entries[node_id].kind) for _, _, node_id in heapq.nsmallest(limit, matches)]
+
+
+class SearchIndexCache(BranchCache[SearchIndex]):
+    """Cache of the search index of each branch.
+
+    The values are loaded once per branch, after that only the nodes created, deleted or whose indexed attributes have
+    been modified since the previous synchronization are loaded again. The modifications done by any worker are found
+    with the time properties of the edges, the index doesn't need to be notified when a node is saved or deleted.
+    The index is loaded again completely when the schema of the branch changes.
+    The indexes of the least recently searched branches are removed when more than max_size branches are indexed.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        super().__init__()
+        self._max_size = max_size
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return config.SETTINGS.api.search_index_cache_size
+
+    async def search(
+        self, db: InfrahubDatabase, branch: Branch, q: str, limit: int, at: Timestamp
+    ) -> Optional[list[tuple[str, str]]]:
+        """Return the id and the kind of the matching nodes, or None if they can't be resolved from the index at this time."""
+        if db.is_transaction or self.max_size <= 0:
+            # The modifications not yet committed by this transaction must not be visible outside of it
+            return None
+
+        index = await self.get(db=db, branch=branch, at=at)
+        if index is None:
+            return None
+        return index.search(q=q, limit=limit)
+
+    async def get(self, db: InfrahubDatabase, branch: Branch, at: Timestamp) -> Optional[SearchIndex]:
+        """Synchronize and return the index, None is returned if it has been modified after the requested time."""
+        attribute_names_by_kind = self._get_attribute_names_by_kind(branch=branch)
+        kinds = sorted(attribute_names_by_kind.keys())
+        attribute_names = sorted({name for names in attribute_names_by_kind.values() for name in names})
+        schema_hash = registry.schema.get_schema_branch(name=branch.name).get_hash()
+        synced_at = Timestamp()
+
+        index = self._get_item(key=branch.name)
+        if index and (index.branched_from != branch.branched_from or index.schema_hash != schema_hash):
+            index = None
+
+        if index is None:
+            query = await NodeGetSearchValuesQuery.init(
+                db=db, branch=branch, kinds=kinds, attribute_names=attribute_names, at=synced_at
+            )
+            await query.execute(db=db)
+            index = SearchIndex(branched_from=branch.branched_from, schema_hash=schema_hash, synced_at=synced_at)
+            self._load_values(index=index, query=query, attribute_names_by_kind=attribute_names_by_kind)
+            self._set_item(key=branch.name, item=index)
+            since = at
+        elif not is_sync_required(synced_at=index.synced_at, at=at):
+            return index
+        else:
+            since = get_sync_since(synced_at=index.synced_at, at=at)
+
+        changes_query = await NodeGetSearchChangesQuery.init(db=db, attribute_names=attribute_names, since=since)
+        await changes_query.execute(db=db)
+        changes = changes_query.get_changes()
+
+        if changes:
+            node_ids = list(changes.keys())
+            query = await NodeGetSearchValuesQuery.init(
+                db=db, branch=branch, kinds=kinds, attribute_names=attribute_names, node_ids=node_ids, at=synced_at
+            )
+            await query.execute(db=db)
+            for node_id in node_ids:
+                index.remove_node(node_id=node_id)
+            self._load_values(index=index, query=query, attribute_names_by_kind=attribute_names_by_kind)
+        index.synced_at = synced_at
+
+        if has_changes_after(changes=changes.values(), at=at):
+            return None
+        return index
+
+    @staticmethod
+    def _load_values(
+        index: SearchIndex, query: NodeGetSearchValuesQuery, attribute_names_by_kind: dict[str, set[str]]
+    ) -> None:
+        kinds: dict[str, str] = {}
+        values: dict[str, list[str]] = defaultdict(list)
+        for node_id, kind, attribute_name, value in query.get_values():
+            if attribute_name in attribute_names_by_kind.get(kind, set()):
+                kinds[node_id] = kind
+                values[node_id].append(value)
+        for node_id, kind in kinds.items():
+            index.set_node(node_id=node_id, kind=kind, values=values[node_id])
+
+    @staticmethod
+    def _get_attribute_names_by_kind(branch: Branch) -> dict[str, set[str]]:
+        """Return the attributes used by the display label and the human friendly id of each kind of node."""
+        schema_branch = registry.schema.get_schema_branch(name=branch.name)
+        attribute_names_by_kind: dict[str, set[str]] = {}
+        for kind in schema_branch.node_names:
+            schema = schema_branch.get_node(name=kind, duplicate=False)
+            paths = (schema.display_labels or []) + (schema.human_friendly_id or [])
+            attribute_names = {path.split("__")[0] for path in paths if path.split("__")[0] in schema.attribute_names}
+            if attribute_names:
+                attribute_names_by_kind[kind] = attribute_names
+        return attribute_names_by_kind
+
+
+search_index_cache = SearchIndexCache()
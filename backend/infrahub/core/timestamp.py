@@ -19,16 +19,19 @@ class Timestamp(BaseTimestamp):
         There is a currently an assumption that the relationship in the path will be named 'r'
         """
 
-        params = {"at": self.to_string()}
+        params = {"at": self.to_string(), "at_ts": self.to_epoch_microseconds()}
 
-        filters = [
-            f"({rel_name}.from <= $at AND {rel_name}.to IS NULL)",
-            f"({rel_name}.from <= $at AND {rel_name}.to >= $at)",
-        ]
-        filter_str = "(" + "\n OR ".join(filters) + ")"
+        filter_str = f"({rel_name}.from_ts <= $at_ts AND ({rel_name}.to_ts IS NULL OR {rel_name}.to_ts >= $at_ts))"
 
         return filter_str, params
 
+    def to_epoch_microseconds(self) -> int:
+        """Return the number of microseconds since the epoch, stored on the edges as `from_ts` and `to_ts`.
+
+        Comparing integers is cheaper than comparing the ISO strings and can be served by a range index.
+        """
+        return self.obj.int_timestamp * 1_000_000 + self.obj.microsecond
+
 
 def current_timestamp() -> str:
     return Timestamp().to_string()
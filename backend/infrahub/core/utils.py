@@ -31,7 +31,7 @@ async def add_relationship(
     MATCH (s) WHERE %(id_func)s(s) = $src_node_id
     MATCH (d) WHERE %(id_func)s(d) = $dst_node_id
     WITH s,d
-    CREATE (s)-[r:%(rel_type)s { branch: $branch, branch_level: $branch_level, from: $at, status: $status }]->(d)
+    CREATE (s)-[r:%(rel_type)s { branch: $branch, branch_level: $branch_level, from: $at, from_ts: $at_ts, status: $status }]->(d)
     RETURN %(id_func)s(r)
     """ % {"id_func": db.get_id_function_name(), "rel_type": str(rel_type).upper()}
 
@@ -41,6 +41,7 @@ async def add_relationship(
         "src_node_id": db.to_database_id(src_node_id),
         "dst_node_id": db.to_database_id(dst_node_id),
         "at": at.to_string(),
+        "at_ts": at.to_epoch_microseconds(),
         "branch": branch_name or registry.default_branch,
         "branch_level": branch_level or 1,
         "status": status.value,
@@ -71,11 +72,15 @@ async def update_relationships_to(ids: list[str], db: InfrahubDatabase, to: Time
     query = """
     MATCH ()-[r]->()
     WHERE %(id_func)s(r) IN $ids
-    SET r.to = $to
+    SET r.to = $to, r.to_ts = $to_ts
     RETURN %(id_func)s(r)
     """ % {"id_func": db.get_id_function_name()}
 
-    params = {"to": to.to_string(), "ids": [db.to_database_id(_id) for _id in ids]}
+    params = {
+        "to": to.to_string(),
+        "to_ts": to.to_epoch_microseconds(),
+        "ids": [db.to_database_id(_id) for _id in ids],
+    }
 
     return await db.execute_query(query=query, params=params, name="update_relationships_to")
 
@@ -10,6 +10,7 @@ from ..shared import AttributeSchemaValidatorQuery
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
+    from infrahub.core.query import QueryResult
     from infrahub.database import InfrahubDatabase
 
     from ..model import SchemaConstraintValidatorRequest
@@ -54,23 +55,19 @@ class AttributeEnumUpdateValidatorQuery(AttributeSchemaValidatorQuery):
         self.add_to_query(query)
         self.return_labels = ["node.uuid", "attribute_value", "value_relationship"]
 
-    async def get_paths(self) -> GroupedDataPaths:
-        grouped_data_paths = GroupedDataPaths()
-        for result in self.results:
-            value = str(result.get("attribute_value"))
-            grouped_data_paths.add_data_path(
-                DataPath(
-                    branch=str(result.get("value_relationship").get("branch")),
-                    path_type=PathType.ATTRIBUTE,
-                    node_id=str(result.get("node.uuid")),
-                    field_name=self.attribute_schema.name,
-                    kind=self.node_schema.kind,
-                    value=value,
-                ),
-                grouping_key=value,
-            )
-
-        return grouped_data_paths
+    def add_result_to_paths(self, result: QueryResult, grouped_data_paths: GroupedDataPaths) -> None:
+        value = str(result.get("attribute_value"))
+        grouped_data_paths.add_data_path(
+            DataPath(
+                branch=str(result.get("value_relationship").get("branch")),
+                path_type=PathType.ATTRIBUTE,
+                node_id=str(result.get("node.uuid")),
+                field_name=self.attribute_schema.name,
+                kind=self.node_schema.kind,
+                value=value,
+            ),
+            grouping_key=value,
+        )
 
 
 class AttributeEnumChecker(ConstraintCheckerInterface):
@@ -101,6 +98,5 @@ class AttributeEnumChecker(ConstraintCheckerInterface):
                 db=self.db, branch=self.branch, node_schema=request.node_schema, schema_path=request.schema_path
             )
 
-            await query.execute(db=self.db)
-            grouped_data_paths_list.append(await query.get_paths())
+            grouped_data_paths_list.append(await query.stream_paths(db=self.db))
         return grouped_data_paths_list
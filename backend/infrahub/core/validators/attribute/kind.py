@@ -13,6 +13,7 @@ from ..shared import AttributeSchemaValidatorQuery
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
+    from infrahub.core.query import QueryResult
     from infrahub.database import InfrahubDatabase
 
     from ..model import SchemaConstraintValidatorRequest
@@ -60,30 +61,27 @@ class AttributeKindUpdateValidatorQuery(AttributeSchemaValidatorQuery):
         self.add_to_query(query)
         self.return_labels = ["node.uuid", "attribute_value", "value_relationship.branch as value_branch"]
 
-    async def get_paths(self) -> GroupedDataPaths:
-        grouped_data_paths = GroupedDataPaths()
+    def add_result_to_paths(self, result: QueryResult, grouped_data_paths: GroupedDataPaths) -> None:
+        value = result.get("attribute_value")
+        if value in (None, NULL_VALUE):
+            return
         infrahub_data_type = get_attribute_type(self.attribute_schema.kind)
         infrahub_attribute_class = infrahub_data_type.get_infrahub_class()
-        for result in self.get_results():
-            value = result.get("attribute_value")
-            if value in (None, NULL_VALUE):
-                continue
-            try:
-                infrahub_attribute_class.validate(
-                    value=result.get("attribute_value"), name=self.attribute_schema.name, schema=self.attribute_schema
-                )
-            except ValidationError:
-                grouped_data_paths.add_data_path(
-                    DataPath(
-                        branch=str(result.get("value_branch")),
-                        path_type=PathType.ATTRIBUTE,
-                        node_id=str(result.get("node.uuid")),
-                        field_name=self.attribute_schema.name,
-                        kind=self.node_schema.kind,
-                        value=value,
-                    )
+        try:
+            infrahub_attribute_class.validate(
+                value=value, name=self.attribute_schema.name, schema=self.attribute_schema
+            )
+        except ValidationError:
+            grouped_data_paths.add_data_path(
+                DataPath(
+                    branch=str(result.get("value_branch")),
+                    path_type=PathType.ATTRIBUTE,
+                    node_id=str(result.get("node.uuid")),
+                    field_name=self.attribute_schema.name,
+                    kind=self.node_schema.kind,
+                    value=value,
                 )
-        return grouped_data_paths
+            )
 
 
 class AttributeKindChecker(ConstraintCheckerInterface):
@@ -108,6 +106,5 @@ class AttributeKindChecker(ConstraintCheckerInterface):
                 db=self.db, branch=self.branch, node_schema=request.node_schema, schema_path=request.schema_path
             )
 
-            await query.execute(db=self.db)
-            grouped_data_paths_list.append(await query.get_paths())
+            grouped_data_paths_list.append(await query.stream_paths(db=self.db))
         return grouped_data_paths_list
@@ -10,6 +10,7 @@ from ..shared import AttributeSchemaValidatorQuery
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
+    from infrahub.core.query import QueryResult
     from infrahub.database import InfrahubDatabase
 
     from ..model import SchemaConstraintValidatorRequest
@@ -53,20 +54,16 @@ class AttributeLengthUpdateValidatorQuery(AttributeSchemaValidatorQuery):
         self.add_to_query(query)
         self.return_labels = ["node.uuid", "value_relationship", "attribute_value"]
 
-    async def get_paths(self) -> GroupedDataPaths:
-        grouped_data_paths = GroupedDataPaths()
-        for result in self.results:
-            grouped_data_paths.add_data_path(
-                DataPath(
-                    branch=str(result.get("value_relationship").get("branch")),
-                    path_type=PathType.ATTRIBUTE,
-                    node_id=str(result.get("node.uuid")),
-                    field_name=self.attribute_schema.name,
-                    kind=self.node_schema.kind,
-                ),
-            )
-
-        return grouped_data_paths
+    def add_result_to_paths(self, result: QueryResult, grouped_data_paths: GroupedDataPaths) -> None:
+        grouped_data_paths.add_data_path(
+            DataPath(
+                branch=str(result.get("value_relationship").get("branch")),
+                path_type=PathType.ATTRIBUTE,
+                node_id=str(result.get("node.uuid")),
+                field_name=self.attribute_schema.name,
+                kind=self.node_schema.kind,
+            ),
+        )
 
 
 class AttributeLengthChecker(ConstraintCheckerInterface):
@@ -96,6 +93,5 @@ class AttributeLengthChecker(ConstraintCheckerInterface):
             query = await query_class.init(
                 db=self.db, branch=self.branch, node_schema=request.node_schema, schema_path=request.schema_path
             )
-            await query.execute(db=self.db)
-            grouped_data_paths_list.append(await query.get_paths())
+            grouped_data_paths_list.append(await query.stream_paths(db=self.db))
         return grouped_data_paths_list
@@ -10,6 +10,7 @@ from ..shared import AttributeSchemaValidatorQuery
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
+    from infrahub.core.query import QueryResult
     from infrahub.database import InfrahubDatabase
 
     from ..model import SchemaConstraintValidatorRequest
@@ -64,28 +65,24 @@ class AttributeUniqueUpdateValidatorQuery(AttributeSchemaValidatorQuery):
             "node_and_value_relationship[1] as value_relationship",
         ]
 
-    async def get_paths(self) -> GroupedDataPaths:
-        grouped_data_paths = GroupedDataPaths()
-        for result in self.results:
-            try:
-                if int(result.get("node_count")) <= 1:  # type: ignore
-                    continue
-            except (ValueError, TypeError):
-                continue
-            value = str(result.get("value"))
-            grouped_data_paths.add_data_path(
-                DataPath(
-                    path_type=PathType.ATTRIBUTE,
-                    branch=str(result.get("value_relationship").get("branch")),
-                    node_id=str(result.get("node").get("uuid")),
-                    field_name=self.attribute_schema.name,
-                    kind=self.node_schema.kind,
-                    value=value,
-                ),
-                grouping_key=value,
-            )
-
-        return grouped_data_paths
+    def add_result_to_paths(self, result: QueryResult, grouped_data_paths: GroupedDataPaths) -> None:
+        try:
+            if int(result.get("node_count")) <= 1:  # type: ignore
+                return
+        except (ValueError, TypeError):
+            return
+        value = str(result.get("value"))
+        grouped_data_paths.add_data_path(
+            DataPath(
+                path_type=PathType.ATTRIBUTE,
+                branch=str(result.get("value_relationship").get("branch")),
+                node_id=str(result.get("node").get("uuid")),
+                field_name=self.attribute_schema.name,
+                kind=self.node_schema.kind,
+                value=value,
+            ),
+            grouping_key=value,
+        )
 
 
 class AttributeUniquenessChecker(ConstraintCheckerInterface):
@@ -119,6 +116,5 @@ class AttributeUniquenessChecker(ConstraintCheckerInterface):
             query = await query_class.init(
                 db=self.db, branch=self.branch, node_schema=request.node_schema, schema_path=request.schema_path
             )
-            await query.execute(db=self.db)
-            grouped_data_paths_list.append(await query.get_paths())
+            grouped_data_paths_list.append(await query.stream_paths(db=self.db))
         return grouped_data_paths_list
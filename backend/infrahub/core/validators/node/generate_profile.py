@@ -12,6 +12,7 @@ from ..shared import (
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
+    from infrahub.core.query import QueryResult
     from infrahub.database import InfrahubDatabase
 
     from ..model import SchemaConstraintValidatorRequest
@@ -43,19 +44,15 @@ class NodeGenerateProfileValidatorQuery(SchemaValidatorQuery):
         self.add_to_query(query)
         self.return_labels = ["latest_r.branch AS branch_name", "n.uuid AS node_uuid"]
 
-    async def get_paths(self) -> GroupedDataPaths:
-        grouped_data_paths = GroupedDataPaths()
-        for result in self.results:
-            grouped_data_paths.add_data_path(
-                DataPath(
-                    branch=str(result.get("branch_name")),
-                    path_type=PathType.NODE,
-                    node_id=str(result.get("node_uuid")),
-                    kind=self.profile_kind,
-                )
+    def add_result_to_paths(self, result: QueryResult, grouped_data_paths: GroupedDataPaths) -> None:
+        grouped_data_paths.add_data_path(
+            DataPath(
+                branch=str(result.get("branch_name")),
+                path_type=PathType.NODE,
+                node_id=str(result.get("node_uuid")),
+                kind=self.profile_kind,
             )
-
-        return grouped_data_paths
+        )
 
 
 class NodeGenerateProfileChecker(ConstraintCheckerInterface):
@@ -85,6 +82,5 @@ class NodeGenerateProfileChecker(ConstraintCheckerInterface):
                 node_schema=request.node_schema,
                 schema_path=request.schema_path,
             )
-            await query.execute(db=self.db)
-            grouped_data_paths_list.append(await query.get_paths())
+            grouped_data_paths_list.append(await query.stream_paths(db=self.db))
         return grouped_data_paths_list
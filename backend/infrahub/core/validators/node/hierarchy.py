@@ -13,6 +13,7 @@ from ..shared import (
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
+    from infrahub.core.query import QueryResult
     from infrahub.database import InfrahubDatabase
 
     from ..model import SchemaConstraintValidatorRequest
@@ -122,21 +123,17 @@ class NodeHierarchyUpdateValidatorQuery(SchemaValidatorQuery):
         self.add_to_query(query)
         self.return_labels = ["start_node.uuid", "branch_name", "current_peer.uuid"]
 
-    async def get_paths(self) -> GroupedDataPaths:
-        grouped_data_paths = GroupedDataPaths()
-        for result in self.results:
-            grouped_data_paths.add_data_path(
-                DataPath(
-                    branch=str(result.get("branch_name")),
-                    path_type=PathType.NODE,
-                    node_id=str(result.get("start_node.uuid")),
-                    property_name="children" if self.check_children else "parent",
-                    peer_id=str(result.get("current_peer.uuid")),
-                    kind=self.node_schema.kind,
-                )
+    def add_result_to_paths(self, result: QueryResult, grouped_data_paths: GroupedDataPaths) -> None:
+        grouped_data_paths.add_data_path(
+            DataPath(
+                branch=str(result.get("branch_name")),
+                path_type=PathType.NODE,
+                node_id=str(result.get("start_node.uuid")),
+                property_name="children" if self.check_children else "parent",
+                peer_id=str(result.get("current_peer.uuid")),
+                kind=self.node_schema.kind,
             )
-
-        return grouped_data_paths
+        )
 
 
 class NodeHierarchyChecker(ConstraintCheckerInterface):
@@ -173,6 +170,5 @@ class NodeHierarchyChecker(ConstraintCheckerInterface):
                 check_children=request.constraint_name == "node.children.update",
                 check_parent=request.constraint_name == "node.parent.update",
             )
-            await query.execute(db=self.db)
-            grouped_data_paths_list.append(await query.get_paths())
+            grouped_data_paths_list.append(await query.stream_paths(db=self.db))
         return grouped_data_paths_list
@@ -12,6 +12,7 @@ from ..shared import (
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
+    from infrahub.core.query import QueryResult
     from infrahub.database import InfrahubDatabase
 
     from ..model import SchemaConstraintValidatorRequest
@@ -124,23 +125,19 @@ class RelationshipCountUpdateValidatorQuery(RelationshipSchemaValidatorQuery):
             "violation_branch_and_count[1] as num_relationships",
         ]
 
-    async def get_paths(self) -> GroupedDataPaths:
-        grouped_data_paths = GroupedDataPaths()
-        for result in self.results:
-            node_id = str(result.get("node_uuid"))
-            grouped_data_paths.add_data_path(
-                DataPath(
-                    branch=str(result.get("branch_name")),
-                    path_type=PathType.NODE,
-                    node_id=node_id,
-                    field_name=self.relationship_schema.name,
-                    kind=self.node_schema.kind,
-                    value=result.get("num_relationships"),
-                ),
-                grouping_key=node_id,
-            )
-
-        return grouped_data_paths
+    def add_result_to_paths(self, result: QueryResult, grouped_data_paths: GroupedDataPaths) -> None:
+        node_id = str(result.get("node_uuid"))
+        grouped_data_paths.add_data_path(
+            DataPath(
+                branch=str(result.get("branch_name")),
+                path_type=PathType.NODE,
+                node_id=node_id,
+                field_name=self.relationship_schema.name,
+                kind=self.node_schema.kind,
+                value=result.get("num_relationships"),
+            ),
+            grouping_key=node_id,
+        )
 
 
 class RelationshipCountChecker(ConstraintCheckerInterface):
@@ -187,6 +184,5 @@ class RelationshipCountChecker(ConstraintCheckerInterface):
                 min_count_override=min_count_override,
                 max_count_override=max_count_override,
             )
-            await query.execute(db=self.db)
-            grouped_data_paths_list.append(await query.get_paths())
+            grouped_data_paths_list.append(await query.stream_paths(db=self.db))
         return grouped_data_paths_list
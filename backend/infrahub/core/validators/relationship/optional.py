@@ -12,6 +12,7 @@ from ..shared import (
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
+    from infrahub.core.query import QueryResult
     from infrahub.database import InfrahubDatabase
 
     from ..model import SchemaConstraintValidatorRequest
@@ -68,19 +69,15 @@ class RelationshipOptionalUpdateValidatorQuery(RelationshipSchemaValidatorQuery)
         self.add_to_query(query)
         self.return_labels = ["n.uuid", "r as root_relationship"]
 
-    async def get_paths(self) -> GroupedDataPaths:
-        grouped_data_paths = GroupedDataPaths()
-        for result in self.results:
-            grouped_data_paths.add_data_path(
-                DataPath(
-                    branch=result.get("root_relationship").get("branch"),
-                    path_type=PathType.NODE,
-                    node_id=str(result.get("n.uuid")),
-                    kind=self.node_schema.kind,
-                )
+    def add_result_to_paths(self, result: QueryResult, grouped_data_paths: GroupedDataPaths) -> None:
+        grouped_data_paths.add_data_path(
+            DataPath(
+                branch=result.get("root_relationship").get("branch"),
+                path_type=PathType.NODE,
+                node_id=str(result.get("n.uuid")),
+                kind=self.node_schema.kind,
             )
-
-        return grouped_data_paths
+        )
 
 
 class RelationshipOptionalChecker(ConstraintCheckerInterface):
@@ -110,6 +107,5 @@ class RelationshipOptionalChecker(ConstraintCheckerInterface):
             query = await query_class.init(
                 db=self.db, branch=self.branch, node_schema=request.node_schema, schema_path=request.schema_path
             )
-            await query.execute(db=self.db)
-            grouped_data_paths_list.append(await query.get_paths())
+            grouped_data_paths_list.append(await query.stream_paths(db=self.db))
         return grouped_data_paths_list
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Union
+from typing import TYPE_CHECKING, Any, Union
 
-from infrahub.core.path import GroupedDataPaths, SchemaPath  # noqa: TCH001
+from infrahub.core.path import GroupedDataPaths, SchemaPath
 from infrahub.core.query import Query, QueryType
 from infrahub.core.schema import AttributeSchema, GenericSchema, NodeSchema, RelationshipSchema  # noqa: TCH001
 
+if TYPE_CHECKING:
+    from infrahub.core.query import QueryResult
+    from infrahub.database import InfrahubDatabase
+
 
 class SchemaValidatorQuery(Query):
     type: QueryType = QueryType.READ
@@ -21,6 +25,20 @@ class SchemaValidatorQuery(Query):
         super().__init__(**kwargs)
 
     async def get_paths(self) -> GroupedDataPaths:
+        """Return the paths matching the results of a query already executed."""
+        grouped_data_paths = GroupedDataPaths()
+        for result in self.results:
+            self.add_result_to_paths(result=result, grouped_data_paths=grouped_data_paths)
+        return grouped_data_paths
+
+    async def stream_paths(self, db: InfrahubDatabase) -> GroupedDataPaths:
+        """Execute the query and extract the paths while the results are being delivered by the database."""
+        grouped_data_paths = GroupedDataPaths()
+        async for result in self.stream(db=db):
+            self.add_result_to_paths(result=result, grouped_data_paths=grouped_data_paths)
+        return grouped_data_paths
+
+    def add_result_to_paths(self, result: QueryResult, grouped_data_paths: GroupedDataPaths) -> None:
         raise NotImplementedError()
 
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import random
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Coroutine, Optional, TypeVar, Union
 
 from neo4j import (
     READ_ACCESS,
@@ -27,6 +27,7 @@ from typing_extensions import Self
 
 from infrahub import config, lock
 from infrahub.core import registry
+from infrahub.core.cache_sync import notify_local_write
 from infrahub.exceptions import DatabaseError
 from infrahub.log import get_logger
 from infrahub.utils import InfrahubStringEnum
@@ -285,6 +286,7 @@ class InfrahubDatabase:
             else:
                 try:
                     await self._transaction.commit()
+                    notify_local_write()
                 except Neo4jError as exc:
                     raise exc
                 finally:
@@ -310,22 +312,50 @@ class InfrahubDatabase:
             if name:
                 span.set_attribute("query_name", name)
 
-            try:
-                query_config = self.queries_names_to_config[name]
-                if self.db_type == DatabaseType.NEO4J:
-                    runtime = self.queries_names_to_config[name].neo4j_runtime
-                    if runtime != Neo4jRuntime.DEFAULT:
-                        query = f"CYPHER runtime = {runtime.value}\n" + query
-                if query_config.profile_memory:
-                    query = "PROFILE\n" + query
-            except KeyError:
-                pass  # No specific config for this query
+            query = self._apply_query_config(query=query, name=name)
 
             with QUERY_EXECUTION_METRICS.labels(self._session_mode.value, name).time():
                 response = await self.run_query(query=query, params=params, name=name)
                 results = [item async for item in response]
                 return results, response._metadata or {}
 
+    async def stream_query(
+        self, query: str, params: Optional[dict[str, Any]] = None, name: Optional[str] = "undefined"
+    ) -> AsyncIterator[Record]:
+        """Execute a query and yield the records as they are delivered by the driver.
+
+        Unlike execute_query, the complete list of records is never held in memory,
+        the memory used is bounded by the fetch size of the driver and by what the caller is keeping.
+        """
+        span = trace.get_tracer(__name__).start_span("stream_db_query")
+        span.set_attribute("query", query)
+        if name:
+            span.set_attribute("query_name", name)
+
+        try:
+            query = self._apply_query_config(query=query, name=name)
+
+            with QUERY_EXECUTION_METRICS.labels(self._session_mode.value, name).time():
+                response = await self.run_query(query=query, params=params, name=name)
+                async for item in response:
+                    yield item
+        finally:
+            span.end()
+
+    def _apply_query_config(self, query: str, name: Optional[str]) -> str:
+        try:
+            query_config = self.queries_names_to_config[name]
+            if self.db_type == DatabaseType.NEO4J:
+                runtime = self.queries_names_to_config[name].neo4j_runtime
+                if runtime != Neo4jRuntime.DEFAULT:
+                    query = f"CYPHER runtime = {runtime.value}\n" + query
+            if query_config.profile_memory:
+                query = "PROFILE\n" + query
+        except KeyError:
+            pass  # No specific config for this query
+
+        return query
+
     async def run_query(
         self, query: str, params: Optional[dict[str, Any]] = None, name: Optional[str] = "undefined"
     ) -> AsyncResult:
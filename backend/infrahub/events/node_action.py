@@ -15,6 +15,9 @@ class NodeMutatedEvent(InfrahubBranchEvent):
     node_id: str = Field(..., description="The ID of the mutated node")
     action: MutationAction = Field(..., description="The action taken on the node")
     data: dict[str, Any] = Field(..., description="Data on modified object")
+    related_nodes: dict[str, str] = Field(
+        default_factory=dict, description="Kind of the other nodes deleted along with this node, indexed by ID"
+    )
 
     def get_name(self) -> str:
         return f"{self.get_event_namespace()}.node.{self.action.value}"
@@ -36,5 +39,6 @@ class NodeMutatedEvent(InfrahubBranchEvent):
             node_id=self.node_id,
             action=self.action.value,
             data=self.data,
+            related_nodes=self.related_nodes,
             meta=self.get_message_meta(),
         )
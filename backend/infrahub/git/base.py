@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
 import shutil
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, NoReturn, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, NoReturn, Optional, TypeVar, Union
 from uuid import UUID  # noqa: TCH003
 
 import git
@@ -38,6 +41,32 @@ if TYPE_CHECKING:
 
 log = get_logger("infrahub.git")
 
+T = TypeVar("T")
+
+_git_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_git_executor() -> ThreadPoolExecutor:
+    """Return the pool of threads executing the git operations, created on first use."""
+    global _git_executor  # pylint: disable=global-statement
+    if _git_executor is None:
+        _git_executor = ThreadPoolExecutor(max_workers=config.SETTINGS.git.max_workers, thread_name_prefix="git")
+    return _git_executor
+
+
+async def run_git_operation(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Execute a blocking git operation in the pool of threads dedicated to git, without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_git_executor(), functools.partial(func, *args, **kwargs))
+
+
+_worktree_locks: dict[str, asyncio.Lock] = {}
+
+
+def get_worktree_lock(directory: str) -> asyncio.Lock:
+    """Return the lock serializing the creation of the worktrees of the repository stored in a given directory."""
+    return _worktree_locks.setdefault(directory, asyncio.Lock())
+
 
 class RepoFileInformation(BaseModel):
     filename: str
@@ -234,7 +263,7 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
             Repo: git object of the main repository
 
         """
-        if worktree := self.get_worktree(identifier=identifier):
+        if worktree := self._find_worktree(identifier=identifier):
             return Repo(worktree.directory)
 
         raise RepositoryError(
@@ -322,8 +351,8 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
         os.makedirs(self.directory_temp)
 
         try:
-            repo = Repo.clone_from(self.location, self.directory_default)
-            repo.git.checkout(checkout_ref or self.default_branch)
+            repo = await run_git_operation(Repo.clone_from, self.location, self.directory_default)
+            await run_git_operation(repo.git.checkout, checkout_ref or self.default_branch)
         except GitCommandError as exc:
             self._raise_enriched_error(error=exc)
 
@@ -332,7 +361,7 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
         # Create a worktree for the commit in the default branch
         # TODO Need to handle the potential exceptions coming from repo.git.worktree
         commit = str(repo.head.commit)
-        self.create_commit_worktree(commit=commit)
+        await self.run_worktree_operation(self.create_commit_worktree, commit=commit)
         await self.update_commit_value(branch_name=infrahub_branch_name or self.default_branch, commit=commit)
 
         return True
@@ -340,37 +369,46 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
     def has_worktree(self, identifier: str) -> bool:
         """Return True if a worktree with a given identifier already exist."""
 
-        worktrees = self.get_worktrees()
+        return self._find_worktree(identifier=identifier) is not None
 
-        for worktree in worktrees:
+    def _find_worktree(self, identifier: str) -> Optional[Worktree]:
+        for worktree in self.get_worktrees():
             if worktree.identifier == identifier:
-                return True
+                return worktree
 
-        return False
+        return None
 
-    def get_worktree(self, identifier: str) -> Worktree:
+    async def get_worktree(self, identifier: str) -> Worktree:
         """Access a specific worktree by its identifier."""
 
-        worktrees = self.get_worktrees()
-        for worktree in worktrees:
-            if worktree.identifier == identifier:
-                return worktree
+        if worktree := await run_git_operation(self._find_worktree, identifier=identifier):
+            return worktree
 
         raise RepositoryError(identifier=identifier, message="Unble to get worktree")
 
-    def get_commit_worktree(self, commit: str) -> Worktree:
-        """Access a specific commit worktree."""
+    async def get_commit_worktree(self, commit: str) -> Worktree:
+        """Access a specific commit worktree, the worktree is created if it doesn't exist yet."""
 
-        worktrees = self.get_worktrees()
+        async with get_worktree_lock(directory=self.directory_root):
+            return await run_git_operation(self._get_commit_worktree, commit=commit)
 
-        for worktree in worktrees:
-            if worktree.identifier == commit:
-                return worktree
+    def _get_commit_worktree(self, commit: str) -> Worktree:
+        if worktree := self._find_worktree(identifier=commit):
+            return worktree
 
         # if not worktree exist for this commit already
         # We'll try to create one
         return self.create_commit_worktree(commit=commit)
 
+    async def run_worktree_operation(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Execute a git operation creating worktrees, one at a time for this repository within this process.
+
+        Otherwise two tasks can both find that a worktree doesn't exist yet, and `git worktree add` fails for the
+        second one because the worktree already exists.
+        """
+        async with get_worktree_lock(directory=self.directory_root):
+            return await run_git_operation(func, *args, **kwargs)
+
     def get_worktrees(self) -> list[Worktree]:
         """Return the list of worktrees configured for this repository."""
         repo = self.get_git_repo_main()
@@ -533,6 +571,13 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
           - Are there some conflicts between the files.
         """
 
+        return await run_git_operation(
+            self._calculate_diff_between_commits, first_commit=first_commit, second_commit=second_commit
+        )
+
+    def _calculate_diff_between_commits(
+        self, first_commit: str, second_commit: str
+    ) -> tuple[list[str], list[str], list[str]]:
         git_repo = self.get_git_repo_main()
 
         commit_to_compare = git_repo.commit(second_commit)
@@ -553,6 +598,9 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
         return changed_files, added_files, removed_files
 
     async def list_all_files(self, commit: str) -> list[str]:
+        return await run_git_operation(self._list_all_files, commit=commit)
+
+    def _list_all_files(self, commit: str) -> list[str]:
         git_repo = self.get_git_repo_main()
         return [str(entry.path) for entry in git_repo.commit(commit).tree.traverse() if isinstance(entry, Blob)]
 
@@ -565,7 +613,7 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
 
         repo = self.get_git_repo_main()
         try:
-            repo.remotes.origin.fetch()
+            await run_git_operation(repo.remotes.origin.fetch)
         except GitCommandError as exc:
             self._raise_enriched_error(error=exc)
 
@@ -582,8 +630,8 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
 
         # TODO move this section into a dedicated function to compare and bring in sync the remote repo with the local one.
         # It can be useful just after a clone etc ...
-        local_branches = self.get_branches_from_local()
-        remote_branches = self.get_branches_from_remote()
+        local_branches = await run_git_operation(self.get_branches_from_local)
+        remote_branches = await run_git_operation(self.get_branches_from_remote)
 
         new_branches = set(remote_branches.keys()) - set(local_branches.keys())
         existing_branches = set(local_branches.keys()) - new_branches
@@ -638,13 +686,13 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
         if branch_name == self.default_branch and branch_name != registry.default_branch:
             identifier = "main"
 
-        repo = self.get_git_repo_worktree(identifier=identifier)
+        repo = await run_git_operation(self.get_git_repo_worktree, identifier=identifier)
         if not repo:
             raise ValueError(f"Unable to identify the worktree for the branch : {branch_name}")
 
         try:
             commit_before = str(repo.head.commit)
-            repo.remotes.origin.pull(branch_name)
+            await run_git_operation(repo.remotes.origin.pull, branch_name)
         except GitCommandError as exc:
             self._raise_enriched_error(error=exc, branch_name=branch_name)
 
@@ -653,26 +701,26 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
         if commit_after == commit_before:
             return True
 
-        self.create_commit_worktree(commit=commit_after)
+        await self.run_worktree_operation(self.create_commit_worktree, commit=commit_after)
         infrahub_branch = self._get_mapped_target_branch(branch_name=branch_name)
         await self.update_commit_value(branch_name=infrahub_branch, commit=commit_after)
 
         return commit_after
 
     async def get_conflicts(self, source_branch: str, dest_branch: str) -> list[str]:
-        repo = self.get_git_repo_worktree(identifier=dest_branch)
+        repo = await run_git_operation(self.get_git_repo_worktree, identifier=dest_branch)
         if not repo:
             raise ValueError(f"Unable to identify the worktree for the branch : {dest_branch}")
 
-        commit = self.get_commit_value(branch_name=source_branch, remote=False)
+        commit = await run_git_operation(self.get_commit_value, branch_name=source_branch, remote=False)
         git_status = ""
         try:
-            repo.git.merge(["--no-commit", "--no-ff", commit])
-            repo.git.merge("--abort")
+            await run_git_operation(repo.git.merge, ["--no-commit", "--no-ff", commit])
+            await run_git_operation(repo.git.merge, "--abort")
         except GitCommandError:
-            git_status = repo.git.status("-s")
+            git_status = await run_git_operation(repo.git.status, "-s")
             if git_status:
-                repo.git.merge("--abort")
+                await run_git_operation(repo.git.merge, "--abort")
 
         changed_files = git_status.splitlines()
         conflict_files = [filename[3:] for filename in changed_files if filename.startswith("UU ")]
@@ -689,7 +737,7 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
         """Return the path of all files matching a specific extension in a given Branch or Commit."""
         if not branch_name and not commit:
             raise ValueError("Either branch_name or commit must be provided.")
-        branch_wt = self.get_worktree(identifier=commit or branch_name)
+        branch_wt = await self.get_worktree(identifier=commit or branch_name)
 
         search_dir = Path(branch_wt.directory)
         if directory:
@@ -706,7 +754,7 @@ class InfrahubRepositoryBase(BaseModel, ABC):  # pylint: disable=too-many-public
         return files
 
     async def get_file(self, commit: str, location: str) -> str:
-        commit_worktree = self.get_commit_worktree(commit=commit)
+        commit_worktree = await self.get_commit_worktree(commit=commit)
         path = self.validate_location(commit=commit, worktree_directory=commit_worktree.directory, file_path=location)
 
         return path.read_text(encoding="UTF-8")
@@ -31,12 +31,12 @@ from infrahub_sdk.schema import (
 )
 from infrahub_sdk.utils import compare_lists
 from infrahub_sdk.yaml import SchemaFile
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from pydantic import ValidationError as PydanticValidationError
 
 from infrahub.core.constants import InfrahubKind, RepositorySyncStatus
 from infrahub.exceptions import CheckError, TransformError
-from infrahub.git.base import InfrahubRepositoryBase, extract_repo_file_information
+from infrahub.git.base import InfrahubRepositoryBase, extract_repo_file_information, run_git_operation
 from infrahub.log import get_logger
 
 if TYPE_CHECKING:
@@ -116,6 +116,28 @@ class TransformPythonInformation(BaseModel):
     """Timeout for the function."""
 
 
+class ImportedCommit(BaseModel):
+    commit: str
+    """Last commit whose objects have been imported successfully in the branch"""
+
+    branched_from: Optional[str] = None
+    """Time at which the branch was created or rebased when the commit was imported"""
+
+
+class ImportScope(BaseModel):
+    """Objects to import again, based on the files modified since the last imported commit."""
+
+    graphql_queries: set[str] = Field(default_factory=set)
+    """Name of the GraphQL queries whose file has been modified"""
+
+    python_files: bool = False
+    """Indicate if a Python file has been modified, the checks, transforms and generators must be imported again"""
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.graphql_queries and not self.python_files
+
+
 class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=too-many-public-methods
     """
     This class provides interfaces to read and process information from .infrahub.yml files and can perform
@@ -125,21 +147,56 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
     class that uses an "InfrahubRepository" or "InfrahubReadOnlyRepository" as input
     """
 
+    _has_import_errors: bool = PrivateAttr(default=False)
+    """Indicate if an object has been skipped because of an error during the current import"""
+
     async def import_objects_from_files(
         self, infrahub_branch_name: str, git_branch_name: Optional[str] = None, commit: Optional[str] = None
     ) -> None:
         if not commit:
-            commit = self.get_commit_value(branch_name=git_branch_name or infrahub_branch_name)
+            commit = await run_git_operation(self.get_commit_value, branch_name=git_branch_name or infrahub_branch_name)
 
-        self.create_commit_worktree(commit)
-        await self._update_sync_status(branch_name=infrahub_branch_name, status=RepositorySyncStatus.SYNCING)
+        await self.run_worktree_operation(self.create_commit_worktree, commit)
 
         config_file = await self.get_repository_config(branch_name=infrahub_branch_name, commit=commit)
+        imported_commit = await self._get_imported_commit(branch_name=infrahub_branch_name)
+        import_scope = (
+            await self._get_import_scope(imported_commit=imported_commit, commit=commit, config_file=config_file)
+            if imported_commit and config_file
+            else None
+        )
+        if imported_commit and import_scope and import_scope.is_empty:
+            log.info(
+                "No object modified since the last imported commit, skipping the import",
+                repository=self.name,
+                branch=infrahub_branch_name,
+                commit=commit,
+            )
+            await self._set_imported_commit(
+                branch_name=infrahub_branch_name, imported_commit=imported_commit, commit=commit
+            )
+            return
+
+        await self._update_sync_status(branch_name=infrahub_branch_name, status=RepositorySyncStatus.SYNCING)
+
+        self._has_import_errors = False
         sync_status = RepositorySyncStatus.IN_SYNC if config_file else RepositorySyncStatus.ERROR_IMPORT
         error: Exception | None = None
 
         try:
-            if config_file:
+            if config_file and import_scope:
+                await self.import_all_graphql_query(
+                    branch_name=infrahub_branch_name,
+                    commit=commit,
+                    config_file=config_file,
+                    query_names=import_scope.graphql_queries,
+                )
+                if import_scope.python_files:
+                    await self.import_all_python_files(
+                        branch_name=infrahub_branch_name, commit=commit, config_file=config_file
+                    )
+
+            elif config_file:
                 await self.import_schema_files(branch_name=infrahub_branch_name, commit=commit, config_file=config_file)
 
                 await self.import_all_graphql_query(
@@ -165,6 +222,84 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
         if error:
             raise error
 
+        # The commit isn't recorded if an object has been skipped, to import it again with the next commit
+        if config_file and imported_commit is not None and not self._has_import_errors:
+            await self._set_imported_commit(
+                branch_name=infrahub_branch_name, imported_commit=imported_commit, commit=commit
+            )
+
+    def _get_imported_commit_key(self, branch_name: str) -> str:
+        return f"git:repository:{self.id}:branch:{branch_name}:imported_commit"
+
+    async def _get_imported_commit(self, branch_name: str) -> Optional[ImportedCommit]:
+        """Return the last commit imported in the branch.
+
+        An empty ImportedCommit is returned if no commit has been imported in the branch, or if the branch has been
+        recreated or rebased since then, None is returned if the imported commits can't be recorded.
+        """
+        key = self._get_imported_commit_key(branch_name=branch_name)
+        try:
+            value = await self.service.cache.get(key=key)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            log.debug("Unable to load the last imported commit", repository=self.name, key=key, error=str(exc))
+            return None
+
+        branch = await self.sdk.branch.get(branch_name=branch_name)
+        imported_commit = ImportedCommit.model_validate_json(value) if value else None
+        if not imported_commit or imported_commit.branched_from != branch.branched_from:
+            return ImportedCommit(commit="", branched_from=branch.branched_from)
+        return imported_commit
+
+    async def _set_imported_commit(self, branch_name: str, imported_commit: ImportedCommit, commit: str) -> None:
+        key = self._get_imported_commit_key(branch_name=branch_name)
+        value = ImportedCommit(commit=commit, branched_from=imported_commit.branched_from).model_dump_json()
+        try:
+            await self.service.cache.set(key=key, value=value)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            log.warning("Unable to record the last imported commit", repository=self.name, key=key, error=str(exc))
+
+    async def _get_import_scope(
+        self, imported_commit: ImportedCommit, commit: str, config_file: InfrahubRepositoryConfig
+    ) -> Optional[ImportScope]:
+        """Identify the objects to import based on the files modified since the last imported commit.
+
+        None is returned if all the objects must be imported: if no commit has been imported yet, if the configuration
+        file or a schema has been modified or if the files modified can't be identified.
+        """
+        if not imported_commit.commit:
+            return None
+        if imported_commit.commit == commit:
+            return ImportScope()
+
+        try:
+            changed_files, added_files, removed_files = await self.calculate_diff_between_commits(
+                first_commit=imported_commit.commit, second_commit=commit
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            log.warning(
+                "Unable to identify the files modified since the last imported commit",
+                repository=self.name,
+                commit=commit,
+                error=str(exc),
+            )
+            return None
+
+        modified_files = set(changed_files + added_files + removed_files)
+        schema_paths = [Path(schema).as_posix() for schema in config_file.schemas]
+        for modified_file in modified_files:
+            if modified_file == ".infrahub.yml" or any(
+                modified_file == schema_path or modified_file.startswith(f"{schema_path}/")
+                for schema_path in schema_paths
+            ):
+                return None
+
+        return ImportScope(
+            graphql_queries={
+                query.name for query in config_file.queries if Path(query.file_path).as_posix() in modified_files
+            },
+            python_files=any(modified_file.endswith(".py") for modified_file in modified_files),
+        )
+
     async def _update_sync_status(self, branch_name: str, status: RepositorySyncStatus) -> None:
         update_status = """
         mutation UpdateRepositoryStatus(
@@ -217,9 +352,11 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
                 for error in exc.errors():
                     locations = [str(error_location) for error_location in error["loc"]]
                     log.error(f"  {'/'.join(locations)} | {error['msg']} ({error['type']})")
+                self._has_import_errors = True
                 continue
             except ValidationError as exc:
                 log.error(exc.message)
+                self._has_import_errors = True
                 continue
 
             transform = InfrahubRepositoryJinja2(repository=str(self.id), **config_transform.model_dump())
@@ -326,9 +463,11 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
                 for error in exc.errors():
                     locations = [str(error_location) for error_location in error["loc"]]
                     log.error(f"  {'/'.join(locations)} | {error['msg']} ({error['type']})")
+                self._has_import_errors = True
                 continue
             except ValidationError as exc:
                 log.error(exc.message)
+                self._has_import_errors = True
                 continue
 
             local_artifact_defs[artdef.name] = artdef
@@ -403,7 +542,7 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
         await existing_artifact_definition.save()
 
     async def get_repository_config(self, branch_name: str, commit: str) -> Optional[InfrahubRepositoryConfig]:
-        branch_wt = self.get_worktree(identifier=commit or branch_name)
+        branch_wt = await self.get_worktree(identifier=commit or branch_name)
 
         config_file_name = ".infrahub.yml"
         config_file = Path(os.path.join(branch_wt.directory, config_file_name))
@@ -446,7 +585,7 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
 
     async def import_schema_files(self, branch_name: str, commit: str, config_file: InfrahubRepositoryConfig) -> None:
         # pylint: disable=too-many-branches
-        branch_wt = self.get_worktree(identifier=commit or branch_name)
+        branch_wt = await self.get_worktree(identifier=commit or branch_name)
 
         schemas_data: list[SchemaFile] = []
 
@@ -456,6 +595,7 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
                 await self.log.warning(
                     f"Unable to find the schema {schema}", repository=self.name, branch=branch_name, commit=commit
                 )
+                self._has_import_errors = True
 
             if full_schema.is_file():
                 schema_file = SchemaFile(identifier=str(schema), location=full_schema)
@@ -474,6 +614,7 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
         for schema_file in schemas_data:
             if schema_file.valid:
                 continue
+            self._has_import_errors = True
             await self.log.error(
                 f"Unable to load the file {schema_file.identifier}, {schema_file.error_message}",
                 repository=self.name,
@@ -525,24 +666,34 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
             )
 
     async def import_all_graphql_query(
-        self, branch_name: str, commit: str, config_file: InfrahubRepositoryConfig
+        self,
+        branch_name: str,
+        commit: str,
+        config_file: InfrahubRepositoryConfig,
+        query_names: Optional[set[str]] = None,
     ) -> None:
-        """Search for all .gql file and import them as GraphQL query."""
+        """Search for all .gql file and import them as GraphQL query.
+
+        If query_names is provided, only these queries are imported and the other queries are left untouched.
+        """
 
         log.debug("Importing all GraphQL Queries", repository=self.name, branch=branch_name, commit=commit)
-        commit_wt = self.get_worktree(identifier=commit)
+        commit_wt = await self.get_worktree(identifier=commit)
         local_queries = {
-            query.name: query.load_query(relative_path=commit_wt.directory) for query in config_file.queries
+            query.name: query.load_query(relative_path=commit_wt.directory)
+            for query in config_file.queries
+            if query_names is None or query.name in query_names
         }
 
         if not local_queries:
             return
 
+        filters: dict[str, Any] = {"repository__ids": [str(self.id)]}
+        if query_names is not None:
+            filters["name__values"] = sorted(local_queries.keys())
         queries_in_graph = {
             query.name.value: query
-            for query in await self.sdk.filters(
-                kind=CoreGraphQLQuery, branch=branch_name, repository__ids=[str(self.id)]
-            )
+            for query in await self.sdk.filters(kind=CoreGraphQLQuery, branch=branch_name, **filters)
         }
 
         present_in_both, only_graph, only_local = compare_lists(
@@ -599,8 +750,8 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
     async def import_python_check_definitions(
         self, branch_name: str, commit: str, config_file: InfrahubRepositoryConfig
     ) -> None:
-        commit_wt = self.get_worktree(identifier=commit)
-        branch_wt = self.get_worktree(identifier=commit or branch_name)
+        commit_wt = await self.get_worktree(identifier=commit)
+        branch_wt = await self.get_worktree(identifier=commit or branch_name)
 
         # Ensure the path for this repository is present in sys.path
         if self.directory_root not in sys.path:
@@ -684,8 +835,8 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
     async def import_generator_definitions(
         self, branch_name: str, commit: str, config_file: InfrahubRepositoryConfig
     ) -> None:
-        commit_wt = self.get_worktree(identifier=commit)
-        branch_wt = self.get_worktree(identifier=commit or branch_name)
+        commit_wt = await self.get_worktree(identifier=commit)
+        branch_wt = await self.get_worktree(identifier=commit or branch_name)
 
         generators = []
         await self.log.info(f"Found {len(config_file.generator_definitions)} generator definitions in the repository")
@@ -786,8 +937,8 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
     async def import_python_transforms(
         self, branch_name: str, commit: str, config_file: InfrahubRepositoryConfig
     ) -> None:
-        commit_wt = self.get_worktree(identifier=commit)
-        branch_wt = self.get_worktree(identifier=commit or branch_name)
+        commit_wt = await self.get_worktree(identifier=commit)
+        branch_wt = await self.get_worktree(identifier=commit or branch_name)
 
         # Ensure the path for this repository is present in sys.path
         if self.directory_root not in sys.path:
@@ -1109,7 +1260,7 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
         await self.import_generator_definitions(branch_name=branch_name, commit=commit, config_file=config_file)
 
     async def render_jinja2_template(self, commit: str, location: str, data: dict) -> str:
-        commit_worktree = self.get_commit_worktree(commit=commit)
+        commit_worktree = await self.get_commit_worktree(commit=commit)
 
         self.validate_location(commit=commit, worktree_directory=commit_worktree.directory, file_path=location)
 
@@ -1133,7 +1284,7 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
     ) -> InfrahubCheck:
         """Execute A Python Check stored in the repository."""
 
-        commit_worktree = self.get_commit_worktree(commit=commit)
+        commit_worktree = await self.get_commit_worktree(commit=commit)
 
         self.validate_location(commit=commit, worktree_directory=commit_worktree.directory, file_path=location)
 
@@ -1203,7 +1354,7 @@ class InfrahubRepositoryIntegrator(InfrahubRepositoryBase):  # pylint: disable=t
             raise ValueError("Transformation location not valid, it must contains a double colons (::)")
 
         file_path, class_name = location.split("::")
-        commit_worktree = self.get_commit_worktree(commit=commit)
+        commit_worktree = await self.get_commit_worktree(commit=commit)
 
         log.debug(
             f"Will run Python Transform from {class_name} at {location}",
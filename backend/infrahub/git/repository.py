@@ -8,6 +8,7 @@ from pydantic import Field
 
 from infrahub.core.constants import InfrahubKind, RepositoryInternalStatus
 from infrahub.exceptions import RepositoryError
+from infrahub.git.base import run_git_operation
 from infrahub.git.integrator import InfrahubRepositoryIntegrator
 from infrahub.log import get_logger
 from infrahub.services import InfrahubServices
@@ -50,13 +51,15 @@ class InfrahubRepository(InfrahubRepositoryIntegrator):
         repo = self.get_git_repo_main()
 
         # Check if the branch already exists locally, if it does do nothing
-        local_branches = self.get_branches_from_local(include_worktree=False)
+        local_branches = await run_git_operation(self.get_branches_from_local, include_worktree=False)
         if branch_name in local_branches:
             return False
 
         # TODO Catch potential exceptions coming from repo.git.branch & repo.git.worktree
-        repo.git.branch(branch_name)
-        self.create_branch_worktree(branch_name=branch_name, branch_id=branch_id or branch_name)
+        await run_git_operation(repo.git.branch, branch_name)
+        await self.run_worktree_operation(
+            self.create_branch_worktree, branch_name=branch_name, branch_id=branch_id or branch_name
+        )
 
         # If there is not remote configured, we are done
         #  Since the branch is a match for the main branch we don't need to create a commit worktree
@@ -72,10 +75,10 @@ class InfrahubRepository(InfrahubRepositoryIntegrator):
         remote_branch = [br for br in repo.remotes.origin.refs if br.name == f"origin/{branch_name}"]
 
         if remote_branch:
-            br_repo = self.get_git_repo_worktree(identifier=branch_name)
+            br_repo = await run_git_operation(self.get_git_repo_worktree, identifier=branch_name)
             br_repo.head.reference.set_tracking_branch(remote_branch[0])
-            br_repo.remotes.origin.pull(branch_name)
-            self.create_commit_worktree(str(br_repo.head.reference.commit))
+            await run_git_operation(br_repo.remotes.origin.pull, branch_name)
+            await self.run_worktree_operation(self.create_commit_worktree, str(br_repo.head.reference.commit))
             log.debug(
                 f"Branch {branch_name} created in Git, tracking remote branch {remote_branch[0]}.",
                 repository=self.name,
@@ -123,8 +126,8 @@ class InfrahubRepository(InfrahubRepositoryIntegrator):
 
                 await self.create_branch_in_git(branch_name=branch.name, branch_id=branch.id)
 
-                commit = self.get_commit_value(branch_name=branch_name, remote=False)
-                self.create_commit_worktree(commit=commit)
+                commit = await run_git_operation(self.get_commit_value, branch_name=branch_name, remote=False)
+                await self.run_worktree_operation(self.create_commit_worktree, commit=commit)
                 await self.update_commit_value(branch_name=infrahub_branch, commit=commit)
 
                 await self.import_objects_from_files(infrahub_branch_name=infrahub_branch, commit=commit)
@@ -179,9 +182,9 @@ class InfrahubRepository(InfrahubRepositoryIntegrator):
         )
 
         # TODO Catch potential exceptions coming from origin.push
-        repo = self.get_git_repo_worktree(identifier=branch_name)
+        repo = await run_git_operation(self.get_git_repo_worktree, identifier=branch_name)
         remote_branch = self._get_mapped_remote_branch(branch_name=branch_name)
-        repo.remotes.origin.push(remote_branch)
+        await run_git_operation(repo.remotes.origin.push, remote_branch)
 
         return True
 
@@ -190,17 +193,17 @@ class InfrahubRepository(InfrahubRepositoryIntegrator):
 
         After the rebase we need to resync the data
         """
-        repo = self.get_git_repo_worktree(identifier=dest_branch)
+        repo = await run_git_operation(self.get_git_repo_worktree, identifier=dest_branch)
         if not repo:
             raise ValueError(f"Unable to identify the worktree for the branch : {dest_branch}")
 
         commit_before = str(repo.head.commit)
-        commit = self.get_commit_value(branch_name=source_branch, remote=False)
+        commit = await run_git_operation(self.get_commit_value, branch_name=source_branch, remote=False)
 
         try:
-            repo.git.merge(commit)
+            await run_git_operation(repo.git.merge, commit)
         except GitCommandError as exc:
-            repo.git.merge("--abort")
+            await run_git_operation(repo.git.merge, "--abort")
             raise RepositoryError(identifier=self.name, message=exc.stderr) from exc
 
         commit_after = str(repo.head.commit)
@@ -208,7 +211,7 @@ class InfrahubRepository(InfrahubRepositoryIntegrator):
         if commit_after == commit_before:
             return False
 
-        self.create_commit_worktree(commit_after)
+        await self.run_worktree_operation(self.create_commit_worktree, commit_after)
         await self.update_commit_value(branch_name=dest_branch, commit=commit_after)
         if self.has_origin and push_remote:
             await self.push(branch_name=dest_branch)
@@ -288,11 +291,11 @@ class InfrahubReadOnlyRepository(InfrahubRepositoryIntegrator):
 
     async def sync_from_remote(self, commit: Optional[str] = None) -> None:
         if not commit:
-            commit = self.get_commit_value(branch_name=self.ref, remote=True)
-        local_branches = self.get_branches_from_local()
+            commit = await run_git_operation(self.get_commit_value, branch_name=self.ref, remote=True)
+        local_branches = await run_git_operation(self.get_branches_from_local)
         if self.ref in local_branches and commit == local_branches[self.ref].commit:
             return
-        self.create_commit_worktree(commit=commit)
+        await self.run_worktree_operation(self.create_commit_worktree, commit=commit)
         await self.import_objects_from_files(infrahub_branch_name=self.infrahub_branch_name, commit=commit)
         await self.update_commit_value(branch_name=self.infrahub_branch_name, commit=commit)
 
@@ -1,12 +1,15 @@
+import asyncio
+from typing import Any
+
 from infrahub_sdk import InfrahubClient
 from prefect import flow, task
 
-from infrahub import lock
+from infrahub import config, lock
 from infrahub.core.constants import InfrahubKind, RepositoryInternalStatus
 from infrahub.core.protocols import CoreRepository
 from infrahub.core.registry import registry
 from infrahub.exceptions import RepositoryError
-from infrahub.services import services
+from infrahub.services import InfrahubServices, services
 
 from .repository import InfrahubRepository
 
@@ -40,23 +43,55 @@ async def sync_remote_repositories() -> None:
     branches = await service.client.branch.all()
     repositories = await service.client.get_list_repositories(branches=branches, kind=InfrahubKind.REPOSITORY)
 
-    for repo_name, repository_data in repositories.items():
-        async with service.git_report(
-            title="Syncing repository", related_node=repository_data.repository.id, create_with_context=False
-        ) as git_report:
-            active_internal_status = RepositoryInternalStatus.ACTIVE.value
-            default_internal_status = repository_data.branch_info[registry.default_branch].internal_status
-            staging_branch = None
-            if default_internal_status != RepositoryInternalStatus.ACTIVE.value:
-                active_internal_status = RepositoryInternalStatus.STAGING.value
-                staging_branch = repository_data.get_staging_branch()
-
-            infrahub_branch = staging_branch or registry.default_branch
-
-            async with lock.registry.get(name=repo_name, namespace="repository"):
-                init_failed = False
+    # The repositories are synchronized concurrently, the operations on the same repository are serialized by its lock
+    semaphore = asyncio.Semaphore(config.SETTINGS.git.sync_concurrency)
+
+    async def sync_with_limit(repo_name: str, repository_data: Any) -> None:
+        async with semaphore:
+            await _sync_remote_repository(service=service, repo_name=repo_name, repository_data=repository_data)
+
+    results = await asyncio.gather(
+        *[sync_with_limit(repo_name, repository_data) for repo_name, repository_data in repositories.items()],
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+async def _sync_remote_repository(service: InfrahubServices, repo_name: str, repository_data: Any) -> None:
+    async with service.git_report(
+        title="Syncing repository", related_node=repository_data.repository.id, create_with_context=False
+    ) as git_report:
+        active_internal_status = RepositoryInternalStatus.ACTIVE.value
+        default_internal_status = repository_data.branch_info[registry.default_branch].internal_status
+        staging_branch = None
+        if default_internal_status != RepositoryInternalStatus.ACTIVE.value:
+            active_internal_status = RepositoryInternalStatus.STAGING.value
+            staging_branch = repository_data.get_staging_branch()
+
+        infrahub_branch = staging_branch or registry.default_branch
+
+        async with lock.registry.get(name=repo_name, namespace="repository"):
+            init_failed = False
+            try:
+                repo = await InfrahubRepository.init(
+                    service=service,
+                    id=repository_data.repository.id,
+                    name=repository_data.repository.name.value,
+                    location=repository_data.repository.location.value,
+                    client=service.client,
+                    task_report=git_report,
+                    internal_status=active_internal_status,
+                    default_branch_name=repository_data.repository.default_branch.value,
+                )
+            except RepositoryError as exc:
+                service.log.error(str(exc))
+                init_failed = True
+
+            if init_failed:
                 try:
-                    repo = await InfrahubRepository.init(
+                    repo = await InfrahubRepository.new(
                         service=service,
                         id=repository_data.repository.id,
                         name=repository_data.repository.name.value,
@@ -66,39 +101,23 @@ async def sync_remote_repositories() -> None:
                         internal_status=active_internal_status,
                         default_branch_name=repository_data.repository.default_branch.value,
                     )
+                    await repo.import_objects_from_files(
+                        git_branch_name=registry.default_branch, infrahub_branch_name=infrahub_branch
+                    )
                 except RepositoryError as exc:
-                    service.log.error(str(exc))
-                    init_failed = True
-
-                if init_failed:
-                    try:
-                        repo = await InfrahubRepository.new(
-                            service=service,
-                            id=repository_data.repository.id,
-                            name=repository_data.repository.name.value,
-                            location=repository_data.repository.location.value,
-                            client=service.client,
-                            task_report=git_report,
-                            internal_status=active_internal_status,
-                            default_branch_name=repository_data.repository.default_branch.value,
-                        )
-                        await repo.import_objects_from_files(
-                            git_branch_name=registry.default_branch, infrahub_branch_name=infrahub_branch
-                        )
-                    except RepositoryError as exc:
-                        await git_report.error(str(exc))
-                        continue
-
-                error: RepositoryError | None = None
+                    await git_report.error(str(exc))
+                    return
 
-                try:
-                    await repo.sync(staging_branch=staging_branch)
-                except RepositoryError as exc:
-                    error = exc
+            error: RepositoryError | None = None
 
-                await git_report.set_status(
-                    previous_status=repository_data.repository.operational_status.value, error=error
-                )
+            try:
+                await repo.sync(staging_branch=staging_branch)
+            except RepositoryError as exc:
+                error = exc
+
+            await git_report.set_status(
+                previous_status=repository_data.repository.operational_status.value, error=error
+            )
 
 
 @task
@@ -1,12 +1,17 @@
-from typing import Any, Optional
+import copy
+from typing import TYPE_CHECKING, Any, Optional
 
-from graphql import GraphQLSchema, OperationType
+from graphql import ExecutionContext, ExecutionResult, GraphQLError, GraphQLSchema, Middleware, OperationType, execute
 from infrahub_sdk.analyzer import GraphQLQueryAnalyzer
 from infrahub_sdk.utils import extract_fields
 
 from infrahub.core.branch import Branch
+from infrahub.graphql.query_cache import query_cache
 from infrahub.graphql.utils import extract_schema_models
 
+if TYPE_CHECKING:
+    from infrahub.graphql.schema_registry import GraphQLSchemaKey
+
 
 class InfrahubGraphQLQueryAnalyzer(GraphQLQueryAnalyzer):
     def __init__(
@@ -20,14 +25,52 @@ class InfrahubGraphQLQueryAnalyzer(GraphQLQueryAnalyzer):
         self.branch: Optional[Branch] = branch
         self.operation_name: Optional[str] = operation_name
         self.query_variables: dict[str, Any] = query_variables or {}
+        # Results of the analysis, they only depend on the query and the schema and are shared between the copies
+        self._analysis: dict[str, Any] = {}
         super().__init__(query=query, schema=schema)
 
+    def copy_for_request(
+        self,
+        schema: GraphQLSchema,
+        branch: Branch,
+        query_variables: Optional[dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+    ) -> "InfrahubGraphQLQueryAnalyzer":
+        """Return a copy of this analyzer for a new request, the parsed document and the analysis are not duplicated."""
+        analyzer = copy.copy(self)
+        analyzer.schema = schema
+        analyzer.branch = branch
+        analyzer.operation_name = operation_name
+        analyzer.query_variables = query_variables or {}
+        return analyzer
+
     @property
     def operation_names(self) -> list[str]:
         return [operation.name for operation in self.operations if operation.name is not None]
 
+    @property
+    def is_valid(self) -> tuple[bool, Optional[list[GraphQLError]]]:
+        if "is_valid" not in self._analysis:
+            self._analysis["is_valid"] = super().is_valid
+        return self._analysis["is_valid"]
+
+    async def calculate_depth(self) -> int:
+        if "depth" not in self._analysis:
+            self._analysis["depth"] = await super().calculate_depth()
+        return self._analysis["depth"]
+
+    async def calculate_height(self) -> int:
+        if "height" not in self._analysis:
+            self._analysis["height"] = await super().calculate_height()
+        return self._analysis["height"]
+
     async def get_models_in_use(self, types: dict[str, Any]) -> set[str]:
         """List of Infrahub models that are referenced in the query."""
+        if "models_in_use" not in self._analysis:
+            self._analysis["models_in_use"] = await self._get_models_in_use(types=types)
+        return set(self._analysis["models_in_use"])
+
+    async def _get_models_in_use(self, types: dict[str, Any]) -> set[str]:
         graphql_types = set()
         models = set()
 
@@ -58,3 +101,58 @@ class InfrahubGraphQLQueryAnalyzer(GraphQLQueryAnalyzer):
                 continue
 
         return models
+
+
+def get_analyzed_query(
+    query: str,
+    schema: GraphQLSchema,
+    schema_key: Optional["GraphQLSchemaKey"],
+    branch: Branch,
+    query_variables: Optional[dict[str, Any]] = None,
+    operation_name: Optional[str] = None,
+) -> InfrahubGraphQLQueryAnalyzer:
+    """Return an analyzer for this query, the query is only parsed if it isn't already present in the cache.
+
+    The cache is indexed by the key of the GraphQL schema, without it the query is always parsed.
+    """
+    analyzed_query = query_cache.get(schema_key=schema_key, query=query) if schema_key else None
+    if analyzed_query is None:
+        analyzed_query = InfrahubGraphQLQueryAnalyzer(query=query, schema=schema, branch=branch)
+        if schema_key:
+            query_cache.set(schema_key=schema_key, query=query, analyzed_query=analyzed_query)
+
+    return analyzed_query.copy_for_request(
+        schema=schema, branch=branch, query_variables=query_variables, operation_name=operation_name
+    )
+
+
+async def execute_analyzed_query(
+    analyzed_query: InfrahubGraphQLQueryAnalyzer,
+    context_value: Any,
+    root_value: Any = None,
+    variable_values: Optional[dict[str, Any]] = None,
+    operation_name: Optional[str] = None,
+    middleware: Optional[Middleware] = None,
+    execution_context_class: Optional[type[ExecutionContext]] = None,
+) -> ExecutionResult:
+    """Execute a query that has already been parsed and validated, equivalent to graphql() without the parsing."""
+    if not analyzed_query.schema:
+        raise ValueError("A schema must be provided to execute the query.")
+
+    valid, errors = analyzed_query.is_valid
+    if not valid:
+        return ExecutionResult(data=None, errors=errors)
+
+    result: Any = execute(
+        schema=analyzed_query.schema,
+        document=analyzed_query.document,
+        root_value=root_value,
+        context_value=context_value,
+        variable_values=variable_values,
+        operation_name=operation_name,
+        middleware=middleware,
+        execution_context_class=execution_context_class,
+    )
+    if isinstance(result, ExecutionResult):
+        return result
+    return await result
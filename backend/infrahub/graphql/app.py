@@ -27,7 +27,6 @@ from graphql import (
     GraphQLFormattedError,
     Middleware,
     OperationType,
-    graphql,
     parse,
     subscribe,
     validate,
@@ -47,7 +46,7 @@ from infrahub.auth import AccountSession, authentication_token
 from infrahub.core.registry import registry
 from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import BranchNotFoundError, Error
-from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
+from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer, execute_analyzed_query, get_analyzed_query
 from infrahub.graphql.initialization import GraphqlParams, prepare_graphql_params
 from infrahub.log import get_logger
 
@@ -207,10 +206,11 @@ class InfrahubGraphQLApp:
         graphql_params = prepare_graphql_params(
             db=db, branch=branch, at=at, account_session=account_session, request=request
         )
-        analyzed_query = InfrahubGraphQLQueryAnalyzer(
+        analyzed_query = get_analyzed_query(
             query=query,
             query_variables=variable_values,
             schema=graphql_params.schema,
+            schema_key=graphql_params.schema_key,
             operation_name=operation_name,
             branch=branch,
         )
@@ -242,9 +242,8 @@ class InfrahubGraphQLApp:
             span.set_attributes(labels)
 
             with GRAPHQL_DURATION_METRICS.labels(**labels).time():
-                result = await graphql(
-                    schema=graphql_params.schema,
-                    source=query,
+                result = await execute_analyzed_query(
+                    analyzed_query=analyzed_query,
                     context_value=graphql_params.context,
                     root_value=self.root_value,
                     middleware=self.middleware,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Optional, Union
 
 from starlette.background import BackgroundTasks
@@ -9,6 +9,7 @@ from infrahub.core import registry
 from infrahub.core.timestamp import Timestamp
 from infrahub.exceptions import InitializationError
 
+from .loaders import PeerRelationshipsDataLoader, QueryPeerParams
 from .manager import GraphQLSchemaManager
 
 if TYPE_CHECKING:
@@ -18,6 +19,7 @@ if TYPE_CHECKING:
     from infrahub.auth import AccountSession
     from infrahub.core.branch import Branch
     from infrahub.database import InfrahubDatabase
+    from infrahub.graphql.schema_registry import GraphQLSchemaKey
     from infrahub.services import InfrahubServices
 
 
@@ -25,6 +27,7 @@ if TYPE_CHECKING:
 class GraphqlParams:
     schema: GraphQLSchema
     context: GraphqlContext
+    schema_key: Optional[GraphQLSchemaKey] = None
 
 
 @dataclass
@@ -38,6 +41,21 @@ class GraphqlContext:
     account_session: Optional[AccountSession] = None
     background: Optional[BackgroundTasks] = None
     request: Optional[HTTPConnection] = None
+    peer_loaders: dict[str, PeerRelationshipsDataLoader] = field(default_factory=dict)
+
+    def get_peer_loader(self, query_params: QueryPeerParams) -> PeerRelationshipsDataLoader:
+        """Return the loader associated with these query parameters, a new one is created if needed.
+
+        Loaders are scoped to the context and as such to a single request.
+        """
+        key = query_params.key
+        if key not in self.peer_loaders:
+            self.peer_loaders[key] = PeerRelationshipsDataLoader(db=self.db, query_params=query_params)
+        return self.peer_loaders[key]
+
+    def clear_peer_loaders(self) -> None:
+        """Drop the loaders and the peers they cached, to be called after a modification of the data within the request."""
+        self.peer_loaders.clear()
 
     @property
     def active_account_session(self) -> AccountSession:
@@ -65,13 +83,13 @@ def prepare_graphql_params(
     branch = registry.get_branch_from_registry(branch=branch)
     schema = registry.schema.get_schema_branch(name=branch.name)
 
-    gqlm = schema.get_graphql_manager()
     gql_schema = schema.get_graphql_schema(
         include_query=include_query,
         include_mutation=include_mutation,
         include_subscription=include_subscription,
         include_types=include_types,
     )
+    gqlm = schema.get_graphql_manager()
 
     if request and not service:
         service = request.app.state.service
@@ -89,6 +107,7 @@ def prepare_graphql_params(
             service=service,
             account_session=account_session,
         ),
+        schema_key=schema.get_graphql_schema_key(),
     )
 
 
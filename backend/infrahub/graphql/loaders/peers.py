@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+from infrahub.core.constants import BranchSupportType
+from infrahub.core.manager import NodeManager
+
+if TYPE_CHECKING:
+    from infrahub.core.branch import Branch
+    from infrahub.core.relationship import Relationship
+    from infrahub.core.schema import RelationshipSchema
+    from infrahub.core.timestamp import Timestamp
+    from infrahub.database import InfrahubDatabase
+
+
+@dataclass
+class QueryPeerParams:
+    """Parameters shared by all the parents resolved within a single batch."""
+
+    source_kind: str
+    schema: RelationshipSchema
+    filters: dict[str, Any]
+    fields: Optional[dict] = None
+    at: Optional[Timestamp] = None
+    branch: Optional[Branch] = None
+    branch_agnostic: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.branch_agnostic = self.schema.branch is BranchSupportType.AGNOSTIC
+
+    @property
+    def key(self) -> str:
+        """Identify the parameters, two sets of parameters with the same key can be resolved in the same query."""
+        return json.dumps(
+            {
+                "source_kind": self.source_kind,
+                "relationship": self.schema.name,
+                "identifier": self.schema.identifier,
+                "filters": self.filters,
+                "fields": self.fields,
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+
+class PeerRelationshipsDataLoader:
+    """Batch the resolution of the peers of a relationship for multiple parent nodes.
+
+    All the calls to `load` issued within the same iteration of the event loop are collected
+    and resolved with a single call to NodeManager.query_peers for the complete list of ids.
+    The results are cached for the lifetime of the loader which is expected to be scoped to a single request.
+    """
+
+    def __init__(self, db: InfrahubDatabase, query_params: QueryPeerParams) -> None:
+        self.db = db
+        self.query_params = query_params
+        self._cache: dict[str, asyncio.Future[list[Relationship]]] = {}
+        self._queue: dict[str, asyncio.Future[list[Relationship]]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, node_id: str) -> list[Relationship]:
+        if node_id in self._cache:
+            return await self._cache[node_id]
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[Relationship]] = loop.create_future()
+        self._cache[node_id] = future
+
+        if not self._queue:
+            loop.call_soon(self._schedule_dispatch)
+        self._queue[node_id] = future
+
+        return await future
+
+    def _schedule_dispatch(self) -> None:
+        queue, self._queue = self._queue, {}
+        # The event loop only keeps a weak reference to the tasks, a reference is kept until the task is done
+        task = asyncio.create_task(self._dispatch(queue=queue))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, queue: dict[str, asyncio.Future[list[Relationship]]]) -> None:
+        try:
+            peers_per_node = await self.query_peers(node_ids=list(queue.keys()))
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            for node_id, future in queue.items():
+                self._cache.pop(node_id, None)
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for node_id, future in queue.items():
+            if not future.done():
+                future.set_result(peers_per_node.get(node_id, []))
+
+    async def query_peers(self, node_ids: list[str]) -> dict[str, list[Relationship]]:
+        async with self.db.start_session() as db:
+            relationships = await NodeManager.query_peers(
+                db=db,
+                ids=node_ids,
+                source_kind=self.query_params.source_kind,
+                schema=self.query_params.schema,
+                filters=self.query_params.filters,
+                fields=self.query_params.fields,
+                at=self.query_params.at,
+                branch=self.query_params.branch,
+                branch_agnostic=self.query_params.branch_agnostic,
+                fetch_peers=True,
+            )
+
+        peers_per_node: dict[str, list[Relationship]] = {node_id: [] for node_id in node_ids}
+        for relationship in relationships:
+            peers_per_node.setdefault(relationship.node_id, []).append(relationship)
+        return peers_per_node
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from graphene import Boolean, Field, InputField, InputObjectType, Int, List, Mutation, NonNull, ObjectType, String
+from graphene.types.generic import GenericScalar
+
+from infrahub import config
+from infrahub.auth import validate_mutation_permissions, validate_mutation_permissions_update_node
+from infrahub.core import registry
+from infrahub.core.account import ObjectPermission
+from infrahub.core.constants import GLOBAL_BRANCH_NAME, MutationAction
+from infrahub.core.constraint.node.runner import NodeConstraintRunner
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.core.schema import NodeSchema
+from infrahub.core.timestamp import Timestamp
+from infrahub.database import retry_db_transaction
+from infrahub.dependencies.registry import get_component_registry
+from infrahub.events import EventMeta, NodeMutatedEvent
+from infrahub.exceptions import PermissionDeniedError, ValidationError
+from infrahub.log import get_log_data
+from infrahub.permissions.constants import PermissionDecisionFlag
+from infrahub.utils import extract_camelcase_words
+from infrahub.worker import WORKER_IDENTITY
+
+from .main import InfrahubMutation
+
+if TYPE_CHECKING:
+    from graphql import GraphQLResolveInfo
+
+    from infrahub.core.branch import Branch
+    from infrahub.database import InfrahubDatabase
+
+    from ..initialization import GraphqlContext
+
+# pylint: disable=unused-argument
+
+
+class BulkUpsertInput(InputObjectType):
+    kind = InputField(String(required=True), description="Kind of the objects to create or update")
+    data = InputField(
+        List(of_type=NonNull(GenericScalar), required=True),
+        description="List of objects, using the same format as the input of the Upsert mutation of the kind",
+    )
+
+
+class BulkUpsertNode(ObjectType):
+    index = Int(required=True, description="Position of the object in the input data")
+    id = String(required=True)
+    created = Boolean(required=True, description="Indicates if the object has been created or updated")
+
+
+class BulkUpsert(Mutation):
+    """Create or update multiple objects of the same kind within a single transaction.
+
+    New objects are validated together and created with one query per batch,
+    existing objects identified by their id or hfid are updated one by one.
+    """
+
+    class Arguments:
+        data = BulkUpsertInput(required=True)
+
+    ok = Boolean()
+    nodes = Field(List(of_type=NonNull(BulkUpsertNode)))
+
+    @classmethod
+    async def mutate(cls, root: dict, info: GraphQLResolveInfo, data: BulkUpsertInput) -> BulkUpsert:
+        context: GraphqlContext = info.context
+        kind = str(data.kind)
+
+        node_schema = cls._get_schema(context=context, kind=kind)
+        validate_mutation_permissions(operation=f"{kind}Upsert", account_session=context.account_session)
+        await cls._validate_object_permissions(context=context, node_schema=node_schema)
+
+        rows: list[dict[str, Any]] = []
+        for index, row in enumerate(data.data):
+            if not isinstance(row, dict):
+                raise ValidationError({"data": f"The object at position {index} must be a dictionary"})
+            rows.append(row)
+        try:
+            created, updated = await cls.mutate_bulk_upsert(
+                context=context, node_schema=node_schema, rows=rows, branch=context.branch, at=context.at
+            )
+        except ValidationError as exc:
+            raise ValueError(str(exc)) from exc
+
+        # Reset the time of the query to guarantee that all resolvers executed after this point will account for the changes
+        context.at = Timestamp()
+        context.clear_peer_loaders()
+
+        if config.SETTINGS.broker.enable and context.background:
+            request_id = get_log_data().get("request_id", "")
+            for nodes, action in ((created, MutationAction.ADDED), (updated, MutationAction.UPDATED)):
+                for node in nodes.values():
+                    event = NodeMutatedEvent(
+                        branch=context.branch.name,
+                        kind=node_schema.kind,
+                        node_id=node.id,
+                        data=await node.to_graphql(db=context.db, filter_sensitive=True),
+                        action=action,
+                        meta=EventMeta(initiator_id=WORKER_IDENTITY, request_id=request_id),
+                    )
+                    context.background.add_task(context.service.event.send, event)
+
+        results = [{"index": index, "id": node.id, "created": True} for index, node in created.items()]
+        results.extend({"index": index, "id": node.id, "created": False} for index, node in updated.items())
+        return cls(ok=True, nodes=sorted(results, key=lambda item: item["index"]))
+
+    @classmethod
+    def _get_schema(cls, context: GraphqlContext, kind: str) -> NodeSchema:
+        mutation = context.types.get(f"{kind}Upsert")
+        if not mutation or not issubclass(mutation, InfrahubMutation):
+            raise ValidationError({"kind": f"{kind!r} is not a valid kind"})
+
+        # Some kinds rely on a dedicated mutation to process their objects, they can't be processed in bulk
+        if mutation.__bases__ != (InfrahubMutation,) or not isinstance(mutation._meta.schema, NodeSchema):
+            raise ValidationError({"kind": f"{kind!r} doesn't support bulk operations"})
+
+        return mutation._meta.schema
+
+    @classmethod
+    async def _validate_object_permissions(cls, context: GraphqlContext, node_schema: NodeSchema) -> None:
+        """Ensure the account is allowed to both create and update objects of this kind, like an Upsert mutation."""
+        if not context.account_session or not context.account_session.authenticated:
+            return
+
+        required_decision = (
+            PermissionDecisionFlag.ALLOW_DEFAULT
+            if context.branch.name in (GLOBAL_BRANCH_NAME, registry.default_branch)
+            else PermissionDecisionFlag.ALLOW_OTHER
+        )
+        extracted_words = extract_camelcase_words(node_schema.kind)
+        for action in ("create", "update"):
+            permission = ObjectPermission(
+                id="",
+                namespace=extracted_words[0],
+                name="".join(extracted_words[1:]),
+                action=action,
+                decision=required_decision,
+            )
+            for permission_backend in registry.permission_backends:
+                if not await permission_backend.has_permission(
+                    db=context.db,
+                    account_id=context.account_session.account_id,
+                    permission=permission,
+                    branch=context.branch,
+                ):
+                    raise PermissionDeniedError(f"You do not have the following permission: {permission}")
+
+    @classmethod
+    async def _get_existing_nodes(
+        cls, db: InfrahubDatabase, node_schema: NodeSchema, rows: list[dict[str, Any]], branch: Branch, at: Timestamp
+    ) -> dict[int, Node]:
+        """Identify the rows matching objects already present in the database, by id or by hfid."""
+        existing: dict[int, Node] = {}
+
+        ids = {index: str(row["id"]) for index, row in enumerate(rows) if row.get("id")}
+        if ids:
+            nodes = await NodeManager.get_many(db=db, ids=list(ids.values()), branch=branch, at=at)
+            for index, node_id in ids.items():
+                if node := nodes.get(node_id):
+                    if node.get_kind() != node_schema.kind:
+                        raise ValidationError({"id": f"{node_id} is not of kind {node_schema.kind}"})
+                    existing[index] = node
+
+        for index, row in enumerate(rows):
+            if index in ids or not row.get("hfid"):
+                continue
+            if node := await NodeManager.get_one_by_hfid(
+                db=db, hfid=row["hfid"], kind=node_schema.kind, branch=branch, at=at
+            ):
+                existing[index] = node
+
+        return existing
+
+    @classmethod
+    @retry_db_transaction(name="object_bulk_upsert")
+    async def mutate_bulk_upsert(
+        cls,
+        context: GraphqlContext,
+        node_schema: NodeSchema,
+        rows: list[dict[str, Any]],
+        branch: Branch,
+        at: Optional[Timestamp],
+    ) -> tuple[dict[int, Node], dict[int, Node]]:
+        node_class = registry.node.get(node_schema.kind, Node)
+        existing = await cls._get_existing_nodes(
+            db=context.db, node_schema=node_schema, rows=rows, branch=branch, at=Timestamp(at)
+        )
+
+        created: dict[int, Node] = {}
+        updated: dict[int, Node] = {}
+        async with context.db.start_transaction() as dbt:
+            component_registry = get_component_registry()
+            node_constraint_runner = await component_registry.get_component(NodeConstraintRunner, db=dbt, branch=branch)
+
+            for index, row in enumerate(rows):
+                if index in existing:
+                    continue
+                node_data = {key: value for key, value in row.items() if key != "hfid"}
+                node = await node_class.init(db=dbt, schema=node_schema, branch=branch, at=at)
+                await node.new(db=dbt, **node_data)
+                created[index] = node
+
+            if created:
+                await node_constraint_runner.check_many(nodes=list(created.values()))
+                await NodeManager.create_many(db=dbt, nodes=list(created.values()), at=at)
+
+            for index, node in existing.items():
+                row = rows[index]
+                await node.from_graphql(db=dbt, data=row)
+                fields = [field_name for field_name in row if field_name not in ("id", "hfid")]
+                await node_constraint_runner.check(node=node, field_filters=fields)
+                validate_mutation_permissions_update_node(
+                    operation=f"{node_schema.kind}Upsert",
+                    node_id=node.id,
+                    account_session=context.account_session,
+                    fields=fields,
+                )
+                await node.save(db=dbt, at=at)
+                updated[index] = node
+
+        return created, updated
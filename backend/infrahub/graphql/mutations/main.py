@@ -54,6 +54,9 @@ class InfrahubMutationOptions(MutationOptions):
 
 
 class InfrahubMutationMixin:
+    # Nodes deleted by a Delete mutation, including the ones deleted by cascade
+    _deleted_nodes: list[Node]
+
     @classmethod
     async def mutate(cls, root: dict, info: GraphQLResolveInfo, *args: Any, **kwargs):
         context: GraphqlContext = info.context
@@ -61,6 +64,7 @@ class InfrahubMutationMixin:
         obj = None
         mutation = None
         action = MutationAction.UNDEFINED
+        related_nodes: dict[str, str] = {}
         validate_mutation_permissions(operation=cls.__name__, account_session=context.account_session)
 
         if "Create" in cls.__name__:
@@ -86,6 +90,11 @@ class InfrahubMutationMixin:
         elif "Delete" in cls.__name__:
             obj, mutation = await cls.mutate_delete(info=info, branch=context.branch, at=context.at, **kwargs)
             action = MutationAction.REMOVED
+            related_nodes = {
+                node.get_id(): node.get_kind()
+                for node in getattr(mutation, "_deleted_nodes", [])
+                if node.get_id() != obj.get_id()
+            }
         else:
             raise ValueError(
                 f"Unexpected class Name: {cls.__name__}, should end with Create, Update, Upsert, or Delete"
@@ -93,6 +102,7 @@ class InfrahubMutationMixin:
 
         # Reset the time of the query to guarantee that all resolvers executed after this point will account for the changes
         context.at = Timestamp()
+        context.clear_peer_loaders()
 
         if config.SETTINGS.broker.enable and context.background:
             log_data = get_log_data()
@@ -106,6 +116,7 @@ class InfrahubMutationMixin:
                 node_id=obj.id,
                 data=data,
                 action=action,
+                related_nodes=related_nodes,
                 meta=EventMeta(initiator_id=WORKER_IDENTITY, request_id=request_id),
             )
 
@@ -289,7 +300,7 @@ class InfrahubMutationMixin:
         context: GraphqlContext = info.context
         db = database or context.db
 
-        node_schema = db.schema.get(name=schema_name, branch=branch)
+        node_schema = db.schema.get(name=schema_name, branch=branch, duplicate=False)
 
         node = None
         for getter in node_getters:
@@ -335,7 +346,9 @@ class InfrahubMutationMixin:
 
         ok = True
 
-        return obj, cls(ok=ok)
+        mutation = cls(ok=ok)
+        mutation._deleted_nodes = deleted
+        return obj, mutation
 
 
 class InfrahubMutation(InfrahubMutationMixin, Mutation):
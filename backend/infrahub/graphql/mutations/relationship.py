@@ -14,6 +14,8 @@ from infrahub.core.query.relationship import (
 from infrahub.core.relationship import Relationship
 from infrahub.database import retry_db_transaction
 from infrahub.exceptions import NodeNotFoundError, ValidationError
+from infrahub.message_bus import messages
+from infrahub.permissions.constants import PERMISSION_RELATED_KINDS
 
 from ..types import RelatedNodeInput
 
@@ -133,6 +135,13 @@ class RelationshipMixin:
                         await rel.load(db=db, data=existing_peers[node_data.get("id")])
                         await rel.delete(db=db)
 
+        context.clear_peer_loaders()
+
+        # The permissions of an account depend on its groups, on their roles and on the permissions of these roles
+        labels = {label for node in [source, *nodes.values()] for label in node.get_labels()}
+        if context.service and not PERMISSION_RELATED_KINDS.isdisjoint(labels):
+            await context.service.send(message=messages.RefreshRegistryPermissions())
+
         return cls(ok=True)
 
 
@@ -7,6 +7,8 @@ from infrahub_sdk.utils import extract_fields_first_node, is_valid_uuid
 
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.manager import NodeManager
+from infrahub.core.search_index import search_index_cache
+from infrahub.core.timestamp import Timestamp
 
 if TYPE_CHECKING:
     from graphql import GraphQLResolveInfo
@@ -42,6 +44,19 @@ async def search_resolver(
 
     fields = await extract_fields_first_node(info)
 
+    if partial_match and not is_valid_uuid(q):
+        # The display labels and the human friendly ids are searched in memory when the index is up to date,
+        # the values of all the attributes are searched in the graph if none of them matches
+        matches = await search_index_cache.search(
+            db=context.db, branch=context.branch, q=q, limit=limit, at=Timestamp(context.at)
+        )
+        if matches:
+            if "edges" in fields:
+                response["edges"] = [{"node": {"id": node_id, "kind": kind}} for node_id, kind in matches]
+            if "count" in fields:
+                response["count"] = len(matches)
+            return response
+
     if is_valid_uuid(q):
         matching: Optional[CoreNode] = await NodeManager.get_one(
             db=context.db, branch=context.branch, at=context.at, id=q
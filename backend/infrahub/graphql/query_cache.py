@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+from infrahub import config
+
+if TYPE_CHECKING:
+    from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
+    from infrahub.graphql.schema_registry import GraphQLSchemaKey
+
+
+class GraphQLQueryCache:
+    """LRU cache of the parsed and analyzed GraphQL queries.
+
+    Queries are indexed by the key of the GraphQL schema they have been validated against, the hash of the schema with
+    the options used to generate it as in the registry of the GraphQL schemas, and by the hash of their content.
+    The same query sent to different branches sharing the same GraphQL schema is only parsed and validated once.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self._max_size = max_size
+        self._items: OrderedDict[tuple[GraphQLSchemaKey, str], InfrahubGraphQLQueryAnalyzer] = OrderedDict()
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return config.SETTINGS.api.graphql_query_cache_size
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @staticmethod
+    def get_query_hash(query: str) -> str:
+        return hashlib.sha256(query.encode(), usedforsecurity=False).hexdigest()
+
+    def get(self, schema_key: GraphQLSchemaKey, query: str) -> Optional[InfrahubGraphQLQueryAnalyzer]:
+        key = (schema_key, self.get_query_hash(query))
+        analyzed_query = self._items.get(key)
+        if analyzed_query is not None:
+            self._items.move_to_end(key)
+        return analyzed_query
+
+    def set(self, schema_key: GraphQLSchemaKey, query: str, analyzed_query: InfrahubGraphQLQueryAnalyzer) -> None:
+        if self.max_size <= 0:
+            return
+
+        key = (schema_key, self.get_query_hash(query))
+        self._items[key] = analyzed_query
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def clear(self, schema_hash: Optional[str] = None) -> None:
+        """Remove the queries associated with a given schema or all the queries if no schema is provided."""
+        if schema_hash is None:
+            self._items.clear()
+            return
+
+        for key in [key for key in self._items if key[0][0] == schema_hash]:
+            del self._items[key]
+
+
+query_cache = GraphQLQueryCache()
@@ -9,6 +9,7 @@ from infrahub.core.manager import NodeManager
 from infrahub.core.query.node import NodeGetHierarchyQuery
 from infrahub.exceptions import NodeNotFoundError
 
+from .loaders import QueryPeerParams
 from .parser import extract_selection
 from .permissions import get_permissions
 from .types import RELATIONS_PROPERTY_MAP, RELATIONS_PROPERTY_MAP_REVERSED
@@ -92,20 +93,20 @@ async def default_resolver(*args: Any, **kwargs) -> dict | list[dict] | None:
         if "__" in key and value or key in ["id", "ids"]
     }
 
-    async with context.db.start_session() as db:
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=[parent["id"]],
+    # The peers of all the parents are resolved together by the loader, one query per relationship
+    peer_loader = context.get_peer_loader(
+        query_params=QueryPeerParams(
             source_kind=node_schema.kind,
             schema=node_rel,
             filters=filters,
             fields=fields,
             at=context.at,
             branch=context.branch,
-            branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
-            fetch_peers=True,
         )
+    )
+    objs = await peer_loader.load(node_id=parent["id"])
 
+    async with context.db.start_session() as db:
         if node_rel.cardinality == "many":
             return [
                 await obj.to_graphql(db=db, fields=fields, related_node_ids=context.related_node_ids) for obj in objs
@@ -237,23 +238,22 @@ async def single_relationship_resolver(parent: dict, info: GraphQLResolveInfo, *
 
     response: dict[str, Any] = {"node": None, "properties": {}}
 
-    async with context.db.start_session() as db:
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=[parent["id"]],
+    peer_loader = context.get_peer_loader(
+        query_params=QueryPeerParams(
             source_kind=node_schema.kind,
             schema=node_rel,
             filters=filters,
             fields=node_fields,
             at=context.at,
             branch=context.branch,
-            branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
-            fetch_peers=True,
         )
+    )
+    objs = await peer_loader.load(node_id=parent["id"])
 
-        if not objs:
-            return response
+    if not objs:
+        return response
 
+    async with context.db.start_session() as db:
         node_graph = await objs[0].to_graphql(db=db, fields=node_fields, related_node_ids=context.related_node_ids)
         for key, mapped in RELATIONS_PROPERTY_MAP_REVERSED.items():
             value = node_graph.pop(key, None)
@@ -334,20 +334,34 @@ async def many_relationship_resolver(
         if not node_fields:
             return response
 
-        objs = await NodeManager.query_peers(
-            db=db,
-            ids=ids,
-            source_kind=source_kind,
-            schema=node_rel,
-            filters=filters,
-            fields=node_fields,
-            offset=offset,
-            limit=limit,
-            at=context.at,
-            branch=context.branch,
-            branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
-            fetch_peers=True,
-        )
+        if offset is None and limit is None and not include_descendants:
+            # Without pagination, the peers of all the parents can be resolved together by the loader
+            peer_loader = context.get_peer_loader(
+                query_params=QueryPeerParams(
+                    source_kind=source_kind,
+                    schema=node_rel,
+                    filters=filters,
+                    fields=node_fields,
+                    at=context.at,
+                    branch=context.branch,
+                )
+            )
+            objs = await peer_loader.load(node_id=parent["id"])
+        else:
+            objs = await NodeManager.query_peers(
+                db=db,
+                ids=ids,
+                source_kind=source_kind,
+                schema=node_rel,
+                filters=filters,
+                fields=node_fields,
+                offset=offset,
+                limit=limit,
+                at=context.at,
+                branch=context.branch,
+                branch_agnostic=node_rel.branch is BranchSupportType.AGNOSTIC,
+                fetch_peers=True,
+            )
 
         if not objs:
             return response
@@ -15,6 +15,7 @@ from .mutations.branch import (
     BranchUpdate,
     BranchValidate,
 )
+from .mutations.bulk import BulkUpsert
 from .mutations.diff import DiffUpdateMutation
 from .mutations.diff_conflict import ResolveDiffConflict
 from .mutations.proposed_change import ProposedChangeRequestRunCheck
@@ -84,6 +85,7 @@ class InfrahubBaseMutation(ObjectType):
     InfrahubAccountSelfUpdate = InfrahubAccountSelfUpdate.Field()
     InfrahubAccountTokenDelete = InfrahubAccountTokenDelete.Field()
     CoreProposedChangeRunCheck = ProposedChangeRequestRunCheck.Field()
+    CoreBulkUpsert = BulkUpsert.Field()
 
     IPPrefixPoolGetResource = IPPrefixPoolGetResource.Field()
     IPAddressPoolGetResource = IPAddressPoolGetResource.Field()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from infrahub import config
+
+from .manager import GraphQLSchemaManager
+
+if TYPE_CHECKING:
+    from graphql import GraphQLSchema
+
+    from infrahub.core.schema.schema_branch import SchemaBranch
+
+GraphQLSchemaKey = tuple[str, bool, bool, bool, bool, bool]
+
+
+@dataclass
+class GraphQLSchemaEntry:
+    manager: GraphQLSchemaManager
+    schema: GraphQLSchema
+    refcount: int = 0
+
+
+class GraphQLSchemaRegistry:
+    """Registry of the generated GraphQL schemas, shared between the schema branches with the same content.
+
+    The schemas are indexed by the hash of the schema branch and by the options used to generate them.
+    Each schema branch using a GraphQL schema holds a reference to it, a GraphQL schema is
+    removed from the registry as soon as the last schema branch using it releases it.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[GraphQLSchemaKey, GraphQLSchemaEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def acquire(
+        self,
+        schema_branch: SchemaBranch,
+        include_query: bool = True,
+        include_mutation: bool = True,
+        include_subscription: bool = True,
+        include_types: bool = True,
+    ) -> tuple[GraphQLSchemaKey, GraphQLSchemaEntry]:
+        """Return the GraphQL schema associated with this schema branch, generate it if it doesn't exist yet.
+
+        The caller must release the key returned once it's not using the GraphQL schema anymore.
+        """
+        key: GraphQLSchemaKey = (
+            schema_branch.get_hash(),
+            include_query,
+            include_mutation,
+            include_subscription,
+            include_types,
+            config.SETTINGS.experimental_features.graphql_enums,
+        )
+
+        entry = self._entries.get(key)
+        if entry is None:
+            # The manager works on its own copy of the schema branch to avoid keeping the original one alive
+            manager = GraphQLSchemaManager(schema=schema_branch.duplicate(name=schema_branch.name))
+            entry = GraphQLSchemaEntry(
+                manager=manager,
+                schema=manager.generate(
+                    include_query=include_query,
+                    include_mutation=include_mutation,
+                    include_subscription=include_subscription,
+                    include_types=include_types,
+                ),
+            )
+            self._entries[key] = entry
+
+        entry.refcount += 1
+        return key, entry
+
+    def release(self, key: GraphQLSchemaKey) -> None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+
+        entry.refcount -= 1
+        if entry.refcount <= 0:
+            del self._entries[key]
+
+
+graphql_schema_registry = GraphQLSchemaRegistry()
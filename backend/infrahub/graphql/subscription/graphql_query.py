@@ -1,59 +1,225 @@
+from __future__ import annotations
+
 import asyncio
-from typing import TYPE_CHECKING, Any, AsyncGenerator
+import contextlib
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Iterable, Optional
 
+import ujson
 from graphene import Field, Int, String
 from graphene.types.generic import GenericScalar
-from graphql import GraphQLResolveInfo, graphql
 
+from infrahub import config
 from infrahub.core import registry
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.manager import NodeManager
 from infrahub.core.protocols import CoreGraphQLQuery
+from infrahub.core.schema import GenericSchema
 from infrahub.core.timestamp import Timestamp
+from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer, execute_analyzed_query, get_analyzed_query
 from infrahub.log import get_logger
 
 if TYPE_CHECKING:
+    from graphql import GraphQLResolveInfo
+
+    from infrahub.core.branch import Branch
     from infrahub.graphql.initialization import GraphqlContext
 
 log = get_logger(name="infrahub.graphql")
 
+# Minimum number of seconds between a modification and the execution of the queries it affects,
+# the modifications received during this delay are coalesced into a single execution
+SUBSCRIPTION_DEBOUNCE_DELAY = 0.5
 
-async def resolver_graphql_query(
-    parent: dict,  # pylint: disable=unused-argument
-    info: GraphQLResolveInfo,
-    name: str,
-    params: dict[str, Any] | None = None,
-    interval: int = 10,
-) -> AsyncGenerator[dict[str, Any], None]:
-    context: GraphqlContext = info.context
-    at = Timestamp()
 
-    async with context.db.start_session() as db:
-        # Find the GraphQLQuery and the GraphQL Schema
-        graphql_query = await NodeManager.get_one_by_default_filter(
-            db=db, id=name, kind=CoreGraphQLQuery, branch=context.branch, at=at
-        )
-        if not graphql_query:
-            raise ValueError(f"Unable to find the {InfrahubKind.GRAPHQLQUERY} {name}")
+@dataclass
+class GraphQLQueryExecution:
+    """Execution of a stored query shared by all the subscribers to this query with the same parameters on a branch.
+
+    The query is executed again when one of the nodes it returned or a node of one of the kinds it queries is modified,
+    at most once per interval. Without notification it's only executed again after the staleness timeout.
+    The result is sent to the subscribers only when it changes.
+    """
 
-        schema_branch = registry.schema.get_schema_branch(name=context.branch.name)
-        graphql_schema = schema_branch.get_graphql_schema()
+    branch: Branch
+    interval: float
+    related_kinds: set[str] = field(default_factory=set)
+    related_node_ids: set[str] = field(default_factory=set)
+    result: Optional[dict[str, Any]] = None
+    error: Optional[Exception] = None
+    subscribers: list[asyncio.Queue] = field(default_factory=list)
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+    task: Optional[asyncio.Task] = None
 
-    while True:
+    def is_affected(self, branch: str, kinds: Iterable[str], node_ids: Iterable[str], all_nodes: bool) -> bool:
+        if branch != self.branch.name and (branch != registry.default_branch or self.branch.is_isolated):
+            return False
+        return all_nodes or not self.related_kinds.isdisjoint(kinds) or not self.related_node_ids.isdisjoint(node_ids)
+
+    def publish(self, result: dict[str, Any]) -> None:
+        """Send the result to every subscriber, a subscriber that didn't consume the previous result only gets the latest one."""
+        self.result = result
+        for queue in self.subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(result)
+
+    def fail(self, error: Exception) -> None:
+        """Send the error that stopped the execution to every subscriber, the subscriptions end with this error."""
+        self.error = error
+        for queue in self.subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(error)
+
+
+class GraphQLQuerySubscriptions:
+    """Executions of the subscribed queries of this worker, indexed by branch, query and parameters."""
+
+    def __init__(self) -> None:
+        self._executions: dict[tuple[str, str, str], GraphQLQueryExecution] = {}
+
+    def __len__(self) -> int:
+        return len(self._executions)
+
+    def notify(
+        self, branch: str, kinds: Iterable[str] = (), node_ids: Iterable[str] = (), all_nodes: bool = False
+    ) -> None:
+        """Flag the executions affected by a modification of these nodes to run them again."""
+        kinds = set(kinds)
+        node_ids = set(node_ids)
+        for execution in self._executions.values():
+            if execution.is_affected(branch=branch, kinds=kinds, node_ids=node_ids, all_nodes=all_nodes):
+                execution.changed.set()
+
+    async def subscribe(
+        self, context: GraphqlContext, name: str, params: Optional[dict[str, Any]], interval: float
+    ) -> AsyncGenerator[dict[str, Any], None]:
         async with context.db.start_session() as db:
-            result = await graphql(
+            # Find the GraphQLQuery and the GraphQL Schema
+            graphql_query = await NodeManager.get_one_by_default_filter(
+                db=db, id=name, kind=CoreGraphQLQuery, branch=context.branch, at=Timestamp()
+            )
+            if not graphql_query:
+                raise ValueError(f"Unable to find the {InfrahubKind.GRAPHQLQUERY} {name}")
+
+        key = (context.branch.name, name, ujson.dumps(params or {}, sort_keys=True))
+        execution = self._executions.get(key)
+        if execution is None or execution.error is not None:
+            execution = GraphQLQueryExecution(branch=context.branch, interval=interval)
+            execution.task = asyncio.create_task(
+                self._run(execution=execution, context=context, query=graphql_query.query.value, params=params or {})
+            )
+            self._executions[key] = execution
+        else:
+            execution.interval = min(execution.interval, interval)
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        if execution.result is not None:
+            queue.put_nowait(execution.result)
+        execution.subscribers.append(queue)
+        try:
+            while True:
+                result = await queue.get()
+                if isinstance(result, Exception):
+                    raise result
+                yield result
+        finally:
+            execution.subscribers.remove(queue)
+            if not execution.subscribers:
+                if self._executions.get(key) is execution:
+                    del self._executions[key]
+                if execution.task:
+                    execution.task.cancel()
+
+    async def _run(
+        self, execution: GraphQLQueryExecution, context: GraphqlContext, query: str, params: dict[str, Any]
+    ) -> None:
+        try:
+            schema_branch = registry.schema.get_schema_branch(name=execution.branch.name)
+            graphql_schema = schema_branch.get_graphql_schema()
+            analyzed_query = get_analyzed_query(
+                query=query,
                 schema=graphql_schema,
-                source=graphql_query.query.value,
+                schema_key=schema_branch.get_graphql_schema_key(),
+                branch=execution.branch,
+                query_variables=params,
+            )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # Without the schema the query can never be executed, the subscribers must not wait for a result
+            log.warning("Unable to prepare the subscribed query", branch=execution.branch.name, error=str(exc))
+            execution.fail(error=exc)
+            return
+
+        try:
+            for kind in await analyzed_query.get_models_in_use(types=context.types):
+                execution.related_kinds.add(kind)
+                schema = schema_branch.get(name=kind, duplicate=False)
+                if isinstance(schema, GenericSchema):
+                    execution.related_kinds.update(schema.used_by)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # The query is still executed again when one of the nodes it returned is modified
+            log.warning(
+                "Unable to find the kinds of the subscribed query", branch=execution.branch.name, error=str(exc)
+            )
+
+        loop = asyncio.get_running_loop()
+        while True:
+            execution.changed.clear()
+            started_at = loop.time()
+            try:
+                await self._execute(execution=execution, context=context, analyzed_query=analyzed_query, params=params)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                log.warning("Unable to execute the subscribed query", branch=execution.branch.name, error=str(exc))
+
+            # The query is also executed after the staleness timeout in case a modification has not been notified,
+            # it's only executed again on notification if the timeout is 0
+            staleness_timeout = config.SETTINGS.api.subscription_staleness_timeout or None
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(execution.changed.wait(), timeout=staleness_timeout)
+            await asyncio.sleep(max(SUBSCRIPTION_DEBOUNCE_DELAY, started_at + execution.interval - loop.time()))
+
+    @staticmethod
+    async def _execute(
+        execution: GraphQLQueryExecution,
+        context: GraphqlContext,
+        analyzed_query: InfrahubGraphQLQueryAnalyzer,
+        params: dict[str, Any],
+    ) -> None:
+        related_node_ids: set[str] = set()
+        async with context.db.start_session() as db:
+            result = await execute_analyzed_query(
+                analyzed_query=analyzed_query,
                 context_value=context.__class__(
-                    db=db, branch=context.branch, at=Timestamp(), related_node_ids=set(), types=context.types
+                    db=db,
+                    branch=execution.branch,
+                    at=Timestamp(),
+                    related_node_ids=related_node_ids,
+                    types=context.types,
                 ),
-                root_value=None,
-                variable_values=params or {},
+                variable_values=params,
             )
-            if result.data:
-                yield result.data
+        if result.data:
+            execution.related_node_ids = related_node_ids
+            if result.data != execution.result:
+                execution.publish(result=result.data)
 
-        await asyncio.sleep(delay=float(interval))
+
+graphql_query_subscriptions = GraphQLQuerySubscriptions()
+
+
+async def resolver_graphql_query(
+    parent: dict,  # pylint: disable=unused-argument
+    info: GraphQLResolveInfo,
+    name: str,
+    params: dict[str, Any] | None = None,
+    interval: int = 10,
+) -> AsyncGenerator[dict[str, Any], None]:
+    """Send the result of the query when it's modified, the subscribers of the same query and parameters share its execution."""
+    async for result in graphql_query_subscriptions.subscribe(
+        context=info.context, name=name, params=params, interval=float(interval or 10)
+    ):
+        yield result
 
 
 GraphQLQuerySubscription = Field(
@@ -29,7 +29,9 @@ from .proposed_change.request_proposedchange_rungenerators import RequestPropose
 from .proposed_change.request_proposedchange_runtests import RequestProposedChangeRunTests
 from .proposed_change.request_proposedchange_schemaintegrity import RequestProposedChangeSchemaIntegrity
 from .refresh_registry_branches import RefreshRegistryBranches
+from .refresh_registry_permissions import RefreshRegistryPermissions
 from .refresh_registry_rebasedbranch import RefreshRegistryRebasedBranch
+from .refresh_registry_subscriptions import RefreshRegistrySubscriptions
 from .refresh_webhook_configuration import RefreshWebhookConfiguration
 from .request_artifact_generate import RequestArtifactGenerate
 from .request_artifactdefinition_check import RequestArtifactDefinitionCheck
@@ -80,7 +82,9 @@ MESSAGE_MAP: dict[str, type[InfrahubMessage]] = {
     "schema.migration.path": SchemaMigrationPath,
     "schema.validator.path": SchemaValidatorPath,
     "refresh.registry.branches": RefreshRegistryBranches,
+    "refresh.registry.permissions": RefreshRegistryPermissions,
     "refresh.registry.rebased_branch": RefreshRegistryRebasedBranch,
+    "refresh.registry.subscriptions": RefreshRegistrySubscriptions,
     "refresh.webhook.configuration": RefreshWebhookConfiguration,
     "request.artifact.generate": RequestArtifactGenerate,
     "request.artifact_definition.check": RequestArtifactDefinitionCheck,
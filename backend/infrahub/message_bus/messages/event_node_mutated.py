@@ -13,3 +13,6 @@ class EventNodeMutated(InfrahubMessage):
     node_id: str = Field(..., description="The ID of the mutated node")
     action: str = Field(..., description="The action taken on the node")
     data: Dict[str, Any] = Field(..., description="Data on modified object")
+    related_nodes: Dict[str, str] = Field(
+        default_factory=dict, description="Kind of the other nodes deleted along with this node, indexed by ID"
+    )
@@ -0,0 +1,5 @@
+from infrahub.message_bus import InfrahubMessage
+
+
+class RefreshRegistryPermissions(InfrahubMessage):
+    """Sent to indicate that the permissions cached for the accounts should be discarded."""
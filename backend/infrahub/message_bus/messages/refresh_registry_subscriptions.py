@@ -0,0 +1,14 @@
+from pydantic import Field
+
+from infrahub.message_bus import InfrahubMessage
+
+
+class RefreshRegistrySubscriptions(InfrahubMessage):
+    """Sent to execute again the GraphQL query subscriptions affected by a modification of the data."""
+
+    branch: str = Field(..., description="The branch that was modified")
+    kinds: list[str] = Field(default_factory=list, description="The kinds of the modified nodes")
+    node_ids: list[str] = Field(default_factory=list, description="The ids of the modified nodes")
+    all_nodes: bool = Field(
+        default=False, description="Indicate that any node of the branch might have been modified, e.g. by a merge"
+    )
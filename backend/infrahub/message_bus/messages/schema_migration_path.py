@@ -30,6 +30,8 @@ class SchemaMigrationPathResponseData(InfrahubResponseData):
     errors: list[str] = Field(default_factory=list)
     migration_name: Optional[str] = None
     nbr_migrations_executed: Optional[int] = None
+    nbr_batches: Optional[int] = None
+    duration: Optional[float] = Field(None, description="Duration of the migration in seconds")
     schema_path: Optional[SchemaPath] = None
 
 
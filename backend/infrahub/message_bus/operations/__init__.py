@@ -43,7 +43,9 @@ COMMAND_MAP = {
     "git.repository.pull_read_only": git.repository.pull_read_only,
     "git.repository.merge": git.repository.merge,
     "refresh.registry.branches": refresh.registry.branches,
+    "refresh.registry.permissions": refresh.registry.permissions,
     "refresh.registry.rebased_branch": refresh.registry.rebased_branch,
+    "refresh.registry.subscriptions": refresh.registry.subscriptions,
     "refresh.webhook.configuration": refresh.webhook.configuration,
     "request.diff.refresh": requests.diff.refresh,
     "request.diff.update": requests.diff.update,
@@ -50,6 +50,7 @@ async def merge(message: messages.EventBranchMerge, service: InfrahubServices) -
 
     events: List[InfrahubMessage] = [
         messages.RefreshRegistryBranches(),
+        messages.RefreshRegistrySubscriptions(branch=message.target_branch, all_nodes=True),
         messages.TriggerArtifactDefinitionGenerate(branch=message.target_branch),
         messages.TriggerGeneratorDefinitionRun(branch=message.target_branch),
     ]
@@ -83,6 +84,7 @@ async def rebased(message: messages.EventBranchRebased, service: InfrahubService
 
     events: List[InfrahubMessage] = [
         messages.RefreshRegistryRebasedBranch(branch=message.branch),
+        messages.RefreshRegistrySubscriptions(branch=message.branch, all_nodes=True),
     ]
     if message.ipam_node_details:
         await service.workflow.submit_workflow(
@@ -27,8 +27,22 @@ async def mutated(
     kind_map = {
         InfrahubKind.STANDARDWEBHOOK: [messages.RefreshWebhookConfiguration()],
         InfrahubKind.CUSTOMWEBHOOK: [messages.RefreshWebhookConfiguration()],
+        InfrahubKind.ACCOUNT: [messages.RefreshRegistryPermissions()],
+        InfrahubKind.ACCOUNTGROUP: [messages.RefreshRegistryPermissions()],
+        InfrahubKind.ACCOUNTROLE: [messages.RefreshRegistryPermissions()],
+        InfrahubKind.GLOBALPERMISSION: [messages.RefreshRegistryPermissions()],
+        InfrahubKind.OBJECTPERMISSION: [messages.RefreshRegistryPermissions()],
     }
-    events.extend(kind_map.get(message.kind, []))
+    kinds = sorted({message.kind, *message.related_nodes.values()})
+    for kind in kinds:
+        for event in kind_map.get(kind, []):
+            if event not in events:
+                events.append(event)
+    events.append(
+        messages.RefreshRegistrySubscriptions(
+            branch=message.branch, kinds=kinds, node_ids=[message.node_id, *message.related_nodes.keys()]
+        )
+    )
     events.append(
         messages.TriggerWebhookActions(event_type=f"{message.kind}.{message.action}", event_data=message.data)
     )
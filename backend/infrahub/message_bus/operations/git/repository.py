@@ -3,6 +3,7 @@ from prefect import flow
 from infrahub import lock
 from infrahub.core.constants import InfrahubKind, RepositoryInternalStatus
 from infrahub.exceptions import RepositoryError
+from infrahub.git.base import run_git_operation
 from infrahub.git.repository import InfrahubReadOnlyRepository, InfrahubRepository, get_initialized_repo
 from infrahub.log import get_logger
 from infrahub.message_bus import messages
@@ -180,7 +181,7 @@ async def merge(message: messages.GitRepositoryMerge, service: InfrahubServices)
         repo_main.internal_status.value = RepositoryInternalStatus.ACTIVE.value
         repo_main.sync_status.value = repo_source.sync_status.value
 
-        commit = repo.get_commit_value(branch_name=repo.default_branch, remote=False)
+        commit = await run_git_operation(repo.get_commit_value, branch_name=repo.default_branch, remote=False)
         repo_main.commit.value = commit
 
         await repo_main.save()
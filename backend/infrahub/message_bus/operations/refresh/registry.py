@@ -1,6 +1,8 @@
 from infrahub import lock
 from infrahub.core.registry import registry
+from infrahub.graphql.subscription.graphql_query import graphql_query_subscriptions
 from infrahub.message_bus import messages
+from infrahub.permissions.cache import permission_cache
 from infrahub.services import InfrahubServices
 from infrahub.tasks.registry import refresh_branches
 from infrahub.worker import WORKER_IDENTITY
@@ -29,3 +31,16 @@ async def rebased_branch(message: messages.RefreshRegistryRebasedBranch, service
         registry.branch[message.branch] = await registry.branch_object.get_by_name(
             name=message.branch, db=service.database
         )
+
+
+async def permissions(message: messages.RefreshRegistryPermissions, service: InfrahubServices) -> None:  # pylint: disable=unused-argument
+    # The cache of the worker at the origin of the request must also be cleared, it's not ignored
+    service.log.info("Clearing the permissions cache", worker=WORKER_IDENTITY)
+    permission_cache.clear()
+
+
+async def subscriptions(message: messages.RefreshRegistrySubscriptions, service: InfrahubServices) -> None:  # pylint: disable=unused-argument
+    # The subscriptions of the worker at the origin of the request must also be refreshed, it's not ignored
+    graphql_query_subscriptions.notify(
+        branch=message.branch, kinds=message.kinds, node_ids=message.node_ids, all_nodes=message.all_nodes
+    )
@@ -32,7 +32,7 @@ async def run(message: messages.RequestGeneratorRun, service: InfrahubServices)
         convert_query_response=message.generator_definition.convert_query_response,
     )
 
-    commit_worktree = repository.get_commit_worktree(commit=message.commit)
+    commit_worktree = await repository.get_commit_worktree(commit=message.commit)
 
     file_info = extract_repo_file_information(
         full_filename=os.path.join(commit_worktree.directory, generator_definition.file_path.as_posix()),
@@ -21,6 +21,7 @@ from infrahub.core.registry import registry
 from infrahub.core.validators.checker import schema_validators_checker
 from infrahub.core.validators.determiner import ConstraintValidatorDeterminer
 from infrahub.dependencies.registry import get_component_registry
+from infrahub.git.base import run_git_operation
 from infrahub.git.repository import InfrahubRepository, get_initialized_repo
 from infrahub.log import get_logger
 from infrahub.message_bus import InfrahubMessage, messages
@@ -630,8 +631,9 @@ async def run_tests(message: messages.RequestProposedChangeRunTests, service: In
                     service=service,
                     repository_kind=repository.kind,
                 )
-                commit = repo.get_commit_value(proposed_change.source_branch.value)
-                worktree_directory = Path(repo.get_commit_worktree(commit=commit).directory)
+                commit = await run_git_operation(repo.get_commit_value, proposed_change.source_branch.value)
+                commit_worktree = await repo.get_commit_worktree(commit=commit)
+                worktree_directory = Path(commit_worktree.directory)
 
                 return_code = await asyncio.to_thread(_execute, worktree_directory, repository, proposed_change)
                 log.info(
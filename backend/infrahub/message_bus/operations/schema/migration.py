@@ -39,7 +39,7 @@ async def path(message: SchemaMigrationPath, service: InfrahubServices) -> None:
             previous_node_schema=message.previous_node_schema,
             schema_path=message.schema_path,
         )
-        execution_result = await migration.execute(db=db, branch=message.branch)
+        execution_result = await migration.execute(db=db, branch=message.branch, checkpoints=service.cache)
 
         service.log.info(
             "schema.migration.path - completed",
@@ -55,6 +55,8 @@ async def path(message: SchemaMigrationPath, service: InfrahubServices) -> None:
                     schema_path=message.schema_path,
                     errors=execution_result.errors,
                     nbr_migrations_executed=execution_result.nbr_migrations_executed,
+                    nbr_batches=execution_result.nbr_batches,
+                    duration=execution_result.duration,
                 )
             )
             await service.reply(message=response, initiator=message)
@@ -97,7 +99,7 @@ async def schema_path_migrate(message: SchemaMigrationPathData) -> SchemaMigrati
             previous_node_schema=message.previous_node_schema,
             schema_path=message.schema_path,
         )
-        execution_result = await migration.execute(db=db, branch=message.branch)
+        execution_result = await migration.execute(db=db, branch=message.branch, checkpoints=service.cache)
 
         logger.info(f"Migration completed for {message.migration_name}")
 
@@ -114,4 +116,6 @@ async def schema_path_migrate(message: SchemaMigrationPathData) -> SchemaMigrati
             schema_path=message.schema_path,
             errors=execution_result.errors,
             nbr_migrations_executed=execution_result.nbr_migrations_executed,
+            nbr_batches=execution_result.nbr_batches,
+            duration=execution_result.duration,
         )
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from infrahub import config
+
+if TYPE_CHECKING:
+    from infrahub.permissions.constants import AssignedPermissions
+    from infrahub.permissions.local_backend import ObjectPermissionLookup
+
+
+@dataclass
+class PermissionCacheEntry:
+    permissions: AssignedPermissions
+    object_lookup: ObjectPermissionLookup
+    expires_at: float
+
+
+class PermissionCache:
+    """TTL and LRU cache of the permissions assigned to an account on a given branch.
+
+    The cache is local to the process, it's cleared on every worker when a role, a group or a permission is modified.
+    The TTL bounds the time an outdated permission can be used if a message is missed.
+    """
+
+    def __init__(self, ttl: Optional[int] = None, max_size: Optional[int] = None) -> None:
+        self._ttl = ttl
+        self._max_size = max_size
+        self._items: OrderedDict[tuple[str, str], PermissionCacheEntry] = OrderedDict()
+
+    @property
+    def ttl(self) -> int:
+        if self._ttl is not None:
+            return self._ttl
+        return config.SETTINGS.security.permission_cache_ttl
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return config.SETTINGS.security.permission_cache_size
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def get(self, account_id: str, branch_name: str) -> Optional[PermissionCacheEntry]:
+        key = (account_id, branch_name)
+        entry = self._items.get(key)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            del self._items[key]
+            return None
+
+        self._items.move_to_end(key)
+        return entry
+
+    def set(
+        self,
+        account_id: str,
+        branch_name: str,
+        permissions: AssignedPermissions,
+        object_lookup: ObjectPermissionLookup,
+    ) -> PermissionCacheEntry:
+        entry = PermissionCacheEntry(
+            permissions=permissions, object_lookup=object_lookup, expires_at=time.monotonic() + self.ttl
+        )
+        if self.ttl <= 0 or self.max_size <= 0:
+            return entry
+
+        key = (account_id, branch_name)
+        self._items[key] = entry
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+        return entry
+
+    def clear(self) -> None:
+        self._items.clear()
+
+
+permission_cache = PermissionCache()
@@ -3,10 +3,24 @@ from __future__ import annotations
 from enum import IntFlag
 from typing import TYPE_CHECKING, TypedDict
 
+from infrahub.core.constants import InfrahubKind
+
 if TYPE_CHECKING:
     from infrahub.core.account import GlobalPermission, ObjectPermission
 
 
+# Kinds of the nodes whose modifications, including the modifications of their relationships,
+# change the permissions assigned to the accounts
+PERMISSION_RELATED_KINDS = frozenset(
+    {
+        InfrahubKind.GENERICACCOUNT,
+        InfrahubKind.ACCOUNTGROUP,
+        InfrahubKind.ACCOUNTROLE,
+        InfrahubKind.BASEPERMISSION,
+    }
+)
+
+
 class AssignedPermissions(TypedDict):
     global_permissions: list[GlobalPermission]
     object_permissions: list[ObjectPermission]
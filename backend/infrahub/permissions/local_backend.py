@@ -1,19 +1,72 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable
 
 from infrahub.core.account import GlobalPermission, ObjectPermission, fetch_permissions
 from infrahub.core.constants import GlobalPermissions, PermissionDecision
 from infrahub.permissions.constants import PermissionDecisionFlag
 
 from .backend import PermissionBackend
+from .cache import permission_cache
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
     from infrahub.database import InfrahubDatabase
+    from infrahub.permissions.cache import PermissionCacheEntry
     from infrahub.permissions.constants import AssignedPermissions
 
 
+class ObjectPermissionLookup:
+    """Object permissions indexed by namespace, name and action.
+
+    A decision only depends on the permissions matching the requested namespace, name and action or their wildcards,
+    they are found with direct lookups instead of scanning all permissions and the decisions are memoized.
+    """
+
+    def __init__(
+        self,
+        permissions: list[ObjectPermission],
+        wildcard_values: list[str],
+        wildcard_actions: list[str],
+        compute_specificity: Callable[[ObjectPermission], int],
+    ) -> None:
+        self.permissions = permissions
+        self.wildcard_values = wildcard_values
+        self.wildcard_actions = wildcard_actions
+        self._index: dict[tuple[str, str, str], list[tuple[int, PermissionDecisionFlag]]] = defaultdict(list)
+        self._decisions: dict[tuple[str, str, str], PermissionDecisionFlag] = {}
+
+        for permission in permissions:
+            self._index[permission.namespace, permission.name, permission.action].append(
+                (compute_specificity(permission), PermissionDecisionFlag(value=permission.decision))
+            )
+
+    def report(self, namespace: str, name: str, action: str) -> PermissionDecisionFlag:
+        key = (namespace, name, action)
+        if key in self._decisions:
+            return self._decisions[key]
+
+        highest_specificity: int = -1
+        combined_decision = PermissionDecisionFlag.DENY
+
+        for permission_namespace in dict.fromkeys([namespace, *self.wildcard_values]):
+            for permission_name in dict.fromkeys([name, *self.wildcard_values]):
+                for permission_action in dict.fromkeys([action, *self.wildcard_actions]):
+                    for specificity, permission_decision in self._index.get(
+                        (permission_namespace, permission_name, permission_action), []
+                    ):
+                        # Keep the decision of the most specific permission if two or more permissions overlap
+                        if specificity > highest_specificity:
+                            combined_decision = permission_decision
+                            highest_specificity = specificity
+                        elif specificity == highest_specificity:
+                            combined_decision |= permission_decision
+
+        self._decisions[key] = combined_decision
+        return combined_decision
+
+
 class LocalPermissionBackend(PermissionBackend):
     wildcard_values = ["*"]
     wildcard_actions = ["any"]
@@ -30,29 +83,20 @@ class LocalPermissionBackend(PermissionBackend):
             specificity += 1
         return specificity
 
+    def compile_object_permissions(self, permissions: list[ObjectPermission]) -> ObjectPermissionLookup:
+        return ObjectPermissionLookup(
+            permissions=permissions,
+            wildcard_values=self.wildcard_values,
+            wildcard_actions=self.wildcard_actions,
+            compute_specificity=self._compute_specificity,
+        )
+
     def report_object_permission(
         self, permissions: list[ObjectPermission], namespace: str, name: str, action: str
     ) -> PermissionDecisionFlag:
         """Given a set of permissions, return the permission decision for a given kind and action."""
-        highest_specificity: int = -1
-        combined_decision = PermissionDecisionFlag.DENY
-
-        for permission in permissions:
-            if (
-                permission.namespace in [namespace, *self.wildcard_values]
-                and permission.name in [name, *self.wildcard_values]
-                and permission.action in [action, *self.wildcard_actions]
-            ):
-                permission_decision = PermissionDecisionFlag(value=permission.decision)
-                # Compute the specifity of a permission to keep the decision of the most specific if two or more permissions overlap
-                specificity = self._compute_specificity(permission=permission)
-                if specificity > highest_specificity:
-                    combined_decision = permission_decision
-                    highest_specificity = specificity
-                elif specificity == highest_specificity:
-                    combined_decision |= permission_decision
-
-        return combined_decision
+        lookup = self.compile_object_permissions(permissions=permissions)
+        return lookup.report(namespace=namespace, name=name, action=action)
 
     def resolve_object_permission(
         self, permissions: list[ObjectPermission], permission_to_check: ObjectPermission
@@ -82,13 +126,30 @@ class LocalPermissionBackend(PermissionBackend):
 
         return grant_permission
 
+    async def load_permission_entry(
+        self, db: InfrahubDatabase, account_id: str, branch: Branch
+    ) -> PermissionCacheEntry:
+        """Return the permissions of an account with the lookup table of its object permissions, from the cache if possible."""
+        entry = permission_cache.get(account_id=account_id, branch_name=branch.name)
+        if entry is None:
+            permissions = await fetch_permissions(db=db, account_id=account_id, branch=branch)
+            entry = permission_cache.set(
+                account_id=account_id,
+                branch_name=branch.name,
+                permissions=permissions,
+                object_lookup=self.compile_object_permissions(permissions=permissions["object_permissions"]),
+            )
+        return entry
+
     async def load_permissions(self, db: InfrahubDatabase, account_id: str, branch: Branch) -> AssignedPermissions:
-        return await fetch_permissions(db=db, account_id=account_id, branch=branch)
+        entry = await self.load_permission_entry(db=db, account_id=account_id, branch=branch)
+        return entry.permissions
 
     async def has_permission(
         self, db: InfrahubDatabase, account_id: str, permission: GlobalPermission | ObjectPermission, branch: Branch
     ) -> bool:
-        granted_permissions = await self.load_permissions(db=db, account_id=account_id, branch=branch)
+        entry = await self.load_permission_entry(db=db, account_id=account_id, branch=branch)
+        granted_permissions = entry.permissions
         is_super_admin = self.resolve_global_permission(
             permissions=granted_permissions["global_permissions"],
             permission_to_check=GlobalPermission(
@@ -104,9 +165,8 @@ class LocalPermissionBackend(PermissionBackend):
                 or is_super_admin
             )
 
-        return (
-            self.resolve_object_permission(
-                permissions=granted_permissions["object_permissions"], permission_to_check=permission
-            )
-            or is_super_admin
+        required_decision = PermissionDecisionFlag(value=permission.decision)
+        combined_decision = entry.object_lookup.report(
+            namespace=permission.namespace, name=permission.name, action=permission.action
         )
+        return combined_decision & required_decision == required_decision or is_super_admin
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING
 
 from infrahub.core.account import GlobalPermission
 from infrahub.core.constants import GlobalPermissions, PermissionDecision
-from infrahub.permissions.constants import AssignedPermissions, PermissionDecisionFlag
+from infrahub.permissions.constants import PermissionDecisionFlag
 from infrahub.permissions.local_backend import LocalPermissionBackend
 
 if TYPE_CHECKING:
@@ -12,13 +12,12 @@ if TYPE_CHECKING:
     from infrahub.core.branch import Branch
     from infrahub.core.schema import MainSchemaTypes
     from infrahub.database import InfrahubDatabase
-    from infrahub.permissions.backend import PermissionBackend
+    from infrahub.permissions.local_backend import ObjectPermissionLookup
     from infrahub.permissions.types import KindPermissions
 
 
 def get_permission_report(
-    backend: PermissionBackend,
-    permissions: AssignedPermissions,
+    object_lookup: ObjectPermissionLookup,
     node: MainSchemaTypes,
     action: str,
     is_super_admin: bool = False,
@@ -27,9 +26,7 @@ def get_permission_report(
     if is_super_admin:
         return PermissionDecisionFlag.ALLOW_ALL
 
-    decision = backend.report_object_permission(
-        permissions=permissions["object_permissions"], namespace=node.namespace, name=node.name, action=action
-    )
+    decision = object_lookup.report(namespace=node.namespace, name=node.name, action=action)
 
     # What do we do if edit default branch global permission is set?
     # if can_edit_default_branch:
@@ -42,7 +39,10 @@ async def report_schema_permissions(
     db: InfrahubDatabase, schemas: list[MainSchemaTypes], account_session: AccountSession, branch: Branch
 ) -> list[KindPermissions]:
     perm_backend = LocalPermissionBackend()
-    permissions = await perm_backend.load_permissions(db=db, account_id=account_session.account_id, branch=branch)
+    permission_entry = await perm_backend.load_permission_entry(
+        db=db, account_id=account_session.account_id, branch=branch
+    )
+    permissions = permission_entry.permissions
 
     is_super_admin = perm_backend.resolve_global_permission(
         permissions=permissions["global_permissions"],
@@ -66,32 +66,28 @@ async def report_schema_permissions(
             {
                 "kind": node.kind,
                 "create": get_permission_report(
-                    backend=perm_backend,
-                    permissions=permissions,
+                    object_lookup=permission_entry.object_lookup,
                     node=node,
                     action="create",
                     is_super_admin=is_super_admin,
                     can_edit_default_branch=can_edit_default_branch,
                 ),
                 "delete": get_permission_report(
-                    backend=perm_backend,
-                    permissions=permissions,
+                    object_lookup=permission_entry.object_lookup,
                     node=node,
                     action="delete",
                     is_super_admin=is_super_admin,
                     can_edit_default_branch=can_edit_default_branch,
                 ),
                 "update": get_permission_report(
-                    backend=perm_backend,
-                    permissions=permissions,
+                    object_lookup=permission_entry.object_lookup,
                     node=node,
                     action="update",
                     is_super_admin=is_super_admin,
                     can_edit_default_branch=can_edit_default_branch,
                 ),
                 "view": get_permission_report(
-                    backend=perm_backend,
-                    permissions=permissions,
+                    object_lookup=permission_entry.object_lookup,
                     node=node,
                     action="view",
                     is_super_admin=is_super_admin,
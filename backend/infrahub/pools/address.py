@@ -1,6 +1,14 @@
+from __future__ import annotations
+
+import ipaddress
+from typing import TYPE_CHECKING, Iterable
+
 from netaddr import IPNetwork, IPSet
 
-from infrahub.core.ipam.constants import IPAddressType, IPNetworkType
+from infrahub.pools.number import NumberAllocator
+
+if TYPE_CHECKING:
+    from infrahub.core.ipam.constants import IPAddressType, IPNetworkType
 
 
 def get_available(network: IPNetworkType, addresses: list[IPAddressType], is_pool: bool) -> IPSet:
@@ -14,3 +22,55 @@ def get_available(network: IPNetworkType, addresses: list[IPAddressType], is_poo
             reserved.append(IPNetwork(f"{str(network.broadcast_address)}/{network.max_prefixlen}"))
 
     return pool - IPSet(reserved)
+
+
+class IPAddressAllocator:
+    """Free addresses of a prefix, stored as ranges of consecutive addresses.
+
+    Like get_available, the network address and the IPv4 broadcast address are not available if the prefix is not a pool.
+    """
+
+    def __init__(self, network: IPNetworkType, is_pool: bool, used: Iterable[IPAddressType] = ()) -> None:
+        self.network = network
+        self.is_pool = is_pool
+
+        reserved = [int(address.ip) for address in used]
+        if not is_pool:
+            reserved.append(int(network.network_address))
+            if network.version == 4:
+                reserved.append(int(network.broadcast_address))
+
+        self._numbers = NumberAllocator(
+            start_range=int(network.network_address), end_range=int(network.broadcast_address), used=reserved
+        )
+
+    @property
+    def free_count(self) -> int:
+        return self._numbers.free_count
+
+    def is_free(self, address: IPAddressType) -> bool:
+        return address.version == self.network.version and self._numbers.is_free(number=int(address.ip))
+
+    def reserve(self, address: IPAddressType) -> bool:
+        """Remove an address from the free addresses, return False if it was not free."""
+        return address.version == self.network.version and self._numbers.reserve(number=int(address.ip))
+
+    def release(self, address: IPAddressType) -> bool:
+        """Add an address back to the free addresses, return False if it was already free or can't be allocated."""
+        if address.version != self.network.version:
+            return False
+        if not self.is_pool and (
+            address.ip == self.network.network_address
+            or (self.network.version == 4 and address.ip == self.network.broadcast_address)
+        ):
+            return False
+        return self._numbers.release(number=int(address.ip))
+
+    def allocate_many(self, count: int, prefixlen: int) -> list[IPAddressType]:
+        """Reserve and return the next free addresses with the given prefix length, fewer than requested if the prefix is full."""
+        address_class = type(self.network.network_address)
+        addresses: list[IPAddressType] = []
+        for number in self._numbers.get_next_many(count=count):
+            self._numbers.reserve(number=number)
+            addresses.append(ipaddress.ip_interface(f"{address_class(number)}/{prefixlen}"))
+        return addresses
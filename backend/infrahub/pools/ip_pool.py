@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+import ipaddress
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Optional, Union
+
+from infrahub.core.cache_sync import get_sync_since, is_full_sync_required
+from infrahub.core.ipam.constants import AllIPTypes, IPAddressType, IPNetworkType
+from infrahub.core.query.ipam import (
+    IPNodeBranchAgnosticValuesQuery,
+    IPNodeChangesQuery,
+    IPNodeOverlapsQuery,
+    get_ip_addresses,
+    get_subnets,
+)
+from infrahub.core.timestamp import Timestamp
+from infrahub.exceptions import ValidationError
+from infrahub.pools.address import IPAddressAllocator
+from infrahub.pools.prefix import IPPrefixAllocator
+
+if TYPE_CHECKING:
+    from infrahub.core.branch import Branch
+    from infrahub.core.node import Node
+    from infrahub.database import InfrahubDatabase
+
+
+@dataclass
+class IPResourceAllocator:
+    """Free space of one resource of a pool, with the IP prefixes or IP addresses using it indexed by id.
+
+    The values allocated by this worker are pending until the node using them is found in the database.
+    """
+
+    network: IPNetworkType
+    allocator: Union[IPAddressAllocator, IPPrefixAllocator]
+    used: dict[str, AllIPTypes] = field(default_factory=dict)
+    pending: dict[AllIPTypes, Timestamp] = field(default_factory=dict)
+
+    @property
+    def is_address(self) -> bool:
+        return isinstance(self.allocator, IPAddressAllocator)
+
+    def contains(self, ip_value: AllIPTypes) -> bool:
+        if ip_value.version != self.network.version:
+            return False
+        if isinstance(ip_value, IPAddressType):
+            return self.is_address and ip_value.ip in self.network
+        return not self.is_address and ip_value.prefixlen > self.network.prefixlen and ip_value.subnet_of(self.network)  # type: ignore[arg-type]
+
+    def allocate_many(self, count: int, prefixlen: int) -> list[AllIPTypes]:
+        values: list[AllIPTypes] = self.allocator.allocate_many(count=count, prefixlen=prefixlen)  # type: ignore[assignment]
+        allocated_at = Timestamp()
+        for ip_value in values:
+            self.pending[ip_value] = allocated_at
+        return values
+
+    def release(self, ip_value: AllIPTypes) -> bool:
+        self.pending.pop(ip_value, None)
+        return self.allocator.release(ip_value)  # type: ignore[arg-type]
+
+    def release_expired(self, before: Timestamp) -> None:
+        """Release the values allocated before this time and still not used, their allocation has been rolled back."""
+        for ip_value, allocated_at in list(self.pending.items()):
+            if allocated_at < before:
+                self.release(ip_value=ip_value)
+
+    def update(self, node_ids: Iterable[str], values: dict[str, list[AllIPTypes]]) -> bool:
+        """Reserve the new values of modified nodes, return False if a node using this resource has been modified or removed.
+
+        All the nodes are processed even if one of them has been modified or removed,
+        so the pending values found in the database are confirmed before the resource is loaded again.
+        """
+        is_valid = True
+        for node_id in node_ids:
+            new_values = [ip_value for ip_value in values.get(node_id, []) if self.contains(ip_value=ip_value)]
+            current_value = self.used.get(node_id)
+            if current_value is not None and current_value not in new_values:
+                is_valid = False
+                continue
+
+            for ip_value in new_values:
+                self.pending.pop(ip_value, None)
+                self.allocator.reserve(ip_value)  # type: ignore[arg-type]
+            if new_values and current_value is None:
+                self.used[node_id] = new_values[0]
+        return is_valid
+
+
+@dataclass
+class IPPoolAllocator:
+    """Free space of all the resources of an IP address pool or an IP prefix pool, in the order of the resources."""
+
+    signature: tuple
+    synced_at: Timestamp
+    full_synced_at: Timestamp
+    resources: list[IPResourceAllocator] = field(default_factory=list)
+
+    @property
+    def namespace_id(self) -> str:
+        return self.signature[0]
+
+    @property
+    def is_address(self) -> bool:
+        return self.signature[1]
+
+    def allocate_many(self, count: int, prefixlen: Optional[int] = None) -> list[AllIPTypes]:
+        """Reserve the next values available, fewer than requested if the pool is full.
+
+        The resources are used one after the other, the prefix length of an address defaults to the one of its resource.
+        """
+        values: list[AllIPTypes] = []
+        for resource in self.resources:
+            if len(values) >= count:
+                break
+
+            prefix_length = prefixlen or resource.network.prefixlen
+            if (
+                resource.is_address
+                and not resource.network.prefixlen <= prefix_length <= resource.network.max_prefixlen
+            ):
+                self.release(values=values)
+                raise ValidationError(input_value="Invalid prefix length for current selected prefix")
+
+            values.extend(resource.allocate_many(count=count - len(values), prefixlen=prefix_length))
+        return values
+
+    def release(self, values: Iterable[AllIPTypes]) -> None:
+        """Make values allocated by this worker available again, if they are not used in the end."""
+        for ip_value in values:
+            for resource in self.resources:
+                if resource.contains(ip_value=ip_value) and resource.release(ip_value=ip_value):
+                    break
+
+    def reserve(self, values: Iterable[AllIPTypes]) -> None:
+        """Mark values found in the database as used."""
+        for ip_value in values:
+            for resource in self.resources:
+                if resource.contains(ip_value=ip_value):
+                    resource.pending.pop(ip_value, None)
+                    resource.allocator.reserve(ip_value)  # type: ignore[arg-type]
+
+    async def get_overlaps(self, db: InfrahubDatabase, branch: Branch, values: list[AllIPTypes]) -> list[AllIPTypes]:
+        """Return the IP prefixes or the IP addresses of the database overlapping with values allocated by this worker.
+
+        A node committed more than the synchronization margin after its time isn't found by the synchronization,
+        the allocated values are checked before being used.
+        """
+        ip_values: dict[AllIPTypes, int] = {}
+        for ip_value in values:
+            for resource in self.resources:
+                if resource.contains(ip_value=ip_value):
+                    ip_values[ip_value] = resource.network.prefixlen
+                    break
+
+        query = await IPNodeOverlapsQuery.init(
+            db=db, branch=branch, ip_values=ip_values, is_address=self.is_address, namespace=self.namespace_id
+        )
+        await query.execute(db=db)
+
+        overlaps: list[AllIPTypes] = []
+        for existing_values in query.get_overlaps().values():
+            for value in existing_values:
+                overlaps.append(ipaddress.ip_interface(value) if self.is_address else ipaddress.ip_network(value))
+        return overlaps
+
+
+class IPPoolAllocatorCache:
+    """Cache of the free space of each IP address pool and IP prefix pool, indexed by pool and by branch.
+
+    Like the allocation, the synchronization considers the IP prefixes and IP addresses of all the branches.
+    After the first load, only the nodes modified since the previous synchronization are loaded again, a resource
+    is loaded again completely only when a node it contains is modified or deleted.
+    All the resources are loaded again every FULL_SYNC_INTERVAL seconds, to find the nodes committed more than
+    the synchronization margin after their time.
+    """
+
+    def __init__(self) -> None:
+        self._items: dict[tuple[str, str], IPPoolAllocator] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def get(self, db: InfrahubDatabase, pool: Node, branch: Branch, is_address: bool) -> IPPoolAllocator:
+        resources = await pool.resources.get_peers(db=db)  # type: ignore[attr-defined]
+        ip_namespace = await pool.ip_namespace.get_peer(db=db)  # type: ignore[attr-defined]
+        resource_values = [
+            (
+                ipaddress.ip_network(resource.prefix.value),  # type: ignore[attr-defined]
+                bool(resource.is_pool.value) if is_address else False,  # type: ignore[attr-defined]
+            )
+            for resource in resources.values()
+        ]
+        signature = (ip_namespace.id, is_address, tuple(resource_values))
+
+        key = (pool.get_id(), branch.name)
+        cached = self._items.get(key)
+        if cached and cached.signature != signature:
+            cached = None
+
+        synced_at = Timestamp()
+        if cached is None:
+            cached = IPPoolAllocator(signature=signature, synced_at=synced_at, full_synced_at=synced_at)
+            for network, is_pool in resource_values:
+                cached.resources.append(
+                    await self._load_resource(
+                        db=db,
+                        branch=branch,
+                        namespace=ip_namespace,
+                        network=network,
+                        is_pool=is_pool,
+                        is_address=is_address,
+                    )
+                )
+            self._items[key] = cached
+            return cached
+
+        since = get_sync_since(synced_at=cached.synced_at)
+        if is_full_sync_required(full_synced_at=cached.full_synced_at):
+            for index, resource in enumerate(cached.resources):
+                network, is_pool = resource_values[index]
+                cached.resources[index] = await self._reload_resource(
+                    db=db,
+                    branch=branch,
+                    namespace=ip_namespace,
+                    network=network,
+                    is_pool=is_pool,
+                    is_address=is_address,
+                    resource=resource,
+                )
+            cached.full_synced_at = synced_at
+        else:
+            changes_query = await IPNodeChangesQuery.init(db=db, branch=branch, since=since)
+            await changes_query.execute(db=db)
+            changed_ids = list(changes_query.get_changes())
+
+            if changed_ids:
+                values_query = await IPNodeBranchAgnosticValuesQuery.init(
+                    db=db, branch=branch, node_ids=changed_ids, at=synced_at
+                )
+                await values_query.execute(db=db)
+                values: dict[str, list[AllIPTypes]] = defaultdict(list)
+                for node in values_query.get_nodes():
+                    if node.namespace_id == ip_namespace.id:
+                        values[node.id].append(node.ip_value)
+
+                for index, resource in enumerate(cached.resources):
+                    if not resource.update(node_ids=changed_ids, values=values):
+                        network, is_pool = resource_values[index]
+                        cached.resources[index] = await self._reload_resource(
+                            db=db,
+                            branch=branch,
+                            namespace=ip_namespace,
+                            network=network,
+                            is_pool=is_pool,
+                            is_address=is_address,
+                            resource=resource,
+                        )
+
+        for resource in cached.resources:
+            resource.release_expired(before=since)
+        cached.synced_at = synced_at
+
+        return cached
+
+    @classmethod
+    async def _reload_resource(
+        cls,
+        db: InfrahubDatabase,
+        branch: Branch,
+        namespace: Node,
+        network: IPNetworkType,
+        is_pool: bool,
+        is_address: bool,
+        resource: IPResourceAllocator,
+    ) -> IPResourceAllocator:
+        loaded_resource = await cls._load_resource(
+            db=db, branch=branch, namespace=namespace, network=network, is_pool=is_pool, is_address=is_address
+        )
+        # The values allocated by this worker and not found in the database might still be created
+        loaded_values = set(loaded_resource.used.values())
+        for ip_value, allocated_at in resource.pending.items():
+            if ip_value in loaded_values:
+                continue
+            loaded_resource.allocator.reserve(ip_value)  # type: ignore[arg-type]
+            loaded_resource.pending[ip_value] = allocated_at
+        return loaded_resource
+
+    @staticmethod
+    async def _load_resource(
+        db: InfrahubDatabase, branch: Branch, namespace: Node, network: IPNetworkType, is_pool: bool, is_address: bool
+    ) -> IPResourceAllocator:
+        if is_address:
+            addresses = await get_ip_addresses(
+                db=db, ip_prefix=network, namespace=namespace, branch=branch, branch_agnostic=True
+            )
+            return IPResourceAllocator(
+                network=network,
+                allocator=IPAddressAllocator(
+                    network=network, is_pool=is_pool, used=[address.address for address in addresses]
+                ),
+                used={address.id: address.address for address in addresses},
+            )
+
+        subnets = await get_subnets(db=db, ip_prefix=network, namespace=namespace, branch=branch, branch_agnostic=True)
+        return IPResourceAllocator(
+            network=network,
+            allocator=IPPrefixAllocator(network=network, used=[subnet.prefix for subnet in subnets]),
+            used={subnet.id: subnet.prefix for subnet in subnets},
+        )
+
+    def invalidate(self, pool_id: Optional[str] = None) -> None:
+        """Remove the allocators of a given pool or of all the pools if no pool is provided."""
+        if pool_id is None:
+            self._items.clear()
+            return
+
+        for key in [key for key in self._items if key[0] == pool_id]:
+            del self._items[key]
+
+
+ip_pool_allocator_cache = IPPoolAllocatorCache()
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Iterable, Optional, Union
 
-from infrahub.core.query.resource_manager import NumberPoolGetAllocated
+from infrahub import config
+from infrahub.core.cache_sync import get_sync_since, is_full_sync_required
+from infrahub.core.query.resource_manager import NumberPoolGetAllocated, NumberPoolGetUsed
 from infrahub.core.registry import registry
+from infrahub.core.timestamp import Timestamp
 
 if TYPE_CHECKING:
     from infrahub.core.branch import Branch
-    from infrahub.core.protocols import CoreNode
-    from infrahub.core.timestamp import Timestamp
+    from infrahub.core.protocols import CoreNode, CoreNumberPool
     from infrahub.database import InfrahubDatabase
 
 
@@ -65,3 +69,211 @@ class NumberUtilizationGetter:
     @property
     def total_pool_size(self) -> int:
         return self.end_range - self.start_range + 1
+
+
+class NumberAllocator:
+    """Free numbers of a pool, stored as a sorted list of non overlapping ranges of consecutive numbers.
+
+    The memory used depends on the fragmentation of the pool and not on its size, finding the next free numbers
+    doesn't require to go over all the numbers already used.
+
+    The numbers allocated by this worker are pending until their reservation is found in the database.
+    """
+
+    def __init__(self, start_range: int, end_range: int, used: Iterable[int] = ()) -> None:
+        self.start_range = start_range
+        self.end_range = end_range
+        self.pending: dict[int, Timestamp] = {}
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+
+        next_free = start_range
+        for number in sorted({number for number in used if start_range <= number <= end_range}):
+            if number > next_free:
+                self._starts.append(next_free)
+                self._ends.append(number - 1)
+            next_free = number + 1
+        if next_free <= end_range:
+            self._starts.append(next_free)
+            self._ends.append(end_range)
+
+    @property
+    def free_count(self) -> int:
+        return sum(end - start + 1 for start, end in zip(self._starts, self._ends))
+
+    @property
+    def free_ranges(self) -> list[tuple[int, int]]:
+        return list(zip(self._starts, self._ends))
+
+    def is_free(self, number: int) -> bool:
+        index = bisect_right(self._starts, number) - 1
+        return index >= 0 and number <= self._ends[index]
+
+    def get_next(self) -> Optional[int]:
+        if not self._starts:
+            return None
+        return self._starts[0]
+
+    def get_next_many(self, count: int) -> list[int]:
+        """Return the next free numbers, fewer than requested if the pool doesn't have enough free numbers."""
+        numbers: list[int] = []
+        for start, end in zip(self._starts, self._ends):
+            numbers.extend(range(start, min(end, start + count - len(numbers) - 1) + 1))
+            if len(numbers) >= count:
+                break
+        return numbers
+
+    def allocate_many(self, count: int) -> list[int]:
+        """Reserve the next free numbers as pending, fewer than requested if the pool doesn't have enough free numbers."""
+        numbers = self.get_next_many(count=count)
+        allocated_at = Timestamp()
+        for number in numbers:
+            self.reserve(number=number)
+            self.pending[number] = allocated_at
+        return numbers
+
+    def reserve(self, number: int) -> bool:
+        """Remove a number from the free ranges, return False if it was not free.
+
+        A pending number is confirmed, it won't be released when its allocation expires.
+        """
+        self.pending.pop(number, None)
+        index = bisect_right(self._starts, number) - 1
+        if index < 0 or number > self._ends[index]:
+            return False
+
+        start, end = self._starts[index], self._ends[index]
+        if start == end:
+            del self._starts[index]
+            del self._ends[index]
+        elif number == start:
+            self._starts[index] = number + 1
+        elif number == end:
+            self._ends[index] = number - 1
+        else:
+            self._ends[index] = number - 1
+            self._starts.insert(index + 1, number + 1)
+            self._ends.insert(index + 1, end)
+        return True
+
+    def release_expired(self, before: Timestamp) -> None:
+        """Release the numbers allocated before this time and still not reserved, their allocation has been rolled back."""
+        for number, allocated_at in list(self.pending.items()):
+            if allocated_at < before:
+                self.release(number=number)
+
+    def release(self, number: int) -> bool:
+        """Add a number back to the free ranges, return False if it was already free or outside of the pool."""
+        self.pending.pop(number, None)
+        if not self.start_range <= number <= self.end_range or self.is_free(number=number):
+            return False
+
+        index = bisect_right(self._starts, number)
+        merge_previous = index > 0 and self._ends[index - 1] == number - 1
+        merge_next = index < len(self._starts) and self._starts[index] == number + 1
+        if merge_previous and merge_next:
+            self._ends[index - 1] = self._ends[index]
+            del self._starts[index]
+            del self._ends[index]
+        elif merge_previous:
+            self._ends[index - 1] = number
+        elif merge_next:
+            self._starts[index] = number
+        else:
+            self._starts.insert(index, number)
+            self._ends.insert(index, number)
+        return True
+
+
+@dataclass
+class CachedNumberAllocator:
+    allocator: NumberAllocator
+    synced_at: Timestamp
+    full_synced_at: Timestamp
+
+
+class NumberAllocatorCache:
+    """Cache of the free numbers of each number pool.
+
+    The reservations are stored in the database and can be done by other workers, the cached allocator of a pool
+    is synchronized before each use by only loading the reservations created since the previous synchronization.
+    The numbers allocated by this worker whose reservation is still not found after the synchronization margin
+    are released, the transaction that was reserving them has been rolled back.
+
+    A reservation committed more than the synchronization margin after its time is only found by the next full load,
+    done every FULL_SYNC_INTERVAL seconds, until then the reservation of a number checks that it isn't already reserved.
+    The allocators of the least recently used pools are removed when more than max_size pools are cached.
+    """
+
+    def __init__(self, max_size: Optional[int] = None) -> None:
+        self._items: OrderedDict[str, CachedNumberAllocator] = OrderedDict()
+        self._max_size = max_size
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return config.SETTINGS.api.number_pool_cache_size
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def get(self, db: InfrahubDatabase, pool: CoreNumberPool, branch: Branch) -> NumberAllocator:
+        start_range = int(pool.start_range.value)  # type: ignore[attr-defined]
+        end_range = int(pool.end_range.value)  # type: ignore[attr-defined]
+
+        cached = self._items.get(pool.get_id())
+        if cached:
+            self._items.move_to_end(pool.get_id())
+        if cached and (cached.allocator.start_range, cached.allocator.end_range) != (start_range, end_range):
+            cached = None
+
+        synced_at = Timestamp()
+        is_full_sync = cached is None or is_full_sync_required(full_synced_at=cached.full_synced_at)
+        since = get_sync_since(synced_at=cached.synced_at) if cached else None
+        query = await NumberPoolGetUsed.init(
+            db=db,
+            branch=branch,
+            pool=pool,
+            since=None if is_full_sync else since,
+            at=synced_at,
+            branch_agnostic=True,
+        )
+        await query.execute(db=db)
+        used = [
+            number
+            for number in (result.get_as_optional_type("av.value", return_type=int) for result in query.results)
+            if number is not None
+        ]
+
+        if cached and since and not is_full_sync:
+            for number in used:
+                cached.allocator.reserve(number=number)
+            cached.allocator.release_expired(before=since)
+            cached.synced_at = synced_at
+            return cached.allocator
+
+        allocator = NumberAllocator(start_range=start_range, end_range=end_range, used=used)
+        if cached and since:
+            # The numbers allocated by this worker whose transaction may still be running remain pending
+            for number, allocated_at in cached.allocator.pending.items():
+                if allocated_at >= since and allocator.reserve(number=number):
+                    allocator.pending[number] = allocated_at
+        self._items[pool.get_id()] = CachedNumberAllocator(
+            allocator=allocator, synced_at=synced_at, full_synced_at=synced_at
+        )
+        self._items.move_to_end(pool.get_id())
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+        return allocator
+
+    def invalidate(self, pool_id: Optional[str] = None) -> None:
+        """Remove the allocator of a given pool or of all the pools if no pool is provided."""
+        if pool_id is None:
+            self._items.clear()
+            return
+        self._items.pop(pool_id, None)
+
+
+number_allocator_cache = NumberAllocatorCache()
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import ipaddress
+from bisect import bisect_left, insort
 from collections import OrderedDict, defaultdict
 from ipaddress import IPv4Network, IPv6Network
-from typing import Optional, Union
+from typing import Iterable, Optional, Union
 
 
 class PrefixPool:
@@ -172,3 +173,123 @@ class PrefixPool:
         # except:
         #     log.warn("Unable to remove %s from list of available subnets" % str(subnet))
         #     return False
+
+
+class IPPrefixAllocator:
+    """Free subnets of a prefix, stored as aligned blocks indexed by prefix length like a buddy allocator.
+
+    A subnet is carved out of the smallest free block large enough, which is split in halves down to the requested size,
+    and a released subnet is merged back with its free buddy. Like PrefixPool, the prefix itself can't be allocated.
+    """
+
+    def __init__(self, network: Union[IPv4Network, IPv6Network], used: Iterable[Union[IPv4Network, IPv6Network]] = ()):
+        self.network = network
+        # The free blocks of each prefix length, sorted by address
+        self._blocks: dict[int, list[int]] = defaultdict(list)
+
+        if network.prefixlen < network.max_prefixlen:
+            start = int(network.network_address)
+            self._blocks[network.prefixlen + 1] = [start, start + self._size(network.prefixlen + 1)]
+
+        for subnet in used:
+            self.reserve(subnet=subnet)
+
+    def _size(self, prefixlen: int) -> int:
+        return 1 << (self.network.max_prefixlen - prefixlen)
+
+    def _is_subnet(self, subnet: Union[IPv4Network, IPv6Network]) -> bool:
+        return (
+            subnet.version == self.network.version
+            and subnet.prefixlen > self.network.prefixlen
+            and subnet.subnet_of(self.network)  # type: ignore[arg-type]
+        )
+
+    def _remove_block(self, start: int, prefixlen: int) -> bool:
+        blocks = self._blocks[prefixlen]
+        index = bisect_left(blocks, start)
+        if index < len(blocks) and blocks[index] == start:
+            del blocks[index]
+            return True
+        return False
+
+    def _remove_blocks_within(self, start: int, prefixlen: int) -> bool:
+        end = start + self._size(prefixlen)
+        removed = False
+        for block_prefixlen in range(prefixlen + 1, self.network.max_prefixlen + 1):
+            blocks = self._blocks[block_prefixlen]
+            first, last = bisect_left(blocks, start), bisect_left(blocks, end)
+            if first < last:
+                del blocks[first:last]
+                removed = True
+        return removed
+
+    def _find_block(self, start: int, prefixlen: int) -> Optional[int]:
+        """Return the prefix length of the free block containing this subnet."""
+        for block_prefixlen in range(prefixlen, self.network.prefixlen, -1):
+            block_start = start & ~(self._size(block_prefixlen) - 1)
+            blocks = self._blocks[block_prefixlen]
+            index = bisect_left(blocks, block_start)
+            if index < len(blocks) and blocks[index] == block_start:
+                return block_prefixlen
+        return None
+
+    @property
+    def free_size(self) -> int:
+        return sum(len(blocks) * self._size(prefixlen) for prefixlen, blocks in self._blocks.items())
+
+    def is_free(self, subnet: Union[IPv4Network, IPv6Network]) -> bool:
+        return self._is_subnet(subnet) and self._find_block(int(subnet.network_address), subnet.prefixlen) is not None
+
+    def reserve(self, subnet: Union[IPv4Network, IPv6Network]) -> bool:
+        """Remove a subnet from the free blocks, return False if no part of it was free."""
+        if not self._is_subnet(subnet):
+            return False
+
+        start = int(subnet.network_address)
+        block_prefixlen = self._find_block(start, subnet.prefixlen)
+        if block_prefixlen is None:
+            # Some smaller blocks might be free within the subnet
+            return self._remove_blocks_within(start, subnet.prefixlen)
+
+        self._remove_block(start & ~(self._size(block_prefixlen) - 1), block_prefixlen)
+        for split_prefixlen in range(block_prefixlen + 1, subnet.prefixlen + 1):
+            # Keep the half of the block that doesn't contain the subnet
+            buddy_start = (start & ~(self._size(split_prefixlen) - 1)) ^ self._size(split_prefixlen)
+            insort(self._blocks[split_prefixlen], buddy_start)
+        return True
+
+    def release(self, subnet: Union[IPv4Network, IPv6Network]) -> bool:
+        """Add a subnet back to the free blocks, return False if it was already free or outside of the prefix."""
+        if not self._is_subnet(subnet) or self.is_free(subnet=subnet):
+            return False
+
+        start, prefixlen = int(subnet.network_address), subnet.prefixlen
+        self._remove_blocks_within(start, prefixlen)
+        while prefixlen > self.network.prefixlen + 1 and self._remove_block(start ^ self._size(prefixlen), prefixlen):
+            start &= ~self._size(prefixlen)
+            prefixlen -= 1
+        insort(self._blocks[prefixlen], start)
+        return True
+
+    def allocate(self, prefixlen: int) -> Optional[Union[IPv4Network, IPv6Network]]:
+        """Reserve and return the first subnet of the smallest free block large enough, None if there is none."""
+        if not self.network.prefixlen < prefixlen <= self.network.max_prefixlen:
+            return None
+
+        for block_prefixlen in range(prefixlen, self.network.prefixlen, -1):
+            blocks = self._blocks[block_prefixlen]
+            if blocks:
+                subnet = type(self.network)((blocks[0], prefixlen))
+                self.reserve(subnet=subnet)
+                return subnet
+        return None
+
+    def allocate_many(self, count: int, prefixlen: int) -> list[Union[IPv4Network, IPv6Network]]:
+        """Reserve and return the next subnets with this prefix length, fewer than requested if the prefix is full."""
+        subnets: list[Union[IPv4Network, IPv6Network]] = []
+        while len(subnets) < count:
+            subnet = self.allocate(prefixlen=prefixlen)
+            if subnet is None:
+                break
+            subnets.append(subnet)
+        return subnets
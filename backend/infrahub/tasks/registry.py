@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 from infrahub import lock
 from infrahub.core import registry
+from infrahub.core.cache_sync import invalidate_branch_caches
 from infrahub.database import InfrahubDatabase
 from infrahub.log import get_logger
 from infrahub.worker import WORKER_IDENTITY
@@ -48,6 +49,7 @@ async def refresh_branches(db: InfrahubDatabase) -> None:
         for branch_name in list(registry.branch.keys()):
             if branch_name not in active_branches:
                 del registry.branch[branch_name]
+                invalidate_branch_caches(branch_name=branch_name)
                 log.info(
                     f"Removed branch {branch_name!r} from the registry", branch=branch_name, worker=WORKER_IDENTITY
                 )
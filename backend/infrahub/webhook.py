@@ -9,6 +9,7 @@ from uuid import uuid4
 from pydantic import BaseModel, ConfigDict, Field
 
 from infrahub.core.constants import InfrahubKind
+from infrahub.git.base import run_git_operation
 from infrahub.git.repository import InfrahubReadOnlyRepository, InfrahubRepository
 from infrahub.services import InfrahubServices
 
@@ -81,7 +82,7 @@ class TransformWebhook(Webhook):
             repo = await InfrahubRepository.init(id=self.repository_id, name=self.repository_name)
 
         default_branch = repo.default_branch
-        commit = repo.get_commit_value(branch_name=default_branch)
+        commit = await run_git_operation(repo.get_commit_value, branch_name=default_branch)
 
         self._payload = await repo.execute_python_transform(
             branch_name=default_branch,
@@ -0,0 +1,55 @@
+import tracemalloc
+from typing import Any, Callable
+
+from infrahub.core import registry
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.database import InfrahubDatabase
+
+
+def _measure_allocations(func: Callable[..., Any], *args: Any, **kwargs: Any) -> tuple[int, int]:
+    """Memory allocated in Python by one call, still allocated with its result and at its peak"""
+    tracemalloc.start()
+    try:
+        result = func(*args, **kwargs)
+        size, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return size, peak
+
+
+def test_schemabranch_get_duplicate(benchmark, db: InfrahubDatabase, default_branch, register_core_models_schema):
+    schema_branch = registry.schema.get_schema_branch(name=default_branch.name)
+    benchmark(schema_branch.get, name="CoreProposedChange", duplicate=True)
+    benchmark.extra_info["allocated_size"], benchmark.extra_info["allocated_peak"] = _measure_allocations(
+        schema_branch.get, name="CoreProposedChange", duplicate=True
+    )
+
+
+def test_schemabranch_get_shared(benchmark, db: InfrahubDatabase, default_branch, register_core_models_schema):
+    schema_branch = registry.schema.get_schema_branch(name=default_branch.name)
+    schema = benchmark(schema_branch.get, name="CoreProposedChange", duplicate=False)
+    assert schema is schema_branch.get(name="CoreProposedChange", duplicate=False)
+
+    benchmark.extra_info["allocated_size"], benchmark.extra_info["allocated_peak"] = _measure_allocations(
+        schema_branch.get, name="CoreProposedChange", duplicate=False
+    )
+    # The shared schema is returned without being copied
+    duplicate_size, _ = _measure_allocations(schema_branch.get, name="CoreProposedChange", duplicate=True)
+    assert benchmark.extra_info["allocated_size"] < duplicate_size
+
+
+def test_node_init(
+    aio_benchmark, benchmark, event_loop, db: InfrahubDatabase, default_branch, register_core_models_schema
+):
+    aio_benchmark(Node.init, db=db, schema="CoreProposedChange", branch=default_branch)
+    benchmark.extra_info["allocated_size"], benchmark.extra_info["allocated_peak"] = _measure_allocations(
+        event_loop.run_until_complete, Node.init(db=db, schema="CoreProposedChange", branch=default_branch)
+    )
+
+
+def test_nodemanager_query_schema_lookup(
+    aio_benchmark, db: InfrahubDatabase, default_branch, register_core_models_schema
+):
+    aio_benchmark(NodeManager.query, db=db, schema="CoreAccount", branch=default_branch)
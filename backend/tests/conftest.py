@@ -23,22 +23,28 @@ from infrahub.config import load_and_exit
 from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.constants import BranchSupportType, InfrahubKind
+from infrahub.core.hfid import hfid_index_cache
+from infrahub.core.hierarchy import hierarchy_closure_cache
 from infrahub.core.initialization import (
     create_default_branch,
     create_global_branch,
     create_ipam_namespace,
     create_root_node,
 )
+from infrahub.core.ipam.tree import ipam_tree_cache
 from infrahub.core.node import Node
 from infrahub.core.schema import SchemaRoot, core_models, internal_schema
 from infrahub.core.schema.definitions.core import core_profile_schema_definition
 from infrahub.core.schema.manager import SchemaManager
 from infrahub.core.schema.schema_branch import SchemaBranch
+from infrahub.core.search_index import search_index_cache
 from infrahub.core.utils import delete_all_nodes
 from infrahub.database import InfrahubDatabase, get_db
 from infrahub.lock import initialize_lock
 from infrahub.message_bus import InfrahubMessage, InfrahubResponse
 from infrahub.message_bus.types import MessageTTL
+from infrahub.permissions.cache import permission_cache
+from infrahub.pools.ip_pool import ip_pool_allocator_cache
 from infrahub.services import services
 from infrahub.services.adapters.message_bus import InfrahubMessageBus
 from tests.adapters.log import FakeLogger
@@ -393,6 +399,18 @@ def reload_settings_before_each_module(tmpdir_factory):
     initialize_lock(local_only=True)
 
 
+@pytest.fixture(autouse=True)
+def clear_local_caches():
+    # Permissions are created and modified directly in the database by the tests without sending any message
+    permission_cache.clear()
+    # The database is emptied between the tests without leaving any trace of the deleted edges
+    hfid_index_cache.invalidate()
+    hierarchy_closure_cache.invalidate()
+    ipam_tree_cache.invalidate()
+    ip_pool_allocator_cache.invalidate()
+    search_index_cache.invalidate()
+
+
 @pytest.fixture
 async def data_schema(db: InfrahubDatabase, default_branch: Branch) -> None:
     SCHEMA: dict[str, Any] = {
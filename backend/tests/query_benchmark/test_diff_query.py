@@ -1,9 +1,12 @@
 import inspect
+import tracemalloc
 from pathlib import Path
 
 import pytest
 
 from infrahub.core import registry
+from infrahub.core.diff.calculator import DiffCalculator
+from infrahub.core.diff.model.path import NodeUuidRange
 from infrahub.core.initialization import create_branch
 from infrahub.core.query.diff import DiffAllPathsQuery
 from infrahub.core.timestamp import Timestamp
@@ -82,3 +85,65 @@ async def test_diff(benchmark_config, car_person_schema_root, graph_generator, i
         test_label=test_label,
         graph_generator=graph_generator,
     )
+
+
+async def _get_calculator_peak_memory(calculator: DiffCalculator, chunk_size: int | None, **kwargs) -> int:
+    """Peak memory allocated in Python to calculate a diff one range of node UUIDs at a time, or at once"""
+    node_uuid_ranges = [NodeUuidRange()]
+    if chunk_size:
+        node_uuid_ranges = await calculator.get_node_uuid_ranges(
+            diff_branch=kwargs["diff_branch"],
+            from_time=kwargs["from_time"],
+            to_time=kwargs["to_time"],
+            chunk_size=chunk_size,
+        )
+
+    tracemalloc.start()
+    try:
+        for node_uuid_range in node_uuid_ranges:
+            await calculator.calculate_diff(node_uuid_range=node_uuid_range, **kwargs)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak_memory
+
+
+@pytest.mark.timeout(36000)  # 10 hours
+async def test_diff_calculator_memory_by_chunk(car_person_schema_root, increase_query_size_limit):
+    db_profiling_queries, default_branch = await start_db_and_create_default_branch(
+        neo4j_image=NEO4J_COMMUNITY_IMAGE, load_indexes=True
+    )
+    registry.schema.register_schema(schema=car_person_schema_root, branch=default_branch.name)
+    diff_branch = await create_branch(branch_name="diff_branch", db=db_profiling_queries)
+
+    nb_cars = 2000
+    chunk_size = 500
+    cars_generator = CarWithDiffInSecondBranchGenerator(
+        db=db_profiling_queries,
+        nb_persons=int(nb_cars / 10),
+        diff_ratio=0.5,
+        main_branch=default_branch,
+        diff_branch=diff_branch,
+    )
+    await cars_generator.init()
+
+    calculator = DiffCalculator(db=db_profiling_queries)
+    chunked_peaks: list[int] = []
+    for _ in range(4):
+        await cars_generator.load_data(nb_elements=nb_cars // 4)
+        diff_kwargs = {
+            "base_branch": default_branch,
+            "diff_branch": diff_branch,
+            "from_time": Timestamp(diff_branch.get_branched_from()),
+            "to_time": Timestamp(),
+        }
+        full_peak = await _get_calculator_peak_memory(calculator=calculator, chunk_size=None, **diff_kwargs)
+        chunked_peak = await _get_calculator_peak_memory(calculator=calculator, chunk_size=chunk_size, **diff_kwargs)
+        log.info(
+            f"Diff calculator peak memory, full diff: {full_peak} B, by chunk of {chunk_size} nodes: {chunked_peak} B"
+        )
+        chunked_peaks.append(chunked_peak)
+
+    # The memory depends on the size of the chunks, not on the number of nodes in the diff
+    assert chunked_peak < full_peak
+    assert max(chunked_peaks) < 2 * min(chunked_peaks)
@@ -38,6 +38,7 @@ from infrahub.core.initialization import (
     first_time_initialization,
     initialization,
 )
+from infrahub.core.migrations.graph.m017_add_edge_timestamps import add_edge_timestamps
 from infrahub.core.node import Node
 from infrahub.core.node.ipam import BuiltinIPPrefix
 from infrahub.core.node.resource_manager.ip_address_pool import CoreIPAddressPool
@@ -398,6 +399,7 @@ async def base_dataset_02(db: InfrahubDatabase, default_branch: Branch, car_pers
     """
 
     await db.execute_query(query=query, params=params)
+    await add_edge_timestamps(db=db)
 
     return params
 
@@ -618,6 +620,7 @@ async def base_dataset_12(db: InfrahubDatabase, default_branch: Branch, car_pers
     """
 
     await db.execute_query(query=query, params=params)
+    await add_edge_timestamps(db=db)
 
     return params
 
@@ -967,6 +970,7 @@ async def base_dataset_03(db: InfrahubDatabase, default_branch: Branch, person_t
     await db.execute_query(query=query_prefix + query2, params=params)
     await db.execute_query(query=query_prefix + query3, params=params)
     await db.execute_query(query=query_prefix + query4, params=params)
+    await add_edge_timestamps(db=db)
     return params
 
 
@@ -8,6 +8,7 @@ from infrahub.core.diff.data_check_synchronizer import DiffDataCheckSynchronizer
 from infrahub.core.initialization import create_branch
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
+from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.dependencies.registry import get_component_registry
 
@@ -49,3 +50,59 @@ class TestDiffCoordinator:
                 assert prop_diff.action is DiffAction.REMOVED
                 assert prop_diff.conflict is None
                 assert prop_diff.new_value is None
+
+    async def test_diff_saved_by_chunk(
+        self, db: InfrahubDatabase, default_branch: Branch, hierarchical_location_data: dict[str, Node]
+    ):
+        branch = await create_branch(db=db, branch_name="branch")
+        for rack_name in ("paris-r1", "london-r2", "seattle-r1"):
+            rack = await NodeManager.get_one(db=db, branch=branch, id=hierarchical_location_data[rack_name].id)
+            rack.status.value = "offline" if rack.status.value == "online" else "online"
+            await rack.save(db=db)
+
+        component_registry = get_component_registry()
+        diff_coordinator = await component_registry.get_component(DiffCoordinator, db=db, branch=branch)
+        mock_synchronizer = AsyncMock(spec=DiffDataCheckSynchronizer)
+        diff_coordinator.data_check_synchronizer = mock_synchronizer
+        diff_coordinator.diff_calculator.NODE_CHUNK_SIZE = 2
+        # Only the 3 racks modified on the branch are split in ranges, not all the nodes of the database
+        node_uuid_ranges = await diff_coordinator.diff_calculator.get_node_uuid_ranges(
+            diff_branch=branch, from_time=Timestamp(branch.get_branched_from()), to_time=Timestamp()
+        )
+        assert len(node_uuid_ranges) == 2
+        diff = await diff_coordinator.update_branch_diff(base_branch=default_branch, diff_branch=branch)
+
+        assert diff.num_updated == 3
+        assert diff.num_added == 0
+        assert diff.num_removed == 0
+        assert len(diff.nodes) == 0
+        mock_synchronizer.synchronize_conflicts.assert_awaited_once()
+
+        saved_diff = await diff_coordinator.diff_repo.get_one(diff_branch_name=branch.name, diff_id=diff.uuid)
+        assert saved_diff.num_updated == 3
+        nodes_by_id = {n.uuid: n for n in saved_diff.nodes}
+        expected_actions = {
+            hierarchical_location_data[name].id: action
+            for name, action in (
+                ("paris-r1", DiffAction.UPDATED),
+                ("london-r2", DiffAction.UPDATED),
+                ("seattle-r1", DiffAction.UPDATED),
+                ("paris", DiffAction.UNCHANGED),
+                ("london", DiffAction.UNCHANGED),
+                ("seattle", DiffAction.UNCHANGED),
+                ("europe", DiffAction.UNCHANGED),
+                ("north-america", DiffAction.UNCHANGED),
+            )
+        }
+        assert {node_id: node.action for node_id, node in nodes_by_id.items()} == expected_actions
+        for child_name, parent_name in (
+            ("paris-r1", "paris"),
+            ("london-r2", "london"),
+            ("seattle-r1", "seattle"),
+            ("paris", "europe"),
+            ("london", "europe"),
+            ("seattle", "north-america"),
+        ):
+            child_node = nodes_by_id[hierarchical_location_data[child_name].id]
+            parent_rel = child_node.get_relationship(name="parent")
+            assert {n.uuid for n in parent_rel.nodes} == {hierarchical_location_data[parent_name].id}
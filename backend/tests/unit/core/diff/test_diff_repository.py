@@ -192,6 +192,56 @@ class TestDiffRepositorySaveAndLoad:
         retrieved_pair = retrieved[0]
         assert retrieved_pair == enriched_diffs
 
+    async def test_save_and_retrieve_batches(self, diff_repository: DiffRepository, reset_database):
+        diff_repository.MAX_SAVE_BATCH_BYTES = 1
+        enriched_branch_diff = EnrichedRootFactory.build(
+            base_branch_name=self.base_branch_name,
+            diff_branch_name=self.diff_branch_name,
+            from_time=Timestamp(self.diff_from_time),
+            to_time=Timestamp(self.diff_to_time),
+            nodes=self._build_nodes(num_nodes=6, num_sub_fields=3),
+            tracking_id=NameTrackingId(name="the-best-diff"),
+        )
+        enriched_base_diff = EnrichedRootFactory.build(
+            base_branch_name=self.base_branch_name,
+            diff_branch_name=self.base_branch_name,
+            from_time=Timestamp(self.diff_from_time),
+            to_time=Timestamp(self.diff_to_time),
+            nodes=self._build_nodes(num_nodes=4, num_sub_fields=2),
+            tracking_id=NameTrackingId(name="the-best-diff"),
+            partner_uuid=enriched_branch_diff.uuid,
+        )
+        enriched_branch_diff.partner_uuid = enriched_base_diff.uuid
+        enriched_diffs = EnrichedDiffs(
+            base_branch_name=self.base_branch_name,
+            diff_branch_name=self.diff_branch_name,
+            base_branch_diff=enriched_base_diff,
+            diff_branch_diff=enriched_branch_diff,
+        )
+
+        # the nodes of a relationship are saved before the node linked to them
+        saved_uuids: set[tuple[str, str]] = set()
+        waves = diff_repository._get_node_create_request_waves(enriched_diffs=enriched_diffs)
+        assert len(waves) == 3
+        for wave in waves:
+            for node_create_request in wave:
+                for relationship in node_create_request.node.relationships:
+                    for child_node in relationship.nodes:
+                        assert (node_create_request.root_uuid, child_node.uuid) in saved_uuids
+            saved_uuids.update((request.root_uuid, request.node.uuid) for request in wave)
+        assert len(saved_uuids) == len(enriched_branch_diff.nodes) + len(enriched_base_diff.nodes)
+
+        await diff_repository.save(enriched_diffs=enriched_diffs)
+
+        retrieved = await diff_repository.get_pairs(
+            base_branch_name=self.base_branch_name,
+            diff_branch_name=self.diff_branch_name,
+            from_time=Timestamp(self.diff_from_time),
+            to_time=Timestamp(self.diff_to_time),
+        )
+        assert len(retrieved) == 1
+        assert retrieved[0] == enriched_diffs
+
     async def test_base_branch_name_filter(self, diff_repository: DiffRepository, reset_database):
         name_uuid_map = {name: str(uuid4()) for name in (self.base_branch_name, "more-main", "most-main")}
         for base_branch_name, root_uuid in name_uuid_map.items():
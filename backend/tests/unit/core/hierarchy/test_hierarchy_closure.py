@@ -0,0 +1,123 @@
+from infrahub.core import registry
+from infrahub.core.branch import Branch
+from infrahub.core.constants import RelationshipHierarchyDirection
+from infrahub.core.hierarchy import HierarchyClosure, HierarchyClosureCache, hierarchy_closure_cache
+from infrahub.core.manager import NodeManager
+from infrahub.core.timestamp import Timestamp
+from infrahub.database import InfrahubDatabase
+
+
+def test_hierarchy_closure():
+    closure = HierarchyClosure(branched_from=None, synced_at=Timestamp())
+    for node_id, parent_id in [("site1", "region1"), ("site2", "region1"), ("rack1", "site1"), ("rack2", "site2")]:
+        closure.set_parent(node_id=node_id, parent_id=parent_id)
+
+    assert closure.get_ancestors(node_id="rack1", max_depth=5) == ["site1", "region1"]
+    assert closure.get_ancestors(node_id="rack1", max_depth=1) == ["site1"]
+    assert sorted(closure.get_descendants(node_id="region1", max_depth=5)) == ["rack1", "rack2", "site1", "site2"]
+    assert sorted(closure.get_descendants(node_id="region1", max_depth=1)) == ["site1", "site2"]
+
+    closure.set_parent(node_id="site2", parent_id="region2")
+    assert sorted(closure.get_descendants(node_id="region1", max_depth=5)) == ["rack1", "site1"]
+    assert sorted(closure.get_descendants(node_id="region2", max_depth=5)) == ["rack2", "site2"]
+
+    closure.set_parent(node_id="rack1", parent_id=None)
+    assert closure.get_ancestors(node_id="rack1", max_depth=5) == []
+    assert closure.get_descendants(node_id="site1", max_depth=5) == []
+
+
+async def test_query_hierarchy_from_closure(db: InfrahubDatabase, hierarchical_location_data):
+    region_schema = registry.schema.get(name="LocationRegion", duplicate=False)
+    europe = hierarchical_location_data["europe"]
+
+    nodes = await NodeManager.query_hierarchy(
+        db=db, id=europe.id, direction=RelationshipHierarchyDirection.DESCENDANTS, node_schema=region_schema, filters={}
+    )
+    assert len(hierarchy_closure_cache) == 1
+    assert {node.name.value for node in nodes.values()} == {
+        "paris",
+        "london",
+        "paris-r1",
+        "paris-r2",
+        "london-r1",
+        "london-r2",
+    }
+
+    before_update = Timestamp()
+    seattle = await NodeManager.get_one(db=db, id=hierarchical_location_data["seattle"].id)
+    await seattle.parent.update(db=db, data=europe)
+    await seattle.save(db=db)
+
+    nodes = await NodeManager.query_hierarchy(
+        db=db, id=europe.id, direction=RelationshipHierarchyDirection.DESCENDANTS, node_schema=region_schema, filters={}
+    )
+    assert {node.name.value for node in nodes.values()} == {
+        "paris",
+        "london",
+        "seattle",
+        "paris-r1",
+        "paris-r2",
+        "london-r1",
+        "london-r2",
+        "seattle-r1",
+        "seattle-r2",
+    }
+    assert (
+        await NodeManager.count_hierarchy(
+            db=db,
+            id=hierarchical_location_data["seattle-r1"].id,
+            direction=RelationshipHierarchyDirection.ANCESTORS,
+            node_schema=registry.schema.get(name="LocationRack", duplicate=False),
+            filters={},
+        )
+        == 2
+    )
+
+    # The hierarchy has been modified after this time, the query falls back to the graph
+    nodes = await NodeManager.query_hierarchy(
+        db=db,
+        id=europe.id,
+        direction=RelationshipHierarchyDirection.DESCENDANTS,
+        node_schema=region_schema,
+        filters={},
+        at=before_update,
+    )
+    assert "seattle" not in {node.name.value for node in nodes.values()}
+
+
+async def test_hierarchy_closure_cache_max_size(
+    db: InfrahubDatabase, default_branch: Branch, hierarchical_location_data
+):
+    region_schema = registry.schema.get(name="LocationRegion", duplicate=False)
+    hierarchy = region_schema.get_hierarchy_schema(db=db, branch=default_branch).kind
+    europe = hierarchical_location_data["europe"]
+
+    # The cache is disabled, the relatives are resolved from the graph
+    cache = HierarchyClosureCache(max_size=0)
+    relatives = await cache.get_relatives(
+        db=db,
+        branch=default_branch,
+        hierarchy=hierarchy,
+        node_id=europe.id,
+        direction=RelationshipHierarchyDirection.DESCENDANTS,
+        at=Timestamp(),
+    )
+    assert relatives is None
+    assert len(cache) == 0
+
+    cache = HierarchyClosureCache(max_size=1)
+    relatives = await cache.get_relatives(
+        db=db,
+        branch=default_branch,
+        hierarchy=hierarchy,
+        node_id=europe.id,
+        direction=RelationshipHierarchyDirection.DESCENDANTS,
+        at=Timestamp(),
+    )
+    assert relatives is not None
+    assert len(relatives) == 6
+
+    # The least recently used hierarchy is evicted
+    cache._set_item(key=("branch2", hierarchy), item=HierarchyClosure(branched_from=None, synced_at=Timestamp()))
+    assert len(cache) == 1
+    assert cache._get_item(key=(default_branch.name, hierarchy)) is None
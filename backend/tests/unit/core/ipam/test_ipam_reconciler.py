@@ -4,10 +4,14 @@ import pytest
 
 from infrahub.core import registry
 from infrahub.core.branch import Branch
+from infrahub.core.cache_sync import SYNC_MARGIN
 from infrahub.core.initialization import create_ipam_namespace, get_default_ipnamespace
+from infrahub.core.ipam.model import IpamNodeDetails
 from infrahub.core.ipam.reconciler import IpamReconciler
+from infrahub.core.ipam.tree import ipam_tree_cache
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
+from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.exceptions import NodeNotFoundError
 
@@ -251,3 +255,92 @@ async def test_ipprefix_reconciler_prefix_value_update(db: InfrahubDatabase, def
         child_parent_rels = await child.ip_prefix.get_relationships(db=db)
         assert len(child_parent_rels) == 1
         assert child_parent_rels[0].peer_id == updated_prefix.id
+
+
+async def test_reconcile_many(db: InfrahubDatabase, default_branch: Branch, ip_dataset_01):
+    namespace = ip_dataset_01["ns1"]
+    prefix_schema = registry.schema.get_node_schema(name="IpamIPPrefix", branch=default_branch)
+    address_schema = registry.schema.get_node_schema(name="IpamIPAddress", branch=default_branch)
+    new_prefix = await Node.init(db=db, schema=prefix_schema)
+    await new_prefix.new(db=db, prefix="10.10.0.0/18", ip_namespace=namespace)
+    await new_prefix.save(db=db)
+    new_address = await Node.init(db=db, schema=address_schema)
+    await new_address.new(db=db, address="10.10.2.5/24", ip_namespace=namespace)
+    await new_address.save(db=db)
+
+    reconciler = IpamReconciler(db=db, branch=default_branch)
+    await reconciler.reconcile_many(
+        ipam_node_details=[
+            IpamNodeDetails(
+                node_uuid=new_address.id,
+                is_address=True,
+                is_delete=False,
+                namespace_id=namespace.id,
+                ip_value="10.10.2.5/24",
+            ),
+            IpamNodeDetails(
+                node_uuid=ip_dataset_01["net142"].id,
+                is_address=False,
+                is_delete=True,
+                namespace_id=namespace.id,
+                ip_value="10.10.1.0/24",
+            ),
+            IpamNodeDetails(
+                node_uuid=new_prefix.id,
+                is_address=False,
+                is_delete=False,
+                namespace_id=namespace.id,
+                ip_value="10.10.0.0/18",
+            ),
+        ]
+    )
+
+    assert not await NodeManager.get_one(db=db, branch=default_branch, id=ip_dataset_01["net142"].id)
+
+    updated_prefix = await NodeManager.get_one(db=db, branch=default_branch, id=new_prefix.id)
+    assert updated_prefix.is_top_level.value is False
+    parent_rels = await updated_prefix.parent.get_relationships(db=db)
+    assert [rel.peer_id for rel in parent_rels] == [ip_dataset_01["net140"].id]
+    children_rels = await updated_prefix.children.get_relationships(db=db)
+    assert sorted(rel.peer_id for rel in children_rels) == sorted(
+        [ip_dataset_01["net143"].id, ip_dataset_01["net144"].id, ip_dataset_01["net145"].id]
+    )
+    address_rels = await updated_prefix.ip_addresses.get_relationships(db=db)
+    assert [rel.peer_id for rel in address_rels] == [ip_dataset_01["address10"].id]
+
+    updated_net140 = await NodeManager.get_one(db=db, branch=default_branch, id=ip_dataset_01["net140"].id)
+    children_rels = await updated_net140.children.get_relationships(db=db)
+    assert [rel.peer_id for rel in children_rels] == [new_prefix.id]
+    assert not await updated_net140.ip_addresses.get_relationships(db=db)
+
+    updated_address = await NodeManager.get_one(db=db, branch=default_branch, id=new_address.id)
+    ip_prefix_rels = await updated_address.ip_prefix.get_relationships(db=db)
+    assert [rel.peer_id for rel in ip_prefix_rels] == [ip_dataset_01["net144"].id]
+
+
+async def test_reconcile_many_node_not_in_tree(db: InfrahubDatabase, default_branch: Branch, ip_dataset_01):
+    namespace = ip_dataset_01["ns1"]
+    assert await ipam_tree_cache.get(db=db, branch=default_branch, namespace_id=namespace.id, at=Timestamp())
+
+    # A prefix committed long after its time isn't found by the synchronization of the tree
+    prefix_schema = registry.schema.get_node_schema(name="IpamIPPrefix", branch=default_branch)
+    new_prefix = await Node.init(db=db, schema=prefix_schema)
+    await new_prefix.new(db=db, prefix="10.10.0.0/18", ip_namespace=namespace)
+    await new_prefix.save(db=db, at=Timestamp().add_delta(seconds=-SYNC_MARGIN * 2))
+
+    reconciler = IpamReconciler(db=db, branch=default_branch)
+    await reconciler.reconcile_many(
+        ipam_node_details=[
+            IpamNodeDetails(
+                node_uuid=new_prefix.id,
+                is_address=False,
+                is_delete=False,
+                namespace_id=namespace.id,
+                ip_value="10.10.0.0/18",
+            ),
+        ]
+    )
+
+    updated_prefix = await NodeManager.get_one(db=db, branch=default_branch, id=new_prefix.id)
+    parent_rels = await updated_prefix.parent.get_relationships(db=db)
+    assert [rel.peer_id for rel in parent_rels] == [ip_dataset_01["net140"].id]
@@ -0,0 +1,122 @@
+import ipaddress
+
+from infrahub.core import registry
+from infrahub.core.branch import Branch
+from infrahub.core.ipam.tree import IPNamespaceTree, IPNamespaceTreeCache, ipam_tree_cache
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.core.query.ipam import IPPrefixSubnetFetch, get_ip_addresses, get_subnets
+from infrahub.core.timestamp import Timestamp
+from infrahub.database import InfrahubDatabase
+
+
+def test_ipam_tree_parent_and_children():
+    tree = IPNamespaceTree(branched_from=None, synced_at=Timestamp())
+    tree.add(node_id="net8", ip_value=ipaddress.ip_network("10.0.0.0/8"))
+    tree.add(node_id="net16", ip_value=ipaddress.ip_network("10.10.0.0/16"))
+    tree.add(node_id="net24", ip_value=ipaddress.ip_network("10.10.1.0/24"))
+    tree.add(node_id="net6", ip_value=ipaddress.ip_network("2001:db8::/48"))
+    tree.add(node_id="address1", ip_value=ipaddress.ip_interface("10.10.1.1/24"))
+    tree.add(node_id="address2", ip_value=ipaddress.ip_interface("10.10.2.1/16"))
+    # The interface is wider than the /24, the address can only be in the /16
+    tree.add(node_id="address3", ip_value=ipaddress.ip_interface("10.10.1.2/16"))
+
+    assert len(tree) == 7
+    assert tree.get_parent(ip_value=ipaddress.ip_network("10.10.0.0/16")) == "net8"
+    assert tree.get_parent(ip_value=ipaddress.ip_network("10.10.1.0/25")) == "net24"
+    assert tree.get_parent(ip_value=ipaddress.ip_network("10.0.0.0/8")) is None
+    assert tree.get_parent(ip_value=ipaddress.ip_interface("10.10.1.1/24")) == "net24"
+    assert tree.get_parent(ip_value=ipaddress.ip_interface("10.10.1.2/16")) == "net16"
+    assert tree.get_parent(ip_value=ipaddress.ip_network("2001:db8::/64")) == "net6"
+
+    assert tree.get_children(ip_value=ipaddress.ip_network("10.0.0.0/8")) == ["net16"]
+    assert sorted(tree.get_children(ip_value=ipaddress.ip_network("10.10.0.0/16"))) == [
+        "address2",
+        "address3",
+        "net24",
+    ]
+    assert tree.get_children(ip_value=ipaddress.ip_network("10.10.1.0/24")) == ["address1"]
+    assert tree.get_children(ip_value=ipaddress.ip_network("10.0.0.0/12")) == ["net16"]
+    assert tree.get_children(ip_value=ipaddress.ip_interface("10.10.1.1/24")) == []
+
+    assert [str(subnet) for _, subnet in tree.get_subnets(ipaddress.ip_network("10.0.0.0/8"))] == ["10.10.0.0/16"]
+    assert [node_id for node_id, _ in tree.get_ip_addresses(ipaddress.ip_network("10.10.0.0/16"))] == [
+        "address1",
+        "address3",
+        "address2",
+    ]
+    assert [node_id for node_id, _ in tree.get_ip_addresses(ipaddress.ip_network("10.10.1.0/24"))] == ["address1"]
+
+    tree.remove(node_id="net16")
+    assert tree.get_parent(ip_value=ipaddress.ip_network("10.10.1.0/24")) == "net8"
+    assert sorted(tree.get_children(ip_value=ipaddress.ip_network("10.0.0.0/8"))) == [
+        "address2",
+        "address3",
+        "net24",
+    ]
+
+    tree.add(node_id="net24", ip_value=ipaddress.ip_network("10.10.3.0/24"))
+    assert tree.get_ids(ip_value=ipaddress.ip_network("10.10.1.0/24")) == []
+    assert tree.get_ids(ip_value=ipaddress.ip_network("10.10.3.0/24")) == ["net24"]
+    assert tree.get_parent(ip_value=ipaddress.ip_interface("10.10.1.1/24")) == "net8"
+
+    for node_id in ["net8", "net24", "net6", "address1", "address2", "address3"]:
+        tree.remove(node_id=node_id)
+    assert len(tree) == 0
+    assert tree.trees[4].root.children == [None, None]
+    assert tree.trees[6].root.children == [None, None]
+
+
+async def test_subnets_and_addresses_from_tree(db: InfrahubDatabase, default_branch: Branch, ip_dataset_01):
+    ns1 = ip_dataset_01["ns1"]
+    prefix = ipaddress.ip_network("10.10.0.0/16")
+
+    query = await IPPrefixSubnetFetch.init(db=db, branch=default_branch, obj=prefix, namespace=ns1.id)
+    await query.execute(db=db)
+    expected_subnets = sorted((subnet.id, str(subnet.prefix)) for subnet in query.get_subnets())
+
+    subnets = await get_subnets(db=db, ip_prefix=prefix, namespace=ns1, branch=default_branch)
+    assert len(ipam_tree_cache) == 1
+    assert sorted((subnet.id, str(subnet.prefix)) for subnet in subnets) == expected_subnets
+    addresses = await get_ip_addresses(db=db, ip_prefix=prefix, namespace=ns1, branch=default_branch)
+    assert sorted(str(address.address) for address in addresses) == ["10.10.0.0/32", "10.10.1.1/32"]
+
+    # The modifications done after the tree has been loaded are visible
+    prefix_schema = registry.schema.get_node_schema(name="IpamIPPrefix", branch=default_branch)
+    net147 = await Node.init(db=db, schema=prefix_schema)
+    await net147.new(db=db, prefix="10.10.4.0/24", ip_namespace=ns1)
+    await net147.save(db=db)
+    before_delete = Timestamp()
+    net144 = await NodeManager.get_one(db=db, branch=default_branch, id=ip_dataset_01["net144"].id)
+    await net144.delete(db=db)
+
+    subnets = await get_subnets(db=db, ip_prefix=prefix, namespace=ns1, branch=default_branch)
+    assert sorted(str(subnet.prefix) for subnet in subnets) == ["10.10.1.0/24", "10.10.3.0/27", "10.10.4.0/24"]
+
+    # The namespace has been modified after this time, the subnets are read from the graph
+    subnets = await get_subnets(db=db, ip_prefix=prefix, namespace=ns1, branch=default_branch, at=before_delete)
+    assert sorted(str(subnet.prefix) for subnet in subnets) == [
+        "10.10.1.0/24",
+        "10.10.2.0/24",
+        "10.10.3.0/27",
+        "10.10.4.0/24",
+    ]
+
+
+async def test_ipam_tree_cache_max_size(db: InfrahubDatabase, default_branch: Branch, ip_dataset_01):
+    ns1 = ip_dataset_01["ns1"]
+
+    # The cache is disabled, the values are read from the graph
+    cache = IPNamespaceTreeCache(max_size=0)
+    assert await cache.get(db=db, branch=default_branch, namespace_id=ns1.id, at=Timestamp()) is None
+    assert len(cache) == 0
+
+    cache = IPNamespaceTreeCache(max_size=1)
+    assert await cache.get(db=db, branch=default_branch, namespace_id=ns1.id, at=Timestamp()) is not None
+
+    # The least recently used namespace is evicted
+    cache._set_item(
+        key=(default_branch.name, "other-namespace"), item=IPNamespaceTree(branched_from=None, synced_at=Timestamp())
+    )
+    assert len(cache) == 1
+    assert cache._get_item(key=(default_branch.name, ns1.id)) is None
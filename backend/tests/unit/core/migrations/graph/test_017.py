@@ -0,0 +1,48 @@
+from infrahub.core.migrations.graph.m017_add_edge_timestamps import Migration017, add_edge_timestamps
+from infrahub.core.node import Node
+from infrahub.core.timestamp import Timestamp
+from infrahub.database import InfrahubDatabase
+
+
+async def test_migration_017(
+    db: InfrahubDatabase,
+    reset_registry,
+    default_branch,
+    delete_all_nodes_in_db,
+    car_accord_main: Node,
+):
+    await car_accord_main.delete(db=db)
+
+    await db.execute_query(query="MATCH ()-[r]->() WHERE r.from IS NOT NULL REMOVE r.from_ts, r.to_ts")
+
+    migration = Migration017()
+    validation_result = await migration.validate_migration(db=db)
+    assert validation_result.errors
+
+    # A small batch size to go over multiple batches of vertices
+    assert await add_edge_timestamps(db=db, batch_size=2)
+
+    validation_result = await migration.validate_migration(db=db)
+    assert not validation_result.errors
+
+    results = await db.execute_query(
+        query="""
+        MATCH ()-[r]->()
+        WHERE r.from IS NOT NULL
+        RETURN r.from AS rel_from, r.from_ts AS rel_from_ts, r.to AS rel_to, r.to_ts AS rel_to_ts
+        """
+    )
+    assert results
+    nbr_closed = 0
+    for result in results:
+        assert result["rel_from_ts"] == Timestamp(result["rel_from"]).to_epoch_microseconds()
+        if result["rel_to"]:
+            nbr_closed += 1
+            assert result["rel_to_ts"] == Timestamp(result["rel_to"]).to_epoch_microseconds()
+        else:
+            assert result["rel_to_ts"] is None
+    assert nbr_closed
+
+    execution_result = await migration.execute(db=db)
+    assert not execution_result.errors
+    assert await add_edge_timestamps(db=db) == 0
@@ -9,6 +9,7 @@ from infrahub.core.migrations.schema.node_attribute_add import (
     NodeAttributeAddMigration,
     NodeAttributeAddMigrationQuery01,
 )
+from infrahub.core.migrations.shared import MigrationCheckpoint
 from infrahub.core.path import SchemaPath
 from infrahub.core.schema import NodeSchema
 from infrahub.core.timestamp import Timestamp
@@ -17,6 +18,7 @@ from infrahub.database import InfrahubDatabase
 from infrahub.message_bus import Meta
 from infrahub.message_bus.messages import SchemaMigrationPath, SchemaMigrationPathResponse
 from infrahub.services import InfrahubServices
+from tests.adapters.cache import MemoryCache
 
 
 @pytest.fixture
@@ -36,9 +38,16 @@ async def schema_aware():
 
 @pytest.fixture
 async def init_database(db: InfrahubDatabase):
+    at = Timestamp()
     params = {
         "nodes": [],
-        "rel_props": {"branch": "main", "branch_level": "1", "status": "active", "from": Timestamp().to_string()},
+        "rel_props": {
+            "branch": "main",
+            "branch_level": "1",
+            "status": "active",
+            "from": at.to_string(),
+            "from_ts": at.to_epoch_microseconds(),
+        },
     }
 
     for _ in range(5):
@@ -106,6 +115,35 @@ async def test_migration(db: InfrahubDatabase, default_branch, init_database, sc
     assert await count_nodes(db=db, label="Attribute") == 5
 
 
+async def test_migration_batches(db: InfrahubDatabase, default_branch, init_database, schema_aware):
+    node = schema_aware
+    migration = NodeAttributeAddMigration(
+        new_node_schema=node,
+        previous_node_schema=node,
+        schema_path=SchemaPath(path_type=SchemaPathType.ATTRIBUTE, schema_kind="TestCar", field_name="nbr_doors"),
+    )
+    results = await db.execute_query(query="MATCH (n:TestCar) RETURN n.uuid AS uuid ORDER BY uuid")
+    car_uuids = [result["uuid"] for result in results]
+
+    # Resume the migration after the first 2 cars
+    checkpoints = MemoryCache()
+    checkpoint = MigrationCheckpoint(at=Timestamp().to_string(), uuid_after=car_uuids[1])
+    await checkpoints.set(key=migration.get_checkpoint_key(branch=default_branch), value=checkpoint.model_dump_json())
+
+    execution_result = await migration.execute(db=db, branch=default_branch, checkpoints=checkpoints, batch_size=2)
+    assert not execution_result.errors
+    assert execution_result.nbr_migrations_executed == 3
+    assert execution_result.nbr_batches == 2
+    assert await count_nodes(db=db, label="Attribute") == 3
+    assert not checkpoints.storage
+
+    execution_result = await migration.execute(db=db, branch=default_branch, checkpoints=checkpoints, batch_size=2)
+    assert not execution_result.errors
+    assert execution_result.nbr_migrations_executed == 2
+    assert execution_result.nbr_batches == 3
+    assert await count_nodes(db=db, label="Attribute") == 5
+
+
 async def test_rpc(db: InfrahubDatabase, default_branch, init_database, schema_aware, helper):
     node = schema_aware
     correlation_id = str(UUIDT())
@@ -1,8 +1,15 @@
+import pytest
+
 from infrahub.core.branch import Branch
+from infrahub.core.cache_sync import FULL_SYNC_INTERVAL, SYNC_MARGIN
 from infrahub.core.initialization import initialize_registry
 from infrahub.core.node import Node
+from infrahub.core.query.resource_manager import NumberPoolSetReserved
 from infrahub.core.schema import SchemaRoot
+from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
+from infrahub.exceptions import PoolExhaustedError
+from infrahub.pools.number import NumberAllocatorCache, number_allocator_cache
 from tests.helpers.schema import TICKET, load_schema
 
 
@@ -24,3 +31,93 @@ async def test_allocate_from_number_pool(db: InfrahubDatabase, default_branch: B
 
     assert ticket1.ticket_id.value == 1
     assert ticket2.ticket_id.value == 2
+
+
+async def test_get_resources_from_number_pool(
+    db: InfrahubDatabase, default_branch: Branch, register_core_models_schema
+):
+    await load_schema(db=db, schema=SchemaRoot(nodes=[TICKET]))
+    await initialize_registry(db=db)
+
+    np1 = await Node.init(db=db, schema="CoreNumberPool")
+    await np1.new(db=db, name="pool1", node="TestingTicket", node_attribute="ticket_id", start_range=1, end_range=10)
+    await np1.save(db=db)
+
+    ticket1 = await Node.init(db=db, schema=TICKET.kind)
+    await ticket1.new(db=db, title="ticket1", ticket_id={"from_pool": {"id": np1.id}})
+    await ticket1.save(db=db)
+    assert ticket1.ticket_id.value == 1
+
+    numbers = await np1.get_resources(db=db, branch=default_branch, count=5)
+    assert numbers == [2, 3, 4, 5, 6]
+
+    # The allocator of the pool is loaded again from the database
+    number_allocator_cache.invalidate(pool_id=np1.id)
+    assert await np1.get_next(db=db, branch=default_branch) == 7
+
+    with pytest.raises(PoolExhaustedError):
+        await np1.get_resources(db=db, branch=default_branch, count=5)
+
+    assert await np1.get_resources(db=db, branch=default_branch, count=2, identifiers=["a", "b"]) == [7, 8]
+    assert await np1.get_resource(db=db, branch=default_branch, node=ticket1, identifier="a") == 7
+
+
+async def test_reserve_number_reserved_by_another_worker(
+    db: InfrahubDatabase, default_branch: Branch, register_core_models_schema
+):
+    await load_schema(db=db, schema=SchemaRoot(nodes=[TICKET]))
+    await initialize_registry(db=db)
+
+    np1 = await Node.init(db=db, schema="CoreNumberPool")
+    await np1.new(db=db, name="pool1", node="TestingTicket", node_attribute="ticket_id", start_range=1, end_range=10)
+    await np1.save(db=db)
+    assert await np1.get_resources(db=db, branch=default_branch, count=1) == [1]
+
+    # A reservation committed long after its time isn't found by the synchronization of the allocator
+    query = await NumberPoolSetReserved.init(
+        db=db, pool_id=np1.id, reservations={"other": 2}, at=Timestamp().add_delta(seconds=-SYNC_MARGIN * 2)
+    )
+    await query.execute(db=db)
+    assert not query.get_conflicts()
+
+    assert await np1.get_resources(db=db, branch=default_branch, count=2) == [3, 4]
+
+    query = await NumberPoolSetReserved.init(db=db, pool_id=np1.id, reservations={"again": 3, "new": 5})
+    await query.execute(db=db)
+    assert query.get_conflicts() == [3]
+    assert await np1.get_next(db=db, branch=default_branch) == 5
+
+    # The reservations missed by the synchronization are found by the next full load
+    number_allocator_cache._items[np1.id].full_synced_at = Timestamp().add_delta(seconds=-FULL_SYNC_INTERVAL - 1)
+    query = await NumberPoolSetReserved.init(
+        db=db, pool_id=np1.id, reservations={"other2": 5}, at=Timestamp().add_delta(seconds=-SYNC_MARGIN * 2)
+    )
+    await query.execute(db=db)
+    assert await np1.get_next(db=db, branch=default_branch) == 6
+
+
+async def test_number_allocator_cache_eviction(
+    db: InfrahubDatabase, default_branch: Branch, register_core_models_schema
+):
+    await load_schema(db=db, schema=SchemaRoot(nodes=[TICKET]))
+    await initialize_registry(db=db)
+
+    np1 = await Node.init(db=db, schema="CoreNumberPool")
+    await np1.new(db=db, name="pool1", node="TestingTicket", node_attribute="ticket_id", start_range=1, end_range=10)
+    await np1.save(db=db)
+    np2 = await Node.init(db=db, schema="CoreNumberPool")
+    await np2.new(db=db, name="pool2", node="TestingTicket", node_attribute="ticket_id", start_range=1, end_range=10)
+    await np2.save(db=db)
+
+    # The allocator of the least recently used pool is evicted
+    cache = NumberAllocatorCache(max_size=1)
+    await cache.get(db=db, pool=np1, branch=default_branch)
+    await cache.get(db=db, pool=np2, branch=default_branch)
+    assert len(cache) == 1
+    assert np2.id in cache._items
+
+    # The allocator of a deleted pool is evicted
+    assert await np1.get_next(db=db, branch=default_branch) == 1
+    assert np1.id in number_allocator_cache._items
+    await np1.delete(db=db)
+    assert np1.id not in number_allocator_cache._items
@@ -2,12 +2,15 @@ import pytest
 
 from infrahub.core import registry
 from infrahub.core.branch import Branch
+from infrahub.core.cache_sync import FULL_SYNC_INTERVAL, SYNC_MARGIN
 from infrahub.core.constants import InfrahubKind
 from infrahub.core.initialization import create_branch
 from infrahub.core.node import Node
 from infrahub.core.node.resource_manager.ip_prefix_pool import CoreIPPrefixPool
 from infrahub.core.schema.schema_branch import SchemaBranch
+from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
+from infrahub.pools.ip_pool import ip_pool_allocator_cache
 
 
 async def test_get_next(
@@ -138,3 +141,74 @@ async def test_get_all_resources(
         prefix5.prefix.value,
     ]
     assert sorted(all_prefixes) == ["10.10.0.0/24", "10.10.128.0/17", "10.10.4.0/24", "10.11.0.0/17", "10.11.128.0/17"]
+
+
+async def test_reserve_next_many(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    default_ipnamespace: Node,
+    register_ipam_schema: SchemaBranch,
+    ip_dataset_prefix_v4,
+):
+    ns1 = ip_dataset_prefix_v4["ns1"]
+    net140 = ip_dataset_prefix_v4["net140"]
+    net141 = ip_dataset_prefix_v4["net141"]
+
+    prefix_pool_schema = registry.schema.get_node_schema(name=InfrahubKind.IPPREFIXPOOL, branch=default_branch)
+
+    pool = await CoreIPPrefixPool.init(schema=prefix_pool_schema, db=db)
+    await pool.new(db=db, name="pool1", resources=[net140, net141], ip_namespace=ns1)
+    await pool.save(db=db)
+
+    subnets = await pool.reserve_next(db=db, count=3, prefixlen=17)
+    assert [str(subnet) for subnet in subnets] == ["10.10.128.0/17", "10.11.0.0/17", "10.11.128.0/17"]
+
+    with pytest.raises(IndexError):
+        await pool.get_next(db=db, prefixlen=17)
+
+    # The prefixes created outside of the pool are not allocated
+    pool2 = await CoreIPPrefixPool.init(schema=prefix_pool_schema, db=db)
+    await pool2.new(db=db, name="pool2", resources=[net141], ip_namespace=ns1)
+    await pool2.save(db=db)
+    assert str(await pool2.get_next(db=db, prefixlen=18)) == "10.11.0.0/18"
+
+    prefix_schema = registry.schema.get_node_schema(name="IpamIPPrefix", branch=default_branch)
+    new_prefix = await Node.init(db=db, schema=prefix_schema)
+    await new_prefix.new(db=db, prefix="10.11.0.0/18", ip_namespace=ns1, parent=net141)
+    await new_prefix.save(db=db)
+    assert str(await pool2.get_next(db=db, prefixlen=18)) == "10.11.64.0/18"
+
+
+async def test_reserve_next_prefix_created_by_another_worker(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    default_ipnamespace: Node,
+    register_ipam_schema: SchemaBranch,
+    ip_dataset_prefix_v4,
+):
+    ns1 = ip_dataset_prefix_v4["ns1"]
+    net141 = ip_dataset_prefix_v4["net141"]
+
+    prefix_pool_schema = registry.schema.get_node_schema(name=InfrahubKind.IPPREFIXPOOL, branch=default_branch)
+    pool = await CoreIPPrefixPool.init(schema=prefix_pool_schema, db=db)
+    await pool.new(db=db, name="pool1", resources=[net141], ip_namespace=ns1)
+    await pool.save(db=db)
+    assert str(await pool.get_next(db=db, prefixlen=18)) == "10.11.0.0/18"
+
+    # A prefix committed long after its time isn't found by the synchronization of the allocator
+    prefix_schema = registry.schema.get_node_schema(name="IpamIPPrefix", branch=default_branch)
+    new_prefix = await Node.init(db=db, schema=prefix_schema)
+    await new_prefix.new(db=db, prefix="10.11.0.0/20", ip_namespace=ns1, parent=net141)
+    await new_prefix.save(db=db, at=Timestamp().add_delta(seconds=-SYNC_MARGIN * 2))
+
+    subnets = await pool.reserve_next(db=db, count=2, prefixlen=18)
+    assert [str(subnet) for subnet in subnets] == ["10.11.64.0/18", "10.11.128.0/18"]
+
+    # The prefixes missed by the synchronization are found by the next full load
+    new_prefix = await Node.init(db=db, schema=prefix_schema)
+    await new_prefix.new(db=db, prefix="10.11.192.0/24", ip_namespace=ns1, parent=net141)
+    await new_prefix.save(db=db, at=Timestamp().add_delta(seconds=-SYNC_MARGIN * 2))
+    for pool_allocator in ip_pool_allocator_cache._items.values():
+        pool_allocator.full_synced_at = Timestamp().add_delta(seconds=-FULL_SYNC_INTERVAL - 1)
+    with pytest.raises(IndexError):
+        await pool.get_next(db=db, prefixlen=18)
@@ -123,10 +123,10 @@ async def test_get_query_filter_relationships_main(db: InfrahubDatabase, base_da
     )
 
     expected_filters = [
-        "(r1.branch IN $branch0 AND r1.from <= $time0 AND r1.to IS NULL)\n OR (r1.branch IN $branch0 AND r1.from <= $time0 AND r1.to >= $time0)",
-        "((r1.branch IN $branch0 AND r1.from <= $time0 AND r1.to IS NULL)\n OR (r1.branch IN $branch0 AND r1.from <= $time0 AND r1.to >= $time0))",
-        "(r2.branch IN $branch0 AND r2.from <= $time0 AND r2.to IS NULL)\n OR (r2.branch IN $branch0 AND r2.from <= $time0 AND r2.to >= $time0)",
-        "((r2.branch IN $branch0 AND r2.from <= $time0 AND r2.to IS NULL)\n OR (r2.branch IN $branch0 AND r2.from <= $time0 AND r2.to >= $time0))",
+        "(r1.branch IN $branch0 AND r1.from_ts <= $time0 AND (r1.to_ts IS NULL OR r1.to_ts >= $time0))",
+        "((r1.branch IN $branch0 AND r1.from_ts <= $time0 AND (r1.to_ts IS NULL OR r1.to_ts >= $time0)))",
+        "(r2.branch IN $branch0 AND r2.from_ts <= $time0 AND (r2.to_ts IS NULL OR r2.to_ts >= $time0))",
+        "((r2.branch IN $branch0 AND r2.from_ts <= $time0 AND (r2.to_ts IS NULL OR r2.to_ts >= $time0)))",
     ]
     assert isinstance(filters, list)
     assert filters == expected_filters
@@ -27,6 +27,23 @@ async def test_rebase_graph(db: InfrahubDatabase, base_dataset_02, register_core
     assert cars[2].name.value == "volt"
 
 
+async def test_rebase_graph_batches(db: InfrahubDatabase, base_dataset_02, register_core_models_schema):
+    branch1 = await Branch.get_by_name(name="branch1", db=db)
+
+    # Within a transaction, the relationships are updated and deleted with one query per batch
+    async with db.start_transaction() as dbt:
+        await branch1.rebase_graph(db=dbt, batch_size=2)
+
+    cars = sorted(await NodeManager.query(schema="TestCar", db=db), key=lambda c: c.id)
+    assert len(cars) == 2
+
+    cars = sorted(await NodeManager.query(schema="TestCar", branch=branch1, db=db), key=lambda c: c.id)
+    assert len(cars) == 3
+    assert cars[0].nbr_seats.value == 4
+    assert cars[0].nbr_seats.is_protected is True
+    assert cars[2].name.value == "volt"
+
+
 async def test_rebase_graph_delete(db: InfrahubDatabase, base_dataset_02, register_core_models_schema):
     branch1 = await Branch.get_by_name(name="branch1", db=db)
 
@@ -0,0 +1,70 @@
+from infrahub.core import cache_sync
+from infrahub.core.cache_sync import (
+    FULL_SYNC_INTERVAL,
+    SYNC_INTERVAL,
+    SYNC_MARGIN,
+    BranchCache,
+    get_sync_since,
+    invalidate_branch_caches,
+    is_full_sync_required,
+    is_sync_required,
+    notify_local_write,
+)
+from infrahub.core.timestamp import Timestamp
+
+
+def test_get_sync_since():
+    synced_at = Timestamp()
+    assert get_sync_since(synced_at=synced_at).to_string() == synced_at.add_delta(seconds=-SYNC_MARGIN).to_string()
+
+    at = synced_at.add_delta(seconds=-SYNC_MARGIN * 2)
+    assert get_sync_since(synced_at=synced_at, at=at).to_string() == at.to_string()
+
+
+def test_is_sync_required(monkeypatch):
+    monkeypatch.setattr(cache_sync, "_last_local_write", None)
+    synced_at = Timestamp()
+
+    assert not is_sync_required(synced_at=synced_at, at=Timestamp())
+    assert is_sync_required(synced_at=synced_at, at=synced_at.add_delta(seconds=-1))
+
+    old_synced_at = synced_at.add_delta(seconds=-SYNC_INTERVAL - 1)
+    assert is_sync_required(synced_at=old_synced_at, at=Timestamp())
+
+    notify_local_write()
+    assert is_sync_required(synced_at=synced_at, at=Timestamp())
+
+
+def test_is_full_sync_required():
+    assert not is_full_sync_required(full_synced_at=Timestamp())
+    assert is_full_sync_required(full_synced_at=Timestamp().add_delta(seconds=-FULL_SYNC_INTERVAL - 1))
+
+
+def test_invalidate_branch_caches():
+    cache: BranchCache[int] = BranchCache()
+    cache._items["branch1"] = 1
+    cache._items["branch1", "kind1"] = 2
+    cache._items["branch2", "kind1"] = 3
+
+    invalidate_branch_caches(branch_name="branch1")
+    assert len(cache) == 1
+
+    invalidate_branch_caches()
+    assert len(cache) == 0
+
+
+def test_branch_cache_max_size():
+    class BoundedCache(BranchCache[int]):
+        max_size = 2
+
+    cache = BoundedCache()
+    cache._set_item(key="branch1", item=1)
+    cache._set_item(key="branch2", item=2)
+    assert cache._get_item(key="branch1") == 1
+
+    # The least recently used item is removed first
+    cache._set_item(key="branch3", item=3)
+    assert len(cache) == 2
+    assert cache._get_item(key="branch2") is None
+    assert cache._get_item(key="branch1") == 1
+    assert cache._get_item(key="branch3") == 3
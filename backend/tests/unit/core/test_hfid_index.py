@@ -0,0 +1,122 @@
+from infrahub.core.branch import Branch
+from infrahub.core.cache_sync import SYNC_MARGIN
+from infrahub.core.hfid import HfidIndex, HfidIndexCache, hfid_index_cache
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.core.schema.schema_branch import SchemaBranch
+from infrahub.core.timestamp import Timestamp
+from infrahub.database import InfrahubDatabase
+
+
+def test_hfid_index():
+    index = HfidIndex(branched_from=None, schema_hash="", synced_at=Timestamp())
+    index.set_node(node_id="node1", values=["Jack", "Rocky"])
+    index.set_node(node_id="node2", values=["Jack", 12])
+    index.set_node(node_id="node3", values=["Jim", None])
+
+    assert index.lookup(key=("Jack", "Rocky")) == ["node1"]
+    assert index.lookup(key=("Jack", "12")) == ["node2"]
+    assert len(index) == 2
+
+    index.set_node(node_id="node2", values=["Jack", "Rocky"])
+    assert index.lookup(key=("Jack", "Rocky")) == ["node1", "node2"]
+    assert index.lookup(key=("Jack", "12")) == []
+
+    index.remove_node(node_id="node1")
+    index.remove_node(node_id="node2")
+    assert len(index) == 0
+    assert not index.node_ids
+
+
+async def test_hfid_index_sync(db: InfrahubDatabase, default_branch: Branch, animal_person_schema: SchemaBranch):
+    person_schema = animal_person_schema.get(name="TestPerson")
+    dog_schema = animal_person_schema.get(name="TestDog")
+
+    person1 = await Node.init(db=db, schema=person_schema, branch=default_branch)
+    await person1.new(db=db, name="Jack")
+    await person1.save(db=db)
+
+    dog1 = await Node.init(db=db, schema=dog_schema, branch=default_branch)
+    await dog1.new(db=db, name="Rocky", breed="Labrador", owner=person1)
+    await dog1.save(db=db)
+
+    node_ids = await hfid_index_cache.lookup(
+        db=db, branch=default_branch, schema=dog_schema, values=["Jack", "Rocky"], at=Timestamp()
+    )
+    assert node_ids == [dog1.id]
+    assert len(hfid_index_cache) == 1
+
+    # The modification of the attribute of a peer used by the human friendly id is visible
+    before_update = Timestamp()
+    person = await NodeManager.get_one(db=db, branch=default_branch, id=person1.id)
+    person.name.value = "John"
+    await person.save(db=db)
+    node_ids = await hfid_index_cache.lookup(
+        db=db, branch=default_branch, schema=dog_schema, values=["John", "Rocky"], at=Timestamp()
+    )
+    assert node_ids == [dog1.id]
+
+    node = await NodeManager.get_one_by_hfid(db=db, hfid=["John", "Rocky"], kind=dog_schema.kind)
+    assert node.id == dog1.id
+    assert not await NodeManager.get_one_by_hfid(db=db, hfid=["Jack", "Rocky"], kind=dog_schema.kind)
+
+    # The index has been modified after this time, the nodes are queried in the graph
+    node_ids = await hfid_index_cache.lookup(
+        db=db, branch=default_branch, schema=dog_schema, values=["Jack", "Rocky"], at=before_update
+    )
+    assert node_ids is None
+
+    # The values of the peers are loaded for all the nodes at once
+    nodes = await NodeManager.get_many(db=db, branch=default_branch, ids=[dog1.id], fields={"hfid": None})
+    assert nodes[dog1.id]._hfid_peer_values == {"owner__name__value": "John"}
+    assert await nodes[dog1.id].get_hfid(db=db) == ["John", "Rocky"]
+
+
+async def test_get_one_by_hfid_not_indexed(
+    db: InfrahubDatabase, default_branch: Branch, animal_person_schema: SchemaBranch
+):
+    person_schema = animal_person_schema.get(name="TestPerson")
+    dog_schema = animal_person_schema.get(name="TestDog")
+
+    person1 = await Node.init(db=db, schema=person_schema, branch=default_branch)
+    await person1.new(db=db, name="Jack")
+    await person1.save(db=db)
+    assert not await NodeManager.get_one_by_hfid(db=db, hfid=["Jack", "Rocky"], kind=dog_schema.kind)
+
+    # A node committed long after its time isn't found by the synchronization of the index
+    dog1 = await Node.init(db=db, schema=dog_schema, branch=default_branch)
+    await dog1.new(db=db, name="Rocky", breed="Labrador", owner=person1)
+    await dog1.save(db=db, at=Timestamp().add_delta(seconds=-SYNC_MARGIN * 2))
+    node_ids = await hfid_index_cache.lookup(
+        db=db, branch=default_branch, schema=dog_schema, values=["Jack", "Rocky"], at=Timestamp()
+    )
+    assert node_ids == []
+
+    node = await NodeManager.get_one_by_hfid(db=db, hfid=["Jack", "Rocky"], kind=dog_schema.kind)
+    assert node.id == dog1.id
+
+
+async def test_hfid_index_cache_max_size(
+    db: InfrahubDatabase, default_branch: Branch, animal_person_schema: SchemaBranch
+):
+    person_schema = animal_person_schema.get(name="TestPerson")
+    dog_schema = animal_person_schema.get(name="TestDog")
+
+    person1 = await Node.init(db=db, schema=person_schema, branch=default_branch)
+    await person1.new(db=db, name="Jack")
+    await person1.save(db=db)
+
+    # The index is disabled, the nodes are queried in the graph
+    cache = HfidIndexCache(max_size=0)
+    assert (
+        await cache.lookup(db=db, branch=default_branch, schema=person_schema, values=["Jack"], at=Timestamp()) is None
+    )
+    assert len(cache) == 0
+
+    # The index of the least recently used kind is evicted
+    cache = HfidIndexCache(max_size=1)
+    node_ids = await cache.lookup(db=db, branch=default_branch, schema=person_schema, values=["Jack"], at=Timestamp())
+    assert node_ids == [person1.id]
+    await cache.lookup(db=db, branch=default_branch, schema=dog_schema, values=["Jack", "Rocky"], at=Timestamp())
+    assert len(cache) == 1
+    assert cache._get_item(key=(default_branch.name, person_schema.kind)) is None
@@ -530,6 +530,36 @@ async def test_identify_node_class(db: InfrahubDatabase, car_schema, default_bra
     assert identify_node_class(node=node) == Car
 
 
+async def test_create_many(db: InfrahubDatabase, default_branch: Branch, person_john_main, car_person_schema):
+    nodes = []
+    for name in ("accord", "volt", "model3"):
+        car = await Node.init(db=db, schema="TestCar", branch=default_branch)
+        await car.new(db=db, name=name, nbr_seats=4, owner=person_john_main)
+        nodes.append(car)
+    person = await Node.init(db=db, schema="TestPerson", branch=default_branch)
+    await person.new(db=db, name="Jane", height=170)
+    nodes.append(person)
+
+    await NodeManager.create_many(db=db, nodes=nodes, batch_size=2)
+
+    assert all(node._existing and node.db_id for node in nodes)
+    assert all(node.name.id for node in nodes)
+
+    cars = await NodeManager.get_many(db=db, ids=[node.id for node in nodes[:3]], prefetch_relationships=True)
+    assert sorted(car.name.value for car in cars.values()) == ["accord", "model3", "volt"]
+    for car in cars.values():
+        assert car.nbr_seats.value == 4
+        assert car.color.value == "#444444"
+        owner = await car.owner.get_peer(db=db)
+        assert owner.id == person_john_main.id
+
+    jane = await NodeManager.get_one(db=db, id=person.id)
+    assert jane.height.value == 170
+
+    with pytest.raises(ValueError, match="already exists"):
+        await NodeManager.create_many(db=db, nodes=[person])
+
+
 # ------------------------------------------------------------------------
 # WITH BRANCH
 # ------------------------------------------------------------------------
@@ -736,6 +736,60 @@ async def test_node_update_local_attrs_with_source(
     assert obj3.name.source_id == second_account.id
 
 
+async def test_node_update_only_modified_fields(db: InfrahubDatabase, default_branch: Branch, criticality_schema):
+    obj1 = await Node.init(db=db, schema=criticality_schema)
+    await obj1.new(db=db, name="low", level=4)
+    await obj1.save(db=db)
+    assert not any(getattr(obj1, name).has_changes for name in obj1._attributes)
+
+    obj2 = await NodeManager.get_one(db=db, id=obj1.id)
+    assert not any(getattr(obj2, name).has_changes for name in obj2._attributes)
+
+    obj2.level.value = 2
+    obj2.mylist.value.append("three")
+    obj2.name.is_protected = True
+    assert {name for name in obj2._attributes if getattr(obj2, name).has_changes} == {"name", "level", "mylist"}
+
+    nbr_rels = await count_relationships(db=db)
+    await obj2.save(db=db)
+    assert not any(getattr(obj2, name).has_changes for name in obj2._attributes)
+
+    # 2 new edges for the new values, 1 for the new flag
+    assert await count_relationships(db=db) == nbr_rels + 3
+
+    obj3 = await NodeManager.get_one(db=db, id=obj1.id)
+    assert obj3.level.value == 2
+    assert obj3.mylist.value == ["one", "two", "three"]
+    assert obj3.name.is_protected is True
+
+    # Setting back the value loaded from the database doesn't require any update
+    obj3.level.value = 3
+    obj3.level.value = 2
+    assert obj3.level.has_changes is False
+
+
+async def test_node_update_relationships_not_modified(db: InfrahubDatabase, default_branch: Branch, car_person_schema):
+    person = await Node.init(db=db, schema="TestPerson", branch=default_branch)
+    await person.new(db=db, name="John", height=180)
+    await person.save(db=db)
+    car = await Node.init(db=db, schema="TestCar", branch=default_branch)
+    await car.new(db=db, name="volt", nbr_seats=4, is_electric=True, owner=person)
+    await car.save(db=db)
+    assert car.owner.has_changes is False
+
+    car2 = await NodeManager.get_one(db=db, id=car.id)
+    assert car2.owner.has_changes is False
+    await car2.owner.get_peer(db=db)
+    assert car2.owner.has_changes is False
+
+    car2.nbr_seats.value = 5
+    await car2.save(db=db)
+
+    car3 = await NodeManager.get_one(db=db, id=car.id)
+    assert car3.nbr_seats.value == 5
+    assert (await car3.owner.get_peer(db=db)).id == person.id
+
+
 async def test_update_related_node(db: InfrahubDatabase, default_branch, data_schema):
     """
     This test has been written to troubleshoot a specific issue
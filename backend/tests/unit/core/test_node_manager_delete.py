@@ -5,6 +5,7 @@ import pytest
 from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.constants import BranchSupportType, RelationshipDeleteBehavior
+from infrahub.core.initialization import create_branch
 from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
 from infrahub.core.schema.relationship_schema import RelationshipSchema
@@ -162,3 +163,47 @@ async def test_delete_with_cascade_both_directions_succeeds(
     assert {d.id for d in deleted} == {person_john_main.id, car_accord_main.id, car_prius_main.id}
     node_map = await NodeManager.get_many(db=db, ids=[person_john_main.id, car_accord_main.id, car_prius_main.id])
     assert node_map == {}
+
+
+async def test_delete_many_in_branch(
+    db, default_branch, car_camry_main, car_accord_main, car_prius_main, person_john_main, person_jane_main
+):
+    branch2 = await create_branch(db=db, branch_name="branch2")
+    cars = await NodeManager.get_many(
+        db=db, ids=[car_accord_main.id, car_prius_main.id, car_camry_main.id], branch=branch2
+    )
+
+    deleted = await NodeManager.delete(db=db, branch=branch2, nodes=list(cars.values()), batch_size=2)
+
+    assert {d.id for d in deleted} == {car_accord_main.id, car_prius_main.id, car_camry_main.id}
+    assert await NodeManager.get_many(db=db, ids=list(cars.keys()), branch=branch2) == {}
+    john = await NodeManager.get_one(db=db, id=person_john_main.id, branch=branch2)
+    assert john.name.value == "John"
+    assert not await john.cars.get_peers(db=db)
+
+    # The nodes and their relationships are still present in the default branch
+    assert len(await NodeManager.get_many(db=db, ids=list(cars.keys()), branch=default_branch)) == 3
+    john = await NodeManager.get_one(db=db, id=person_john_main.id, branch=default_branch)
+    assert set((await john.cars.get_peers(db=db)).keys()) == {car_accord_main.id, car_prius_main.id}
+
+
+async def test_delete_many_in_branch_updated_attribute(
+    db, default_branch, car_camry_main, car_accord_main, car_prius_main, person_john_main, person_jane_main
+):
+    branch2 = await create_branch(db=db, branch_name="branch2")
+    car = await NodeManager.get_one(db=db, id=car_accord_main.id, branch=branch2)
+    car.name.value = "accord-hybrid"
+    await car.save(db=db)
+
+    await NodeManager.delete(db=db, branch=branch2, nodes=[car], batch_size=2)
+
+    # Only the latest value of the attribute is deleted, not the value still active in the default branch
+    results = await db.execute_query(
+        query="""
+        MATCH (:Node { uuid: $node_id })-[:HAS_ATTRIBUTE]->(:Attribute { name: "name" })-[r:HAS_VALUE]->(av)
+        WHERE r.branch = $branch_name AND r.status = "deleted"
+        RETURN av.value AS value
+        """,
+        params={"node_id": car_accord_main.id, "branch_name": branch2.name},
+    )
+    assert sorted(result["value"] for result in results) == ["accord", "accord-hybrid"]
@@ -1,7 +1,9 @@
 import pendulum
 import pytest
 
+from infrahub import config
 from infrahub.core.query import (
+    KeysetCursor,
     Query,
     QueryNode,
     QueryRel,
@@ -29,6 +31,26 @@ class Query01(Query):
         self.add_to_query(query)
 
 
+class Query03(Query):
+    keyset_keys = ["at.name", "av.uuid"]
+
+    async def query_init(self, db: InfrahubDatabase, *args, **kwargs):
+        self.order_by = ["at.name", "av.uuid"]
+
+        query = """
+        MATCH (n)-[r1]-(at:Attribute)-[r2]-(av:AttributeValue)
+        """
+        self.add_to_query(query)
+        self.add_keyset_filter()
+
+        query = """
+        MATCH (n)-[:IS_PART_OF]->(:Root)
+        """
+        self.add_to_query(query)
+
+        self.return_labels = ["n", "at", "av"]
+
+
 class Query02(Query):
     type: QueryType = QueryType.WRITE
 
@@ -54,6 +76,67 @@ async def test_query_base(db: InfrahubDatabase):
     assert query.get_query() == expected_query
 
 
+async def test_query_keyset(db: InfrahubDatabase):
+    query = await Query03.init(db=db)
+
+    keyset_filter, params = query.get_keyset_filter(cursor=KeysetCursor(values=["name", "volt"]))
+    assert keyset_filter == "(at.name > $keyset_0) OR (at.name = $keyset_0 AND av.uuid > $keyset_1)"
+    assert params == {"keyset_0": "name", "keyset_1": "volt"}
+
+    keyset_filter, _ = query.get_keyset_filter(cursor=KeysetCursor(values=["name", "volt"], inclusive=True))
+    assert keyset_filter == (
+        "(at.name > $keyset_0) OR (at.name = $keyset_0 AND av.uuid > $keyset_1) "
+        "OR (at.name = $keyset_0 AND av.uuid = $keyset_1)"
+    )
+
+    expected_query = (
+        "MATCH (n)-[r1]-(at:Attribute)-[r2]-(av:AttributeValue)\n"
+        "WITH *\n"
+        "WHERE (at.name > $keyset_0) OR (at.name = $keyset_0 AND av.uuid > $keyset_1)\n"
+        "MATCH (n)-[:IS_PART_OF]->(:Root)\n"
+        "RETURN n,at,av,at.name AS keyset_0,av.uuid AS keyset_1\n"
+        "ORDER BY at.name,av.uuid\n"
+        "LIMIT 2"
+    )
+    assert query.get_query(limit=2, keyset=KeysetCursor(values=["name", "volt"]), with_keys=True) == expected_query
+
+
+async def test_query_results_keyset(db: InfrahubDatabase, simple_dataset_01):
+    original_query_size_limit = config.SETTINGS.database.query_size_limit
+    config.SETTINGS.database.query_size_limit = 2
+    try:
+        query = await Query03.init(db=db)
+        await query.execute(db=db)
+    finally:
+        config.SETTINGS.database.query_size_limit = original_query_size_limit
+
+    query_all = await Query01.init(db=db)
+    await query_all.execute(db=db)
+
+    assert query.num_of_results == query_all.num_of_results
+    assert sorted(str(result.get("av").get("value")) for result in query.results) == sorted(
+        str(result.get("av").get("value")) for result in query_all.results
+    )
+
+
+async def test_query_stream(db: InfrahubDatabase, simple_dataset_01):
+    query = await Query01.init(db=db)
+    streamed_values = [result.get("av").get("value") async for result in query.stream(db=db)]
+
+    assert query.has_been_executed is True
+    assert query.results == []
+    assert sorted(str(value) for value in streamed_values) == ["5", "accord", "volt"]
+
+    query = await Query01.init(db=db, limit=2, offset=1)
+    streamed_values = [result.get("av").get("value") async for result in query.stream(db=db)]
+    assert streamed_values == ["accord", 5]
+
+    query = await Query02.init(db=db)
+    with pytest.raises(TypeError):
+        async for _ in query.stream(db=db):
+            pass
+
+
 async def test_insert_variables_in_query(db: InfrahubDatabase, simple_dataset_01):
     params = {
         "my": "tooshort",
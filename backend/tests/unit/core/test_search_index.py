@@ -0,0 +1,56 @@
+from infrahub.core.branch import Branch
+from infrahub.core.manager import NodeManager
+from infrahub.core.node import Node
+from infrahub.core.search_index import SearchIndex, search_index_cache
+from infrahub.core.timestamp import Timestamp
+from infrahub.database import InfrahubDatabase
+
+
+def test_search_index_ranking():
+    index = SearchIndex(branched_from=None, schema_hash="", synced_at=Timestamp())
+    index.set_node(node_id="node1", kind="TestCar", values=["Accord"])
+    index.set_node(node_id="node2", kind="TestCar", values=["Accordion", "red"])
+    index.set_node(node_id="node3", kind="TestCar", values=["Big Accord"])
+    index.set_node(node_id="node4", kind="TestPerson", values=["John"])
+
+    assert index.search(q="accord", limit=10) == [("node1", "TestCar"), ("node2", "TestCar"), ("node3", "TestCar")]
+    assert index.search(q="ACC", limit=2) == [("node1", "TestCar"), ("node2", "TestCar")]
+    assert index.search(q="j", limit=10) == [("node4", "TestPerson")]
+    assert index.search(q="accordions", limit=10) == []
+
+    index.set_node(node_id="node1", kind="TestCar", values=["Civic"])
+    assert index.search(q="accord", limit=10) == [("node2", "TestCar"), ("node3", "TestCar")]
+
+    for node_id in ["node1", "node2", "node3", "node4"]:
+        index.remove_node(node_id=node_id)
+    assert len(index) == 0
+    assert not index.trigrams
+
+
+async def test_search_index_sync(
+    db: InfrahubDatabase,
+    default_branch: Branch,
+    person_john_main: Node,
+    car_accord_main: Node,
+    car_prius_main: Node,
+):
+    matches = await search_index_cache.search(db=db, branch=default_branch, q="accord", limit=10, at=Timestamp())
+    assert matches == [(car_accord_main.id, "TestCar")]
+    assert len(search_index_cache) == 1
+
+    # The modifications done after the index has been loaded are visible
+    before_update = Timestamp()
+    car = await NodeManager.get_one(db=db, branch=default_branch, id=car_prius_main.id)
+    car.name.value = "accord-hybrid"
+    await car.save(db=db)
+    matches = await search_index_cache.search(db=db, branch=default_branch, q="accord", limit=10, at=Timestamp())
+    assert matches == [(car_accord_main.id, "TestCar"), (car_prius_main.id, "TestCar")]
+
+    car = await NodeManager.get_one(db=db, branch=default_branch, id=car_accord_main.id)
+    await car.delete(db=db)
+    matches = await search_index_cache.search(db=db, branch=default_branch, q="accord", limit=10, at=Timestamp())
+    assert matches == [(car_prius_main.id, "TestCar")]
+
+    # The index has been modified after this time, the nodes are searched in the graph
+    matches = await search_index_cache.search(db=db, branch=default_branch, q="accord", limit=10, at=before_update)
+    assert matches is None
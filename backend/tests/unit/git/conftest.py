@@ -302,7 +302,7 @@ async def git_repo_06(client, git_upstream_repo_01, git_repos_dir, branch01: Bra
     upstream.git.checkout("main")
 
     # Update the local branch branch01 to create a conflict.
-    branch_wt = repo.get_worktree(identifier=branch01.name)
+    branch_wt = await repo.get_worktree(identifier=branch01.name)
     branch_repo = Repo(branch_wt.directory)
     first_file_in_repo = Path(os.path.join(branch_wt.directory, first_file))
     with first_file_in_repo.open(mode="a", encoding="utf-8") as file:
@@ -1,4 +1,6 @@
+import asyncio
 import os
+import threading
 from pathlib import Path
 
 import pytest
@@ -6,10 +8,11 @@ from git import Repo
 from infrahub_sdk import Config, InfrahubClient
 from infrahub_sdk.branch import BranchData
 from infrahub_sdk.node import InfrahubNode
+from infrahub_sdk.schema import InfrahubRepositoryConfig
 from infrahub_sdk.uuidt import UUIDT
 from pytest_httpx._httpx_mock import HTTPXMock
 
-from infrahub.core.constants import InfrahubKind
+from infrahub.core.constants import InfrahubKind, RepositorySyncStatus
 from infrahub.exceptions import (
     CheckError,
     CommitNotFoundError,
@@ -21,11 +24,14 @@ from infrahub.git import InfrahubRepository
 from infrahub.git.base import (
     RepoFileInformation,
     extract_repo_file_information,
+    run_git_operation,
 )
 from infrahub.git.constants import BRANCHES_DIRECTORY_NAME, COMMITS_DIRECTORY_NAME, TEMPORARY_DIRECTORY_NAME
 from infrahub.git.integrator import (
     ArtifactGenerateResult,
     CheckDefinitionInformation,
+    ImportedCommit,
+    ImportScope,
 )
 from infrahub.git.worktree import Worktree
 from infrahub.utils import find_first_file_in_directory
@@ -198,11 +204,29 @@ async def test_get_commit_worktree(git_repo_01: InfrahubRepository):
     commit = repo.get_commit_value(branch_name="main")
 
     assert repo.has_worktree(identifier=commit) is False
-    worktree = repo.get_commit_worktree(commit=commit)
+    worktree = await repo.get_commit_worktree(commit=commit)
     assert isinstance(worktree, Worktree)
     assert repo.has_worktree(identifier=commit) is True
 
 
+async def test_get_commit_worktree_concurrently(git_repo_01: InfrahubRepository):
+    repo = git_repo_01
+    git_repo = repo.get_git_repo_main()
+
+    first_file = find_first_file_in_directory(repo.directory_default)
+    with Path(os.path.join(repo.directory_default, first_file)).open(mode="a", encoding="utf-8") as file:
+        file.write("new line\n")
+    git_repo.index.add([first_file])
+    git_repo.index.commit("Change first file")
+
+    commit = repo.get_commit_value(branch_name="main")
+
+    # The worktree is created once, the other tasks wait for it instead of failing to create it again
+    worktrees = await asyncio.gather(*[repo.get_commit_worktree(commit=commit) for _ in range(4)])
+    assert len({worktree.directory for worktree in worktrees}) == 1
+    assert len([worktree for worktree in repo.get_worktrees() if worktree.identifier == commit]) == 1
+
+
 async def test_get_branch_worktree(git_repo_01: InfrahubRepository, branch99: BranchData):
     repo = git_repo_01
     git_repo = repo.get_git_repo_main()
@@ -714,7 +738,7 @@ async def test_calculate_diff_between_commits(
     await repo.create_branch_in_git(branch_name=branch01.name, branch_id=branch01.id)
     await repo.create_branch_in_git(branch_name=branch02.name, branch_id=branch02.id)
 
-    worktree = repo.get_worktree(identifier=branch01.name)
+    worktree = await repo.get_worktree(identifier=branch01.name)
     git_repo = repo.get_git_repo_worktree(identifier=branch01.name)
 
     # Add a file
@@ -733,7 +757,7 @@ async def test_calculate_diff_between_commits(
     # TODO Need to move this code, it's useful to modify a file in the repo
     # for branch in ["branch01", "branch02"]:
 
-    #     worktree = repo.get_worktree(identifier=branch)
+    #     worktree = await repo.get_worktree(identifier=branch)
     #     git_repo = repo.get_git_repo_worktree(identifier=branch)
 
     #     sports_file = os.path.join(worktree.directory, "test_files/sports.yml")
@@ -766,13 +790,111 @@ async def test_calculate_diff_between_commits(
     assert removed == ["pyproject.toml"]
 
 
+async def test_run_git_operation(git_repo_01: InfrahubRepository):
+    repo = git_repo_01
+
+    assert await run_git_operation(threading.current_thread) is not threading.current_thread()
+    assert await run_git_operation(
+        repo.get_branches_from_local, include_worktree=False
+    ) == repo.get_branches_from_local(include_worktree=False)
+
+    with pytest.raises(ValueError):
+        await run_git_operation(int, "not a number")
+
+
+async def test_get_import_scope(git_repo_01: InfrahubRepository, branch01: BranchData):
+    repo = git_repo_01
+    await repo.create_branch_in_git(branch_name=branch01.name, branch_id=branch01.id)
+
+    commit_main = repo.get_commit_value(branch_name="main", remote=False)
+    commit_branch01 = repo.get_commit_value(branch_name=branch01.name, remote=False)
+    config_file = InfrahubRepositoryConfig(
+        schemas=["schemas"],
+        queries=[
+            {"name": "sports", "file_path": "test_files/sports.yml"},
+            {"name": "countries", "file_path": "test_files/countries.yml"},
+        ],
+    )
+
+    scope = await repo._get_import_scope(
+        imported_commit=ImportedCommit(commit=commit_main), commit=commit_branch01, config_file=config_file
+    )
+    assert scope == ImportScope(graphql_queries={"sports"}, python_files=False)
+
+    scope = await repo._get_import_scope(
+        imported_commit=ImportedCommit(commit=commit_main), commit=commit_main, config_file=config_file
+    )
+    assert scope.is_empty
+
+    # All the objects are imported if a schema has been modified or if no commit has been imported yet
+    config_file.schemas = ["test_files"]
+    assert not await repo._get_import_scope(
+        imported_commit=ImportedCommit(commit=commit_main), commit=commit_branch01, config_file=config_file
+    )
+    assert not await repo._get_import_scope(
+        imported_commit=ImportedCommit(commit=""), commit=commit_branch01, config_file=config_file
+    )
+
+
+async def test_import_objects_from_files_imported_commit(git_repo_01: InfrahubRepository, monkeypatch):
+    repo = git_repo_01
+    commit = repo.get_commit_value(branch_name="main", remote=False)
+    config_file = InfrahubRepositoryConfig(queries=[{"name": "sports", "file_path": "test_files/sports.yml"}])
+    imported_commits: list[str] = []
+    sync_statuses: list[RepositorySyncStatus] = []
+
+    async def get_repository_config(self, branch_name: str, commit: str) -> InfrahubRepositoryConfig:
+        return config_file
+
+    async def get_imported_commit(self, branch_name: str) -> ImportedCommit:
+        return imported_commit
+
+    async def set_imported_commit(self, branch_name: str, imported_commit: ImportedCommit, commit: str) -> None:
+        imported_commits.append(commit)
+
+    async def update_sync_status(self, branch_name: str, status: RepositorySyncStatus) -> None:
+        sync_statuses.append(status)
+
+    async def get_import_scope(self, imported_commit: ImportedCommit, commit: str, config_file) -> ImportScope:
+        return import_scope
+
+    async def import_all_graphql_query(self, branch_name: str, commit: str, config_file, query_names=None) -> None:
+        self._has_import_errors = import_failure
+
+    monkeypatch.setattr(InfrahubRepository, "get_repository_config", get_repository_config)
+    monkeypatch.setattr(InfrahubRepository, "_get_imported_commit", get_imported_commit)
+    monkeypatch.setattr(InfrahubRepository, "_set_imported_commit", set_imported_commit)
+    monkeypatch.setattr(InfrahubRepository, "_get_import_scope", get_import_scope)
+    monkeypatch.setattr(InfrahubRepository, "_update_sync_status", update_sync_status)
+    monkeypatch.setattr(InfrahubRepository, "import_all_graphql_query", import_all_graphql_query)
+
+    # The commit has already been imported, the import is skipped without updating the sync status
+    imported_commit = ImportedCommit(commit=commit)
+    import_scope = ImportScope()
+    import_failure = False
+    await repo.import_objects_from_files(infrahub_branch_name="main", commit=commit)
+    assert imported_commits == [commit]
+    assert not sync_statuses
+
+    # An object has been skipped, the commit isn't recorded to import it again with the next commit
+    import_scope = ImportScope(graphql_queries={"sports"})
+    import_failure = True
+    await repo.import_objects_from_files(infrahub_branch_name="main", commit=commit)
+    assert imported_commits == [commit]
+    assert sync_statuses == [RepositorySyncStatus.SYNCING, RepositorySyncStatus.IN_SYNC]
+
+    import_failure = False
+    await repo.import_objects_from_files(infrahub_branch_name="main", commit=commit)
+    assert imported_commits == [commit, commit]
+
+
 async def test_list_all_files(git_repo_01: InfrahubRepository, branch01: BranchData, branch02: BranchData):
     repo = git_repo_01
 
     await repo.create_branch_in_git(branch_name=branch01.name, branch_id=branch01.id)
     await repo.create_branch_in_git(branch_name=branch02.name, branch_id=branch02.id)
 
-    worktree = repo.get_worktree(identifier=branch01.name)
+    worktree = await repo.get_worktree(identifier=branch01.name)
     git_repo = repo.get_git_repo_worktree(identifier=branch01.name)
 
     # Add a file
@@ -1,6 +1,7 @@
 from graphql import graphql
 
 from infrahub.core.branch import Branch
+from infrahub.core.manager import NodeManager
 from infrahub.core.node import Node
 from infrahub.database import InfrahubDatabase
 from infrahub.graphql.initialization import prepare_graphql_params
@@ -93,3 +94,31 @@ async def test_search_anywhere_by_string(
 
     assert sorted(node_ids) == sorted([person_john_main.id, person_jane_main.id])
     assert sorted(node_kinds) == sorted([person_john_main.get_kind(), person_jane_main.get_kind()])
+
+
+async def test_search_anywhere_not_indexed_attribute(
+    db: InfrahubDatabase,
+    person_john_main: Node,
+    car_accord_main: Node,
+    car_prius_main: Node,
+    branch: Branch,
+):
+    car = await NodeManager.get_one(db=db, branch=branch, id=car_accord_main.id)
+    car.transmission.value = "manual"
+    await car.save(db=db)
+
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=branch)
+
+    # The transmission is not part of the display label, the nodes are searched in the graph
+    result = await graphql(
+        schema=gql_params.schema,
+        source=SEARCH_QUERY,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={"search": "manual"},
+    )
+
+    assert result.errors is None
+    assert result.data
+    assert result.data["InfrahubSearchAnywhere"]["count"] == 1
+    assert result.data["InfrahubSearchAnywhere"]["edges"][0]["node"]["id"] == car_accord_main.id
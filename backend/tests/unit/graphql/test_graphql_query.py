@@ -1,4 +1,5 @@
 from typing import Dict, Literal
+from unittest.mock import patch
 
 import pytest
 from deepdiff import DeepDiff
@@ -15,6 +16,7 @@ from infrahub.core.schema.schema_branch import SchemaBranch
 from infrahub.core.timestamp import Timestamp
 from infrahub.database import InfrahubDatabase
 from infrahub.graphql.initialization import prepare_graphql_params
+from infrahub.graphql.loaders import PeerRelationshipsDataLoader
 
 
 async def test_info_query(db: InfrahubDatabase, default_branch: Branch, criticality_schema: NodeSchema):
@@ -566,6 +568,73 @@ async def test_nested_query(db: InfrahubDatabase, default_branch: Branch, car_pe
     assert gql_params.context.related_node_ids == {p1.id, p2.id, c1.id, c2.id, c3.id}
 
 
+async def test_nested_query_peers_batched(
+    db: InfrahubDatabase, default_branch: Branch, car_person_schema: SchemaBranch
+):
+    car = registry.schema.get(name="TestCar")
+    person = registry.schema.get(name="TestPerson")
+
+    persons = []
+    for idx in range(5):
+        person_node = await Node.init(db=db, schema=person)
+        await person_node.new(db=db, name=f"person{idx}", height=170 + idx)
+        await person_node.save(db=db)
+        persons.append(person_node)
+
+    for idx, person_node in enumerate(persons):
+        for car_idx in range(idx):
+            car_node = await Node.init(db=db, schema=car)
+            await car_node.new(db=db, name=f"car{idx}-{car_idx}", nbr_seats=4, is_electric=True, owner=person_node)
+            await car_node.save(db=db)
+
+    query = """
+    query {
+        TestPerson {
+            edges {
+                node {
+                    name {
+                        value
+                    }
+                    cars {
+                        edges {
+                            node {
+                                name {
+                                    value
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+    """
+
+    gql_params = prepare_graphql_params(
+        db=db, include_mutation=False, include_subscription=False, branch=default_branch
+    )
+    with patch.object(
+        PeerRelationshipsDataLoader, "query_peers", autospec=True, side_effect=PeerRelationshipsDataLoader.query_peers
+    ) as query_peers:
+        result = await graphql(
+            schema=gql_params.schema,
+            source=query,
+            context_value=gql_params.context,
+            root_value=None,
+            variable_values={},
+        )
+
+    assert result.errors is None
+
+    result_per_name = {result["node"]["name"]["value"]: result["node"] for result in result.data["TestPerson"]["edges"]}
+    for idx in range(5):
+        car_names = sorted(edge["node"]["name"]["value"] for edge in result_per_name[f"person{idx}"]["cars"]["edges"])
+        assert car_names == sorted(f"car{idx}-{car_idx}" for car_idx in range(idx))
+
+    # The cars of all the persons must have been resolved with a single query
+    assert query_peers.call_count == 1
+
+
 async def test_double_nested_query(db: InfrahubDatabase, default_branch: Branch, car_person_schema: SchemaBranch):
     car = registry.schema.get(name="TestCar")
     person = registry.schema.get(name="TestPerson")
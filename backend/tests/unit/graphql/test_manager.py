@@ -1,3 +1,4 @@
+import gc
 import inspect
 
 import graphene
@@ -6,6 +7,7 @@ from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.database import InfrahubDatabase
 from infrahub.graphql.manager import GraphQLSchemaManager
+from infrahub.graphql.schema_registry import graphql_schema_registry
 from infrahub.graphql.types import InfrahubObject
 
 
@@ -258,3 +260,31 @@ async def test_generate_filters(db: InfrahubDatabase, default_branch: Branch, da
         "subscriber_of_groups__name__values",
     ]
     assert sorted(list(filters.keys())) == sorted(expected_filters)
+
+
+async def test_graphql_schema_shared_between_schema_branches(
+    db: InfrahubDatabase, default_branch: Branch, car_person_schema
+):
+    schema = registry.schema.get_schema_branch(name=default_branch.name)
+    schema.clear_cache()
+    gc.collect()
+    nbr_entries = len(graphql_schema_registry)
+
+    schema1 = schema.duplicate(name="branch1")
+    schema2 = schema.duplicate(name="branch2")
+    gql_schema1 = schema1.get_graphql_schema()
+    assert len(graphql_schema_registry) == nbr_entries + 1
+    assert schema2.get_graphql_schema() is gql_schema1
+    assert schema2.get_graphql_manager() is schema1.get_graphql_manager()
+    assert len(graphql_schema_registry) == nbr_entries + 1
+
+    # The GraphQL schema is kept as long as one schema branch is using it
+    schema1.clear_cache()
+    assert len(graphql_schema_registry) == nbr_entries + 1
+    assert schema1.get_graphql_schema() is gql_schema1
+
+    schema1.clear_cache()
+    del schema2
+    gc.collect()
+    assert len(graphql_schema_registry) == nbr_entries
+    assert schema1.get_graphql_schema() is not gql_schema1
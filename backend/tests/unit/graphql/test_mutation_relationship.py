@@ -8,6 +8,9 @@ from infrahub.core.node import Node
 from infrahub.core.utils import count_relationships
 from infrahub.database import InfrahubDatabase
 from infrahub.graphql.initialization import prepare_graphql_params
+from infrahub.message_bus import messages
+from infrahub.services import InfrahubServices
+from tests.adapters.message_bus import BusRecorder
 
 
 async def test_relationship_add(
@@ -695,3 +698,43 @@ async def test_relationship_add_from_pool(
     addresses = await p1.ip_addresses.get(db=db)
     assert prefixes
     assert not addresses
+
+
+async def test_relationship_add_account_group_member(
+    db: InfrahubDatabase, default_branch: Branch, create_test_admin: Node, first_account: Node
+):
+    group = await Node.init(db=db, schema=InfrahubKind.ACCOUNTGROUP)
+    await group.new(db=db, name="operators")
+    await group.save(db=db)
+
+    query = """
+    mutation {
+        RelationshipAdd(data: {
+            id: "%s",
+            name: "members",
+            nodes: [{id: "%s"}],
+        }) {
+            ok
+        }
+    }
+    """ % (
+        group.id,
+        first_account.id,
+    )
+    recorder = BusRecorder()
+    service = InfrahubServices(message_bus=recorder)
+
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch, service=service)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors is None
+    assert result.data["RelationshipAdd"]["ok"] is True
+
+    # The permissions cached for the accounts are discarded by every worker
+    assert messages.RefreshRegistryPermissions() in recorder.messages
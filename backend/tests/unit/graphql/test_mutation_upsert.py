@@ -446,3 +446,95 @@ async def test_with_constructed_hfid_with_numbers(
         "description": {"value": "Here is the update"},
         "id": first_ticket.id,
     }
+
+
+async def test_bulk_upsert(db: InfrahubDatabase, person_john_main: Node, branch: Branch):
+    query = """
+    mutation BulkUpsert($data: [GenericScalar!]!) {
+        CoreBulkUpsert(data: {kind: "TestPerson", data: $data}) {
+            ok
+            nodes {
+                index
+                id
+                created
+            }
+        }
+    }
+    """
+    data = [
+        {"name": {"value": "Jane"}, "height": {"value": 165}},
+        {"id": person_john_main.id, "height": {"value": 175}},
+        {"name": {"value": "Jim"}},
+    ]
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=branch)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={"data": data},
+    )
+
+    assert result.errors is None
+    assert result.data["CoreBulkUpsert"]["ok"] is True
+    nodes = result.data["CoreBulkUpsert"]["nodes"]
+    assert [node["index"] for node in nodes] == [0, 1, 2]
+    assert [node["created"] for node in nodes] == [True, False, True]
+    assert nodes[1]["id"] == person_john_main.id
+
+    persons = await NodeManager.get_many(db=db, ids=[node["id"] for node in nodes], branch=branch)
+    assert persons[nodes[0]["id"]].name.value == "Jane"
+    assert persons[nodes[0]["id"]].height.value == 165
+    assert persons[person_john_main.id].name.value == "John"
+    assert persons[person_john_main.id].height.value == 175
+    assert persons[nodes[2]["id"]].name.value == "Jim"
+
+
+async def test_bulk_upsert_uniqueness_violation(db: InfrahubDatabase, person_john_main: Node, branch: Branch):
+    query = """
+    mutation BulkUpsert($data: [GenericScalar!]!) {
+        CoreBulkUpsert(data: {kind: "TestPerson", data: $data}) {
+            ok
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=branch)
+
+    for data in (
+        [{"name": {"value": "Jane"}}, {"name": {"value": "Jane"}}],
+        [{"name": {"value": "Jane"}}, {"id": str(uuid4()), "name": {"value": "John"}}],
+    ):
+        result = await graphql(
+            schema=gql_params.schema,
+            source=query,
+            context_value=gql_params.context,
+            root_value=None,
+            variable_values={"data": data},
+        )
+
+        assert result.errors
+        assert "name" in str(result.errors[0])
+
+    persons = await NodeManager.query(db=db, schema="TestPerson", branch=branch)
+    assert [person.name.value for person in persons] == ["John"]
+
+
+async def test_bulk_upsert_unsupported_kind(db: InfrahubDatabase, register_core_models_schema, branch: Branch):
+    query = """
+    mutation {
+        CoreBulkUpsert(data: {kind: "CoreRepository", data: [{name: {value: "repo"}}]}) {
+            ok
+        }
+    }
+    """
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=branch)
+    result = await graphql(
+        schema=gql_params.schema,
+        source=query,
+        context_value=gql_params.context,
+        root_value=None,
+        variable_values={},
+    )
+
+    assert result.errors
+    assert "doesn't support bulk operations" in str(result.errors[0])
@@ -1,10 +1,12 @@
 from graphql import DocumentNode, GraphQLSchema
 
+from infrahub.core import registry
 from infrahub.core.branch import Branch
 from infrahub.core.constants import InfrahubKind
 from infrahub.database import InfrahubDatabase
-from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer
+from infrahub.graphql.analyzer import InfrahubGraphQLQueryAnalyzer, get_analyzed_query
 from infrahub.graphql.initialization import prepare_graphql_params
+from infrahub.graphql.query_cache import GraphQLQueryCache, query_cache
 
 
 async def test_analyzer_init_with_schema(
@@ -104,3 +106,69 @@ async def test_get_models_in_use(
         "TestGazCar",
         "TestPerson",
     }
+
+
+async def test_get_analyzed_query_from_cache(
+    db: InfrahubDatabase, default_branch: Branch, query_01: str, query_02: str, car_person_schema_generics
+):
+    query_cache.clear()
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+    assert gql_params.schema_key
+
+    gqa1 = get_analyzed_query(
+        query=query_01, schema=gql_params.schema, schema_key=gql_params.schema_key, branch=default_branch
+    )
+    gqa2 = get_analyzed_query(
+        query=query_01,
+        schema=gql_params.schema,
+        schema_key=gql_params.schema_key,
+        branch=default_branch,
+        operation_name="TestQuery",
+        query_variables={"name": "volt"},
+    )
+    assert len(query_cache) == 1
+    assert gqa1 is not gqa2
+    assert gqa1.document is gqa2.document
+    assert gqa1.operation_name is None
+    assert gqa2.operation_name == "TestQuery"
+    assert gqa2.query_variables == {"name": "volt"}
+
+    assert await gqa1.get_models_in_use(types=gql_params.context.types) == {
+        "TestCar",
+        "TestElectricCar",
+        "TestGazCar",
+        "TestPerson",
+    }
+    assert "models_in_use" in gqa2._analysis
+
+    get_analyzed_query(
+        query=query_02, schema=gql_params.schema, schema_key=gql_params.schema_key, branch=default_branch
+    )
+    assert len(query_cache) == 2
+
+    registry.schema.get_schema_branch(name=default_branch.name).clear_cache()
+    assert len(query_cache) == 0
+
+
+def test_query_cache_lru():
+    cache = GraphQLQueryCache(max_size=2)
+    analyzers = [InfrahubGraphQLQueryAnalyzer(query=f"query {{ query{idx} {{ id }} }}") for idx in range(3)]
+    key_aaa = ("aaa", True, True, True, True, False)
+    key_bbb = ("bbb", True, True, True, True, False)
+
+    cache.set(schema_key=key_aaa, query=analyzers[0].query, analyzed_query=analyzers[0])
+    cache.set(schema_key=key_aaa, query=analyzers[1].query, analyzed_query=analyzers[1])
+    assert cache.get(schema_key=key_aaa, query=analyzers[0].query) is analyzers[0]
+    assert cache.get(schema_key=key_bbb, query=analyzers[0].query) is None
+
+    # The same schema generated with other options is another GraphQL schema
+    assert cache.get(schema_key=("aaa", True, False, False, True, False), query=analyzers[0].query) is None
+
+    # The least recently used query is evicted
+    cache.set(schema_key=key_bbb, query=analyzers[2].query, analyzed_query=analyzers[2])
+    assert len(cache) == 2
+    assert cache.get(schema_key=key_aaa, query=analyzers[1].query) is None
+
+    cache.clear(schema_hash="aaa")
+    assert len(cache) == 1
+    assert cache.get(schema_key=key_bbb, query=analyzers[2].query) is analyzers[2]
@@ -0,0 +1,31 @@
+import pytest
+
+from infrahub.core.branch import Branch
+from infrahub.core.constants import InfrahubKind
+from infrahub.core.node import Node
+from infrahub.database import InfrahubDatabase
+from infrahub.graphql.initialization import prepare_graphql_params
+from infrahub.graphql.subscription import graphql_query
+from infrahub.graphql.subscription.graphql_query import GraphQLQuerySubscriptions
+
+
+async def test_subscription_prepare_failure(
+    db: InfrahubDatabase, default_branch: Branch, register_core_models_schema, monkeypatch
+):
+    """Validate that the subscribers fail instead of waiting for a result when the query can't be prepared"""
+    q1 = await Node.init(db=db, schema=InfrahubKind.GRAPHQLQUERY, branch=default_branch)
+    await q1.new(db=db, name="query01", query="query { BuiltinTag { count }}")
+    await q1.save(db=db)
+
+    def get_analyzed_query(**kwargs):
+        raise ValueError("Unable to analyze the query")
+
+    monkeypatch.setattr(graphql_query, "get_analyzed_query", get_analyzed_query)
+
+    gql_params = prepare_graphql_params(db=db, include_subscription=False, branch=default_branch)
+    subscriptions = GraphQLQuerySubscriptions()
+    with pytest.raises(ValueError, match="Unable to analyze the query"):
+        async for _ in subscriptions.subscribe(context=gql_params.context, name="query01", params=None, interval=10):
+            pass
+
+    assert len(subscriptions) == 0
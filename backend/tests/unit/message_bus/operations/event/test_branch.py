@@ -78,12 +78,13 @@ async def test_merged(default_branch: Branch, prefect_test_fixture):
 
     mock_component_registry.get_component.assert_awaited_once_with(DiffRepository, db=database, branch=default_branch)
     diff_repo.get_empty_roots.assert_awaited_once_with(base_branch_names=[target_branch_name])
-    assert len(recorder.messages) == 5
+    assert len(recorder.messages) == 6
     assert recorder.messages[0] == messages.RefreshRegistryBranches()
-    assert recorder.messages[1] == messages.TriggerArtifactDefinitionGenerate(branch=target_branch_name)
-    assert recorder.messages[2] == messages.TriggerGeneratorDefinitionRun(branch=target_branch_name)
-    assert recorder.messages[3] == messages.RequestDiffUpdate(branch_name=tracked_diff_roots[0].diff_branch_name)
-    assert recorder.messages[4] == messages.RequestDiffUpdate(branch_name=tracked_diff_roots[1].diff_branch_name)
+    assert recorder.messages[1] == messages.RefreshRegistrySubscriptions(branch=target_branch_name, all_nodes=True)
+    assert recorder.messages[2] == messages.TriggerArtifactDefinitionGenerate(branch=target_branch_name)
+    assert recorder.messages[3] == messages.TriggerGeneratorDefinitionRun(branch=target_branch_name)
+    assert recorder.messages[4] == messages.RequestDiffUpdate(branch_name=tracked_diff_roots[0].diff_branch_name)
+    assert recorder.messages[5] == messages.RequestDiffUpdate(branch_name=tracked_diff_roots[1].diff_branch_name)
 
 
 async def test_rebased(default_branch: Branch, prefect_test_fixture):
@@ -117,9 +118,10 @@ async def test_rebased(default_branch: Branch, prefect_test_fixture):
 
     mock_component_registry.get_component.assert_awaited_once_with(DiffRepository, db=database, branch=default_branch)
     diff_repo.get_empty_roots.assert_awaited_once_with(diff_branch_names=[branch_name])
-    assert len(recorder.messages) == 3
+    assert len(recorder.messages) == 4
     assert isinstance(recorder.messages[0], messages.RefreshRegistryRebasedBranch)
     refresh_message: messages.RefreshRegistryRebasedBranch = recorder.messages[0]
     assert refresh_message.branch == "cr1234"
-    assert recorder.messages[1] == messages.RequestDiffRefresh(branch_name=branch_name, diff_id=diff_roots[0].uuid)
-    assert recorder.messages[2] == messages.RequestDiffRefresh(branch_name=branch_name, diff_id=diff_roots[1].uuid)
+    assert recorder.messages[1] == messages.RefreshRegistrySubscriptions(branch=branch_name, all_nodes=True)
+    assert recorder.messages[2] == messages.RequestDiffRefresh(branch_name=branch_name, diff_id=diff_roots[0].uuid)
+    assert recorder.messages[3] == messages.RequestDiffRefresh(branch_name=branch_name, diff_id=diff_roots[1].uuid)
@@ -1,10 +1,14 @@
+import asyncio
 from uuid import uuid4
 
 from infrahub.core.branch import Branch
 from infrahub.core.registry import registry
 from infrahub.database import InfrahubDatabase
+from infrahub.graphql.subscription.graphql_query import GraphQLQueryExecution, graphql_query_subscriptions
 from infrahub.message_bus import Meta, messages
-from infrahub.message_bus.operations.refresh.registry import rebased_branch
+from infrahub.message_bus.operations.refresh.registry import permissions, rebased_branch, subscriptions
+from infrahub.permissions.cache import permission_cache
+from infrahub.permissions.local_backend import LocalPermissionBackend
 from infrahub.services import InfrahubServices
 from tests.adapters.message_bus import BusSimulator
 
@@ -22,3 +26,49 @@ async def test_rebased_branch(db: InfrahubDatabase):
     assert branch_name not in registry.branch
     await rebased_branch(message=message, service=service)
     assert branch_name in registry.branch
+
+
+async def test_permissions(db: InfrahubDatabase, default_branch: Branch):
+    """Validate that the permissions cache is cleared, even if the request originates from the worker itself"""
+    backend = LocalPermissionBackend()
+    await backend.load_permissions(db=db, account_id=str(uuid4()), branch=default_branch)
+    assert len(permission_cache) == 1
+
+    message = messages.RefreshRegistryPermissions()
+    service = InfrahubServices(database=db, message_bus=BusSimulator())
+    await permissions(message=message, service=service)
+    assert len(permission_cache) == 0
+
+
+async def test_subscriptions(default_branch: Branch):
+    """Validate that only the subscribed queries affected by the modified nodes are executed again"""
+    isolated_branch = Branch(name="isolated", is_isolated=True)
+    executions = {
+        "by_kind": GraphQLQueryExecution(branch=default_branch, interval=10, related_kinds={"TestCar"}),
+        "by_node": GraphQLQueryExecution(branch=default_branch, interval=10, related_node_ids={"person1"}),
+        "isolated": GraphQLQueryExecution(branch=isolated_branch, interval=10, related_kinds={"TestCar", "TestPerson"}),
+    }
+    for name, execution in executions.items():
+        graphql_query_subscriptions._executions[execution.branch.name, name, "{}"] = execution
+
+    try:
+        service = InfrahubServices(message_bus=BusSimulator())
+        message = messages.RefreshRegistrySubscriptions(
+            branch=default_branch.name, kinds=["TestPerson"], node_ids=["person1"]
+        )
+        await subscriptions(message=message, service=service)
+        assert [name for name, execution in executions.items() if execution.changed.is_set()] == ["by_node"]
+
+        message = messages.RefreshRegistrySubscriptions(branch="isolated", all_nodes=True)
+        await subscriptions(message=message, service=service)
+        assert [name for name, execution in executions.items() if execution.changed.is_set()] == ["by_node", "isolated"]
+    finally:
+        graphql_query_subscriptions._executions.clear()
+
+    # A subscriber that didn't consume the previous result only gets the latest one
+    execution = executions["by_kind"]
+    execution.subscribers.append(asyncio.Queue(maxsize=1))
+    execution.publish(result={"count": 1})
+    execution.publish(result={"count": 2})
+    assert execution.subscribers[0].get_nowait() == {"count": 2}
+    assert execution.subscribers[0].empty()
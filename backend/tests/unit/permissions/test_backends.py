@@ -5,7 +5,8 @@ from infrahub.core.node import Node
 from infrahub.core.protocols import CoreAccount
 from infrahub.database import InfrahubDatabase
 from infrahub.permissions import LocalPermissionBackend
-from infrahub.permissions.constants import PermissionDecisionFlag
+from infrahub.permissions.cache import PermissionCache, permission_cache
+from infrahub.permissions.constants import AssignedPermissions, PermissionDecisionFlag
 
 
 async def test_load_permissions(db: InfrahubDatabase, default_branch: Branch, create_test_admin, first_account):
@@ -305,3 +306,96 @@ async def test_report_permission_object(
         )
         == PermissionDecisionFlag.DENY
     )
+
+
+async def test_load_permissions_from_cache(
+    db: InfrahubDatabase, default_branch: Branch, create_test_admin: CoreAccount, first_account: CoreAccount
+):
+    backend = LocalPermissionBackend()
+
+    permissions = await backend.load_permissions(db=db, account_id=create_test_admin.id, branch=default_branch)
+    assert len(permission_cache) == 1
+    assert await backend.load_permissions(db=db, account_id=create_test_admin.id, branch=default_branch) is permissions
+
+    entry = await backend.load_permission_entry(db=db, account_id=create_test_admin.id, branch=default_branch)
+    assert entry.permissions is permissions
+    assert entry.object_lookup.permissions is permissions["object_permissions"]
+
+    await backend.load_permissions(db=db, account_id=first_account.id, branch=default_branch)
+    assert len(permission_cache) == 2
+
+    permission_cache.clear()
+    assert permission_cache.get(account_id=create_test_admin.id, branch_name=default_branch.name) is None
+    assert (
+        await backend.load_permissions(db=db, account_id=create_test_admin.id, branch=default_branch) is not permissions
+    )
+
+
+def test_permission_cache_expiration_and_size():
+    backend = LocalPermissionBackend()
+    cache = PermissionCache(ttl=60, max_size=2)
+
+    for account_id in ["account1", "account2", "account3"]:
+        permissions: AssignedPermissions = {"global_permissions": [], "object_permissions": []}
+        cache.set(
+            account_id=account_id,
+            branch_name="main",
+            permissions=permissions,
+            object_lookup=backend.compile_object_permissions(permissions=permissions["object_permissions"]),
+        )
+
+    assert len(cache) == 2
+    assert cache.get(account_id="account1", branch_name="main") is None
+    assert cache.get(account_id="account3", branch_name="main") is not None
+    assert cache.get(account_id="account3", branch_name="branch2") is None
+
+    expired_cache = PermissionCache(ttl=0, max_size=2)
+    expired_cache.set(
+        account_id="account1",
+        branch_name="main",
+        permissions=permissions,
+        object_lookup=backend.compile_object_permissions(permissions=permissions["object_permissions"]),
+    )
+    assert expired_cache.get(account_id="account1", branch_name="main") is None
+
+
+def test_report_permission_object_lookup():
+    backend = LocalPermissionBackend()
+    permissions = [
+        ObjectPermission(
+            id="",
+            namespace="*",
+            name="*",
+            action=PermissionAction.ANY.value,
+            decision=PermissionDecision.ALLOW_DEFAULT.value,
+        ),
+        ObjectPermission(
+            id="",
+            namespace="Builtin",
+            name="*",
+            action=PermissionAction.ANY.value,
+            decision=PermissionDecision.DENY.value,
+        ),
+        ObjectPermission(
+            id="",
+            namespace="Builtin",
+            name="Tag",
+            action=PermissionAction.VIEW.value,
+            decision=PermissionDecision.ALLOW_DEFAULT.value,
+        ),
+        ObjectPermission(
+            id="",
+            namespace="Builtin",
+            name="Tag",
+            action=PermissionAction.VIEW.value,
+            decision=PermissionDecision.ALLOW_OTHER.value,
+        ),
+    ]
+
+    lookup = backend.compile_object_permissions(permissions=permissions)
+    assert lookup.report(namespace="Core", name="Account", action="view") == PermissionDecisionFlag.ALLOW_DEFAULT
+    assert lookup.report(namespace="Builtin", name="Tag", action="create") == PermissionDecisionFlag.DENY
+    assert lookup.report(namespace="Builtin", name="Tag", action="view") == PermissionDecisionFlag.ALLOW_ALL
+    assert lookup.report(namespace="Builtin", name="Tag", action="view") == backend.report_object_permission(
+        permissions=permissions, namespace="Builtin", name="Tag", action="view"
+    )
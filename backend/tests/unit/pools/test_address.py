@@ -2,7 +2,7 @@ from ipaddress import ip_interface, ip_network
 
 from netaddr import IPNetwork
 
-from infrahub.pools.address import get_available
+from infrahub.pools.address import IPAddressAllocator, get_available
 
 
 def test_get_available():
@@ -27,3 +27,32 @@ def test_get_available_full():
     addresses = [ip_interface("10.16.18.1/30"), ip_interface("10.16.18.2/30")]
     available = get_available(network=network, addresses=addresses, is_pool=False)
     assert len(available) == 0
+
+
+def test_address_allocator():
+    network = ip_network("10.16.18.0/29")
+    allocator = IPAddressAllocator(network=network, is_pool=False, used=[ip_interface("10.16.18.2/29")])
+    assert allocator.free_count == 5
+
+    assert allocator.allocate_many(count=2, prefixlen=29) == [
+        ip_interface("10.16.18.1/29"),
+        ip_interface("10.16.18.3/29"),
+    ]
+    assert allocator.release(address=ip_interface("10.16.18.0/29")) is False
+    assert allocator.release(address=ip_interface("10.16.18.1/29")) is True
+    assert allocator.allocate_many(count=10, prefixlen=32) == [
+        ip_interface("10.16.18.1/32"),
+        ip_interface("10.16.18.4/32"),
+        ip_interface("10.16.18.5/32"),
+        ip_interface("10.16.18.6/32"),
+    ]
+    assert allocator.free_count == 0
+
+
+def test_address_allocator_pool():
+    allocator = IPAddressAllocator(network=ip_network("2001:db8::/126"), is_pool=True)
+    assert allocator.allocate_many(count=2, prefixlen=64) == [
+        ip_interface("2001:db8::/64"),
+        ip_interface("2001:db8::1/64"),
+    ]
+    assert allocator.is_free(address=ip_interface("2001:db8::2/64")) is True
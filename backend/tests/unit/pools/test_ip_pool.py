@@ -0,0 +1,24 @@
+from ipaddress import ip_interface, ip_network
+
+from infrahub.pools.address import IPAddressAllocator
+from infrahub.pools.ip_pool import IPResourceAllocator
+
+
+def test_ip_resource_allocator_update():
+    network = ip_network("10.16.18.0/29")
+    resource = IPResourceAllocator(
+        network=network,
+        allocator=IPAddressAllocator(network=network, is_pool=False, used=[ip_interface("10.16.18.1/29")]),
+        used={"address1": ip_interface("10.16.18.1/29")},
+    )
+    allocated = resource.allocate_many(count=2, prefixlen=29)
+    assert allocated == [ip_interface("10.16.18.2/29"), ip_interface("10.16.18.3/29")]
+    assert len(resource.pending) == 2
+
+    # The first address has been modified, the pending addresses found in the database are still confirmed
+    assert not resource.update(
+        node_ids=["address1", "address2"],
+        values={"address1": [ip_interface("10.16.18.6/29")], "address2": [ip_interface("10.16.18.2/29")]},
+    )
+    assert list(resource.pending) == [ip_interface("10.16.18.3/29")]
+    assert resource.used["address2"] == ip_interface("10.16.18.2/29")
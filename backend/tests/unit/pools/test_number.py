@@ -0,0 +1,58 @@
+from infrahub.core.timestamp import Timestamp
+from infrahub.pools.number import NumberAllocator
+
+
+def test_number_allocator():
+    allocator = NumberAllocator(start_range=1, end_range=10, used=[2, 3, 7, 12])
+    assert allocator.free_ranges == [(1, 1), (4, 6), (8, 10)]
+    assert allocator.free_count == 7
+    assert allocator.get_next() == 1
+    assert allocator.get_next_many(count=5) == [1, 4, 5, 6, 8]
+    assert allocator.get_next_many(count=20) == [1, 4, 5, 6, 8, 9, 10]
+
+
+def test_number_allocator_reserve():
+    allocator = NumberAllocator(start_range=1, end_range=10)
+    assert allocator.free_ranges == [(1, 10)]
+
+    assert allocator.reserve(number=5)
+    assert allocator.reserve(number=1)
+    assert allocator.reserve(number=10)
+    assert not allocator.reserve(number=5)
+    assert not allocator.reserve(number=11)
+    assert allocator.free_ranges == [(2, 4), (6, 9)]
+
+    for number in range(2, 5):
+        assert allocator.reserve(number=number)
+    assert allocator.free_ranges == [(6, 9)]
+    assert allocator.get_next() == 6
+
+
+def test_number_allocator_release():
+    allocator = NumberAllocator(start_range=1, end_range=10, used=range(1, 11))
+    assert allocator.get_next() is None
+    assert not allocator.get_next_many(count=3)
+
+    assert allocator.release(number=5)
+    assert allocator.release(number=7)
+    assert not allocator.release(number=7)
+    assert not allocator.release(number=11)
+    assert allocator.free_ranges == [(5, 5), (7, 7)]
+
+    assert allocator.release(number=6)
+    assert allocator.release(number=4)
+    assert allocator.release(number=8)
+    assert allocator.free_ranges == [(4, 8)]
+
+
+def test_number_allocator_pending():
+    allocator = NumberAllocator(start_range=1, end_range=10)
+    assert allocator.allocate_many(count=3) == [1, 2, 3]
+    assert sorted(allocator.pending) == [1, 2, 3]
+    assert allocator.get_next() == 4
+
+    # The reservation of 2 has been found in the database, 1 and 3 have been rolled back
+    allocator.reserve(number=2)
+    allocator.release_expired(before=Timestamp().add_delta(seconds=1))
+    assert not allocator.pending
+    assert allocator.free_ranges == [(1, 1), (3, 10)]
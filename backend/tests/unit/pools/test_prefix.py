@@ -2,7 +2,7 @@ import ipaddress
 
 import pytest
 
-from infrahub.pools.prefix import PrefixPool
+from infrahub.pools.prefix import IPPrefixAllocator, PrefixPool
 
 
 def test_init_v4():
@@ -146,3 +146,50 @@ def test_reserve_with_owner():
     assert sub.reserve("192.192.1.0/24", identifier="second") is True
 
     assert str(sub.get(prefixlen=24)) == "192.192.2.0/24"
+
+
+def test_allocator_smallest_block_first():
+    allocator = IPPrefixAllocator(
+        network=ipaddress.ip_network("192.168.0.0/24"), used=[ipaddress.ip_network("192.168.0.128/26")]
+    )
+    assert allocator.free_size == 192
+
+    # The free /26 is used before splitting the free /25, like PrefixPool.get
+    assert allocator.allocate(prefixlen=26) == ipaddress.ip_network("192.168.0.192/26")
+    assert allocator.allocate_many(count=3, prefixlen=27) == [
+        ipaddress.ip_network("192.168.0.0/27"),
+        ipaddress.ip_network("192.168.0.32/27"),
+        ipaddress.ip_network("192.168.0.64/27"),
+    ]
+    assert allocator.allocate(prefixlen=25) is None
+    assert allocator.allocate(prefixlen=24) is None
+    assert allocator.free_size == 32
+
+
+def test_allocator_reserve_and_release():
+    allocator = IPPrefixAllocator(network=ipaddress.ip_network("10.0.0.0/16"))
+    assert allocator.reserve(subnet=ipaddress.ip_network("10.0.1.0/24")) is True
+    assert allocator.reserve(subnet=ipaddress.ip_network("10.0.1.128/25")) is False
+    assert allocator.reserve(subnet=ipaddress.ip_network("10.1.0.0/24")) is False
+    assert allocator.is_free(subnet=ipaddress.ip_network("10.0.0.0/24")) is True
+    assert allocator.is_free(subnet=ipaddress.ip_network("10.0.0.0/23")) is False
+
+    # A subnet partially free is removed from the free blocks
+    assert allocator.reserve(subnet=ipaddress.ip_network("10.0.0.0/22")) is True
+    assert allocator.is_free(subnet=ipaddress.ip_network("10.0.2.0/24")) is False
+    assert allocator.free_size == 2**16 - 2**10
+
+    # The released subnets are merged back with their buddy
+    assert allocator.release(subnet=ipaddress.ip_network("10.0.0.0/22")) is True
+    assert allocator.release(subnet=ipaddress.ip_network("10.0.0.0/24")) is False
+    assert allocator.free_size == 2**16
+    assert allocator.allocate(prefixlen=17) == ipaddress.ip_network("10.0.0.0/17")
+
+
+def test_allocator_v6_many():
+    allocator = IPPrefixAllocator(network=ipaddress.ip_network("2001:db8::/48"))
+    subnets = allocator.allocate_many(count=1000, prefixlen=64)
+    assert len(subnets) == 1000
+    assert subnets[0] == ipaddress.ip_network("2001:db8::/64")
+    assert subnets[-1] == ipaddress.ip_network("2001:db8:0:3e7::/64")
+    assert len(set(subnets)) == 1000